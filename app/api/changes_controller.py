@@ -0,0 +1,56 @@
+"""
+GET /changes?since=<seq>: cambios del inventario (VMs e infraestructuras)
+posteriores a una secuencia, para sincronizar sin descargar la flota entera.
+
+Flujo del cliente: descarga GET /vm/ y GET /cloud/infrastructure una vez y
+guarda su cabecera X-Change-Seq; después pide /changes?since=<seq> y continúa
+con next_since (mientras has_more, sin esperar). Si la respuesta es 410 el
+registro ya no llega tan atrás: repetir la descarga completa.
+"""
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+
+from app.core.container import get_change_log
+from app.domain.errors import ChangesExpiredError
+from app.domain.schemas import ChangesResponse
+from app.domain.schemas.changes import ChangeResource
+from app.infrastructure.change_log import ChangeLog
+from app.infrastructure.serialization import NEGOTIATED_RESPONSES, negotiated_response
+
+router = APIRouter()
+
+CHANGE_SEQ_HEADER = "X-Change-Seq"
+
+
+@router.get(
+    "/changes",
+    response_model=ChangesResponse,
+    responses={**NEGOTIATED_RESPONSES, 410: {"description": "`since` anterior al registro de cambios: resincronizar con los listados"}},
+)
+async def list_changes(
+    since: int = Query(0, ge=0, description="Última secuencia ya aplicada (X-Change-Seq o next_since)"),
+    limit: int = Query(1000, ge=1, le=10_000, description="Máximo de cambios leídos del registro por llamada"),
+    resource: Optional[ChangeResource] = Query(None, description="Solo cambios de vm o de infrastructure"),
+    changes: ChangeLog = Depends(get_change_log),
+    accept: Optional[str] = Header(None, include_in_schema=False),
+):
+    """Creaciones, cambios y bajas posteriores a `since`, uno por recurso con su estado actual."""
+    try:
+        entries, next_since, has_more = changes.changes_since(
+            since, limit, frozenset((resource,)) if resource else None
+        )
+    except ChangesExpiredError as e:
+        raise HTTPException(status_code=410, detail=str(e), headers={CHANGE_SEQ_HEADER: str(e.current_seq)})
+    # Dicts sobre los modelos ya validados del repositorio (mismo JSON que
+    # ChangesResponse, que documenta la respuesta): sin un ChangeDTO por cambio
+    response = {
+        "since": since,
+        "next_since": next_since,
+        "current_seq": changes.current_seq,
+        "has_more": has_more,
+        "changes": [
+            {"seq": entry.seq, "resource": entry.resource, "id": entry.resource_id, "op": entry.op, "data": entry.obj}
+            for entry in entries
+        ],
+    }
+    return negotiated_response(accept, response, headers={CHANGE_SEQ_HEADER: str(next_since)})
@@ -0,0 +1,31 @@
+"""
+Controlador de estimación de costes: valora en bloque specs de VMs, bases de
+datos, load balancers y storage con el catálogo de precios por proveedor.
+"""
+from typing import Any, Dict
+from fastapi import APIRouter, Depends, HTTPException
+
+from app.core.container import get_cost_service
+from app.domain.catalog import get_price_catalog
+from app.domain.schemas.cost import CostEstimateRequest, CostEstimateResponse
+from app.domain.services import CostService
+
+router = APIRouter()
+
+
+@router.post("/estimate", response_model=CostEstimateResponse, response_model_exclude_none=True)
+async def estimate_cost(payload: CostEstimateRequest, service: CostService = Depends(get_cost_service)):
+    """
+    Coste horario y mensual (730 h) de hasta 100k items, con totales por proveedor y
+    tipo de recurso. Los tamaños fuera del catálogo se valoran por vCPU/RAM/GB.
+    """
+    return service.estimate(payload)
+
+
+@router.get("/prices/{provider}", response_model=Dict[str, Any])
+async def list_prices(provider: str):
+    """Catálogo de precios del proveedor por tipo de recurso y tamaño ("*" = precios por unidad)."""
+    try:
+        return {"provider": provider, "currency": "USD", "prices": get_price_catalog().list_prices(provider.lower())}
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
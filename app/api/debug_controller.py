@@ -0,0 +1,136 @@
+"""
+Endpoints de diagnóstico interno (contadores y estado de componentes en memoria).
+"""
+import asyncio
+import hmac
+import os
+import time
+from typing import Any, Dict, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from app.core.container import get_change_log, get_idempotency_store, get_job_service, get_lifecycle_service, get_vm_watch
+from app.domain.builders import vm_build_plan_stats
+from app.domain.services import JobService, VMLifecycleService
+from app.infrastructure.change_log import ChangeLog
+from app.infrastructure.governor import get_governor
+from app.infrastructure.idempotency_store import IdempotencyStore
+from app.infrastructure.profiler import SamplingProfiler
+from app.infrastructure.tracing import get_tracer
+from app.infrastructure.vm_watch import VMWatchHub
+
+# Sin token configurado /debug/profile está deshabilitado
+PROFILER_TOKEN_ENV_VAR = "VM_API_PROFILER_TOKEN"
+
+router = APIRouter()
+
+
+@router.get("/idempotency", response_model=Dict[str, Any])
+async def idempotency_stats(store: IdempotencyStore = Depends(get_idempotency_store)):
+    """Contadores del almacén de Idempotency-Key: hits, misses, coalesced, takeovers, mismatches, evictions..."""
+    return {
+        "max_entries": store.max_entries,
+        "ttl_s": store.ttl_s,
+        **store.stats(),
+    }
+
+
+@router.get("/changes", response_model=Dict[str, Any])
+async def change_log_stats(changes: ChangeLog = Depends(get_change_log)):
+    """Registro de cambios de /changes: secuencia actual, la más antigua que aún se sirve y ocupación."""
+    return changes.stats()
+
+
+@router.get("/watch", response_model=Dict[str, Any])
+async def vm_watch_stats(watch: VMWatchHub = Depends(get_vm_watch)):
+    """Watch de /vm/watch: secuencia actual, la más antigua reanudable y suscriptores conectados."""
+    return watch.stats()
+
+
+@router.get("/jobs", response_model=Dict[str, Any])
+async def job_stats(jobs: JobService = Depends(get_job_service)):
+    """Jobs en memoria, terminados retenidos, líneas del JSONL y colas."""
+    return jobs.stats()
+
+
+@router.get("/lifecycle", response_model=Dict[str, Any])
+async def lifecycle_stats(lifecycle: VMLifecycleService = Depends(get_lifecycle_service)):
+    """Transiciones de ciclo de vida: en curso, terminadas por resultado y tabla de la máquina de estados."""
+    return lifecycle.stats()
+
+
+@router.get("/builder-plans", response_model=Dict[str, Any])
+async def builder_plan_stats():
+    """Caché de planes Builder/Director compilados por (proveedor, tier, perfil, opcionales)."""
+    return vm_build_plan_stats()
+
+
+@router.get("/governor", response_model=Dict[str, Any])
+async def governor_stats():
+    """Governor de aprovisionamiento: admitidas, rechazadas, cola y espera por (proveedor, recurso) y estado de cada límite."""
+    governor = get_governor()
+    if governor is None:
+        return {"enabled": False}
+    return {"enabled": True, **governor.stats()}
+
+
+@router.get("/traces", response_model=Dict[str, Any])
+async def list_traces(
+    limit: int = Query(20, ge=1, le=500),
+    min_ms: float = Query(0.0, ge=0, description="Solo peticiones de al menos esta duración"),
+    name: Optional[str] = Query(None, description="Filtra por nombre del span raíz (p. ej. /cloud/infrastructure/create)"),
+):
+    """Peticiones recientes más lentas del ring buffer, con el desglose del primer nivel de spans."""
+    tracer = get_tracer()
+    if tracer is None:
+        return {"enabled": False}
+    return {"enabled": True, **tracer.stats(), "traces": tracer.recent(limit=limit, min_ms=min_ms, name=name)}
+
+
+@router.get("/traces/{trace_id}", response_model=Dict[str, Any])
+async def get_trace(trace_id: str):
+    """Árbol completo de spans de una traza (offset, duración y tiempo propio de cada uno)."""
+    tracer = get_tracer()
+    trace = tracer.get(trace_id) if tracer is not None else None
+    if trace is None:
+        raise HTTPException(status_code=404, detail=f"Traza {trace_id} no encontrada (o ya fuera del buffer)")
+    return trace.to_dict()
+
+
+def _require_profiler_token(x_debug_token: Optional[str] = Header(None)) -> None:
+    expected = os.environ.get(PROFILER_TOKEN_ENV_VAR)
+    if not expected:
+        raise HTTPException(status_code=403, detail=f"Profiler deshabilitado: define {PROFILER_TOKEN_ENV_VAR}")
+    if x_debug_token is None or not hmac.compare_digest(x_debug_token.encode(), expected.encode()):
+        raise HTTPException(status_code=403, detail="X-Debug-Token inválido")
+
+
+@router.get("/profile", dependencies=[Depends(_require_profiler_token)])
+async def profile(
+    seconds: float = Query(10.0, gt=0, le=60, description="Duración del muestreo"),
+    interval_ms: float = Query(10.0, ge=1, le=1000, description="Intervalo entre muestras"),
+    format: str = Query("collapsed", pattern="^(collapsed|json)$", description="collapsed (flamegraph) | json (top funciones)"),
+    idle: bool = Query(False, description="Incluir hilos ociosos (event loop en select, workers esperando)"),
+    lines: bool = Query(False, description="Agrupar por línea en lugar de por función"),
+    threads: bool = Query(True, description="Primer marco = hilo (solo collapsed)"),
+    limit: int = Query(30, ge=1, le=500, description="Funciones en el top (solo json)"),
+):
+    """
+    Muestrea todos los hilos del worker durante `seconds` y devuelve las pilas
+    en formato collapsed (flamegraph.pl, speedscope) o un resumen JSON. Requiere
+    la cabecera X-Debug-Token con el valor de VM_API_PROFILER_TOKEN.
+    """
+    if SamplingProfiler.busy():
+        raise HTTPException(status_code=409, detail="Ya hay una sesión de profiling en curso")
+    profiler = SamplingProfiler(interval_s=interval_ms / 1000.0, include_idle=idle, lines=lines)
+    try:
+        # El muestreador corre en un hilo aparte; el event loop sigue atendiendo (y se muestrea)
+        result = await asyncio.to_thread(profiler.run, seconds)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    if format == "json":
+        return result.to_dict(limit=limit)
+    filename = f"profile-{time.strftime('%Y%m%dT%H%M%S')}.folded"
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    headers.update({f"X-Profile-{k.replace('_', '-').title()}": str(v) for k, v in result.stats().items()})
+    return PlainTextResponse(result.collapsed(threads=threads), headers=headers)
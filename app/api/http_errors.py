@@ -0,0 +1,12 @@
+"""Traducción de errores de dominio a respuestas HTTP compartida por los controladores."""
+import math
+from fastapi import HTTPException
+from app.domain.errors import ProviderError, ProviderThrottledError
+
+
+def provider_error_to_http(error: ProviderError) -> HTTPException:
+    """429 (con Retry-After), 503 o 504 según el tipo de fallo del proveedor."""
+    headers = None
+    if isinstance(error, ProviderThrottledError) and error.retry_after is not None:
+        headers = {"Retry-After": str(max(1, math.ceil(error.retry_after)))}
+    return HTTPException(status_code=error.status_code, detail=str(error), headers=headers)
@@ -0,0 +1,48 @@
+"""Soporte de la cabecera Idempotency-Key para los endpoints de creación."""
+import hashlib
+import json
+from typing import Awaitable, Callable
+
+from fastapi import HTTPException, Response
+from pydantic import BaseModel
+
+from app.domain.errors import IdempotencyKeyReuseError
+from app.infrastructure.idempotency_store import IdempotencyStore, IdempotentResponse
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+
+async def run_idempotent(
+    store: IdempotencyStore,
+    scope: str,
+    key: str,
+    payload: BaseModel,
+    handler: Callable[[], Awaitable[BaseModel]],
+) -> Response:
+    """
+    Ejecuta `handler` como mucho una vez por (scope, key). Los errores HTTP del handler
+    también se guardan (salvo 5xx/429) para que un reintento reciba la misma respuesta.
+    """
+    if not key or len(key) > MAX_KEY_LENGTH:
+        raise HTTPException(status_code=400, detail=f"{IDEMPOTENCY_HEADER} debe tener entre 1 y {MAX_KEY_LENGTH} caracteres")
+    fingerprint = hashlib.sha256(payload.model_dump_json().encode("utf-8")).hexdigest()
+
+    async def execute() -> IdempotentResponse:
+        try:
+            result = await handler()
+        except HTTPException as e:
+            body = json.dumps({"detail": e.detail}).encode("utf-8")
+            return IdempotentResponse(e.status_code, body, dict(e.headers or {}))
+        return IdempotentResponse(200, result.model_dump_json().encode("utf-8"))
+
+    try:
+        stored, outcome = await store.run(scope, key, fingerprint, execute)
+    except IdempotencyKeyReuseError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    headers = dict(stored.headers)
+    if outcome != "miss":
+        headers[REPLAYED_HEADER] = "true"
+    return Response(content=stored.body, status_code=stored.status_code, media_type="application/json", headers=headers)
@@ -0,0 +1,137 @@
+"""
+Controlador de jobs de aprovisionamiento asíncrono.
+Las creaciones responden 202 + Location y el cliente consulta GET /jobs/{id}
+(con ?wait= para long-poll) o se suscribe a GET /jobs/{id}/events (SSE).
+"""
+import math
+from typing import AsyncIterator, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+
+from app.core.container import get_job_service, get_placement_service
+from app.domain.errors import JobQueueFullError
+from app.domain.factory_provider import CloudProvider
+from app.domain.schemas import VMCreateRequest, VMBuildRequest
+from app.domain.schemas.infrastructure import InfrastructureCreateRequest
+from app.domain.schemas.jobs import JobKind, JobListResponse, JobRecord, JobStatusResponse, JobSubmitResponse
+from app.domain.services import JobService, PlacementService
+
+router = APIRouter()
+
+# Tope del long-poll para no retener conexiones indefinidamente
+_MAX_WAIT_S = 60.0
+_SSE_HEARTBEAT_S = 15.0
+
+
+def _to_status(record: JobRecord) -> JobStatusResponse:
+    # El payload original puede contener credenciales: nunca se devuelve
+    return JobStatusResponse.model_validate(record.model_dump(exclude={"request"}))
+
+
+async def _submit(
+    service: JobService, response: Response, kind: JobKind, provider: str, request: dict, priority: int
+) -> JobSubmitResponse:
+    try:
+        record = await service.submit(kind, provider, request, priority=priority)
+    except JobQueueFullError as e:
+        headers = {"Retry-After": str(max(1, math.ceil(e.retry_after)))} if e.retry_after else None
+        raise HTTPException(status_code=e.status_code, detail=str(e), headers=headers)
+    status_url = f"/jobs/{record.id}"
+    response.headers["Location"] = status_url
+    return JobSubmitResponse(
+        job_id=record.id,
+        status=record.status,
+        status_url=status_url,
+        events_url=f"{status_url}/events",
+    )
+
+
+@router.post("/vm/create", response_model=JobSubmitResponse, status_code=202)
+async def submit_vm_create(
+    payload: VMCreateRequest,
+    response: Response,
+    priority: int = Query(5, ge=0, le=9, description="0 = máxima prioridad"),
+    service: JobService = Depends(get_job_service),
+):
+    return await _submit(service, response, "vm.create", payload.provider.value, payload.model_dump(mode="json"), priority)
+
+
+@router.post("/vm/build", response_model=JobSubmitResponse, status_code=202)
+async def submit_vm_build(
+    payload: VMBuildRequest,
+    response: Response,
+    priority: int = Query(5, ge=0, le=9, description="0 = máxima prioridad"),
+    service: JobService = Depends(get_job_service),
+    placement: PlacementService = Depends(get_placement_service),
+):
+    # El placement se decide al encolar: el job se persiste con proveedor y región fijos
+    try:
+        payload = placement.resolve(payload)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return await _submit(service, response, "vm.build", payload.provider.value, payload.model_dump(mode="json"), priority)
+
+
+@router.post("/infrastructure/create", response_model=JobSubmitResponse, status_code=202)
+async def submit_infrastructure_create(
+    payload: InfrastructureCreateRequest,
+    response: Response,
+    priority: int = Query(5, ge=0, le=9, description="0 = máxima prioridad"),
+    service: JobService = Depends(get_job_service),
+):
+    # Validar el proveedor antes de encolar: cada proveedor tiene su propia cola
+    try:
+        provider = CloudProvider(payload.provider.lower()).value
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Proveedor '{payload.provider}' no soportado. Proveedores disponibles: {[p.value for p in CloudProvider]}",
+        )
+    return await _submit(service, response, "infrastructure.create", provider, payload.model_dump(mode="json"), priority)
+
+
+@router.get("/", response_model=JobListResponse)
+async def list_jobs(
+    status: Optional[str] = Query(None, description="queued | running | succeeded | failed"),
+    kind: Optional[str] = Query(None, description="vm.create | vm.build | infrastructure.create"),
+    limit: int = Query(100, ge=1, le=1000),
+    service: JobService = Depends(get_job_service),
+):
+    items = [_to_status(r) for r in service.list(status=status, kind=kind, limit=limit)]
+    return JobListResponse(total=len(items), items=items)
+
+
+@router.get("/{job_id}", response_model=JobStatusResponse)
+async def get_job(
+    job_id: str,
+    wait: float = Query(0.0, ge=0.0, le=_MAX_WAIT_S, description="Long-poll: segundos a esperar a que el job termine"),
+    service: JobService = Depends(get_job_service),
+):
+    try:
+        record = await service.wait(job_id, wait) if wait else service.get(job_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Job no encontrado")
+    return _to_status(record)
+
+
+async def _sse_frames(service: JobService, job_id: str) -> AsyncIterator[bytes]:
+    async for record in service.events(job_id, heartbeat_s=_SSE_HEARTBEAT_S):
+        if record is None:
+            yield b": keep-alive\n\n"
+            continue
+        event = "done" if record.is_terminal else "progress"
+        yield f"event: {event}\ndata: {_to_status(record).model_dump_json()}\n\n".encode("utf-8")
+
+
+@router.get("/{job_id}/events")
+async def job_events(job_id: str, service: JobService = Depends(get_job_service)):
+    """Server-Sent Events con el estado del job en cada cambio; termina con `event: done`."""
+    try:
+        service.get(job_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Job no encontrado")
+    return StreamingResponse(
+        _sse_frames(service, job_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Header, Query, HTTPException
 from typing import Optional
 from app.domain.schemas.logs import LogsResponse, LogsQuery, AuditLogEntry
 from app.domain.services.log_service import LogService
+from app.infrastructure.serialization import NEGOTIATED_RESPONSES, negotiated_response
 
 router = APIRouter()
 
@@ -9,7 +10,7 @@ router = APIRouter()
 log_service = LogService()
 
 
-@router.get("/logs", response_model=LogsResponse)
+@router.get("/logs", response_model=LogsResponse, responses=NEGOTIATED_RESPONSES)
 def get_audit_logs(
     actor: Optional[str] = Query(None, description="Filtrar por actor"),
     action: Optional[str] = Query(None, description="Filtrar por acción (create, update, delete, start, stop, restart)"),
@@ -17,7 +18,8 @@ def get_audit_logs(
     success: Optional[bool] = Query(None, description="Filtrar por éxito/fallo"),
     vm_id: Optional[str] = Query(None, description="Filtrar por ID de VM"),
     page: int = Query(1, ge=1, description="Número de página"),
-    page_size: int = Query(50, ge=1, le=200, description="Tamaño de página (máx 200)")
+    page_size: int = Query(50, ge=1, le=200, description="Tamaño de página (máx 200)"),
+    accept: Optional[str] = Header(None, include_in_schema=False),
 ):
  
     try:
@@ -33,12 +35,13 @@ def get_audit_logs(
         
         logs, total = log_service.get_logs(query)
         
-        return LogsResponse(
+        # JSON, MessagePack o CBOR según Accept
+        return negotiated_response(accept, LogsResponse(
             logs=logs,
             total=total,
             page=page,
             page_size=page_size
-        )
+        ))
         
     except Exception as e:
         raise HTTPException(status_code=500, detail="Error reading logs")
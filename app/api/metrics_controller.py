@@ -0,0 +1,59 @@
+"""
+GET /metrics en formato de texto de Prometheus y middleware de latencia por ruta.
+"""
+import time
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.infrastructure.metrics import get_metrics_registry
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+HTTP_REQUEST_SECONDS = get_metrics_registry().histogram(
+    "vm_api_http_request_duration_seconds",
+    "Duración de las peticiones HTTP por método, plantilla de ruta y código de estado",
+    ("method", "route", "status"),
+)
+
+
+class RequestMetricsMiddleware:
+    """
+    Middleware ASGI puro (sin BaseHTTPMiddleware, que añade una tarea y colas
+    por petición). La ruta se etiqueta con su plantilla (/vm/{vm_id}), no con
+    la URL, para no disparar la cardinalidad; lo que no casa con ninguna ruta
+    va a "unmatched". Una excepción no controlada cuenta como 500.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        t0 = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # El router de FastAPI deja la ruta resuelta en el scope
+            route = scope.get("route")
+            HTTP_REQUEST_SECONDS.observe(
+                (scope["method"], route.path if route is not None else "unmatched", str(status)),
+                time.perf_counter() - t0,
+            )
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Contadores e histogramas de la API (peticiones, factories, repositorios, auditoría, logs)."""
+    return PlainTextResponse(get_metrics_registry().render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,72 @@
+"""
+Span raíz por petición y spans del propio FastAPI (endpoint y serialización).
+"""
+from fastapi import routing as fastapi_routing
+
+from app.infrastructure.tracing import get_tracer, span
+
+TRACE_ID_HEADER = b"x-trace-id"
+
+
+class TracingMiddleware:
+    """
+    Middleware ASGI puro: abre el span raíz de cada petición muestreada y
+    devuelve su id en X-Trace-Id para buscarla en /debug/traces/{trace_id}.
+    El span se nombra al final con la plantilla de la ruta ("POST /vm/build").
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        tracer = get_tracer()
+        if scope["type"] != "http" or tracer is None:
+            await self.app(scope, receive, send)
+            return
+        root = tracer.start_trace(f"{scope['method']} {scope['path']}", method=scope["method"], path=scope["path"])
+        if root is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_trace_id(message):
+            if message["type"] == "http.response.start":
+                root.attrs["status"] = message["status"]
+                message["headers"] = [*message.get("headers", []), (TRACE_ID_HEADER, root.trace.trace_id.encode())]
+            await send(message)
+
+        try:
+            with root:
+                await self.app(scope, receive, send_with_trace_id)
+        finally:
+            route = scope.get("route")
+            if route is not None:
+                root.name = f"{scope['method']} {route.path}"
+                root.attrs["route"] = route.path
+            root.attrs.setdefault("status", 500)
+            tracer.finish(root.trace)
+
+
+def _traced_coroutine(name, fn):
+    async def wrapper(*args, **kwargs):
+        with span(name):
+            return await fn(*args, **kwargs)
+    wrapper.__wrapped__ = fn
+    return wrapper
+
+
+def instrument_fastapi() -> None:
+    """
+    Envuelve solve_dependencies, run_endpoint_function y serialize_response de
+    fastapi.routing (el handler de cada ruta los busca como globales del módulo
+    en cada petición) para separar la validación del body y las dependencias,
+    el endpoint y la serialización de la respuesta con Pydantic. Idempotente.
+    Solo se llama con el trazado activo: sin él los globales quedan intactos.
+    """
+    for attr, name in (
+        ("solve_dependencies", "fastapi.solve_dependencies"),
+        ("run_endpoint_function", "fastapi.endpoint"),
+        ("serialize_response", "fastapi.serialize_response"),
+    ):
+        original = getattr(fastapi_routing, attr)
+        if not hasattr(original, "__wrapped__"):
+            setattr(fastapi_routing, attr, _traced_coroutine(name, original))
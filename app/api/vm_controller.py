@@ -1,30 +1,77 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import AsyncIterable, AsyncIterator, Optional, Set
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from app.domain.schemas import (
+    ProviderEnum,
+    VMDTO,
     VMCreateRequest,
     VMResponse,
     VMUpdateRequest,
     VMActionRequest,
     VMListResponse,
     VMBuildRequest,
+    VMFleetBuildRequest,
+    FleetBuildEvent,
+    CostEstimateResponse,
+    VMPlacementRequest,
+    VMPlacementResponse,
+    VMWatchPollResponse,
 )
-from app.core.container import get_vm_service
-from app.domain.services import VMService
-from app.infrastructure.logger import audit_log
+from app.core.container import (
+    get_async_vm_service,
+    get_change_log,
+    get_cost_service,
+    get_idempotency_store,
+    get_placement_service,
+    get_vm_watch,
+)
+from app.domain.services import AsyncVMService, CostService, PlacementService
+from app.infrastructure.logger import audit_log_async
+from app.domain.abstractions.lifecycle import VM_LIFECYCLE
+from app.domain.errors import InvalidTransitionError, ProviderError, WatchExpiredError
+from app.api.http_errors import provider_error_to_http
+from app.api.idempotency import IDEMPOTENCY_HEADER, run_idempotent
+from app.api.changes_controller import CHANGE_SEQ_HEADER
+from app.infrastructure.idempotency_store import IdempotencyStore
+from app.infrastructure.change_log import ChangeLog
+from app.infrastructure.serialization import NEGOTIATED_RESPONSES, FastJSONResponse, dumps, negotiated_response
+from app.infrastructure.vm_watch import VMWatchHub, WatchSelector
 
 router = APIRouter()
 
+# Número de VMs serializadas por chunk del export NDJSON (equilibrio entre
+# overhead por chunk y memoria retenida por el buffer)
+_EXPORT_CHUNK_SIZE = 500
+
+# Secuencia del watch al leer: desde dónde pedir /vm/watch?since= sin perder transiciones
+WATCH_SEQ_HEADER = "X-Watch-Seq"
+# Tope del long-poll de /vm/watch/poll y keep-alive del SSE de /vm/watch (como en /jobs)
+_MAX_WAIT_S = 60.0
+_SSE_HEARTBEAT_S = 15.0
+
 
 @router.post("/create", response_model=VMResponse)
-def create_vm(
+async def create_vm(
     payload: VMCreateRequest,
-    service: VMService = Depends(get_vm_service),
+    service: AsyncVMService = Depends(get_async_vm_service),
+    idempotency_key: Optional[str] = Header(None, alias=IDEMPOTENCY_HEADER),
+    store: IdempotencyStore = Depends(get_idempotency_store),
 ):
+    if idempotency_key is None:
+        return FastJSONResponse(await _create_vm(payload, service))
+    return await run_idempotent(store, "POST /vm/create", idempotency_key, payload, lambda: _create_vm(payload, service))
+
+
+async def _create_vm(payload: VMCreateRequest, service: AsyncVMService) -> VMResponse:
     try:
-        vm = service.create_vm(payload)
+        vm = await service.create_vm(payload)
         return VMResponse(success=True, vm=vm)
+    except ProviderError as e:
+        # Fallo transitorio del proveedor: el servicio ya lo auditó; el cliente puede reintentar
+        raise provider_error_to_http(e)
     except ValueError as e:
         # Log de error de validación sin datos sensibles
-        audit_log(
+        await audit_log_async(
             actor=payload.requested_by or "system",
             action="create",
             vm_id="n/a",
@@ -34,7 +81,7 @@ def create_vm(
         )
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        audit_log(
+        await audit_log_async(
             actor=payload.requested_by or "system",
             action="create",
             vm_id="n/a",
@@ -46,19 +93,29 @@ def create_vm(
 
 
 @router.post("/build", response_model=VMResponse)
-def build_vm(
+async def build_vm(
     payload: VMBuildRequest,
-    service: VMService = Depends(get_vm_service),
+    service: AsyncVMService = Depends(get_async_vm_service),
+    idempotency_key: Optional[str] = Header(None, alias=IDEMPOTENCY_HEADER),
+    store: IdempotencyStore = Depends(get_idempotency_store),
 ):
+    if idempotency_key is None:
+        return FastJSONResponse(await _build_vm(payload, service))
+    return await run_idempotent(store, "POST /vm/build", idempotency_key, payload, lambda: _build_vm(payload, service))
+
+
+async def _build_vm(payload: VMBuildRequest, service: AsyncVMService) -> VMResponse:
     try:
-        vm = service.build_vm(payload)
+        vm = await service.build_vm(payload)
         return VMResponse(success=True, vm=vm)
+    except ProviderError as e:
+        raise provider_error_to_http(e)
     except ValueError as e:
-        audit_log(
+        await audit_log_async(
             actor="system",
             action="create(builder)",
             vm_id="n/a",
-            provider=payload.provider.value,
+            provider=payload.provider.value if payload.provider else "auto",
             success=False,
             details={"error": str(e)},
         )
@@ -67,17 +124,192 @@ def build_vm(
         raise HTTPException(status_code=500, detail="Internal error")
 
 
+@router.post("/placement", response_model=VMPlacementResponse)
+async def score_placement(
+    payload: VMPlacementRequest,
+    limit: Optional[int] = Query(None, ge=1, description="Máximo de candidatos a devolver"),
+    placement: PlacementService = Depends(get_placement_service),
+):
+    """
+    Candidatos (proveedor, región) para la forma, ordenados como los elegiría /vm/build
+    sin provider/region: precio del tipo del sizing, holgura, cuota y capacidad on-prem.
+    """
+    try:
+        return placement.rank(payload.tier.value, payload.profile.value, payload.provider, payload.region, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+async def _fleet_lines(events: AsyncIterable[FleetBuildEvent]) -> AsyncIterator[bytes]:
+    # Una línea por evento, sin agrupar: el cliente ve cada VM en cuanto termina
+    async for event in events:
+        yield (event.model_dump_json(exclude_none=True) + "\n").encode("utf-8")
+
+
+@router.post("/build/fleet")
+async def build_fleet(
+    payload: VMFleetBuildRequest,
+    service: AsyncVMService = Depends(get_async_vm_service),
+):
+    """
+    Construye una flota (grupos de N VMs por tier/perfil/región) con Builder + Director.
+    Responde NDJSON en streaming: una línea `type=vm` por VM según van terminando y
+    una línea final `type=summary` cuando todas están guardadas.
+    """
+    return StreamingResponse(_fleet_lines(service.build_fleet(payload)), media_type="application/x-ndjson")
+
+
+def _parse_export_fields(fields: Optional[str]) -> Optional[Set[str]]:
+    if not fields:
+        return None
+    requested = {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = requested - set(VMDTO.model_fields)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Campos no válidos para export: {sorted(unknown)}. Válidos: {list(VMDTO.model_fields)}",
+        )
+    return requested
+
+
+async def _ndjson_chunks(vms: AsyncIterable[VMDTO], include: Optional[Set[str]]) -> AsyncIterator[bytes]:
+    """Serializa una VM por línea, agrupando en chunks para no pagar un write por VM."""
+    buffer = []
+    async for vm in vms:
+        buffer.append(vm.model_dump_json(include=include))
+        if len(buffer) >= _EXPORT_CHUNK_SIZE:
+            yield ("\n".join(buffer) + "\n").encode("utf-8")
+            buffer.clear()
+    if buffer:
+        yield ("\n".join(buffer) + "\n").encode("utf-8")
+
+
+@router.get("/export")
+async def export_vms(
+    fields: Optional[str] = Query(None, description="Proyección de campos separados por coma (id,name,provider,status,specs)"),
+    provider: Optional[ProviderEnum] = Query(None, description="Filtrar por proveedor"),
+    status: Optional[str] = Query(None, description="Filtrar por estado exacto (creating, running, stopped...)"),
+    name: Optional[str] = Query(None, description="Filtrar por nombre (contiene, sin distinguir mayúsculas)"),
+    service: AsyncVMService = Depends(get_async_vm_service),
+):
+    """
+    Exporta el inventario como NDJSON (un objeto JSON por línea) en streaming.
+    La memoria usada es constante respecto al tamaño de la flota: nunca se construye
+    la lista completa ni un único documento JSON.
+    """
+    include = _parse_export_fields(fields)
+    vms = service.iter_vms(provider=provider, status=status, name_contains=name)
+    return StreamingResponse(_ndjson_chunks(vms, include), media_type="application/x-ndjson")
+
+
+@router.get("/cost", response_model=CostEstimateResponse, response_model_exclude_none=True)
+async def vm_cost(
+    provider: Optional[ProviderEnum] = Query(None, description="Filtrar por proveedor"),
+    include_items: bool = Query(False, description="Incluir el coste de cada VM"),
+    service: CostService = Depends(get_cost_service),
+):
+    """Coste horario y mensual estimado del inventario de VMs (catálogo de precios)."""
+    return service.vm_cost(provider=provider.value if provider else None, include_items=include_items)
+
+
+def _watch_selector(vm_id: Optional[str], selector: Optional[str]) -> WatchSelector:
+    try:
+        return WatchSelector.parse(selector, vm_id=vm_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _check_since(watch: VMWatchHub, since: int) -> None:
+    try:
+        watch.check_since(since)
+    except WatchExpiredError as e:
+        raise HTTPException(status_code=410, detail=str(e), headers={WATCH_SEQ_HEADER: str(e.current_seq)})
+
+
+async def _watch_frames(watch: VMWatchHub, selector: WatchSelector, since: Optional[int]) -> AsyncIterator[bytes]:
+    try:
+        async for event in watch.watch(selector, since, heartbeat_s=_SSE_HEARTBEAT_S):
+            if event is None:
+                yield b": keep-alive\n\n"
+                continue
+            # id: permite al cliente reconectar con Last-Event-ID sin perder eventos
+            yield b"id: %d\nevent: %s\ndata: %s\n\n" % (event.seq, event.type.encode("ascii"), event.encoded())
+    except WatchExpiredError as e:
+        # Consumidor tan lento que el histórico ya no llega a donde se quedó: releer y volver a suscribirse
+        yield b"event: expired\ndata: %s\n\n" % dumps({"detail": str(e), "current_seq": e.current_seq})
+
+
+_WATCH_RESPONSES = {410: {"description": "`since` anterior al histórico del watch: releer la VM o el listado"}}
+
+
+@router.get("/watch", responses=_WATCH_RESPONSES)
+async def watch_vms(
+    vm_id: Optional[str] = Query(None, description="Solo esta VM"),
+    selector: Optional[str] = Query(None, description="clave=valor separados por coma (provider, status, name o specs: region...)"),
+    since: Optional[int] = Query(None, ge=0, description="Reanudar tras esta secuencia (X-Watch-Seq o el último id recibido)"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID", include_in_schema=False),
+    watch: VMWatchHub = Depends(get_vm_watch),
+):
+    """
+    Server-Sent Events con las altas, cambios de estado/specs y bajas de las VMs
+    que cumplen el filtro (toda la flota sin filtros). Cada evento lleva `id:`
+    (su secuencia), `event:` created | updated | deleted y en `data` la VM con
+    su estado anterior. Sin `since` empieza en los eventos nuevos.
+    """
+    watch_selector = _watch_selector(vm_id, selector)
+    if since is None and last_event_id and last_event_id.isdigit():
+        since = int(last_event_id)
+    if since is not None:
+        _check_since(watch, since)
+    return StreamingResponse(
+        _watch_frames(watch, watch_selector, since),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", WATCH_SEQ_HEADER: str(watch.current_seq)},
+    )
+
+
+@router.get("/watch/poll", response_model=VMWatchPollResponse, responses=_WATCH_RESPONSES)
+async def poll_vm_watch(
+    vm_id: Optional[str] = Query(None, description="Solo esta VM"),
+    selector: Optional[str] = Query(None, description="clave=valor separados por coma (provider, status, name o specs: region...)"),
+    since: Optional[int] = Query(None, ge=0, description="Última secuencia ya vista (X-Watch-Seq o next_since); sin ella, solo eventos nuevos"),
+    wait: float = Query(30.0, ge=0.0, le=_MAX_WAIT_S, description="Segundos a esperar si aún no hay eventos"),
+    limit: int = Query(1000, ge=1, le=10_000),
+    watch: VMWatchHub = Depends(get_vm_watch),
+):
+    """
+    Long-poll: eventos posteriores a `since` que cumplen el filtro; si no hay
+    ninguno responde en cuanto llegue el primero (o con la lista vacía al
+    vencer `wait`). Esperar a que una VM arranque:
+    GET /vm/{id} (X-Watch-Seq) y después ?vm_id=<id>&selector=status=running&since=<seq>.
+    """
+    watch_selector = _watch_selector(vm_id, selector)
+    start = watch.current_seq if since is None else since
+    try:
+        events, next_since = await watch.poll(watch_selector, start, wait, limit)
+    except WatchExpiredError as e:
+        raise HTTPException(status_code=410, detail=str(e), headers={WATCH_SEQ_HEADER: str(e.current_seq)})
+    # Los eventos ya guardan la VM como JSON: sin un VMWatchEvent por evento
+    response = {
+        "since": start,
+        "next_since": next_since,
+        "current_seq": watch.current_seq,
+        "events": [event.to_dict() for event in events],
+    }
+    return FastJSONResponse(response, headers={WATCH_SEQ_HEADER: str(next_since)})
+
+
 @router.put("/{vm_id}", response_model=VMResponse)
-def update_vm(
+async def update_vm(
     vm_id: str,
     payload: VMUpdateRequest,
-    service: VMService = Depends(get_vm_service),
+    service: AsyncVMService = Depends(get_async_vm_service),
 ):
     try:
-        vm = service.update_vm(vm_id, payload)
-        return VMResponse(success=True, vm=vm)
+        vm = await service.update_vm(vm_id, payload)
+        return FastJSONResponse(VMResponse(success=True, vm=vm))
     except KeyError:
-        audit_log(
+        await audit_log_async(
             actor="system",
             action="update",
             vm_id=vm_id,
@@ -87,7 +319,7 @@ def update_vm(
         )
         raise HTTPException(status_code=404, detail="VM not found")
     except ValueError as e:
-        audit_log(
+        await audit_log_async(
             actor="system",
             action="update",
             vm_id=vm_id,
@@ -98,16 +330,30 @@ def update_vm(
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.delete("/{vm_id}", response_model=VMResponse)
-def delete_vm(
+_LIFECYCLE_RESPONSES = {
+    202: {"model": VMResponse, "description": "Transición en curso: la VM queda en su estado transitorio hasta completarse"},
+    409: {"description": "La acción no está permitida en el estado actual de la VM"},
+}
+
+
+def _transition_response(vm: Optional[VMDTO]) -> FastJSONResponse:
+    """200 si la transición ya terminó; 202 si la completa el servicio de ciclo de vida en segundo plano."""
+    pending = vm is not None and VM_LIFECYCLE.is_transient(vm.status)
+    return FastJSONResponse(VMResponse(success=True, vm=vm), status_code=202 if pending else 200)
+
+
+@router.delete("/{vm_id}", response_model=VMResponse, responses=_LIFECYCLE_RESPONSES)
+async def delete_vm(
     vm_id: str,
-    service: VMService = Depends(get_vm_service),
+    service: AsyncVMService = Depends(get_async_vm_service),
 ):
     try:
-        service.delete_vm(vm_id)
-        return VMResponse(success=True, vm=None)
+        return _transition_response(await service.delete_vm(vm_id))
+    except InvalidTransitionError as e:
+        # El servicio ya auditó el intento
+        raise HTTPException(status_code=e.status_code, detail=str(e))
     except KeyError:
-        audit_log(
+        await audit_log_async(
             actor="system",
             action="delete",
             vm_id=vm_id,
@@ -118,17 +364,18 @@ def delete_vm(
         raise HTTPException(status_code=404, detail="VM not found")
 
 
-@router.post("/{vm_id}/action", response_model=VMResponse)
-def action_vm(
+@router.post("/{vm_id}/action", response_model=VMResponse, responses=_LIFECYCLE_RESPONSES)
+async def action_vm(
     vm_id: str,
     payload: VMActionRequest,
-    service: VMService = Depends(get_vm_service),
+    service: AsyncVMService = Depends(get_async_vm_service),
 ):
     try:
-        vm = service.apply_action(vm_id, payload)
-        return VMResponse(success=True, vm=vm)
+        return _transition_response(await service.apply_action(vm_id, payload))
+    except InvalidTransitionError as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
     except KeyError:
-        audit_log(
+        await audit_log_async(
             actor=payload.requested_by or "system",
             action=payload.action,
             vm_id=vm_id,
@@ -138,7 +385,7 @@ def action_vm(
         )
         raise HTTPException(status_code=404, detail="VM not found")
     except ValueError as e:
-        audit_log(
+        await audit_log_async(
             actor=payload.requested_by or "system",
             action=payload.action,
             vm_id=vm_id,
@@ -150,18 +397,33 @@ def action_vm(
 
 
 @router.get("/{vm_id}", response_model=VMResponse)
-def get_vm(
+async def get_vm(
     vm_id: str,
-    service: VMService = Depends(get_vm_service),
+    service: AsyncVMService = Depends(get_async_vm_service),
+    watch: VMWatchHub = Depends(get_vm_watch),
 ):
+    """X-Watch-Seq: desde dónde pedir /vm/watch?since= para no perder la siguiente transición."""
+    # Antes de leer la VM: una transición entre medias se vuelve a recibir en el watch
+    seq = watch.current_seq
     try:
-        vm = service.get_vm(vm_id)
-        return VMResponse(success=True, vm=vm)
+        vm = await service.get_vm(vm_id)
+        return FastJSONResponse(VMResponse(success=True, vm=vm), headers={WATCH_SEQ_HEADER: str(seq)})
     except KeyError:
         raise HTTPException(status_code=404, detail="VM not found")
 
 
-@router.get("/", response_model=VMListResponse)
-def list_vms(service: VMService = Depends(get_vm_service)):
-    vms = service.list_vms()
-    return VMListResponse(items=vms)
+@router.get("/", response_model=VMListResponse, responses=NEGOTIATED_RESPONSES)
+async def list_vms(
+    service: AsyncVMService = Depends(get_async_vm_service),
+    changes: ChangeLog = Depends(get_change_log),
+    accept: Optional[str] = Header(None, include_in_schema=False),
+):
+    """
+    Inventario completo. JSON por defecto; MessagePack o CBOR con Accept: application/msgpack | application/cbor.
+    X-Change-Seq: desde dónde pedir GET /changes para seguir sincronizado.
+    """
+    # La secuencia se lee antes del listado: lo que cambie entre medias se vuelve a recibir en /changes
+    seq = changes.current_seq
+    vms = await service.list_vms()
+    # VMDTO ya validados en el repositorio: sin revalidar contra el response_model
+    return negotiated_response(accept, VMListResponse(items=vms), headers={CHANGE_SEQ_HEADER: str(seq)})
@@ -1,10 +1,130 @@
-from app.domain.services import VMService
-from app.infrastructure.repository import VMRepository
+from typing import Any, Dict
+from pydantic import TypeAdapter
+from app.domain.schemas import VMCreateRequest, VMBuildRequest
+from app.domain.schemas.infrastructure import InfrastructureCreateRequest
+from app.domain.services import VMService, AsyncVMService, InfrastructureService, JobService, CostService, PlacementService
+from app.domain.services.job_service import JobProgressCallback
+from app.domain.services.lifecycle_service import LifecycleConfig, VMLifecycleService
+from app.infrastructure.repository import VMRepository, AsyncVMRepository
+from app.infrastructure.infrastructure_repository import InfrastructureRepository
+from app.infrastructure.change_log import ChangeLog
+from app.infrastructure.vm_watch import VMWatchHub
+from app.infrastructure.job_store import JsonlJobStore
+from app.infrastructure.idempotency_store import IdempotencyStore
+from app.infrastructure.simulation import enable_simulation_from_env
+from app.infrastructure.governor import enable_governor_from_env
+from app.infrastructure.factory_metrics import enable_factory_metrics
+from app.infrastructure.factory_tracing import enable_factory_tracing
+from app.infrastructure.tracing import enable_tracing_from_env
+from app.domain.placement import enable_placement_from_env
 
 # Contenedor simple para inyección de dependencias (DIP)
-_repo = VMRepository()
-_service = VMService(repo=_repo)
+# Secuencia de cambios compartida por VMs e infraestructuras (GET /changes)
+_change_log = ChangeLog.from_env()
+_repo = VMRepository(changes=_change_log)
+# Placement multi-proveedor de /vm/build (una caché de formas compartida)
+_placement_service = PlacementService()
+# Pub/sub de GET /vm/watch: ambos servicios publican en el mismo hub
+_vm_watch = VMWatchHub.from_env()
+_async_repo = AsyncVMRepository(_repo)
+# Completa las transiciones de ciclo de vida en segundo plano (arranca con el lifespan)
+_lifecycle_service = VMLifecycleService(repo=_async_repo, watch=_vm_watch, config=LifecycleConfig.from_env())
+_service = VMService(repo=_repo, placement=_placement_service, watch=_vm_watch, lifecycle=_lifecycle_service)
+# Variante asíncrona sobre el mismo store (ambos caminos ven el mismo inventario)
+_async_service = AsyncVMService(
+    repo=_async_repo, placement=_placement_service, watch=_vm_watch, lifecycle=_lifecycle_service
+)
+_infra_repo = InfrastructureRepository(changes=_change_log)
+_infra_service = InfrastructureService(repo=_infra_repo)
+# Retención de jobs terminados con VM_API_JOBS_RETENTION
+_job_service = JobService.from_env(store=JsonlJobStore())
+# Respuestas de creaciones con Idempotency-Key (24 h, 10k claves)
+_idempotency_store = IdempotencyStore()
+# Costes sobre el mismo inventario de VMs e infraestructuras
+_cost_service = CostService(vm_repo=_repo, infra_repo=_infra_repo)
 
 
 def get_vm_service() -> VMService:
     return _service
+
+
+async def get_async_vm_service() -> AsyncVMService:
+    # async def: FastAPI resuelve dependencias sync en el threadpool, esta no lo necesita
+    return _async_service
+
+
+async def get_infrastructure_service() -> InfrastructureService:
+    return _infra_service
+
+
+async def get_job_service() -> JobService:
+    return _job_service
+
+
+async def get_cost_service() -> CostService:
+    return _cost_service
+
+
+async def get_placement_service() -> PlacementService:
+    return _placement_service
+
+
+async def get_idempotency_store() -> IdempotencyStore:
+    return _idempotency_store
+
+
+async def get_change_log() -> ChangeLog:
+    return _change_log
+
+
+async def get_vm_watch() -> VMWatchHub:
+    return _vm_watch
+
+
+async def get_lifecycle_service() -> VMLifecycleService:
+    return _lifecycle_service
+
+
+# Handlers de jobs: re-validan el payload persistido y delegan en los servicios
+# (VMCreateRequest es una unión por proveedor: sin model_validate propio)
+_vm_create_request = TypeAdapter(VMCreateRequest)
+
+
+async def _run_vm_create(request: Dict[str, Any], progress: JobProgressCallback) -> Dict[str, Any]:
+    await progress(0, 1, "virtual_machine")
+    vm = await _async_service.create_vm(_vm_create_request.validate_python(request))
+    await progress(1, 1, "virtual_machine")
+    return vm.model_dump(mode="json")
+
+
+async def _run_vm_build(request: Dict[str, Any], progress: JobProgressCallback) -> Dict[str, Any]:
+    await progress(0, 1, "virtual_machine")
+    vm = await _async_service.build_vm(VMBuildRequest.model_validate(request))
+    await progress(1, 1, "virtual_machine")
+    return vm.model_dump(mode="json")
+
+
+async def _run_infrastructure_create(request: Dict[str, Any], progress: JobProgressCallback) -> Dict[str, Any]:
+    response = await _infra_service.create_infrastructure(
+        InfrastructureCreateRequest.model_validate(request), progress=progress
+    )
+    return response.model_dump(mode="json")
+
+
+_job_service.register_handler("vm.create", _run_vm_create)
+_job_service.register_handler("vm.build", _run_vm_build)
+_job_service.register_handler("infrastructure.create", _run_infrastructure_create)
+
+
+# Simulación opcional de latencia/fallos de proveedor (VM_API_SIMULATION)
+enable_simulation_from_env()
+# Latencia de las factories en /metrics: por fuera de la simulación y por dentro del governor
+enable_factory_metrics()
+# Límites de tasa/concurrencia/cuotas por proveedor (VM_API_GOVERNOR); tras la
+# simulación para quedar por fuera: las esperas ocurren antes de "llamar" al proveedor
+enable_governor_from_env()
+# Trazas por petición (VM_API_TRACING); el span de la factory, por fuera de todo, incluye la espera del governor
+if enable_tracing_from_env():
+    enable_factory_tracing()
+# Inventario on-prem para la colocación de VMs en hosts/datastores (VM_API_ONPREM_INVENTORY)
+enable_placement_from_env()
@@ -5,7 +5,8 @@ Esta es la interfaz principal del patrón Abstract Factory.
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
-from .products import VirtualMachine, Database, LoadBalancer, Storage
+from .products import CloudResource, ResourceStatus, VirtualMachine, Database, LoadBalancer, Storage
+from .provisioning import DEFAULT_MAX_CONCURRENCY, ProvisioningPlan, ResourceCreatedCallback, aexecute_plan, execute_plan
 
 
 class CloudAbstractFactory(ABC):
@@ -63,6 +64,94 @@ class CloudAbstractFactory(ABC):
         """Valida si la región es soportada por el proveedor"""
         pass
 
+    # ---------------------- Hooks asíncronos ----------------------
+    # Por defecto delegan en la creación síncrona (instantánea en memoria).
+    # Una factory con latencia real o simulada los sobrescribe para esperar
+    # con `await` sin ocupar un hilo del pool.
+
+    async def acreate_virtual_machine(self, name: str, vm_config: Dict[str, Any]) -> VirtualMachine:
+        """Variante asíncrona de create_virtual_machine"""
+        return self.create_virtual_machine(name, vm_config)
+
+    async def acreate_database(self, name: str, db_config: Dict[str, Any]) -> Database:
+        """Variante asíncrona de create_database"""
+        return self.create_database(name, db_config)
+
+    async def acreate_load_balancer(self, name: str, lb_config: Dict[str, Any]) -> LoadBalancer:
+        """Variante asíncrona de create_load_balancer"""
+        return self.create_load_balancer(name, lb_config)
+
+    async def acreate_storage(self, name: str, storage_config: Dict[str, Any]) -> Storage:
+        """Variante asíncrona de create_storage"""
+        return self.create_storage(name, storage_config)
+
+    # ---------------------- Eliminación (rollback) ----------------------
+
+    def delete_resource(self, resource: CloudResource) -> None:
+        """Elimina un recurso creado por esta factory (en memoria: marcarlo como eliminándose)"""
+        resource.status = ResourceStatus.DELETING
+
+    async def adelete_resource(self, resource: CloudResource) -> None:
+        """Variante asíncrona de delete_resource"""
+        self.delete_resource(resource)
+
+
+class CloudFactoryDecorator(CloudAbstractFactory):
+    """
+    Decorador base de factories: delega todo en la factory envuelta.
+    Permite añadir comportamiento transversal (simulación de latencia, límites,
+    métricas...) sin modificar las factories concretas (OCP).
+    Los métodos de capacidades propios de cada proveedor (get_supported_regions, etc.)
+    se resuelven por __getattr__ para que `hasattr` siga funcionando.
+    """
+
+    def __init__(self, inner: CloudAbstractFactory):
+        self._inner = inner
+
+    @property
+    def inner(self) -> CloudAbstractFactory:
+        return self._inner
+
+    def create_virtual_machine(self, name: str, vm_config: Dict[str, Any]) -> VirtualMachine:
+        return self._inner.create_virtual_machine(name, vm_config)
+
+    def create_database(self, name: str, db_config: Dict[str, Any]) -> Database:
+        return self._inner.create_database(name, db_config)
+
+    def create_load_balancer(self, name: str, lb_config: Dict[str, Any]) -> LoadBalancer:
+        return self._inner.create_load_balancer(name, lb_config)
+
+    def create_storage(self, name: str, storage_config: Dict[str, Any]) -> Storage:
+        return self._inner.create_storage(name, storage_config)
+
+    async def acreate_virtual_machine(self, name: str, vm_config: Dict[str, Any]) -> VirtualMachine:
+        return await self._inner.acreate_virtual_machine(name, vm_config)
+
+    async def acreate_database(self, name: str, db_config: Dict[str, Any]) -> Database:
+        return await self._inner.acreate_database(name, db_config)
+
+    async def acreate_load_balancer(self, name: str, lb_config: Dict[str, Any]) -> LoadBalancer:
+        return await self._inner.acreate_load_balancer(name, lb_config)
+
+    async def acreate_storage(self, name: str, storage_config: Dict[str, Any]) -> Storage:
+        return await self._inner.acreate_storage(name, storage_config)
+
+    def delete_resource(self, resource: CloudResource) -> None:
+        self._inner.delete_resource(resource)
+
+    async def adelete_resource(self, resource: CloudResource) -> None:
+        await self._inner.adelete_resource(resource)
+
+    def get_provider_name(self) -> str:
+        return self._inner.get_provider_name()
+
+    def validate_region(self, region: str) -> bool:
+        return self._inner.validate_region(region)
+
+    def __getattr__(self, item: str) -> Any:
+        # Solo se invoca si el atributo no existe en el decorador
+        return getattr(self._inner, item)
+
 
 class CloudResourceManager:
     """
@@ -76,51 +165,37 @@ class CloudResourceManager:
     
     def create_infrastructure(
         self, 
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        max_workers: int = DEFAULT_MAX_CONCURRENCY,
     ) -> Dict[str, Any]:
         """
         Crea una infraestructura completa usando la factory.
         Este método demuestra cómo el Abstract Factory permite crear
         familias de productos relacionados.
+
+        Los recursos se crean como un DAG (ver provisioning.py): los independientes
+        en paralelo hasta `max_workers`, y si alguno falla se eliminan los ya creados.
         """
-        infrastructure = {}
-        
-        # Crear VM si está especificada
-        if 'vm' in config:
-            vm = self._factory.create_virtual_machine(
-                name=config['vm']['name'],
-                vm_config=config['vm']['config']
-            )
-            infrastructure['vm'] = vm
-            self._resources[vm.resource_id] = vm
-        
-        # Crear Database si está especificada
-        if 'database' in config:
-            db = self._factory.create_database(
-                name=config['database']['name'],
-                db_config=config['database']['config']
-            )
-            infrastructure['database'] = db
-            self._resources[db.resource_id] = db
-        
-        # Crear Load Balancer si está especificado
-        if 'load_balancer' in config:
-            lb = self._factory.create_load_balancer(
-                name=config['load_balancer']['name'],
-                lb_config=config['load_balancer']['config']
-            )
-            infrastructure['load_balancer'] = lb
-            self._resources[lb.resource_id] = lb
-        
-        # Crear Storage si está especificado
-        if 'storage' in config:
-            storage = self._factory.create_storage(
-                name=config['storage']['name'],
-                storage_config=config['storage']['config']
-            )
-            infrastructure['storage'] = storage
-            self._resources[storage.resource_id] = storage
-        
+        plan = ProvisioningPlan.from_config(config)
+        created = execute_plan(self._factory, plan, max_workers=max_workers)
+        return self._register(plan, created)
+
+    async def acreate_infrastructure(
+        self,
+        config: Dict[str, Any],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        on_created: Optional[ResourceCreatedCallback] = None,
+    ) -> Dict[str, Any]:
+        """Variante asíncrona de create_infrastructure usando los hooks acreate_* de la factory"""
+        plan = ProvisioningPlan.from_config(config)
+        created = await aexecute_plan(self._factory, plan, max_concurrency=max_concurrency, on_created=on_created)
+        return self._register(plan, created)
+
+    def _register(self, plan: ProvisioningPlan, created: Dict[str, CloudResource]) -> Dict[str, Any]:
+        # Mismo orden de claves que el config, independientemente del orden de finalización
+        infrastructure = {key: created[key] for key in plan.nodes}
+        for resource in infrastructure.values():
+            self._resources[resource.resource_id] = resource
         return infrastructure
     
     def get_resource(self, resource_id: str) -> Optional[Any]:
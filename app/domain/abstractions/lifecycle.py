@@ -0,0 +1,96 @@
+"""
+Máquina de estados del ciclo de vida de una VM, compartida por los productos
+concretos (EC2Instance.start...) y por los servicios.
+
+    acción     desde                            durante      al terminar
+    provision  creating                         creating     running
+    start      stopped | error                  starting     running
+    stop       running                          stopping     stopped
+    restart    running                          restarting   running
+    delete     creating | running | stopped |   deleting     (borrada)
+               error
+
+Cada acción tiene estados de origen válidos, un estado transitorio mientras se
+ejecuta y un estado final (None en
+delete: la VM desaparece). Si la ejecución falla la VM queda en error, desde
+donde solo se puede arrancar o borrar.
+"""
+from __future__ import annotations
+from typing import Dict, FrozenSet, Optional, Tuple
+
+from app.domain.errors import InvalidTransitionError
+from .products import ResourceStatus
+
+PROVISION = "provision"
+START = "start"
+STOP = "stop"
+RESTART = "restart"
+DELETE = "delete"
+
+
+class LifecycleTransition:
+    __slots__ = ("action", "sources", "transient", "target")
+
+    def __init__(self, action: str, sources: FrozenSet[str], transient: str, target: Optional[str]):
+        self.action = action
+        self.sources = sources
+        self.transient = transient
+        self.target = target
+
+
+def _states(*statuses: ResourceStatus) -> FrozenSet[str]:
+    return frozenset(s.value for s in statuses)
+
+
+_S = ResourceStatus
+
+
+class VMLifecycle:
+    def __init__(self, transitions: Tuple[LifecycleTransition, ...]):
+        self._transitions: Dict[str, LifecycleTransition] = {t.action: t for t in transitions}
+        self.transient_states = frozenset(t.transient for t in transitions)
+        # Acciones permitidas por estado, para los mensajes de error y la documentación
+        self._allowed: Dict[str, Tuple[str, ...]] = {}
+        for t in transitions:
+            for source in t.sources:
+                self._allowed[source] = self._allowed.get(source, ()) + (t.action,)
+
+    @property
+    def actions(self) -> Tuple[str, ...]:
+        return tuple(self._transitions)
+
+    def allowed_actions(self, status: str) -> Tuple[str, ...]:
+        return self._allowed.get(str(status), ())
+
+    def is_transient(self, status: str) -> bool:
+        return status in self.transient_states
+
+    def transition(self, status: str, action: str) -> LifecycleTransition:
+        """Transición de `action` desde `status`; InvalidTransitionError si no está permitida."""
+        transition = self._transitions.get(action)
+        if transition is None:
+            raise ValueError(f"Acción de ciclo de vida desconocida: {action}")
+        status = getattr(status, "value", status)
+        if status not in transition.sources:
+            raise InvalidTransitionError(status, action, self.allowed_actions(status))
+        return transition
+
+    def describe(self) -> Dict[str, Dict[str, object]]:
+        return {
+            t.action: {"from": sorted(t.sources), "via": t.transient, "to": t.target}
+            for t in self._transitions.values()
+        }
+
+
+VM_LIFECYCLE = VMLifecycle((
+    LifecycleTransition(PROVISION, _states(_S.CREATING), _S.CREATING.value, _S.RUNNING.value),
+    LifecycleTransition(START, _states(_S.STOPPED, _S.ERROR), _S.STARTING.value, _S.RUNNING.value),
+    LifecycleTransition(STOP, _states(_S.RUNNING), _S.STOPPING.value, _S.STOPPED.value),
+    LifecycleTransition(RESTART, _states(_S.RUNNING), _S.RESTARTING.value, _S.RUNNING.value),
+    LifecycleTransition(DELETE, _states(_S.CREATING, _S.RUNNING, _S.STOPPED, _S.ERROR), _S.DELETING.value, None),
+))
+
+
+def complete_transition(vm, action: str) -> None:
+    """Para los productos concretos (síncronos): valida `action` y deja la VM en su estado final."""
+    vm.status = ResourceStatus(VM_LIFECYCLE.transition(vm.status, action).target)
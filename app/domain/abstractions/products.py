@@ -9,10 +9,13 @@ from enum import Enum
 
 
 class ResourceStatus(str, Enum):
-    """Estados posibles de los recursos"""
+    """Estados posibles de los recursos (transiciones de VMs en abstractions/lifecycle.py)"""
     CREATING = "creating"
     RUNNING = "running" 
     STOPPED = "stopped"
+    STARTING = "starting"
+    STOPPING = "stopping"
+    RESTARTING = "restarting"
     DELETING = "deleting"
     ERROR = "error"
 
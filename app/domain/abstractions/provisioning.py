@@ -0,0 +1,239 @@
+"""
+Creación de infraestructura como un DAG de recursos.
+
+Cada recurso declara de qué otros depende (p. ej. el load balancer necesita la
+VM a la que apunta) y se crea en cuanto sus dependencias existen, con un máximo
+de creaciones simultáneas. Así la latencia total es la del camino crítico y no
+la suma de todos los recursos. Si una creación falla, no se lanzan más, se
+espera a las que estaban en curso (ya existen en el proveedor) y se eliminan
+todas las creadas en orden topológico inverso (rollback). En el camino async
+lo mismo ocurre si se cancela a quien espera el plan (parada de los workers de
+jobs, petición idempotente cancelada): la cancelación se propaga después.
+"""
+from __future__ import annotations
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .products import CloudResource
+
+if TYPE_CHECKING:
+    # factory.py importa este módulo (CloudResourceManager): sólo para anotaciones
+    from .factory import CloudAbstractFactory
+
+# Claves del config de CloudResourceManager → tipo de recurso de la factory
+RESOURCE_TYPES_BY_KEY: Dict[str, str] = {
+    "vm": "virtual_machine",
+    "database": "database",
+    "load_balancer": "load_balancer",
+    "storage": "storage",
+}
+# Dependencias por defecto: el LB registra la VM como target; BD y storage son independientes
+DEFAULT_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {"load_balancer": ("vm",)}
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Callback al crear cada recurso: (clave, recurso)
+ResourceCreatedCallback = Callable[[str, CloudResource], Awaitable[None]]
+
+
+class ResourceNode:
+    """Un recurso a crear: clave en el config, nombre, configuración y dependencias."""
+
+    def __init__(self, key: str, name: str, config: Dict[str, Any], depends_on: Sequence[str] = ()):
+        if key not in RESOURCE_TYPES_BY_KEY:
+            raise ValueError(f"Recurso desconocido en la infraestructura: {key}. Válidos: {list(RESOURCE_TYPES_BY_KEY)}")
+        self.key = key
+        self.resource_type = RESOURCE_TYPES_BY_KEY[key]
+        self.name = name
+        self.config = config
+        self.depends_on = tuple(depends_on)
+
+    def create(self, factory: CloudAbstractFactory) -> CloudResource:
+        return getattr(factory, f"create_{self.resource_type}")(self.name, self.config)
+
+    async def acreate(self, factory: CloudAbstractFactory) -> CloudResource:
+        return await getattr(factory, f"acreate_{self.resource_type}")(self.name, self.config)
+
+
+class ProvisioningPlan:
+    """Nodos validados (dependencias existentes, sin ciclos) en orden topológico."""
+
+    def __init__(self, nodes: Iterable[ResourceNode]):
+        self.nodes: Dict[str, ResourceNode] = {node.key: node for node in nodes}
+        self.order: List[str] = self._topological_order()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "ProvisioningPlan":
+        """
+        Construye el plan desde el config de CloudResourceManager. Cada entrada puede
+        declarar `depends_on`; si no, se usan DEFAULT_DEPENDENCIES (filtradas a los
+        recursos presentes: sin VM, el LB no espera a nada).
+        """
+        nodes = []
+        for key, entry in config.items():
+            if key not in RESOURCE_TYPES_BY_KEY:
+                continue
+            if "depends_on" in entry:
+                depends_on = tuple(entry["depends_on"])
+            else:
+                depends_on = tuple(d for d in DEFAULT_DEPENDENCIES.get(key, ()) if d in config)
+            nodes.append(ResourceNode(key, entry["name"], entry["config"], depends_on))
+        return cls(nodes)
+
+    def _topological_order(self) -> List[str]:
+        pending = {key: set(node.depends_on) for key, node in self.nodes.items()}
+        for key, deps in pending.items():
+            unknown = deps - self.nodes.keys()
+            if unknown:
+                raise ValueError(f"'{key}' depende de recursos no incluidos: {sorted(unknown)}")
+        order: List[str] = []
+        while pending:
+            ready = [key for key, deps in pending.items() if not deps]
+            if not ready:
+                raise ValueError(f"Dependencias cíclicas entre recursos: {sorted(pending)}")
+            for key in ready:
+                del pending[key]
+                order.append(key)
+            for deps in pending.values():
+                deps.difference_update(ready)
+        return order
+
+    def critical_path_length(self, cost: Callable[[ResourceNode], float]) -> float:
+        """Coste del camino más largo del DAG (cota inferior de la latencia total)."""
+        finish: Dict[str, float] = {}
+        for key in self.order:
+            node = self.nodes[key]
+            finish[key] = cost(node) + max((finish[d] for d in node.depends_on), default=0.0)
+        return max(finish.values(), default=0.0)
+
+
+def _rollback(factory: CloudAbstractFactory, plan: ProvisioningPlan, created: Dict[str, CloudResource]) -> None:
+    for key in reversed(plan.order):
+        resource = created.get(key)
+        if resource is None:
+            continue
+        try:
+            factory.delete_resource(resource)
+            print(f"↩️ Rollback: {resource.get_resource_type()} {resource.name} eliminado")
+        except Exception as e:
+            print(f"⚠️ Rollback de {resource.name} falló: {e}")
+
+
+async def _arollback(factory: CloudAbstractFactory, plan: ProvisioningPlan, created: Dict[str, CloudResource]) -> None:
+    for key in reversed(plan.order):
+        resource = created.get(key)
+        if resource is None:
+            continue
+        try:
+            await factory.adelete_resource(resource)
+            print(f"↩️ Rollback: {resource.get_resource_type()} {resource.name} eliminado")
+        except Exception as e:
+            print(f"⚠️ Rollback de {resource.name} falló: {e}")
+
+
+def execute_plan(
+    factory: CloudAbstractFactory,
+    plan: ProvisioningPlan,
+    max_workers: int = DEFAULT_MAX_CONCURRENCY,
+) -> Dict[str, CloudResource]:
+    """Ejecuta el plan en un ThreadPoolExecutor acotado (camino síncrono)."""
+    created: Dict[str, CloudResource] = {}
+    remaining = {key: set(node.depends_on) for key, node in plan.nodes.items()}
+    running: Dict[Future, str] = {}
+    error: Optional[BaseException] = None
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="provisioning") as executor:
+        while remaining or running:
+            if error is None:
+                for key in [k for k, deps in remaining.items() if not deps]:
+                    del remaining[key]
+                    running[executor.submit(plan.nodes[key].create, factory)] = key
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = running.pop(future)
+                exc = future.exception()
+                if exc is not None:
+                    error = error or exc
+                    continue
+                created[key] = future.result()
+                for deps in remaining.values():
+                    deps.discard(key)
+
+    if error is not None:
+        _rollback(factory, plan, created)
+        raise error
+    return created
+
+
+async def aexecute_plan(
+    factory: CloudAbstractFactory,
+    plan: ProvisioningPlan,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    on_created: Optional[ResourceCreatedCallback] = None,
+) -> Dict[str, CloudResource]:
+    """Ejecuta el plan con una tarea por recurso y un semáforo de `max_concurrency`."""
+    created: Dict[str, CloudResource] = {}
+    semaphore = asyncio.Semaphore(max_concurrency)
+    aborted = asyncio.Event()
+    tasks: Dict[str, asyncio.Task] = {}
+
+    async def run(node: ResourceNode) -> None:
+        if node.depends_on:
+            # Si una dependencia falló, esta tarea falla también y nunca se lanza
+            await asyncio.gather(*(tasks[d] for d in node.depends_on))
+        async with semaphore:
+            if aborted.is_set():
+                return
+            try:
+                resource = await node.acreate(factory)
+            except BaseException:
+                aborted.set()
+                raise
+        created[node.key] = resource
+        if on_created is not None:
+            await on_created(node.key, resource)
+
+    # En orden topológico, así tasks[d] ya existe cuando se crea la tarea que depende de d
+    for key in plan.order:
+        tasks[key] = asyncio.create_task(run(plan.nodes[key]))
+    # Se espera a todas (también a las que estaban en curso al fallar otra) antes del
+    # rollback. wait y no gather: al cancelar a quien espera, gather cancelaría las
+    # creaciones en curso, que pueden terminar en el proveedor sin quedar en `created`
+    try:
+        if tasks:
+            await asyncio.wait(tasks.values())
+    except BaseException:
+        aborted.set()
+        # shield: el rollback termina aunque vuelvan a cancelar a quien espera
+        await asyncio.shield(asyncio.ensure_future(_adrain(factory, plan, tasks, created)))
+        raise
+
+    # Lista y no next(): se consultan todas para que ninguna quede como "never retrieved"
+    errors = [e for e in map(_task_error, tasks.values()) if e is not None]
+    if errors:
+        await _arollback(factory, plan, created)
+        raise errors[0]
+    return created
+
+
+def _task_error(task: asyncio.Task) -> Optional[BaseException]:
+    """Error de una tarea terminada (consultarlo la marca como recuperada)."""
+    if task.cancelled():
+        return asyncio.CancelledError()
+    return task.exception()
+
+
+async def _adrain(
+    factory: CloudAbstractFactory,
+    plan: ProvisioningPlan,
+    tasks: Dict[str, asyncio.Task],
+    created: Dict[str, CloudResource],
+) -> None:
+    """Plan abandonado: deja terminar las creaciones en curso (ya no se lanzan más) y deshace todo."""
+    if tasks:
+        await asyncio.wait(tasks.values())
+    for task in tasks.values():
+        _task_error(task)  # marcar como recuperadas: el error que se propaga es la cancelación
+    await _arollback(factory, plan, created)
@@ -3,6 +3,8 @@ from .vm_builders_concrete import (
     AWSVMBuilder, AzureVMBuilder, GCPVMBuilder, OnPremVMBuilder, OracleVMBuilder
 )
 from .director import VMTierDirector
+from .registry import VMBuilderRegistry, create_vm_builder, register_vm_builder
+from .plans import VMBuildPlan, build_vm_config, construct_vm_config, vm_build_plan_stats
 
 __all__ = [
     "VMBuilder",
@@ -12,4 +14,11 @@ __all__ = [
     "OnPremVMBuilder",
     "OracleVMBuilder",
     "VMTierDirector",
+    "VMBuilderRegistry",
+    "create_vm_builder",
+    "register_vm_builder",
+    "VMBuildPlan",
+    "build_vm_config",
+    "construct_vm_config",
+    "vm_build_plan_stats",
 ]
@@ -2,6 +2,7 @@ from __future__ import annotations
 from typing import Dict, Any, Optional, List
 from .vm_builder import Director, VMBuilder
 from app.domain.schemas.common import VMProfile
+from app.domain.catalog import get_sizing_engine
 
 
 class VMTierDirector(Director):
@@ -34,9 +35,9 @@ class VMTierDirector(Director):
         builder.set_name(name)
         builder.set_region(region)
 
-        # 1) Selección de CPU/RAM según perfil + tier (valores didácticos por proveedor)
-        # La traducción específica a instance_type/vm_size/machine_type la hace el builder
-        builder.set_cpu_ram_by_tier(self._resolve_effective_tier(profile, tier))
+        # 1) Selección de CPU/RAM según perfil + tier: el builder elige en el catálogo
+        # del proveedor el tipo más barato que cubre los requisitos (motor de sizing)
+        builder.set_cpu_ram_by_tier(tier, profile)
 
         # 2) Defaults de imagen y red por proveedor
         builder.set_image_defaults()
@@ -58,26 +59,13 @@ class VMTierDirector(Director):
         if storage_iops is not None:
             config["storage_iops"] = storage_iops
 
-        # 4) Añadir anotaciones didácticas de vCPU/RAM (derivadas de tier genérico)
-        vcpus, mem_gb = self._tier_to_compute(tier)
+        # 4) vCPU/RAM: los builders anotan los del tipo elegido; si no, los requisitos del tier
+        vcpus, mem_gb = self._tier_to_compute(tier, profile)
         config.setdefault("vcpus", vcpus)
         config.setdefault("memory_gb", mem_gb)
 
         return builder.build()
 
-    def _resolve_effective_tier(self, profile: VMProfile, tier: str) -> str:
-        """Permite ajustar el tier si el perfil requiere otra familia de tipos.
-        Por ahora devolvemos el mismo tier; el mapping por proveedor se hace en cada builder
-        con su propia tabla por perfil si fuera necesario. Esta función queda para futura expansión.
-        """
-        return tier
-
-    def _tier_to_compute(self, tier: str) -> tuple[int, int]:
-        """Conversión didáctica de tier a (vCPUs, RAM GiB), usada para exponer en specs."""
-        mapping = {
-            "small": (2, 4),
-            "medium": (4, 8),
-            "large": (8, 16),
-            "xlarge": (16, 32),
-        }
-        return mapping.get(tier, (2, 4))
+    def _tier_to_compute(self, tier: str, profile: VMProfile = VMProfile.general) -> tuple[int, float]:
+        """Requisitos mínimos (vCPUs, RAM GiB) del tier bajo el perfil."""
+        return get_sizing_engine().requirements(tier, getattr(profile, "value", profile))
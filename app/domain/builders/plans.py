@@ -0,0 +1,116 @@
+"""
+Planes de construcción de VM memoizados.
+
+El resultado de Director + Builder sólo depende de (proveedor, tier, perfil,
+opcionales): el nombre no entra en el config y la región sólo se copia en
+config["region"]. Un plan guarda ese config ya resuelto y cada petición sólo
+estampa la región, en lugar de repetir reset → set_* → build.
+
+Al compilar se construye con dos regiones centinela: si un builder derivase
+algo más de la región (p. ej. la zona), el plan se marca dependiente de la
+región y se cachea por región, así la memoización nunca cambia el resultado.
+"""
+from __future__ import annotations
+import copy
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from app.domain.schemas.common import VMBuildRequest
+from .director import VMTierDirector
+from .registry import create_vm_builder
+
+PLAN_CACHE_SIZE = 1024
+_SENTINEL_REGIONS = ("__plan-region-a__", "__plan-region-b__")
+
+# (proveedor, tier, perfil, key_pair_name, firewall_rules, public_ip,
+#  memory_optimization, disk_optimization, storage_iops)
+PlanKey = Tuple[Any, ...]
+
+
+class VMBuildPlan:
+    """Config resuelta para una forma de VM; stamp() produce el config de cada petición."""
+
+    __slots__ = ("template", "region_dependent", "_mutable_keys")
+
+    def __init__(self, template: Dict[str, Any], region_dependent: bool = False):
+        self.template = template
+        self.region_dependent = region_dependent
+        self._mutable_keys = tuple(k for k, v in template.items() if isinstance(v, (list, dict, set)))
+
+    def stamp(self, region: str) -> Dict[str, Any]:
+        config = dict(self.template)
+        # Las listas (firewall_rules/security_groups...) no se comparten entre VMs;
+        # contienen escalares, basta una copia superficial
+        for key in self._mutable_keys:
+            config[key] = copy.copy(self.template[key])
+        config["region"] = region
+        return config
+
+
+def construct_vm_config(data: VMBuildRequest) -> Dict[str, Any]:
+    """Camino sin memoizar: Director + Builder del proveedor → config para la Abstract Factory."""
+    return _construct(plan_key(data), data.name, data.region)
+
+
+def plan_key(data: VMBuildRequest) -> PlanKey:
+    # provider/profile ya vienen validados como Enum por Pydantic
+    return (
+        data.provider,
+        data.tier.value,
+        data.profile,
+        data.key_pair_name,
+        tuple(data.firewall_rules) if data.firewall_rules is not None else None,
+        data.public_ip,
+        data.memory_optimization,
+        data.disk_optimization,
+        data.storage_iops,
+    )
+
+
+def _construct(key: PlanKey, name: str, region: str) -> Dict[str, Any]:
+    provider, tier, profile, key_pair_name, firewall_rules, public_ip, memory_opt, disk_opt, storage_iops = key
+    return VMTierDirector().construct(
+        create_vm_builder(provider),
+        name=name,
+        region=region,
+        tier=tier,
+        profile=profile,
+        key_pair_name=key_pair_name,
+        firewall_rules=list(firewall_rules) if firewall_rules is not None else None,
+        public_ip=public_ip,
+        memory_optimization=memory_opt,
+        disk_optimization=disk_opt,
+        storage_iops=storage_iops,
+    )
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _compile_plan(key: PlanKey, region: Optional[str]) -> VMBuildPlan:
+    if region is not None:
+        return VMBuildPlan(_construct(key, "", region), region_dependent=True)
+    first, second = (_construct(key, "", r) for r in _SENTINEL_REGIONS)
+    first_rest = {k: v for k, v in first.items() if k != "region"}
+    second_rest = {k: v for k, v in second.items() if k != "region"}
+    return VMBuildPlan(first, region_dependent=first_rest != second_rest)
+
+
+def get_vm_build_plan(data: VMBuildRequest) -> VMBuildPlan:
+    key = plan_key(data)
+    plan = _compile_plan(key, None)
+    if plan.region_dependent:
+        plan = _compile_plan(key, data.region)
+    return plan
+
+
+def build_vm_config(data: VMBuildRequest) -> Dict[str, Any]:
+    """Config de la VM a partir del plan memoizado (mismo resultado que construct_vm_config)."""
+    return get_vm_build_plan(data).stamp(data.region)
+
+
+def vm_build_plan_stats() -> Dict[str, int]:
+    info = _compile_plan.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "max_size": info.maxsize}
+
+
+def clear_vm_build_plans() -> None:
+    _compile_plan.cache_clear()
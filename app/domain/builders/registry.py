@@ -0,0 +1,49 @@
+"""
+Registro de builders por proveedor (patrón Registry, igual que FactoryProvider).
+Sustituye la cadena if/elif: añadir un proveedor es registrar su builder (OCP).
+"""
+from typing import Dict, List, Type
+
+from app.domain.schemas.common import ProviderEnum
+from .vm_builder import VMBuilder
+from .vm_builders_concrete import AWSVMBuilder, AzureVMBuilder, GCPVMBuilder, OnPremVMBuilder, OracleVMBuilder
+
+
+class VMBuilderRegistry:
+    def __init__(self):
+        self._builders: Dict[ProviderEnum, Type[VMBuilder]] = {}
+        self._register_default_builders()
+
+    def _register_default_builders(self) -> None:
+        self.register_builder(ProviderEnum.aws, AWSVMBuilder)
+        self.register_builder(ProviderEnum.azure, AzureVMBuilder)
+        self.register_builder(ProviderEnum.gcp, GCPVMBuilder)
+        self.register_builder(ProviderEnum.onpremise, OnPremVMBuilder)
+        self.register_builder(ProviderEnum.oracle, OracleVMBuilder)
+
+    def register_builder(self, provider: ProviderEnum, builder_class: Type[VMBuilder]) -> None:
+        self._builders[ProviderEnum(provider)] = builder_class
+
+    def create_builder(self, provider: ProviderEnum) -> VMBuilder:
+        builder_class = self._builders.get(provider)
+        if builder_class is None:
+            raise ValueError(f"Proveedor no soportado: {provider}")
+        return builder_class()
+
+    def providers(self) -> List[ProviderEnum]:
+        return list(self._builders)
+
+
+_registry = VMBuilderRegistry()
+
+
+def create_vm_builder(provider: ProviderEnum) -> VMBuilder:
+    return _registry.create_builder(provider)
+
+
+def register_vm_builder(provider: ProviderEnum, builder_class: Type[VMBuilder]) -> None:
+    """Registra (o reemplaza) el builder de un proveedor e invalida los planes compilados."""
+    from .plans import clear_vm_build_plans  # plans depende de este módulo
+
+    _registry.register_builder(provider, builder_class)
+    clear_vm_build_plans()
@@ -2,6 +2,8 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Dict, Any
 
+from app.domain.catalog import InstanceType, get_sizing_engine
+
 
 class VMBuilder(ABC):
     """
@@ -10,6 +12,9 @@ class VMBuilder(ABC):
     correspondiente (create_virtual_machine(name, config)).
     """
 
+    # Clave del proveedor en el catálogo de instancias (app.domain.catalog)
+    provider_key: str = ""
+
     def __init__(self):
         self._config: Dict[str, Any] = {}
         self._name: str = ""
@@ -32,9 +37,16 @@ class VMBuilder(ABC):
         """
         return self._config
 
+    def _select_instance(self, tier: str, profile: str) -> InstanceType:
+        """Tipo más barato del catálogo que cubre el tier bajo el perfil; anota vcpus/memory_gb reales."""
+        instance = get_sizing_engine().select_for_tier(self.provider_key, tier, getattr(profile, "value", profile))
+        self._config["vcpus"] = instance.vcpus
+        self._config["memory_gb"] = instance.ram_gb
+        return instance
+
     @abstractmethod
-    def set_cpu_ram_by_tier(self, tier: str) -> "VMBuilder":
-        """Asigna valores de CPU/RAM en función del tier (small/medium/large/etc)."""
+    def set_cpu_ram_by_tier(self, tier: str, profile: str = "general") -> "VMBuilder":
+        """Asigna valores de CPU/RAM en función del tier (small/medium/large/etc) y el perfil."""
         raise NotImplementedError
 
     @abstractmethod
@@ -1,20 +1,17 @@
 from __future__ import annotations
 from typing import Dict, Any
+from app.domain.catalog import get_provider_catalog
 from .vm_builder import VMBuilder
 
 
 class AWSVMBuilder(VMBuilder):
     """Builder para AWS EC2 config."""
 
-    def set_cpu_ram_by_tier(self, tier: str) -> "AWSVMBuilder":
-        # Mapear tiers a instance types (simplificado)
-        mapping = {
-            "small": "t3.micro",
-            "medium": "t3.small",
-            "large": "t3.medium",
-            "xlarge": "m5.large",
-        }
-        self._config["instance_type"] = mapping.get(tier, "t3.micro")
+    provider_key = "aws"
+
+    def set_cpu_ram_by_tier(self, tier: str, profile: str = "general") -> "AWSVMBuilder":
+        # Tipo más barato del catálogo que cubre tier + perfil (motor de sizing compartido)
+        self._config["instance_type"] = self._select_instance(tier, profile).name
         return self
 
     def set_image_defaults(self) -> "AWSVMBuilder":
@@ -38,14 +35,11 @@ class AWSVMBuilder(VMBuilder):
 class AzureVMBuilder(VMBuilder):
     """Builder para Azure VM config."""
 
-    def set_cpu_ram_by_tier(self, tier: str) -> "AzureVMBuilder":
-        mapping = {
-            "small": "Standard_B1s",
-            "medium": "Standard_B2s",
-            "large": "Standard_D2s_v3",
-            "xlarge": "Standard_D4s_v3",
-        }
-        self._config["vm_size"] = mapping.get(tier, "Standard_B1s")
+    provider_key = "azure"
+
+    def set_cpu_ram_by_tier(self, tier: str, profile: str = "general") -> "AzureVMBuilder":
+        # Tipo más barato del catálogo que cubre tier + perfil (motor de sizing compartido)
+        self._config["vm_size"] = self._select_instance(tier, profile).name
         return self
 
     def set_image_defaults(self) -> "AzureVMBuilder":
@@ -73,14 +67,11 @@ class AzureVMBuilder(VMBuilder):
 class GCPVMBuilder(VMBuilder):
     """Builder para GCP Compute Engine config."""
 
-    def set_cpu_ram_by_tier(self, tier: str) -> "GCPVMBuilder":
-        mapping = {
-            "small": "e2-micro",
-            "medium": "e2-small",
-            "large": "e2-medium",
-            "xlarge": "e2-standard-2",
-        }
-        self._config["machine_type"] = mapping.get(tier, "e2-micro")
+    provider_key = "gcp"
+
+    def set_cpu_ram_by_tier(self, tier: str, profile: str = "general") -> "GCPVMBuilder":
+        # Tipo más barato del catálogo que cubre tier + perfil (motor de sizing compartido)
+        self._config["machine_type"] = self._select_instance(tier, profile).name
         return self
 
     def set_image_defaults(self) -> "GCPVMBuilder":
@@ -89,7 +80,9 @@ class GCPVMBuilder(VMBuilder):
         return self
 
     def set_network_defaults(self) -> "GCPVMBuilder":
-        self._config.setdefault("zone", "us-central1-a")
+        # La VM toma su región de la zona: tiene que ser una zona de la región pedida
+        region = self._config.get("region", "us-central1")
+        self._config.setdefault("zone", get_provider_catalog("gcp").default_zone(region) or f"{region}-a")
         self._config.setdefault("project", "demo-project")
         return self
 
@@ -101,16 +94,13 @@ class GCPVMBuilder(VMBuilder):
 class OnPremVMBuilder(VMBuilder):
     """Builder para OnPrem VM config."""
 
-    def set_cpu_ram_by_tier(self, tier: str) -> "OnPremVMBuilder":
-        mapping = {
-            "small": (2, 4),
-            "medium": (4, 8),
-            "large": (8, 16),
-            "xlarge": (16, 32),
-        }
-        cpu, ram = mapping.get(tier, (2, 4))
-        self._config["cpu"] = cpu
-        self._config["ram_gb"] = ram
+    provider_key = "onprem"
+
+    def set_cpu_ram_by_tier(self, tier: str, profile: str = "general") -> "OnPremVMBuilder":
+        # Sin tipos de instancia: el catálogo on-prem son tamaños (cpu, ram)
+        instance = self._select_instance(tier, profile)
+        self._config["cpu"] = instance.vcpus
+        self._config["ram_gb"] = instance.ram_gb
         self._config.setdefault("disk_gb", 50)
         return self
 
@@ -130,14 +120,11 @@ class OnPremVMBuilder(VMBuilder):
 class OracleVMBuilder(VMBuilder):
     """Builder para Oracle Compute config."""
 
-    def set_cpu_ram_by_tier(self, tier: str) -> "OracleVMBuilder":
-        mapping = {
-            "small": "VM.Standard2.1",
-            "medium": "VM.Standard2.2",
-            "large": "VM.Standard2.4",
-            "xlarge": "VM.Standard2.8",
-        }
-        self._config["compute_shape"] = mapping.get(tier, "VM.Standard2.1")
+    provider_key = "oracle"
+
+    def set_cpu_ram_by_tier(self, tier: str, profile: str = "general") -> "OracleVMBuilder":
+        # Tipo más barato del catálogo que cubre tier + perfil (motor de sizing compartido)
+        self._config["compute_shape"] = self._select_instance(tier, profile).name
         return self
 
     def set_image_defaults(self) -> "OracleVMBuilder":
@@ -0,0 +1,25 @@
+# Catálogos de proveedores (instancias, precios, regiones...) y motor de sizing
+from .instances import InstanceType, INSTANCE_CATALOG, FAMILIES, instance_types, instance_type_names
+from .sizing import SizingEngine, get_sizing_engine, TIER_REQUIREMENTS, PROFILE_RAM_PER_VCPU
+from .pricing import PriceCatalog, CostEstimate, PRICE_CATALOG, HOURS_PER_MONTH, get_price_catalog
+from .providers import ProviderCatalog, PROVIDER_CATALOG, get_provider_catalog
+
+__all__ = [
+    "InstanceType",
+    "INSTANCE_CATALOG",
+    "FAMILIES",
+    "instance_types",
+    "instance_type_names",
+    "SizingEngine",
+    "get_sizing_engine",
+    "TIER_REQUIREMENTS",
+    "PROFILE_RAM_PER_VCPU",
+    "PriceCatalog",
+    "CostEstimate",
+    "PRICE_CATALOG",
+    "HOURS_PER_MONTH",
+    "get_price_catalog",
+    "ProviderCatalog",
+    "PROVIDER_CATALOG",
+    "get_provider_catalog",
+]
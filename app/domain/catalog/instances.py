@@ -0,0 +1,142 @@
+"""
+Catálogo de tipos de instancia por proveedor: vCPU, RAM, precio por hora y familia.
+
+Precios on-demand aproximados (USD/h, región de referencia); son didácticos y
+sirven para comparar opciones, no para facturar. Familias:
+- general: propósito general (incluye burstable)
+- memory: optimizadas para memoria
+- compute: optimizadas para cómputo
+On-premise no tiene tipos de instancia: se generan tamaños (cpu, ram) con un
+coste amortizado por vCPU y GB para poder compararlos igual.
+"""
+from typing import Dict, List, Tuple
+
+FAMILIES = ("general", "memory", "compute")
+
+
+class InstanceType:
+    __slots__ = ("name", "vcpus", "ram_gb", "price_hour", "family")
+
+    def __init__(self, name: str, vcpus: int, ram_gb: float, price_hour: float, family: str):
+        if family not in FAMILIES:
+            raise ValueError(f"Familia desconocida: {family}. Válidas: {list(FAMILIES)}")
+        self.name = name
+        self.vcpus = vcpus
+        self.ram_gb = ram_gb
+        self.price_hour = price_hour
+        self.family = family
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "name": self.name,
+            "vcpus": self.vcpus,
+            "ram_gb": self.ram_gb,
+            "price_hour": self.price_hour,
+            "family": self.family,
+        }
+
+    def __repr__(self) -> str:
+        return f"InstanceType({self.name!r}, {self.vcpus} vCPU, {self.ram_gb} GB, {self.price_hour}/h, {self.family})"
+
+
+def _types(family: str, rows: List[Tuple[str, int, float, float]]) -> List[InstanceType]:
+    return [InstanceType(name, vcpus, ram, price, family) for name, vcpus, ram, price in rows]
+
+
+_AWS = (
+    _types("general", [
+        ("t2.micro", 1, 1, 0.0116), ("t3.micro", 2, 1, 0.0104), ("t3.small", 2, 2, 0.0208), ("t3.medium", 2, 4, 0.0416),
+        ("t3.large", 2, 8, 0.0832), ("t3.xlarge", 4, 16, 0.1664), ("t3.2xlarge", 8, 32, 0.3328),
+        ("m5.large", 2, 8, 0.096), ("m5.xlarge", 4, 16, 0.192), ("m5.2xlarge", 8, 32, 0.384),
+        ("m5.4xlarge", 16, 64, 0.768),
+    ])
+    + _types("memory", [
+        ("r5.large", 2, 16, 0.126), ("r5.xlarge", 4, 32, 0.252), ("r5.2xlarge", 8, 64, 0.504),
+        ("r5.4xlarge", 16, 128, 1.008),
+    ])
+    + _types("compute", [
+        ("c5.large", 2, 4, 0.085), ("c5.xlarge", 4, 8, 0.17), ("c5.2xlarge", 8, 16, 0.34),
+        ("c5.4xlarge", 16, 32, 0.68),
+    ])
+)
+
+_AZURE = (
+    _types("general", [
+        ("Standard_B1s", 1, 1, 0.0104), ("Standard_B1ms", 1, 2, 0.0207), ("Standard_B2s", 2, 4, 0.0416),
+        ("Standard_B2ms", 2, 8, 0.0832), ("Standard_B4ms", 4, 16, 0.166), ("Standard_D2s_v3", 2, 8, 0.096),
+        ("Standard_D4s_v3", 4, 16, 0.192), ("Standard_D8s_v3", 8, 32, 0.384), ("Standard_D16s_v3", 16, 64, 0.768),
+    ])
+    + _types("memory", [
+        ("Standard_E2s_v3", 2, 16, 0.126), ("Standard_E4s_v3", 4, 32, 0.252), ("Standard_E8s_v3", 8, 64, 0.504),
+        ("Standard_E16s_v3", 16, 128, 1.008),
+    ])
+    + _types("compute", [
+        ("Standard_F2s_v2", 2, 4, 0.085), ("Standard_F4s_v2", 4, 8, 0.169), ("Standard_F8s_v2", 8, 16, 0.338),
+        ("Standard_F16s_v2", 16, 32, 0.677),
+    ])
+)
+
+_GCP = (
+    _types("general", [
+        ("e2-micro", 2, 1, 0.0084), ("e2-small", 2, 2, 0.0168), ("e2-medium", 2, 4, 0.0335),
+        ("e2-standard-2", 2, 8, 0.067), ("e2-standard-4", 4, 16, 0.134), ("e2-standard-8", 8, 32, 0.268),
+        ("e2-standard-16", 16, 64, 0.536),
+        ("n1-standard-1", 1, 3.75, 0.0475), ("n1-standard-2", 2, 7.5, 0.095), ("n1-standard-4", 4, 15, 0.19),
+        ("n1-standard-8", 8, 30, 0.38),
+        ("n2-standard-2", 2, 8, 0.0971), ("n2-standard-4", 4, 16, 0.1942), ("n2-standard-8", 8, 32, 0.3885),
+        ("n2-standard-16", 16, 64, 0.777),
+    ])
+    + _types("memory", [
+        ("n2-highmem-2", 2, 16, 0.131), ("n2-highmem-4", 4, 32, 0.262), ("n2-highmem-8", 8, 64, 0.524),
+        ("n2-highmem-16", 16, 128, 1.048),
+    ])
+    + _types("compute", [
+        ("n2-highcpu-2", 2, 2, 0.0717), ("n2-highcpu-4", 4, 4, 0.1434), ("n2-highcpu-8", 8, 8, 0.2868),
+        ("n2-highcpu-16", 16, 16, 0.5736), ("c2-standard-4", 4, 16, 0.2088), ("c2-standard-8", 8, 32, 0.4176),
+        ("c2-standard-16", 16, 64, 0.8352),
+    ])
+)
+
+# Oracle: 1 OCPU = 2 vCPU. Sin familias memory/compute de forma fija: el motor de
+# sizing cae a general para esos perfiles.
+_ORACLE = _types("general", [
+    ("VM.Standard2.1", 2, 15, 0.0638), ("VM.Standard2.2", 4, 30, 0.1276), ("VM.Standard2.4", 8, 60, 0.2552),
+    ("VM.Standard2.8", 16, 120, 0.5104), ("VM.Standard2.16", 32, 240, 1.0208),
+])
+
+# On-premise: coste amortizado de hardware por vCPU-hora y GB-hora
+ONPREM_PRICE_PER_VCPU_HOUR = 0.012
+ONPREM_PRICE_PER_GB_HOUR = 0.002
+_ONPREM_RATIOS = {"general": (2, 4), "memory": (8,), "compute": (1,)}
+
+
+def _onprem_catalog() -> List[InstanceType]:
+    out = []
+    for family, ratios in _ONPREM_RATIOS.items():
+        for ratio in ratios:
+            for cpu in (1, 2, 4, 8, 16, 32):
+                ram = cpu * ratio
+                price = round(cpu * ONPREM_PRICE_PER_VCPU_HOUR + ram * ONPREM_PRICE_PER_GB_HOUR, 4)
+                out.append(InstanceType(f"onprem-{cpu}c-{ram}g", cpu, ram, price, family))
+    return out
+
+
+# Claves = valores de CloudProvider (los mismos que /cloud/providers/{provider})
+INSTANCE_CATALOG: Dict[str, List[InstanceType]] = {
+    "aws": _AWS,
+    "azure": _AZURE,
+    "gcp": _GCP,
+    "oracle": _ORACLE,
+    "onprem": _onprem_catalog(),
+}
+
+
+def instance_types(provider: str) -> List[InstanceType]:
+    try:
+        return INSTANCE_CATALOG[provider]
+    except KeyError:
+        raise ValueError(f"Proveedor sin catálogo de instancias: {provider}. Disponibles: {list(INSTANCE_CATALOG)}")
+
+
+def instance_type_names(provider: str) -> List[str]:
+    return [t.name for t in instance_types(provider)]
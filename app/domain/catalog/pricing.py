@@ -0,0 +1,291 @@
+"""
+Catálogo de precios por proveedor y tipo de recurso, y estimador vectorizado.
+
+Cada SKU (proveedor, tipo de recurso, tamaño) tiene cuatro componentes:
+- hourly: precio fijo por hora (tipo de instancia, clase de BD, LB...)
+- vcpu_hour / ram_gb_hour: precio por vCPU-hora y GB-hora (on-prem, tamaños
+  fuera del catálogo, BD por OCPU)
+- storage_gb_month: precio por GB-mes (almacenamiento de BD y buckets)
+
+Cada (proveedor, tipo) tiene además una fila comodín "*" para tamaños
+desconocidos. Una fila que solo cobra por vCPU/RAM no puede valorar un recurso
+sin vCPU ni RAM: ese recurso cuenta como sin precio (coste 0, priced=False) en
+lugar de salir gratis. El estimador traduce proveedor/tipo/tamaño a códigos enteros con
+búsquedas binarias sobre vocabularios ordenados (np.searchsorted) y resuelve la
+fila con una tabla densa [proveedor, tipo, tamaño]: todo el cálculo son
+operaciones NumPy sobre columnas, sin bucles Python por recurso.
+
+Precios on-demand aproximados (USD); didácticos, como los del catálogo de instancias.
+"""
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .instances import INSTANCE_CATALOG, ONPREM_PRICE_PER_GB_HOUR, ONPREM_PRICE_PER_VCPU_HOUR
+
+CURRENCY = "USD"
+HOURS_PER_MONTH = 730
+RESOURCE_TYPES = ("virtual_machine", "database", "load_balancer", "storage")
+WILDCARD = "*"
+
+# (hourly, vcpu_hour, ram_gb_hour, storage_gb_month)
+PriceComponents = Tuple[float, float, float, float]
+
+
+def _flat(hourly: float, storage_gb_month: float = 0.0) -> PriceComponents:
+    return (hourly, 0.0, 0.0, storage_gb_month)
+
+
+def _per_unit(vcpu_hour: float, ram_gb_hour: float = 0.0, storage_gb_month: float = 0.0, hourly: float = 0.0) -> PriceComponents:
+    return (hourly, vcpu_hour, ram_gb_hour, storage_gb_month)
+
+
+def _vm_prices(provider: str, wildcard: PriceComponents) -> Dict[str, PriceComponents]:
+    # Los tipos de VM salen del catálogo de instancias (mismo precio que usa el sizing)
+    prices = {t.name: _flat(t.price_hour) for t in INSTANCE_CATALOG[provider]}
+    prices[WILDCARD] = wildcard
+    return prices
+
+
+_ONPREM_UNIT = _per_unit(ONPREM_PRICE_PER_VCPU_HOUR, ONPREM_PRICE_PER_GB_HOUR, storage_gb_month=0.05)
+
+PRICE_CATALOG: Dict[str, Dict[str, Dict[str, PriceComponents]]] = {
+    "aws": {
+        "virtual_machine": _vm_prices("aws", _per_unit(0.024, 0.006)),
+        "database": {
+            "db.t3.micro": _flat(0.017, 0.115), "db.t3.small": _flat(0.034, 0.115),
+            "db.t3.medium": _flat(0.068, 0.115), "db.m5.large": _flat(0.171, 0.115),
+            "db.r5.large": _flat(0.24, 0.115), WILDCARD: _per_unit(0.04, 0.01, 0.115),
+        },
+        "load_balancer": {"application": _flat(0.0225), "network": _flat(0.0225), WILDCARD: _flat(0.0225)},
+        "storage": {
+            "STANDARD": _flat(0.0, 0.023), "STANDARD_IA": _flat(0.0, 0.0125),
+            "INTELLIGENT_TIERING": _flat(0.0, 0.023), "GLACIER": _flat(0.0, 0.004),
+            WILDCARD: _flat(0.0, 0.023),
+        },
+    },
+    "azure": {
+        "virtual_machine": _vm_prices("azure", _per_unit(0.024, 0.006)),
+        "database": {
+            "Basic": _flat(0.0068, 0.1), "Standard": _flat(0.0202, 0.1), "Premium": _flat(0.625, 0.1),
+            WILDCARD: _per_unit(0.04, 0.01, 0.1),
+        },
+        "load_balancer": {"Basic": _flat(0.0), "Standard": _flat(0.025), WILDCARD: _flat(0.025)},
+        "storage": {
+            "Hot": _flat(0.0, 0.0184), "Cool": _flat(0.0, 0.01), "Archive": _flat(0.0, 0.00099),
+            WILDCARD: _flat(0.0, 0.0184),
+        },
+    },
+    "gcp": {
+        "virtual_machine": _vm_prices("gcp", _per_unit(0.0316, 0.0042)),
+        "database": {
+            "db-f1-micro": _flat(0.0105, 0.17), "db-g1-small": _flat(0.035, 0.17),
+            "db-standard-1": _flat(0.0965, 0.17), "db-standard-2": _flat(0.193, 0.17),
+            "db-standard-4": _flat(0.386, 0.17), WILDCARD: _per_unit(0.0413, 0.007, 0.17),
+        },
+        "load_balancer": {
+            "HTTP(S)": _flat(0.025), "TCP": _flat(0.025), "UDP": _flat(0.025), "SSL": _flat(0.025),
+            WILDCARD: _flat(0.025),
+        },
+        "storage": {
+            "STANDARD": _flat(0.0, 0.02), "NEARLINE": _flat(0.0, 0.01), "COLDLINE": _flat(0.0, 0.004),
+            "ARCHIVE": _flat(0.0, 0.0012), WILDCARD: _flat(0.0, 0.02),
+        },
+    },
+    "oracle": {
+        "virtual_machine": _vm_prices("oracle", _per_unit(0.0319, 0.0015)),
+        # Autonomous Database se factura por OCPU-hora (cpu_count) y TB-mes
+        "database": {
+            "OLTP": _per_unit(1.3441, storage_gb_month=0.1156), "DW": _per_unit(1.3441, storage_gb_month=0.1156),
+            "AJD": _per_unit(0.3226, storage_gb_month=0.1156), "APEX": _per_unit(0.3226, storage_gb_month=0.1156),
+            WILDCARD: _per_unit(1.3441, storage_gb_month=0.1156),
+        },
+        "load_balancer": {
+            "10Mbps": _flat(0.0), "100Mbps": _flat(0.0144), "400Mbps": _flat(0.0576), "8000Mbps": _flat(1.152),
+            WILDCARD: _flat(0.0144),
+        },
+        "storage": {
+            "Standard": _flat(0.0, 0.0255), "InfrequentAccess": _flat(0.0, 0.01), "Archive": _flat(0.0, 0.0026),
+            WILDCARD: _flat(0.0, 0.0255),
+        },
+    },
+    # On-premise: coste amortizado (hardware + energía) por unidad
+    "onprem": {
+        "virtual_machine": _vm_prices("onprem", _ONPREM_UNIT),
+        "database": {WILDCARD: _per_unit(ONPREM_PRICE_PER_VCPU_HOUR, storage_gb_month=0.05, hourly=0.05)},
+        "load_balancer": {WILDCARD: _flat(0.01)},
+        "storage": {WILDCARD: _flat(0.0, 0.05)},
+    },
+}
+
+# Alias de proveedor aceptados (ProviderEnum usa "onpremise")
+PROVIDER_ALIASES = {"onpremise": "onprem"}
+
+
+def _as_str_array(values: Iterable[object]) -> np.ndarray:
+    # None pasa a "None", que no coincide con ningún tamaño: cae en la fila comodín
+    if isinstance(values, np.ndarray):
+        return values.astype(str, copy=False)
+    return np.asarray(values if isinstance(values, (list, tuple)) else list(values), dtype=str)
+
+
+def _as_float_array(values: Optional[Iterable[float]], n: int, default: float = 0.0) -> np.ndarray:
+    if values is None:
+        return np.full(n, default)
+    array = np.asarray(values if isinstance(values, (np.ndarray, list, tuple)) else list(values), dtype=float)
+    return np.nan_to_num(array, nan=default)
+
+
+class CostEstimate:
+    """Resultado vectorizado: coste por recurso y agregados por proveedor y tipo."""
+
+    __slots__ = ("hourly", "monthly", "priced", "by_provider", "by_resource_type")
+
+    def __init__(
+        self,
+        hourly: np.ndarray,
+        monthly: np.ndarray,
+        priced: np.ndarray,
+        by_provider: Dict[str, float],
+        by_resource_type: Dict[str, float],
+    ):
+        self.hourly = hourly
+        self.monthly = monthly
+        self.priced = priced
+        self.by_provider = by_provider
+        self.by_resource_type = by_resource_type
+
+    @property
+    def total_hourly(self) -> float:
+        return float(self.hourly.sum())
+
+    @property
+    def total_monthly(self) -> float:
+        return float(self.monthly.sum())
+
+    @property
+    def unpriced(self) -> int:
+        return int(self.priced.size - np.count_nonzero(self.priced))
+
+
+class PriceCatalog:
+    """Catálogo compilado a arrays NumPy para estimar muchos recursos a la vez."""
+
+    def __init__(self, catalog: Dict[str, Dict[str, Dict[str, PriceComponents]]]):
+        self.providers = np.array(sorted(catalog))
+        self.resource_types = np.array(sorted(RESOURCE_TYPES))
+        self.sizes = np.array(sorted({
+            size for types in catalog.values() for sizes in types.values() for size in sizes if size != WILDCARD
+        }))
+        rows = [(0.0, 0.0, 0.0, 0.0)]  # fila 0: sin precio (proveedor o tipo desconocido)
+        # Índices: [proveedor | desconocido, tipo | desconocido, tamaño | desconocido] → fila
+        table = np.zeros((len(self.providers) + 1, len(self.resource_types) + 1, len(self.sizes) + 1), dtype=np.intp)
+        for p, provider in enumerate(self.providers):
+            for t, resource_type in enumerate(self.resource_types):
+                sizes = catalog[provider].get(resource_type)
+                if not sizes:
+                    continue
+                wildcard_row = len(rows)
+                rows.append(sizes[WILDCARD])
+                table[p, t, :] = wildcard_row
+                for size, components in sizes.items():
+                    if size == WILDCARD:
+                        continue
+                    table[p, t, np.searchsorted(self.sizes, size)] = len(rows)
+                    rows.append(components)
+        self._table = table
+        components = np.array(rows, dtype=float)
+        self._hourly, self._vcpu_hour, self._ram_gb_hour, self._storage_gb_month = components.T
+        # Filas con precio solo por unidad: sin vCPU ni RAM no hay nada que multiplicar
+        self._unit_only = (self._hourly == 0) & ((self._vcpu_hour > 0) | (self._ram_gb_hour > 0))
+
+    @staticmethod
+    def _codes(vocabulary: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Posición de cada valor en el vocabulario ordenado; len(vocabulary) si no está."""
+        idx = np.searchsorted(vocabulary, values)
+        clipped = np.minimum(idx, len(vocabulary) - 1)
+        return np.where(vocabulary[clipped] == values, clipped, len(vocabulary))
+
+    def encode(
+        self, providers: Iterable[str], resource_types: Iterable[str], sizes: Iterable[str]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Códigos enteros (proveedor, tipo, tamaño) de cada recurso."""
+        provider_values = _as_str_array(providers)
+        for alias, canonical in PROVIDER_ALIASES.items():
+            provider_values = np.where(provider_values == alias, canonical, provider_values)
+        return (
+            self._codes(self.providers, provider_values),
+            self._codes(self.resource_types, _as_str_array(resource_types)),
+            self._codes(self.sizes, _as_str_array(sizes)),
+        )
+
+    def estimate_codes(
+        self,
+        provider_codes: np.ndarray,
+        type_codes: np.ndarray,
+        size_codes: np.ndarray,
+        vcpus: np.ndarray,
+        ram_gb: np.ndarray,
+        storage_gb: np.ndarray,
+        count: np.ndarray,
+    ) -> CostEstimate:
+        rows = self._table[provider_codes, type_codes, size_codes]
+        priced = (rows != 0) & ~(self._unit_only[rows] & (vcpus <= 0) & (ram_gb <= 0))
+        hourly = (
+            self._hourly[rows]
+            + self._vcpu_hour[rows] * vcpus
+            + self._ram_gb_hour[rows] * ram_gb
+            + self._storage_gb_month[rows] * storage_gb / HOURS_PER_MONTH
+        ) * count
+        hourly = np.where(priced, hourly, 0.0)
+        monthly = hourly * HOURS_PER_MONTH
+        by_provider = np.bincount(provider_codes, weights=monthly, minlength=len(self.providers) + 1)
+        by_type = np.bincount(type_codes, weights=monthly, minlength=len(self.resource_types) + 1)
+        return CostEstimate(
+            hourly=hourly,
+            monthly=monthly,
+            priced=priced,
+            by_provider={str(p): float(v) for p, v in zip(self.providers, by_provider) if v},
+            by_resource_type={str(t): float(v) for t, v in zip(self.resource_types, by_type) if v},
+        )
+
+    def estimate(
+        self,
+        providers: Sequence[str],
+        resource_types: Sequence[str],
+        sizes: Sequence[str],
+        vcpus: Optional[Sequence[float]] = None,
+        ram_gb: Optional[Sequence[float]] = None,
+        storage_gb: Optional[Sequence[float]] = None,
+        count: Optional[Sequence[float]] = None,
+    ) -> CostEstimate:
+        """Precio de N recursos dados por columnas (listas o arrays de igual longitud)."""
+        provider_codes, type_codes, size_codes = self.encode(providers, resource_types, sizes)
+        n = len(provider_codes)
+        return self.estimate_codes(
+            provider_codes,
+            type_codes,
+            size_codes,
+            _as_float_array(vcpus, n),
+            _as_float_array(ram_gb, n),
+            _as_float_array(storage_gb, n),
+            _as_float_array(count, n, default=1.0),
+        )
+
+    def list_prices(self, provider: str) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Precios de un proveedor (lo que expone la API)."""
+        provider = PROVIDER_ALIASES.get(provider, provider)
+        if provider not in PRICE_CATALOG:
+            raise ValueError(f"Proveedor sin catálogo de precios: {provider}. Disponibles: {list(PRICE_CATALOG)}")
+        names = ("hourly", "vcpu_hour", "ram_gb_hour", "storage_gb_month")
+        return {
+            resource_type: {size: dict(zip(names, components)) for size, components in sizes.items()}
+            for resource_type, sizes in PRICE_CATALOG[provider].items()
+        }
+
+
+_price_catalog = PriceCatalog(PRICE_CATALOG)
+
+
+def get_price_catalog() -> PriceCatalog:
+    return _price_catalog
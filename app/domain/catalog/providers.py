@@ -0,0 +1,236 @@
+"""
+Catálogo inmutable de proveedores: regiones, zonas, factor de precio de cada
+región y valores válidos de cada opción (machine types, engines, clases de
+storage...).
+
+Se construye una vez al importar el módulo y lo comparten todas las factories y
+/cloud/providers/{provider}/info: cada validación es una búsqueda O(1) en un
+frozenset en lugar de recorrer (o reconstruir) una lista por petición. Las
+tuplas conservan el orden de presentación para las respuestas de la API.
+"""
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .instances import INSTANCE_CATALOG
+
+
+class ProviderCatalog:
+    """Regiones y opciones válidas de un proveedor (solo lectura)."""
+
+    __slots__ = (
+        "code", "name", "open_regions", "region_list", "regions",
+        "zones", "zone_index", "price_factors", "options", "recommended", "_option_lists",
+    )
+
+    def __init__(
+        self,
+        code: str,
+        name: str,
+        regions: Sequence[str] = (),
+        zones: Optional[Dict[str, Sequence[str]]] = None,
+        options: Optional[Dict[str, Sequence[str]]] = None,
+        recommended: Optional[Dict[str, Sequence[str]]] = None,
+        open_regions: bool = False,
+        price_factors: Optional[Dict[str, float]] = None,
+    ):
+        self.code = code
+        self.name = name
+        # On-prem no tiene regiones fijas: cualquier ubicación es válida
+        self.open_regions = open_regions
+        self.region_list: Tuple[str, ...] = tuple(regions)
+        self.regions: FrozenSet[str] = frozenset(self.region_list)
+        self.zones: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+            {region: tuple(names) for region, names in (zones or {}).items()}
+        )
+        # Solo se indexan las zonas con nombre único (las de Azure/Oracle se repiten por región)
+        owners: Dict[str, List[str]] = {}
+        for region, names in self.zones.items():
+            for zone in names:
+                owners.setdefault(zone, []).append(region)
+        self.zone_index: Mapping[str, str] = MappingProxyType(
+            {zone: owner[0] for zone, owner in owners.items() if len(owner) == 1}
+        )
+        # Multiplicador del precio de lista por región (1.0 = la región de referencia)
+        self.price_factors: Mapping[str, float] = MappingProxyType(dict(price_factors or {}))
+        self._option_lists: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+            {option: tuple(values) for option, values in (options or {}).items()}
+        )
+        self.options: Mapping[str, FrozenSet[str]] = MappingProxyType(
+            {option: frozenset(values) for option, values in self._option_lists.items()}
+        )
+        self.recommended: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+            {use_case: tuple(names) for use_case, names in (recommended or {}).items()}
+        )
+
+    def has_region(self, region: str) -> bool:
+        try:
+            return self.open_regions or region in self.regions
+        except TypeError:
+            return False
+
+    def allows(self, option: str, value: str) -> bool:
+        """True si value es válido para la opción. KeyError si el proveedor no la define."""
+        try:
+            return value in self.options[option]
+        except TypeError:
+            # Valores no hashables (listas, dicts) nunca son válidos
+            return False
+
+    def values(self, option: str) -> List[str]:
+        """Valores de la opción en orden de presentación (copia: el catálogo no cambia)."""
+        return list(self._option_lists[option])
+
+    def region_for_zone(self, zone: str) -> Optional[str]:
+        return self.zone_index.get(zone)
+
+    def default_zone(self, region: str) -> Optional[str]:
+        """Primera zona de la región (None si el proveedor no define zonas para ella)."""
+        zones = self.zones.get(region)
+        return zones[0] if zones else None
+
+    def price_factor(self, region: str) -> float:
+        return self.price_factors.get(region, 1.0)
+
+    def recommended_lists(self) -> Dict[str, List[str]]:
+        return {use_case: list(names) for use_case, names in self.recommended.items()}
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "code": self.code,
+            "name": self.name,
+            "regions": list(self.region_list),
+            "open_regions": self.open_regions,
+            "zones": {region: list(names) for region, names in self.zones.items()},
+            "price_factors": dict(self.price_factors),
+            "options": {option: list(values) for option, values in self._option_lists.items()},
+            "recommended": self.recommended_lists(),
+        }
+
+    def __repr__(self) -> str:
+        return f"ProviderCatalog({self.code!r}, {len(self.regions)} regiones, opciones={list(self.options)})"
+
+
+def _suffixed(regions: Iterable[str], suffixes: Iterable[str]) -> Dict[str, Tuple[str, ...]]:
+    suffixes = tuple(suffixes)
+    return {region: tuple(f"{region}{suffix}" for suffix in suffixes) for region in regions}
+
+
+def _same_zones(regions: Iterable[str], zones: Iterable[str]) -> Dict[str, Tuple[str, ...]]:
+    zones = tuple(zones)
+    return {region: zones for region in regions}
+
+
+_AWS_REGIONS = (
+    "us-east-1", "us-west-1", "us-west-2", "eu-west-1",
+    "eu-central-1", "ap-southeast-1", "ap-northeast-1",
+)
+_AZURE_REGIONS = (
+    "eastus", "westus", "westus2", "northeurope", "westeurope",
+    "southeastasia", "eastasia", "japaneast", "australiaeast",
+)
+_GCP_REGIONS = (
+    "us-central1", "us-east1", "us-west1", "us-west2",
+    "europe-west1", "europe-west2", "asia-east1", "asia-southeast1",
+)
+_ORACLE_REGIONS = (
+    "us-ashburn-1", "us-phoenix-1", "us-sanjose-1",
+    "ca-toronto-1", "ca-montreal-1",
+    "eu-frankfurt-1", "eu-zurich-1", "eu-amsterdam-1",
+    "uk-london-1", "ap-tokyo-1", "ap-osaka-1",
+    "ap-sydney-1", "ap-melbourne-1", "ap-mumbai-1",
+)
+# Sobrecoste aproximado de cada región frente a la más barata del proveedor.
+# Oracle cobra lo mismo en todas sus regiones; las que faltan valen 1.0
+_AWS_PRICE_FACTORS = {
+    "us-east-1": 1.0, "us-west-2": 1.0, "us-west-1": 1.12, "eu-west-1": 1.06,
+    "eu-central-1": 1.15, "ap-southeast-1": 1.2, "ap-northeast-1": 1.25,
+}
+_AZURE_PRICE_FACTORS = {
+    "eastus": 1.0, "westus2": 1.0, "westus": 1.08, "northeurope": 1.05, "westeurope": 1.1,
+    "southeastasia": 1.15, "eastasia": 1.25, "japaneast": 1.2, "australiaeast": 1.22,
+}
+_GCP_PRICE_FACTORS = {
+    "us-central1": 1.0, "us-east1": 1.0, "us-west1": 1.0, "us-west2": 1.2,
+    "europe-west1": 1.1, "europe-west2": 1.2, "asia-east1": 1.1, "asia-southeast1": 1.15,
+}
+# Shapes de Oracle: los del catálogo de instancias más los Flex y bare metal
+_ORACLE_EXTRA_SHAPES = (
+    "VM.Standard3.Flex", "VM.Optimized3.Flex",
+    "BM.Standard2.52", "BM.Standard3.64",
+    "VM.Standard.E3.Flex", "VM.Standard.E4.Flex",
+)
+
+
+def _names(provider: str) -> Tuple[str, ...]:
+    return tuple(t.name for t in INSTANCE_CATALOG[provider])
+
+
+# Claves = valores de CloudProvider (como INSTANCE_CATALOG y PRICE_CATALOG)
+PROVIDER_CATALOG: Mapping[str, ProviderCatalog] = MappingProxyType({
+    "aws": ProviderCatalog(
+        "aws", "Amazon Web Services",
+        regions=_AWS_REGIONS,
+        zones=_suffixed(_AWS_REGIONS, "abc"),
+        price_factors=_AWS_PRICE_FACTORS,
+        recommended={
+            "general": ("t3.micro", "t3.small", "t3.medium", "m5.large"),
+            "compute": ("c5.large", "c5.xlarge", "c5.2xlarge"),
+            "memory": ("r5.large", "r5.xlarge", "r5.2xlarge"),
+            "storage": ("i3.large", "i3.xlarge", "d2.xlarge"),
+        },
+    ),
+    "azure": ProviderCatalog(
+        "azure", "Microsoft Azure",
+        regions=_AZURE_REGIONS,
+        zones=_same_zones(_AZURE_REGIONS, ("1", "2", "3")),
+        price_factors=_AZURE_PRICE_FACTORS,
+        recommended={
+            "general": ("Standard_B1s", "Standard_B2s", "Standard_D2s_v3"),
+            "compute": ("Standard_F2s_v2", "Standard_F4s_v2", "Standard_F8s_v2"),
+            "memory": ("Standard_E2s_v3", "Standard_E4s_v3", "Standard_E8s_v3"),
+            "storage": ("Standard_L4s", "Standard_L8s", "Standard_L16s"),
+        },
+    ),
+    "gcp": ProviderCatalog(
+        "gcp", "Google Cloud Platform",
+        regions=_GCP_REGIONS,
+        zones=_suffixed(_GCP_REGIONS, ("-a", "-b", "-c")),
+        price_factors=_GCP_PRICE_FACTORS,
+        options={
+            "machine_types": _names("gcp"),
+            "database_engines": ("mysql", "postgres", "sqlserver"),
+            "load_balancer_types": ("HTTP(S)", "TCP", "UDP", "SSL"),
+            "storage_classes": ("STANDARD", "NEARLINE", "COLDLINE", "ARCHIVE"),
+            "locations": ("US", "EU", "ASIA") + _GCP_REGIONS,
+        },
+    ),
+    "oracle": ProviderCatalog(
+        "oracle", "Oracle Cloud Infrastructure",
+        regions=_ORACLE_REGIONS,
+        zones=_same_zones(_ORACLE_REGIONS, ("AD-1", "AD-2", "AD-3")),
+        options={
+            "compute_shapes": _names("oracle") + _ORACLE_EXTRA_SHAPES,
+            "database_workloads": ("OLTP", "DW", "AJD", "APEX"),
+            "load_balancer_shapes": ("10Mbps", "100Mbps", "400Mbps", "8000Mbps"),
+            "storage_tiers": ("Standard", "InfrequentAccess", "Archive"),
+        },
+    ),
+    "onprem": ProviderCatalog(
+        "onprem", "On-Premise Infrastructure",
+        open_regions=True,
+        options={
+            "hypervisors": ("vmware", "hyperv", "kvm", "xen"),
+            "database_engines": ("postgresql", "mysql", "oracle", "sqlserver"),
+            "load_balancer_types": ("nginx", "haproxy", "f5", "citrix"),
+            "load_balancer_algorithms": ("round_robin", "least_conn", "ip_hash", "least_time"),
+            "storage_types": ("nfs", "smb", "iscsi", "fc"),
+        },
+    ),
+})
+
+
+def get_provider_catalog(provider: str) -> ProviderCatalog:
+    try:
+        return PROVIDER_CATALOG[provider]
+    except KeyError:
+        raise ValueError(f"Proveedor sin catálogo: {provider}. Disponibles: {list(PROVIDER_CATALOG)}")
@@ -0,0 +1,114 @@
+"""
+Motor de sizing: elige el tipo de instancia más barato que cubre los vCPU/RAM
+de un tier bajo un perfil (general | memory | compute).
+
+Índice precomputado por (proveedor, familia): tipos ordenados por vCPU y, para
+cada sufijo "vCPU >= v", las RAM ordenadas con el mínimo de precio acumulado
+desde la derecha. Una consulta son dos búsquedas binarias: O(log n).
+"""
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+from .instances import INSTANCE_CATALOG, InstanceType
+
+# Requisitos por tier para el perfil general (vCPU, RAM GiB)
+TIER_REQUIREMENTS: Dict[str, Tuple[int, float]] = {
+    "small": (2, 4),
+    "medium": (4, 8),
+    "large": (8, 16),
+    "xlarge": (16, 32),
+}
+# GiB de RAM por vCPU según perfil (general = 2, como TIER_REQUIREMENTS)
+PROFILE_RAM_PER_VCPU: Dict[str, float] = {"general": 2, "memory": 8, "compute": 1}
+FALLBACK_FAMILY = "general"
+
+
+def _rank(t: InstanceType) -> Tuple[float, int, float, str]:
+    # Más barato primero; a igual precio, el más pequeño (desempate estable por nombre)
+    return (t.price_hour, t.vcpus, t.ram_gb, t.name)
+
+
+class _FamilyIndex:
+    def __init__(self, types: List[InstanceType]):
+        ordered = sorted(types, key=lambda t: (t.vcpus, t.ram_gb))
+        self.vcpus = [t.vcpus for t in ordered]
+        # Por cada posición i: (RAMs ordenadas del sufijo, mejor tipo con RAM >= rams[j])
+        self._suffix: List[Tuple[List[float], List[InstanceType]]] = []
+        for i in range(len(ordered)):
+            by_ram = sorted(ordered[i:], key=lambda t: t.ram_gb)
+            best: List[InstanceType] = [None] * len(by_ram)  # type: ignore[list-item]
+            current: Optional[InstanceType] = None
+            for j in range(len(by_ram) - 1, -1, -1):
+                if current is None or _rank(by_ram[j]) < _rank(current):
+                    current = by_ram[j]
+                best[j] = current
+            self._suffix.append(([t.ram_gb for t in by_ram], best))
+
+    def cheapest(self, vcpus: int, ram_gb: float) -> Optional[InstanceType]:
+        i = bisect_left(self.vcpus, vcpus)
+        if i == len(self.vcpus):
+            return None
+        rams, best = self._suffix[i]
+        j = bisect_left(rams, ram_gb)
+        return best[j] if j < len(rams) else None
+
+
+class SizingEngine:
+    def __init__(self, catalog: Dict[str, List[InstanceType]]):
+        self._catalog = catalog
+        self._index: Dict[Tuple[str, str], _FamilyIndex] = {}
+        for provider, types in catalog.items():
+            families = {t.family for t in types}
+            for family in families:
+                self._index[(provider, family)] = _FamilyIndex([t for t in types if t.family == family])
+
+    def providers(self) -> List[str]:
+        return list(self._catalog)
+
+    def catalog(self, provider: str) -> List[InstanceType]:
+        if provider not in self._catalog:
+            raise ValueError(f"Proveedor sin catálogo de instancias: {provider}. Disponibles: {list(self._catalog)}")
+        return self._catalog[provider]
+
+    @staticmethod
+    def requirements(tier: str, profile: str = "general") -> Tuple[int, float]:
+        """(vCPU, RAM GiB) mínimos del tier bajo el perfil."""
+        if tier not in TIER_REQUIREMENTS:
+            raise ValueError(f"Tier desconocido: {tier}. Válidos: {list(TIER_REQUIREMENTS)}")
+        if profile not in PROFILE_RAM_PER_VCPU:
+            raise ValueError(f"Perfil desconocido: {profile}. Válidos: {list(PROFILE_RAM_PER_VCPU)}")
+        vcpus, _ = TIER_REQUIREMENTS[tier]
+        return vcpus, vcpus * PROFILE_RAM_PER_VCPU[profile]
+
+    def select(self, provider: str, vcpus: int, ram_gb: float, family: str = "general") -> InstanceType:
+        """
+        Tipo más barato de la familia con al menos vcpus/ram_gb. Si la familia no
+        existe en el proveedor o nada la cubre, se busca en la familia general.
+        """
+        self.catalog(provider)
+        for candidate_family in dict.fromkeys((family, FALLBACK_FAMILY)):
+            index = self._index.get((provider, candidate_family))
+            if index is None:
+                continue
+            found = index.cheapest(vcpus, ram_gb)
+            if found is not None:
+                return found
+        raise ValueError(f"Ningún tipo de instancia de {provider} cubre {vcpus} vCPU / {ram_gb} GiB")
+
+    def select_for_tier(self, provider: str, tier: str, profile: str = "general") -> InstanceType:
+        vcpus, ram_gb = self.requirements(tier, profile)
+        return self.select(provider, vcpus, ram_gb, family=profile)
+
+    def tier_table(self, provider: str) -> Dict[str, Dict[str, Dict[str, object]]]:
+        """Selección para cada perfil × tier (lo que usan los builders)."""
+        return {
+            profile: {tier: self.select_for_tier(provider, tier, profile).to_dict() for tier in TIER_REQUIREMENTS}
+            for profile in PROFILE_RAM_PER_VCPU
+        }
+
+
+_engine = SizingEngine(INSTANCE_CATALOG)
+
+
+def get_sizing_engine() -> SizingEngine:
+    return _engine
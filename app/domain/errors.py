@@ -0,0 +1,101 @@
+"""
+Errores de proveedor (transitorios) diferenciados de los de validación (ValueError).
+Los controladores los traducen a 429/503/504 para que los clientes puedan reintentar.
+"""
+from typing import Optional, Tuple
+
+
+class ProviderError(Exception):
+    """Fallo transitorio del proveedor (equivalente a un 5xx del API del cloud)."""
+
+    status_code = 503
+
+    def __init__(self, message: str, provider: str = "", resource_type: str = ""):
+        super().__init__(message)
+        self.provider = provider
+        self.resource_type = resource_type
+
+
+class ProviderThrottledError(ProviderError):
+    """El proveedor rechazó la llamada por límite de tasa (HTTP 429)."""
+
+    status_code = 429
+
+    def __init__(self, message: str, provider: str = "", resource_type: str = "", retry_after: Optional[float] = None):
+        super().__init__(message, provider, resource_type)
+        self.retry_after = retry_after
+
+
+class QuotaExceededError(ProviderThrottledError):
+    """La VM no cabe en la cuota de la región (vCPU o instancias) del governor (HTTP 429)."""
+
+
+class ProviderTimeoutError(ProviderError):
+    """La llamada al proveedor superó el timeout configurado (HTTP 504)."""
+
+    status_code = 504
+
+
+class UnsupportedProviderError(ValueError):
+    """El proveedor solicitado no tiene Abstract Factory registrada."""
+
+
+class JobQueueFullError(Exception):
+    """La cola de jobs del proveedor está llena; el cliente debe reintentar más tarde (HTTP 503)."""
+
+    status_code = 503
+
+    def __init__(self, message: str, provider: str = "", retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.provider = provider
+        self.retry_after = retry_after
+
+
+class IdempotencyKeyReuseError(ValueError):
+    """La misma Idempotency-Key se reutilizó con un payload distinto (HTTP 422)."""
+
+
+class InvalidTransitionError(ValueError):
+    """La acción no está permitida en el estado actual de la VM (HTTP 409)."""
+
+    status_code = 409
+
+    def __init__(self, status: str, action: str, allowed: Tuple[str, ...] = ()):
+        hint = f"; acciones permitidas: {', '.join(allowed)}" if allowed else ""
+        super().__init__(f"No se puede '{action}' una VM en estado '{status}'{hint}")
+        self.status = status
+        self.action = action
+        self.allowed = allowed
+
+
+def status_code_for(error: Exception) -> int:
+    """Código HTTP equivalente a un error de dominio (para jobs y respuestas por elemento)."""
+    if isinstance(error, (ProviderError, JobQueueFullError, InvalidTransitionError)):
+        return error.status_code
+    if isinstance(error, KeyError):
+        return 404
+    if isinstance(error, IdempotencyKeyReuseError):
+        return 422
+    if isinstance(error, ValueError):
+        return 400
+    return 500
+
+
+class ChangesExpiredError(LookupError):
+    """El `since` pedido ya salió del registro de cambios: hay que resincronizar con el listado completo (HTTP 410)."""
+
+    def __init__(self, since: int, oldest_seq: int, current_seq: int):
+        super().__init__(f"since={since} ya no está en el registro de cambios (el más antiguo es {oldest_seq})")
+        self.since = since
+        self.oldest_seq = oldest_seq
+        self.current_seq = current_seq
+
+
+class WatchExpiredError(LookupError):
+    """La secuencia desde la que se quiere reanudar un watch ya salió de su histórico: releer la VM o el listado (HTTP 410)."""
+
+    def __init__(self, since: int, oldest_seq: int, current_seq: int):
+        super().__init__(f"since={since} ya no está en el histórico del watch (el más antiguo es {oldest_seq})")
+        self.since = since
+        self.oldest_seq = oldest_seq
+        self.current_seq = current_seq
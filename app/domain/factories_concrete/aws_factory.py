@@ -5,6 +5,8 @@ Crea familias de productos específicos de AWS que trabajan juntos.
 from typing import Dict, Any
 from ..abstractions.factory import CloudAbstractFactory
 from ..abstractions.products import VirtualMachine, Database, LoadBalancer, Storage
+from ..catalog import get_provider_catalog
+from ..validation import CONFIG_SCHEMAS
 from ..products.aws_products import EC2Instance, RDSDatabase, ApplicationLoadBalancer, S3Storage
 
 
@@ -15,19 +17,15 @@ class AWSCloudFactory(CloudAbstractFactory):
     """
     
     def __init__(self):
-        self._supported_regions = {
-            "us-east-1", "us-west-1", "us-west-2", "eu-west-1", 
-            "eu-central-1", "ap-southeast-1", "ap-northeast-1"
-        }
+        self._catalog = get_provider_catalog("aws")
+        self._supported_regions = self._catalog.regions
+        self._schemas = CONFIG_SCHEMAS["aws"]
     
     def create_virtual_machine(self, name: str, vm_config: Dict[str, Any]) -> VirtualMachine:
         """Crea una instancia EC2"""
-        required_fields = ["instance_type", "ami", "vpc_id", "region"]
-        self._validate_config(vm_config, required_fields)
-        
+        # Requeridos, región y defaults en una pasada (no revalida configs ya validados por el plan)
+        vm_config = self._schemas["virtual_machine"].validate(vm_config)
         region = vm_config["region"]
-        if not self.validate_region(region):
-            raise ValueError(f"Region {region} not supported by AWS")
         
         vm = EC2Instance(
             name=name,
@@ -56,12 +54,8 @@ class AWSCloudFactory(CloudAbstractFactory):
     
     def create_database(self, name: str, db_config: Dict[str, Any]) -> Database:
         """Crea una instancia RDS"""
-        required_fields = ["engine", "instance_class", "allocated_storage", "region"]
-        self._validate_config(db_config, required_fields)
-        
+        db_config = self._schemas["database"].validate(db_config)
         region = db_config["region"]
-        if not self.validate_region(region):
-            raise ValueError(f"Region {region} not supported by AWS")
         
         db = RDSDatabase(
             name=name,
@@ -76,12 +70,8 @@ class AWSCloudFactory(CloudAbstractFactory):
     
     def create_load_balancer(self, name: str, lb_config: Dict[str, Any]) -> LoadBalancer:
         """Crea un Application Load Balancer"""
-        required_fields = ["vpc_id", "region"]
-        self._validate_config(lb_config, required_fields)
-        
+        lb_config = self._schemas["load_balancer"].validate(lb_config)
         region = lb_config["region"]
-        if not self.validate_region(region):
-            raise ValueError(f"Region {region} not supported by AWS")
         
         lb = ApplicationLoadBalancer(
             name=name,
@@ -99,12 +89,8 @@ class AWSCloudFactory(CloudAbstractFactory):
     
     def create_storage(self, name: str, storage_config: Dict[str, Any]) -> Storage:
         """Crea un bucket S3"""
-        required_fields = ["region"]
-        self._validate_config(storage_config, required_fields)
-        
+        storage_config = self._schemas["storage"].validate(storage_config)
         region = storage_config["region"]
-        if not self.validate_region(region):
-            raise ValueError(f"Region {region} not supported by AWS")
         
         storage = S3Storage(
             name=name,
@@ -124,7 +110,7 @@ class AWSCloudFactory(CloudAbstractFactory):
         return {
             "name": "Amazon Web Services",
             "code": "aws",
-            "supported_regions": self._supported_regions,
+            "supported_regions": list(self._catalog.region_list),
             "services": {
                 "compute": "EC2 Instances",
                 "database": "RDS",
@@ -141,21 +127,10 @@ class AWSCloudFactory(CloudAbstractFactory):
         """Valida si la región es soportada por AWS"""
         return region in self._supported_regions
     
-    def _validate_config(self, config: Dict[str, Any], required_fields: list) -> None:
-        """Valida que la configuración tenga los campos requeridos"""
-        missing_fields = [field for field in required_fields if field not in config]
-        if missing_fields:
-            raise ValueError(f"Missing required fields for AWS: {missing_fields}")
-    
-    def get_supported_regions(self) -> set:
-        """Retorna las regiones soportadas"""
-        return self._supported_regions.copy()
+    def get_supported_regions(self) -> frozenset:
+        """Retorna las regiones soportadas (frozenset compartido del catálogo)"""
+        return self._supported_regions
     
     def get_recommended_instance_types(self) -> Dict[str, list]:
         """Retorna tipos de instancia recomendados por caso de uso"""
-        return {
-            "general": ["t3.micro", "t3.small", "t3.medium", "m5.large"],
-            "compute": ["c5.large", "c5.xlarge", "c5.2xlarge"],
-            "memory": ["r5.large", "r5.xlarge", "r5.2xlarge"],
-            "storage": ["i3.large", "i3.xlarge", "d2.xlarge"]
-        }
\ No newline at end of file
+        return self._catalog.recommended_lists()
\ No newline at end of file
@@ -5,6 +5,8 @@ Crea familias de productos específicos de Azure que trabajan juntos.
 from typing import Dict, Any
 from ..abstractions.factory import CloudAbstractFactory
 from ..abstractions.products import VirtualMachine, Database, LoadBalancer, Storage
+from ..catalog import get_provider_catalog
+from ..validation import CONFIG_SCHEMAS
 from ..products.azure_products import AzureVirtualMachine, AzureSQLDatabase, AzureLoadBalancer, AzureBlobStorage
 
 
@@ -15,19 +17,15 @@ class AzureCloudFactory(CloudAbstractFactory):
     """
     
     def __init__(self):
-        self._supported_regions = {
-            "eastus", "westus", "westus2", "northeurope", "westeurope",
-            "southeastasia", "eastasia", "japaneast", "australiaeast"
-        }
+        self._catalog = get_provider_catalog("azure")
+        self._supported_regions = self._catalog.regions
+        self._schemas = CONFIG_SCHEMAS["azure"]
     
     def create_virtual_machine(self, name: str, vm_config: Dict[str, Any]) -> VirtualMachine:
         """Crea una VM de Azure"""
-        required_fields = ["vm_size", "image", "resource_group", "region"]
-        self._validate_config(vm_config, required_fields)
-        
+        # Requeridos, región y defaults en una pasada (no revalida configs ya validados por el plan)
+        vm_config = self._schemas["virtual_machine"].validate(vm_config)
         region = vm_config["region"]
-        if not self.validate_region(region):
-            raise ValueError(f"Region {region} not supported by Azure")
         
         vm = AzureVirtualMachine(
             name=name,
@@ -54,12 +52,8 @@ class AzureCloudFactory(CloudAbstractFactory):
     
     def create_database(self, name: str, db_config: Dict[str, Any]) -> Database:
         """Crea una Azure SQL Database"""
-        required_fields = ["tier", "server_name", "resource_group", "region"]
-        self._validate_config(db_config, required_fields)
-        
+        db_config = self._schemas["database"].validate(db_config)
         region = db_config["region"]
-        if not self.validate_region(region):
-            raise ValueError(f"Region {region} not supported by Azure")
         
         db = AzureSQLDatabase(
             name=name,
@@ -77,12 +71,8 @@ class AzureCloudFactory(CloudAbstractFactory):
     
     def create_load_balancer(self, name: str, lb_config: Dict[str, Any]) -> LoadBalancer:
         """Crea un Azure Load Balancer"""
-        required_fields = ["resource_group", "region"]
-        self._validate_config(lb_config, required_fields)
-        
+        lb_config = self._schemas["load_balancer"].validate(lb_config)
         region = lb_config["region"]
-        if not self.validate_region(region):
-            raise ValueError(f"Region {region} not supported by Azure")
         
         lb = AzureLoadBalancer(
             name=name,
@@ -100,12 +90,8 @@ class AzureCloudFactory(CloudAbstractFactory):
     
     def create_storage(self, name: str, storage_config: Dict[str, Any]) -> Storage:
         """Crea una cuenta de almacenamiento Azure Blob"""
-        required_fields = ["region"]
-        self._validate_config(storage_config, required_fields)
-        
+        storage_config = self._schemas["storage"].validate(storage_config)
         region = storage_config["region"]
-        if not self.validate_region(region):
-            raise ValueError(f"Region {region} not supported by Azure")
         
         storage = AzureBlobStorage(
             name=name,
@@ -125,7 +111,7 @@ class AzureCloudFactory(CloudAbstractFactory):
         return {
             "name": "Microsoft Azure",
             "code": "azure",
-            "supported_regions": self._supported_regions,
+            "supported_regions": list(self._catalog.region_list),
             "services": {
                 "compute": "Virtual Machines",
                 "database": "Azure SQL Database",
@@ -142,21 +128,10 @@ class AzureCloudFactory(CloudAbstractFactory):
         """Valida si la región es soportada por Azure"""
         return region in self._supported_regions
     
-    def _validate_config(self, config: Dict[str, Any], required_fields: list) -> None:
-        """Valida que la configuración tenga los campos requeridos"""
-        missing_fields = [field for field in required_fields if field not in config]
-        if missing_fields:
-            raise ValueError(f"Missing required fields for Azure: {missing_fields}")
-    
-    def get_supported_regions(self) -> set:
-        """Retorna las regiones soportadas"""
-        return self._supported_regions.copy()
+    def get_supported_regions(self) -> frozenset:
+        """Retorna las regiones soportadas (frozenset compartido del catálogo)"""
+        return self._supported_regions
     
     def get_recommended_vm_sizes(self) -> Dict[str, list]:
         """Retorna tamaños de VM recomendados por caso de uso"""
-        return {
-            "general": ["Standard_B1s", "Standard_B2s", "Standard_D2s_v3"],
-            "compute": ["Standard_F2s_v2", "Standard_F4s_v2", "Standard_F8s_v2"],
-            "memory": ["Standard_E2s_v3", "Standard_E4s_v3", "Standard_E8s_v3"],
-            "storage": ["Standard_L4s", "Standard_L8s", "Standard_L16s"]
-        }
\ No newline at end of file
+        return self._catalog.recommended_lists()
\ No newline at end of file
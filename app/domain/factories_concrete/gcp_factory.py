@@ -2,6 +2,8 @@
 from typing import Dict, Any
 from ..abstractions.factory import CloudAbstractFactory
 from ..abstractions.products import VirtualMachine, Database, LoadBalancer, Storage
+from ..catalog import get_provider_catalog
+from ..validation import CONFIG_SCHEMAS
 from ..products.gcp_products import ComputeEngineInstance, CloudSQLDatabase, CloudLoadBalancer, CloudStorage
 
 
@@ -13,10 +15,9 @@ class GCPCloudFactory(CloudAbstractFactory):
     
     def __init__(self):
         self.provider_name = "gcp"
-        self.supported_regions = [
-            "us-central1", "us-east1", "us-west1", "us-west2",
-            "europe-west1", "europe-west2", "asia-east1", "asia-southeast1"
-        ]
+        self._catalog = get_provider_catalog("gcp")
+        self.supported_regions = self._catalog.region_list
+        self._schemas = CONFIG_SCHEMAS["gcp"]
     
     def create_virtual_machine(self, name: str, config: Dict[str, Any]) -> VirtualMachine:
         """
@@ -29,8 +30,7 @@ class GCPCloudFactory(CloudAbstractFactory):
             ComputeEngineInstance: Nueva instancia de VM de GCP
         """
         # Validar configuración específica de GCP
-        self._validate_vm_config(config)
-        config = config.copy()
+        config = self._schemas["virtual_machine"].validate(config)
         config["name"] = name
         
         # Crear la instancia de Compute Engine
@@ -50,8 +50,7 @@ class GCPCloudFactory(CloudAbstractFactory):
             CloudSQLDatabase: Nueva instancia de base de datos de GCP
         """
         # Validar configuración específica de GCP
-        self._validate_database_config(config)
-        config = config.copy()
+        config = self._schemas["database"].validate(config)
         config["name"] = name
         
         # Crear la instancia de Cloud SQL
@@ -71,8 +70,7 @@ class GCPCloudFactory(CloudAbstractFactory):
             CloudLoadBalancer: Nueva instancia de load balancer de GCP
         """
         # Validar configuración específica de GCP
-        self._validate_load_balancer_config(config)
-        config = config.copy()
+        config = self._schemas["load_balancer"].validate(config)
         config["name"] = name
         
         # Crear el Load Balancer
@@ -92,8 +90,7 @@ class GCPCloudFactory(CloudAbstractFactory):
             CloudStorage: Nueva instancia de storage de GCP
         """
         # Validar configuración específica de GCP
-        self._validate_storage_config(config)
-        config = config.copy()
+        config = self._schemas["storage"].validate(config)
         config["name"] = name
         
         # Crear el Cloud Storage bucket
@@ -107,7 +104,7 @@ class GCPCloudFactory(CloudAbstractFactory):
         return {
             "name": "Google Cloud Platform",
             "code": "gcp",
-            "supported_regions": self.supported_regions,
+            "supported_regions": list(self.supported_regions),
             "services": {
                 "compute": "Compute Engine",
                 "database": "Cloud SQL",
@@ -122,78 +119,20 @@ class GCPCloudFactory(CloudAbstractFactory):
     
     def validate_region(self, region: str) -> bool:
         """Valida si la región es soportada por GCP"""
-        return region in self.supported_regions
+        return self._catalog.has_region(region)
     
-    def _validate_vm_config(self, config: Dict[str, Any]) -> None:
-        """Valida la configuración específica de Compute Engine"""
-        required_fields = ["machine_type"]
-        for field in required_fields:
-            if field not in config:
-                raise ValueError(f"Campo requerido faltante para GCP VM: {field}")
-        
-        # Validar machine types válidos de GCP
-        valid_machine_types = [
-            "e2-micro", "e2-small", "e2-medium", "e2-standard-2", "e2-standard-4",
-            "n1-standard-1", "n1-standard-2", "n1-standard-4", "n1-standard-8",
-            "n2-standard-2", "n2-standard-4", "n2-standard-8"
-        ]
-        
-        if config["machine_type"] not in valid_machine_types:
-            raise ValueError(f"Machine type inválido para GCP: {config['machine_type']}")
-    
-    def _validate_database_config(self, config: Dict[str, Any]) -> None:
-        """Valida la configuración específica de Cloud SQL"""
-        required_fields = ["engine"]
-        for field in required_fields:
-            if field not in config:
-                raise ValueError(f"Campo requerido faltante para GCP Database: {field}")
-        
-        # Validar engines soportados
-        valid_engines = ["mysql", "postgres", "sqlserver"]
-        if config["engine"] not in valid_engines:
-            raise ValueError(f"Engine de base de datos inválido para GCP: {config['engine']}")
-    
-    def _validate_load_balancer_config(self, config: Dict[str, Any]) -> None:
-        """Valida la configuración específica del Load Balancer de GCP"""
-        # Validar tipos de load balancer válidos
-        valid_types = ["HTTP(S)", "TCP", "UDP", "SSL"]
-        lb_type = config.get("type", "HTTP(S)")
-        
-        if lb_type not in valid_types:
-            raise ValueError(f"Tipo de load balancer inválido para GCP: {lb_type}")
-    
-    def _validate_storage_config(self, config: Dict[str, Any]) -> None:
-        """Valida la configuración específica de Cloud Storage"""
-        # Validar storage classes válidos
-        valid_storage_classes = ["STANDARD", "NEARLINE", "COLDLINE", "ARCHIVE"]
-        storage_class = config.get("storage_class", "STANDARD")
-        
-        if storage_class not in valid_storage_classes:
-            raise ValueError(f"Storage class inválido para GCP: {storage_class}")
-        
-        # Validar ubicaciones válidas
-        valid_locations = ["US", "EU", "ASIA"] + self.supported_regions
-        location = config.get("location", "US")
-        
-        if location not in valid_locations:
-            raise ValueError(f"Ubicación inválida para GCP Storage: {location}")
-
     # ---------------------- Métodos de capacidades (expuestos al endpoint info) ----------------------
     def get_supported_machine_types(self) -> list[str]:
-        return [
-            "e2-micro", "e2-small", "e2-medium", "e2-standard-2", "e2-standard-4",
-            "n1-standard-1", "n1-standard-2", "n1-standard-4", "n1-standard-8",
-            "n2-standard-2", "n2-standard-4", "n2-standard-8"
-        ]
+        return self._catalog.values("machine_types")
 
     def get_supported_database_engines(self) -> list[str]:
-        return ["mysql", "postgres", "sqlserver"]
+        return self._catalog.values("database_engines")
 
     def get_supported_storage_classes(self) -> list[str]:
-        return ["STANDARD", "NEARLINE", "COLDLINE", "ARCHIVE"]
+        return self._catalog.values("storage_classes")
 
     def get_supported_load_balancer_types(self) -> list[str]:
-        return ["HTTP(S)", "TCP", "UDP", "SSL"]
+        return self._catalog.values("load_balancer_types")
 
     def get_supported_locations(self) -> list[str]:
-        return ["US", "EU", "ASIA"] + self.supported_regions
\ No newline at end of file
+        return self._catalog.values("locations")
\ No newline at end of file
@@ -2,6 +2,8 @@
 from typing import Dict, Any
 from ..abstractions.factory import CloudAbstractFactory
 from ..abstractions.products import VirtualMachine, Database, LoadBalancer, Storage
+from ..catalog import get_provider_catalog
+from ..validation import CONFIG_SCHEMAS
 from ..products.oracle_products import OracleComputeInstance, OracleAutonomousDatabase, OracleLoadBalancer, OracleObjectStorage
 
 
@@ -13,13 +15,9 @@ class OracleCloudFactory(CloudAbstractFactory):
     
     def __init__(self):
         self.provider_name = "oracle"
-        self.supported_regions = [
-            "us-ashburn-1", "us-phoenix-1", "us-sanjose-1",
-            "ca-toronto-1", "ca-montreal-1",
-            "eu-frankfurt-1", "eu-zurich-1", "eu-amsterdam-1",
-            "uk-london-1", "ap-tokyo-1", "ap-osaka-1",
-            "ap-sydney-1", "ap-melbourne-1", "ap-mumbai-1"
-        ]
+        self._catalog = get_provider_catalog("oracle")
+        self.supported_regions = self._catalog.region_list
+        self._schemas = CONFIG_SCHEMAS["oracle"]
     
     def create_virtual_machine(self, name: str, vm_config: Dict[str, Any]) -> VirtualMachine:
         """
@@ -32,9 +30,8 @@ class OracleCloudFactory(CloudAbstractFactory):
             OracleComputeInstance: Nueva instancia de VM de Oracle Cloud
         """
         # Validar configuración específica de Oracle
-        config = vm_config.copy()
+        config = self._schemas["virtual_machine"].validate(vm_config)
         config["name"] = name
-        self._validate_vm_config(config)
         
         # Crear la instancia de Oracle Compute
         vm = OracleComputeInstance(config)
@@ -53,9 +50,8 @@ class OracleCloudFactory(CloudAbstractFactory):
             OracleAutonomousDatabase: Nueva instancia de base de datos de Oracle Cloud
         """
         # Validar configuración específica de Oracle
-        config = db_config.copy()
+        config = self._schemas["database"].validate(db_config)
         config["name"] = name
-        self._validate_database_config(config)
         
         # Crear la Autonomous Database
         database = OracleAutonomousDatabase(config)
@@ -74,9 +70,8 @@ class OracleCloudFactory(CloudAbstractFactory):
             OracleLoadBalancer: Nueva instancia de load balancer de Oracle Cloud
         """
         # Validar configuración específica de Oracle
-        config = lb_config.copy()
+        config = self._schemas["load_balancer"].validate(lb_config)
         config["name"] = name
-        self._validate_load_balancer_config(config)
         
         # Crear el Load Balancer
         load_balancer = OracleLoadBalancer(config)
@@ -95,9 +90,8 @@ class OracleCloudFactory(CloudAbstractFactory):
             OracleObjectStorage: Nueva instancia de storage de Oracle Cloud
         """
         # Validar configuración específica de Oracle
-        config = storage_config.copy()
+        config = self._schemas["storage"].validate(storage_config)
         config["name"] = name
-        self._validate_storage_config(config)
         
         # Crear el Object Storage bucket
         storage = OracleObjectStorage(config)
@@ -110,7 +104,7 @@ class OracleCloudFactory(CloudAbstractFactory):
         return {
             "name": "Oracle Cloud Infrastructure",
             "code": "oracle",
-            "supported_regions": self.supported_regions,
+            "supported_regions": list(self.supported_regions),
             "services": {
                 "compute": "Oracle Compute",
                 "database": "Autonomous Database",
@@ -125,79 +119,17 @@ class OracleCloudFactory(CloudAbstractFactory):
     
     def validate_region(self, region: str) -> bool:
         """Valida si la región es soportada por Oracle"""
-        return region in self.supported_regions
+        return self._catalog.has_region(region)
     
-    def _validate_vm_config(self, config: Dict[str, Any]) -> None:
-        """Valida la configuración específica de Oracle Compute"""
-        required_fields = ["compute_shape", "compartment_id", "availability_domain", "subnet_id", "image_id"]
-        for field in required_fields:
-            if field not in config:
-                raise ValueError(f"Campo requerido faltante para Oracle VM: {field}")
-        
-        # Validar compute shapes válidos de Oracle
-        valid_compute_shapes = [
-            "VM.Standard2.1", "VM.Standard2.2", "VM.Standard2.4", "VM.Standard2.8",
-            "VM.Standard3.Flex", "VM.Optimized3.Flex",
-            "BM.Standard2.52", "BM.Standard3.64",
-            "VM.Standard.E3.Flex", "VM.Standard.E4.Flex"
-        ]
-        
-        if config["compute_shape"] not in valid_compute_shapes:
-            raise ValueError(f"Compute shape inválido para Oracle: {config['compute_shape']}")
-    
-    def _validate_database_config(self, config: Dict[str, Any]) -> None:
-        """Valida la configuración específica de Autonomous Database"""
-        required_fields = ["workload_type", "compartment_id"]
-        for field in required_fields:
-            if field not in config:
-                raise ValueError(f"Campo requerido faltante para Oracle Database: {field}")
-        
-        # Validar workload types soportados
-        valid_workload_types = ["OLTP", "DW", "AJD", "APEX"]
-        if config["workload_type"] not in valid_workload_types:
-            raise ValueError(f"Workload type inválido para Oracle Database: {config['workload_type']}")
-    
-    def _validate_load_balancer_config(self, config: Dict[str, Any]) -> None:
-        """Valida la configuración específica del Load Balancer de Oracle"""
-        required_fields = ["compartment_id"]
-        for field in required_fields:
-            if field not in config:
-                raise ValueError(f"Campo requerido faltante para Oracle Load Balancer: {field}")
-        
-        # Validar shapes válidos de Load Balancer
-        valid_shapes = ["10Mbps", "100Mbps", "400Mbps", "8000Mbps"]
-        shape = config.get("shape", "100Mbps")
-        
-        if shape not in valid_shapes:
-            raise ValueError(f"Shape de load balancer inválido para Oracle: {shape}")
-    
-    def _validate_storage_config(self, config: Dict[str, Any]) -> None:
-        """Valida la configuración específica de Object Storage"""
-        required_fields = ["namespace", "compartment_id"]
-        for field in required_fields:
-            if field not in config:
-                raise ValueError(f"Campo requerido faltante para Oracle Storage: {field}")
-        
-        # Validar storage tiers válidos
-        valid_storage_tiers = ["Standard", "InfrequentAccess", "Archive"]
-        storage_tier = config.get("storage_tier", "Standard")
-        
-        if storage_tier not in valid_storage_tiers:
-            raise ValueError(f"Storage tier inválido para Oracle: {storage_tier}")
-
     # ---------------------- Métodos de capacidades (expuestos al endpoint info) ----------------------
     def get_supported_compute_shapes(self) -> list[str]:
-        return [
-            "VM.Standard2.1", "VM.Standard2.2", "VM.Standard2.4", "VM.Standard2.8",
-            "VM.Standard3.Flex", "VM.Optimized3.Flex", "BM.Standard2.52",
-            "BM.Standard3.64", "VM.Standard.E3.Flex", "VM.Standard.E4.Flex"
-        ]
+        return self._catalog.values("compute_shapes")
 
     def get_supported_database_workloads(self) -> list[str]:
-        return ["OLTP", "DW", "AJD", "APEX"]
+        return self._catalog.values("database_workloads")
 
     def get_supported_load_balancer_shapes(self) -> list[str]:
-        return ["10Mbps", "100Mbps", "400Mbps", "8000Mbps"]
+        return self._catalog.values("load_balancer_shapes")
 
     def get_supported_storage_tiers(self) -> list[str]:
-        return ["Standard", "InfrequentAccess", "Archive"]
\ No newline at end of file
+        return self._catalog.values("storage_tiers")
\ No newline at end of file
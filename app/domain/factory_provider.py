@@ -9,7 +9,7 @@ Este módulo implementa todos los principios SOLID:
 - ISP: Interfaces segregadas por tipo de recurso
 - DIP: Depende de abstracciones, no de implementaciones concretas
 """
-from typing import Dict, Type
+from typing import Callable, Dict, List, Tuple, Type
 from enum import Enum
 from .abstractions.factory import CloudAbstractFactory
 from .factories_concrete.aws_factory import AWSCloudFactory
@@ -28,6 +28,11 @@ class CloudProvider(str, Enum):
     ONPREM = "onprem"
 
 
+# Un decorador recibe el proveedor y la factory ya construida y devuelve la factory
+# a usar (normalmente un CloudFactoryDecorator que envuelve a la original)
+FactoryDecorator = Callable[[CloudProvider, CloudAbstractFactory], CloudAbstractFactory]
+
+
 class FactoryProvider:
     """
     Provider que implementa el patrón Factory Method para obtener 
@@ -37,6 +42,8 @@ class FactoryProvider:
     def __init__(self):
         # Registro de factories disponibles (patrón Registry)
         self._factories: Dict[CloudProvider, Type[CloudAbstractFactory]] = {}
+        # Cadena de decoradores por nombre (orden de registro = de dentro hacia fuera)
+        self._decorators: List[Tuple[str, FactoryDecorator]] = []
         self._register_default_factories()
     
     def _register_default_factories(self) -> None:
@@ -70,9 +77,19 @@ class FactoryProvider:
         
         factory_class = self._factories[provider]
         factory_instance = factory_class()
+        for _, decorator in self._decorators:
+            factory_instance = decorator(provider, factory_instance)
         
         print(f"🏭 Abstract Factory Provider: Creando factory para {provider.value}")
         return factory_instance
+
+    def add_decorator(self, name: str, decorator: FactoryDecorator) -> None:
+        """Registra (o reemplaza, por nombre) un decorador aplicado a cada factory creada"""
+        self.remove_decorator(name)
+        self._decorators.append((name, decorator))
+
+    def remove_decorator(self, name: str) -> None:
+        self._decorators = [(n, d) for n, d in self._decorators if n != name]
     
     def get_available_providers(self) -> list[str]:
         """Retorna la lista de proveedores disponibles"""
@@ -121,6 +138,15 @@ def register_custom_factory(
     _factory_provider.register_factory(provider, factory_class)
 
 
+def add_factory_decorator(name: str, decorator: FactoryDecorator) -> None:
+    """Añade comportamiento transversal a todas las factories (simulación, límites...)"""
+    _factory_provider.add_decorator(name, decorator)
+
+
+def remove_factory_decorator(name: str) -> None:
+    _factory_provider.remove_decorator(name)
+
+
 def is_provider_supported(provider_str: str) -> bool:
     """Verifica si un proveedor (como string) está soportado"""
     try:
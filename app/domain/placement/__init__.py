@@ -0,0 +1,26 @@
+# Inventario on-prem (hosts/datastores) y scheduler de colocación de VMs
+from .inventory import Host, Datastore, Inventory, INVENTORY_ENV_VAR, ANY_DATACENTER
+from .scheduler import (
+    PlacementScheduler,
+    Placement,
+    InsufficientCapacityError,
+    STRATEGIES,
+    get_placement_scheduler,
+    configure_placement,
+    enable_placement_from_env,
+)
+
+__all__ = [
+    "Host",
+    "Datastore",
+    "Inventory",
+    "INVENTORY_ENV_VAR",
+    "ANY_DATACENTER",
+    "PlacementScheduler",
+    "Placement",
+    "InsufficientCapacityError",
+    "STRATEGIES",
+    "get_placement_scheduler",
+    "configure_placement",
+    "enable_placement_from_env",
+]
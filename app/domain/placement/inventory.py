@@ -0,0 +1,140 @@
+"""
+Inventario on-premise: hosts (CPU/RAM) y datastores (disco) por datacenter.
+
+Se carga con la variable de entorno VM_API_ONPREM_INVENTORY (ruta a un JSON o
+el JSON en línea) o programáticamente con Inventory.from_dict(...).
+
+Formato:
+{
+  "strategy": "best_fit",
+  "datacenters": {
+    "datacenter-1": {
+      "hosts": [{"name": "esxi-01.company.local", "cpu_cores": 32, "ram_gb": 256,
+                 "hypervisor": "vmware", "cpu_overcommit": 2.0}],
+      "datastores": [{"name": "datastore1", "capacity_gb": 4096}]
+    },
+    "*": {...}
+  }
+}
+El datacenter "*" sirve a cualquier región sin datacenter propio.
+"""
+from __future__ import annotations
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+INVENTORY_ENV_VAR = "VM_API_ONPREM_INVENTORY"
+ANY_DATACENTER = "*"
+
+
+class Host:
+    """Host de virtualización con capacidad y uso de vCPU/RAM."""
+
+    __slots__ = ("name", "datacenter", "hypervisor", "cpu_cores", "cpu_overcommit", "ram_gb", "used_vcpus", "used_ram_gb", "vms")
+
+    def __init__(
+        self,
+        name: str,
+        cpu_cores: int,
+        ram_gb: float,
+        hypervisor: str = "vmware",
+        datacenter: str = ANY_DATACENTER,
+        cpu_overcommit: float = 1.0,
+    ):
+        if cpu_cores <= 0 or ram_gb <= 0 or cpu_overcommit <= 0:
+            raise ValueError(f"Host {name}: cpu_cores, ram_gb y cpu_overcommit deben ser > 0")
+        self.name = name
+        self.datacenter = datacenter
+        self.hypervisor = hypervisor
+        self.cpu_cores = cpu_cores
+        self.cpu_overcommit = cpu_overcommit
+        self.ram_gb = ram_gb
+        self.used_vcpus = 0.0
+        self.used_ram_gb = 0.0
+        self.vms = 0
+
+    @property
+    def vcpu_capacity(self) -> float:
+        return self.cpu_cores * self.cpu_overcommit
+
+    @property
+    def free_vcpus(self) -> float:
+        return self.vcpu_capacity - self.used_vcpus
+
+    @property
+    def free_ram_gb(self) -> float:
+        return self.ram_gb - self.used_ram_gb
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "datacenter": self.datacenter,
+            "hypervisor": self.hypervisor,
+            "vcpu_capacity": self.vcpu_capacity,
+            "ram_gb": self.ram_gb,
+            "used_vcpus": self.used_vcpus,
+            "used_ram_gb": self.used_ram_gb,
+            "free_vcpus": self.free_vcpus,
+            "free_ram_gb": self.free_ram_gb,
+            "vms": self.vms,
+        }
+
+
+class Datastore:
+    """Datastore compartido por los hosts de un datacenter."""
+
+    __slots__ = ("name", "datacenter", "capacity_gb", "used_gb", "vms")
+
+    def __init__(self, name: str, capacity_gb: float, datacenter: str = ANY_DATACENTER):
+        if capacity_gb <= 0:
+            raise ValueError(f"Datastore {name}: capacity_gb debe ser > 0")
+        self.name = name
+        self.datacenter = datacenter
+        self.capacity_gb = capacity_gb
+        self.used_gb = 0.0
+        self.vms = 0
+
+    @property
+    def free_gb(self) -> float:
+        return self.capacity_gb - self.used_gb
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "datacenter": self.datacenter,
+            "capacity_gb": self.capacity_gb,
+            "used_gb": self.used_gb,
+            "free_gb": self.free_gb,
+            "vms": self.vms,
+        }
+
+
+class Inventory:
+    """Hosts y datastores declarados (la capacidad usada la lleva el scheduler)."""
+
+    def __init__(self, hosts: List[Host], datastores: List[Datastore], strategy: str = "best_fit"):
+        names = [h.name for h in hosts]
+        if len(names) != len(set(names)):
+            raise ValueError("Nombres de host duplicados en el inventario")
+        self.hosts = hosts
+        self.datastores = datastores
+        self.strategy = strategy
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Inventory":
+        hosts: List[Host] = []
+        datastores: List[Datastore] = []
+        for datacenter, spec in data.get("datacenters", {}).items():
+            hosts.extend(Host(datacenter=datacenter, **h) for h in spec.get("hosts", []))
+            datastores.extend(Datastore(datacenter=datacenter, **d) for d in spec.get("datastores", []))
+        return cls(hosts, datastores, strategy=data.get("strategy", "best_fit"))
+
+    @classmethod
+    def from_env(cls) -> Optional["Inventory"]:
+        raw = os.environ.get(INVENTORY_ENV_VAR)
+        if not raw:
+            return None
+        if os.path.exists(raw):
+            with open(raw, "r", encoding="utf-8") as fh:
+                return cls.from_dict(json.load(fh))
+        return cls.from_dict(json.loads(raw))
@@ -0,0 +1,337 @@
+"""
+Scheduler de colocación on-premise: elige host y datastore para cada VM.
+
+Estrategias:
+- best_fit: el host con menos RAM libre que aún cabe (empaqueta, deja hosts enteros libres)
+- worst_fit: el host con más RAM libre (deja más hueco en cada host)
+- spread: el host con menos VMs (reparte el riesgo de caída de un host)
+
+Cada pool (datacenter, hipervisor) agrupa sus hosts por vCPU libres y, dentro
+de cada grupo, los mantiene ordenados por RAM libre y por número de VMs; cada
+datacenter mantiene sus datastores ordenados por GB libres. Una colocación son
+unas pocas búsquedas binarias y la reinserción ordenada del host elegido, así
+que sigue siendo rápida con miles de hosts incluso con el pool lleno.
+"""
+from __future__ import annotations
+import math
+import threading
+from bisect import bisect_left, insort
+from typing import Any, Dict, List, Optional, Tuple
+
+from .inventory import ANY_DATACENTER, Datastore, Host, Inventory
+
+STRATEGIES = ("best_fit", "worst_fit", "spread")
+
+
+class InsufficientCapacityError(ValueError):
+    """Ningún host/datastore del pool tiene capacidad libre para la VM."""
+
+
+class Placement:
+    """Reserva de capacidad de una VM en un host y un datastore."""
+
+    __slots__ = ("resource_id", "host", "datastore", "vcpus", "ram_gb", "disk_gb")
+
+    def __init__(self, resource_id: str, host: Host, datastore: Optional[Datastore], vcpus: float, ram_gb: float, disk_gb: float):
+        self.resource_id = resource_id
+        self.host = host
+        self.datastore = datastore
+        self.vcpus = vcpus
+        self.ram_gb = ram_gb
+        self.disk_gb = disk_gb
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "resource_id": self.resource_id,
+            "host_server": self.host.name,
+            "datastore": self.datastore.name if self.datastore else None,
+            "vcpus": self.vcpus,
+            "ram_gb": self.ram_gb,
+            "disk_gb": self.disk_gb,
+        }
+
+
+def _ram_key(host: Host) -> Tuple[float, str]:
+    return (host.free_ram_gb, host.name)
+
+
+def _spread_key(host: Host) -> Tuple[int, float, str]:
+    # Menos VMs primero; a igualdad, el de más RAM libre
+    return (host.vms, -host.free_ram_gb, host.name)
+
+
+def _disk_key(datastore: Datastore) -> Tuple[float, str]:
+    return (datastore.free_gb, datastore.name)
+
+
+def _cpu_level(host: Host) -> int:
+    return int(math.floor(host.free_vcpus))
+
+
+class _HostPool:
+    """
+    Hosts de un (datacenter, hipervisor) agrupados por vCPU libres enteras.
+
+    Cada nivel de CPU guarda sus hosts ordenados por RAM libre y por nº de VMs.
+    Una búsqueda recorre solo los niveles con CPU suficiente (decenas, no miles
+    de hosts) y en cada uno hace una bisección por RAM, así que tanto una
+    colocación como un rechazo con el pool lleno cuestan O(niveles · log n).
+    """
+
+    def __init__(self, hosts: List[Host]):
+        self.hosts: Dict[str, Host] = {h.name: h for h in hosts}
+        self.vcpu_capacity = sum(h.vcpu_capacity for h in hosts)
+        self.used_vcpus = sum(h.used_vcpus for h in hosts)
+        self._levels: List[int] = []
+        self._by_ram: Dict[int, List[Tuple[float, str]]] = {}
+        self._by_vms: Dict[int, List[Tuple[int, float, str]]] = {}
+        for host in hosts:
+            self._insert(host)
+
+    def _insert(self, host: Host) -> None:
+        level = _cpu_level(host)
+        if level not in self._by_ram:
+            insort(self._levels, level)
+            self._by_ram[level] = []
+            self._by_vms[level] = []
+        insort(self._by_ram[level], _ram_key(host))
+        insort(self._by_vms[level], _spread_key(host))
+
+    def _remove(self, host: Host) -> None:
+        level = _cpu_level(host)
+        by_ram, by_vms = self._by_ram[level], self._by_vms[level]
+        del by_ram[bisect_left(by_ram, _ram_key(host))]
+        del by_vms[bisect_left(by_vms, _spread_key(host))]
+        if not by_ram:
+            del self._by_ram[level], self._by_vms[level]
+            del self._levels[bisect_left(self._levels, level)]
+
+    def update(self, host: Host, vcpus: float, ram_gb: float, vms: int) -> None:
+        """Aplica un delta de uso manteniendo los índices ordenados."""
+        self._remove(host)
+        self.used_vcpus += vcpus
+        host.used_vcpus += vcpus
+        host.used_ram_gb += ram_gb
+        host.vms += vms
+        self._insert(host)
+
+    def find(self, vcpus: float, ram_gb: float, strategy: str) -> Optional[Host]:
+        best: Optional[Host] = None
+        best_key: Any = None
+        first_level = math.floor(vcpus)
+        for level in self._levels[bisect_left(self._levels, first_level):]:
+            by_ram = self._by_ram[level]
+            if by_ram[-1][0] < ram_gb:
+                continue
+            # En el nivel frontera (vCPU fraccionarias) hay hosts con algo menos de lo pedido
+            exact = level >= vcpus
+            if strategy == "best_fit":
+                # Menos RAM libre que aún cabe; a igualdad gana el nivel de CPU más bajo
+                for free_ram, name in by_ram[bisect_left(by_ram, (ram_gb,)):]:
+                    if exact or self.hosts[name].free_vcpus >= vcpus:
+                        if best_key is None or free_ram < best_key:
+                            best, best_key = self.hosts[name], free_ram
+                        break
+            elif strategy == "worst_fit":
+                for free_ram, name in reversed(by_ram):
+                    if free_ram < ram_gb:
+                        break
+                    if exact or self.hosts[name].free_vcpus >= vcpus:
+                        if best_key is None or (free_ram, level) >= best_key:
+                            best, best_key = self.hosts[name], (free_ram, level)
+                        break
+            else:
+                for key in self._by_vms[level]:
+                    if best_key is not None and key >= best_key:
+                        break
+                    host = self.hosts[key[2]]
+                    if host.free_ram_gb >= ram_gb and (exact or host.free_vcpus >= vcpus):
+                        best, best_key = host, key
+                        break
+        return best
+
+
+class _DatastorePool:
+    def __init__(self, datastores: List[Datastore]):
+        self.by_free: List[Tuple[float, str]] = sorted(_disk_key(d) for d in datastores)
+        self.datastores: Dict[str, Datastore] = {d.name: d for d in datastores}
+
+    def update(self, datastore: Datastore, disk_gb: float, vms: int) -> None:
+        del self.by_free[bisect_left(self.by_free, _disk_key(datastore))]
+        datastore.used_gb += disk_gb
+        datastore.vms += vms
+        insort(self.by_free, _disk_key(datastore))
+
+    def find(self, disk_gb: float, strategy: str) -> Optional[Datastore]:
+        i = bisect_left(self.by_free, (disk_gb,))
+        if i == len(self.by_free):
+            return None
+        # best_fit: el más ajustado; worst_fit/spread: el de más espacio libre
+        _, name = self.by_free[i] if strategy == "best_fit" else self.by_free[-1]
+        return self.datastores[name]
+
+
+class PlacementScheduler:
+    """Colocación thread-safe de VMs on-prem sobre un Inventory."""
+
+    def __init__(self, inventory: Inventory, strategy: Optional[str] = None):
+        strategy = strategy or inventory.strategy
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Estrategia de colocación desconocida: {strategy}. Válidas: {list(STRATEGIES)}")
+        self.strategy = strategy
+        self._inventory = inventory
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, Host] = {h.name: h for h in inventory.hosts}
+        self._host_pools: Dict[Tuple[str, str], _HostPool] = {}
+        grouped: Dict[Tuple[str, str], List[Host]] = {}
+        for host in inventory.hosts:
+            grouped.setdefault((host.datacenter, host.hypervisor), []).append(host)
+        for key, hosts in grouped.items():
+            self._host_pools[key] = _HostPool(hosts)
+        self._datastore_pools: Dict[str, _DatastorePool] = {}
+        by_dc: Dict[str, List[Datastore]] = {}
+        for datastore in inventory.datastores:
+            by_dc.setdefault(datastore.datacenter, []).append(datastore)
+        for datacenter, datastores in by_dc.items():
+            self._datastore_pools[datacenter] = _DatastorePool(datastores)
+        self._placements: Dict[str, Placement] = {}
+
+    def _host_pool(self, datacenter: str, hypervisor: str) -> Optional[_HostPool]:
+        return self._host_pools.get((datacenter, hypervisor)) or self._host_pools.get((ANY_DATACENTER, hypervisor))
+
+    def _datastore_pool(self, datacenter: str) -> Optional[_DatastorePool]:
+        return self._datastore_pools.get(datacenter) or self._datastore_pools.get(ANY_DATACENTER)
+
+    def place(
+        self,
+        resource_id: str,
+        vcpus: float,
+        ram_gb: float,
+        disk_gb: float,
+        datacenter: str = ANY_DATACENTER,
+        hypervisor: str = "vmware",
+        strategy: Optional[str] = None,
+        host_name: Optional[str] = None,
+    ) -> Placement:
+        """
+        Reserva CPU/RAM en un host y disco en un datastore. Con `host_name` se fija el
+        host (se valida su capacidad). InsufficientCapacityError si no cabe.
+        """
+        strategy = strategy or self.strategy
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Estrategia de colocación desconocida: {strategy}. Válidas: {list(STRATEGIES)}")
+        with self._lock:
+            if resource_id in self._placements:
+                return self._placements[resource_id]
+            if host_name is not None:
+                host = self._hosts.get(host_name)
+                if host is None:
+                    raise ValueError(f"Host desconocido en el inventario on-prem: {host_name}")
+                pool = self._host_pools[(host.datacenter, host.hypervisor)]
+                if host.free_vcpus < vcpus or host.free_ram_gb < ram_gb:
+                    raise InsufficientCapacityError(
+                        f"Host {host_name} sin capacidad para {vcpus} vCPU / {ram_gb} GB "
+                        f"(libres: {host.free_vcpus} vCPU / {host.free_ram_gb} GB)"
+                    )
+                datacenter = host.datacenter
+            else:
+                pool = self._host_pool(datacenter, hypervisor)
+                if pool is None:
+                    raise InsufficientCapacityError(f"No hay hosts {hypervisor} en el datacenter {datacenter}")
+                host = pool.find(vcpus, ram_gb, strategy)
+                if host is None:
+                    raise InsufficientCapacityError(
+                        f"Sin capacidad on-prem para {vcpus} vCPU / {ram_gb} GB en {datacenter} ({hypervisor})"
+                    )
+
+            datastore = None
+            datastore_pool = self._datastore_pool(datacenter)
+            if datastore_pool is not None:
+                datastore = datastore_pool.find(disk_gb, strategy)
+                if datastore is None:
+                    raise InsufficientCapacityError(f"Sin datastore con {disk_gb} GB libres en {datacenter}")
+                datastore_pool.update(datastore, disk_gb, 1)
+            pool.update(host, vcpus, ram_gb, 1)
+            placement = Placement(resource_id, host, datastore, vcpus, ram_gb, disk_gb)
+            self._placements[resource_id] = placement
+            return placement
+
+    def release(self, resource_id: str) -> bool:
+        """Libera la reserva de una VM. False si no tenía (VM sin colocación o ya liberada)."""
+        with self._lock:
+            placement = self._placements.pop(resource_id, None)
+            if placement is None:
+                return False
+            host = placement.host
+            self._host_pools[(host.datacenter, host.hypervisor)].update(host, -placement.vcpus, -placement.ram_gb, -1)
+            if placement.datastore is not None:
+                self._datastore_pools[placement.datastore.datacenter].update(placement.datastore, -placement.disk_gb, -1)
+            return True
+
+    def headroom(
+        self, vcpus: float, ram_gb: float, datacenter: str = ANY_DATACENTER, hypervisor: str = "vmware"
+    ) -> Optional[float]:
+        """
+        Fracción de vCPU del pool que quedaría libre tras colocar la VM. None si no hay
+        pool para el datacenter; negativo si ningún host tiene hueco ahora mismo.
+        """
+        with self._lock:
+            pool = self._host_pool(datacenter, hypervisor)
+            if pool is None or not pool.vcpu_capacity:
+                return None
+            if pool.find(vcpus, ram_gb, self.strategy) is None:
+                return -1.0
+            return (pool.vcpu_capacity - pool.used_vcpus - vcpus) / pool.vcpu_capacity
+
+    def datacenters(self) -> List[str]:
+        """Datacenters con hosts propios (sin el comodín)."""
+        return sorted({dc for dc, _ in self._host_pools if dc != ANY_DATACENTER})
+
+    def get(self, resource_id: str) -> Optional[Placement]:
+        return self._placements.get(resource_id)
+
+    def capacity(self) -> Dict[str, Any]:
+        """Uso por host y datastore más totales (lo que expone la API)."""
+        with self._lock:
+            hosts = [h.to_dict() for h in self._inventory.hosts]
+            datastores = [d.to_dict() for d in self._inventory.datastores]
+            placements = len(self._placements)
+        total_vcpus = sum(h["vcpu_capacity"] for h in hosts)
+        total_ram = sum(h["ram_gb"] for h in hosts)
+        total_disk = sum(d["capacity_gb"] for d in datastores)
+        return {
+            "strategy": self.strategy,
+            "placements": placements,
+            "totals": {
+                "vcpu_capacity": total_vcpus,
+                "used_vcpus": sum(h["used_vcpus"] for h in hosts),
+                "ram_gb": total_ram,
+                "used_ram_gb": sum(h["used_ram_gb"] for h in hosts),
+                "disk_gb": total_disk,
+                "used_disk_gb": sum(d["used_gb"] for d in datastores),
+            },
+            "hosts": hosts,
+            "datastores": datastores,
+        }
+
+
+# Scheduler del proceso: None = sin inventario (se mantiene el host por defecto de la VM)
+_scheduler: Optional[PlacementScheduler] = None
+
+
+def get_placement_scheduler() -> Optional[PlacementScheduler]:
+    return _scheduler
+
+
+def configure_placement(scheduler: Optional[PlacementScheduler]) -> None:
+    global _scheduler
+    _scheduler = scheduler
+
+
+def enable_placement_from_env() -> bool:
+    inventory = Inventory.from_env()
+    if inventory is None:
+        return False
+    configure_placement(PlacementScheduler(inventory))
+    print(f"🗄️ Inventario on-prem cargado: {len(inventory.hosts)} hosts, {len(inventory.datastores)} datastores")
+    return True
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, Iterable, Iterator, List
 from app.domain.schemas import VMDTO
 
 
@@ -8,6 +8,11 @@ class VMRepositoryPort(ABC):
     @abstractmethod
     def save(self, vm: VMDTO) -> None: ...
 
+    @abstractmethod
+    def save_many(self, vms: Iterable[VMDTO]) -> int:
+        """Guarda varias VMs en una sola escritura; devuelve cuántas se guardaron."""
+        ...
+
     @abstractmethod
     def get(self, vm_id: str) -> VMDTO: ...
 
@@ -16,3 +21,32 @@ class VMRepositoryPort(ABC):
 
     @abstractmethod
     def list(self) -> List[VMDTO]: ...
+
+    @abstractmethod
+    def iter(self) -> Iterator[VMDTO]:
+        """Recorre las VMs una a una sin materializar una lista completa."""
+        ...
+
+
+class AsyncVMRepositoryPort(ABC):
+    """Variante asíncrona del puerto de repositorio (para AsyncVMService)."""
+
+    @abstractmethod
+    async def save(self, vm: VMDTO) -> None: ...
+
+    @abstractmethod
+    async def save_many(self, vms: Iterable[VMDTO]) -> int: ...
+
+    @abstractmethod
+    async def get(self, vm_id: str) -> VMDTO: ...
+
+    @abstractmethod
+    async def delete(self, vm_id: str) -> None: ...
+
+    @abstractmethod
+    async def list(self) -> List[VMDTO]: ...
+
+    @abstractmethod
+    def iter(self) -> AsyncIterator[VMDTO]:
+        """Iterador asíncrono sobre las VMs (sin materializar la lista)."""
+        ...
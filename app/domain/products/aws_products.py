@@ -5,6 +5,7 @@ Estos implementan las interfaces abstractas para los servicios específicos de A
 from __future__ import annotations
 from typing import Dict, Any, List
 import uuid
+from ..abstractions.lifecycle import complete_transition
 from ..abstractions.products import VirtualMachine, Database, LoadBalancer, Storage, ResourceStatus, NetworkInterface
 
 
@@ -37,28 +38,18 @@ class EC2Instance(VirtualMachine):
     
     def start(self) -> None:
         """Inicia la instancia EC2"""
-        if self.status == ResourceStatus.STOPPED:
-            self.status = ResourceStatus.RUNNING
-            print(f"✅ EC2 Instance {self.name} started in region {self.region}")
-        else:
-            raise ValueError(f"Cannot start instance in state {self.status}")
+        complete_transition(self, "start")
+        print(f"✅ EC2 Instance {self.name} started in region {self.region}")
     
     def stop(self) -> None:
         """Detiene la instancia EC2"""
-        if self.status == ResourceStatus.RUNNING:
-            self.status = ResourceStatus.STOPPED
-            print(f"⏹️ EC2 Instance {self.name} stopped")
-        else:
-            raise ValueError(f"Cannot stop instance in state {self.status}")
+        complete_transition(self, "stop")
+        print(f"⏹️ EC2 Instance {self.name} stopped")
     
     def restart(self) -> None:
         """Reinicia la instancia EC2"""
-        if self.status == ResourceStatus.RUNNING:
-            print(f"🔄 EC2 Instance {self.name} restarting...")
-            # Simula reinicio
-            self.status = ResourceStatus.RUNNING
-        else:
-            raise ValueError(f"Cannot restart instance in state {self.status}")
+        complete_transition(self, "restart")
+        print(f"🔄 EC2 Instance {self.name} restarting...")
     
     def resize(self, new_instance_type: str) -> None:
         """Cambia el tipo de instancia"""
@@ -5,6 +5,7 @@ Estos implementan las interfaces abstractas para los servicios específicos de A
 from __future__ import annotations
 from typing import Dict, Any, List
 import uuid
+from ..abstractions.lifecycle import complete_transition
 from ..abstractions.products import VirtualMachine, Database, LoadBalancer, Storage, ResourceStatus, NetworkInterface
 
 
@@ -38,27 +39,18 @@ class AzureVirtualMachine(VirtualMachine):
     
     def start(self) -> None:
         """Inicia la VM de Azure"""
-        if self.status == ResourceStatus.STOPPED:
-            self.status = ResourceStatus.RUNNING
-            print(f"✅ Azure VM {self.name} started in region {self.region}")
-        else:
-            raise ValueError(f"Cannot start VM in state {self.status}")
+        complete_transition(self, "start")
+        print(f"✅ Azure VM {self.name} started in region {self.region}")
     
     def stop(self) -> None:
         """Detiene la VM de Azure"""
-        if self.status == ResourceStatus.RUNNING:
-            self.status = ResourceStatus.STOPPED
-            print(f"⏹️ Azure VM {self.name} stopped")
-        else:
-            raise ValueError(f"Cannot stop VM in state {self.status}")
+        complete_transition(self, "stop")
+        print(f"⏹️ Azure VM {self.name} stopped")
     
     def restart(self) -> None:
         """Reinicia la VM de Azure"""
-        if self.status == ResourceStatus.RUNNING:
-            print(f"🔄 Azure VM {self.name} restarting...")
-            self.status = ResourceStatus.RUNNING
-        else:
-            raise ValueError(f"Cannot restart VM in state {self.status}")
+        complete_transition(self, "restart")
+        print(f"🔄 Azure VM {self.name} restarting...")
     
     def resize(self, new_vm_size: str) -> None:
         """Cambia el tamaño de la VM"""
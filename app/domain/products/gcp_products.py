@@ -2,6 +2,7 @@
 from __future__ import annotations
 from typing import Dict, Any, List
 import uuid
+from ..abstractions.lifecycle import complete_transition
 from ..abstractions.products import VirtualMachine, Database, LoadBalancer, Storage, ResourceStatus, NetworkInterface
 
 
@@ -21,17 +22,17 @@ class ComputeEngineInstance(VirtualMachine):
         
     def start(self) -> None:
         """Iniciar la instancia de Compute Engine"""
+        complete_transition(self, "start")
         print(f"🟢 GCP: Iniciando Compute Engine instance {self.name} en zona {self.zone}")
-        self.status = ResourceStatus.RUNNING
         
     def stop(self) -> None:
         """Detener la instancia de Compute Engine"""
+        complete_transition(self, "stop")
         print(f"🔴 GCP: Deteniendo Compute Engine instance {self.name}")
-        self.status = ResourceStatus.STOPPED
         
     def restart(self) -> None:
+        complete_transition(self, "restart")
         print(f"🔁 GCP: Reiniciando Compute Engine instance {self.name}")
-        self.status = ResourceStatus.RUNNING
 
     def resize(self, new_size: str) -> None:
         print(f"🔄 GCP: Cambiando machine type de {self.machine_type} a {new_size}")
@@ -5,6 +5,7 @@ Estos implementan las interfaces abstractas para infraestructura on-premise (VMw
 from __future__ import annotations
 from typing import Dict, Any, List
 import uuid
+from ..abstractions.lifecycle import complete_transition
 from ..abstractions.products import VirtualMachine, Database, LoadBalancer, Storage, ResourceStatus, NetworkInterface
 
 
@@ -27,16 +28,16 @@ class OnPremiseVirtualMachine(VirtualMachine):
         self.datastore = config.get("datastore", "datastore1")
         
     def start(self) -> None:
+        complete_transition(self, "start")
         print(f"🟢 OnPrem: Iniciando VM {self.name} en {self.hypervisor} host {self.host_server}")
-        self.status = ResourceStatus.RUNNING
 
     def stop(self) -> None:
+        complete_transition(self, "stop")
         print(f"🔴 OnPrem: Deteniendo VM {self.name} en {self.hypervisor}")
-        self.status = ResourceStatus.STOPPED
 
     def restart(self) -> None:
+        complete_transition(self, "restart")
         print(f"🔁 OnPrem: Reiniciando VM {self.name} en {self.hypervisor}")
-        self.status = ResourceStatus.RUNNING
 
     def resize(self, new_size: str) -> None:
         print(f"🔄 OnPrem: Redimensionando VM {self.name} a tamaño {new_size}")
@@ -5,6 +5,7 @@ Estos implementan las interfaces abstractas para los servicios específicos de O
 from __future__ import annotations
 from typing import Dict, Any, List
 import uuid
+from ..abstractions.lifecycle import complete_transition
 from ..abstractions.products import VirtualMachine, Database, LoadBalancer, Storage, ResourceStatus, NetworkInterface
 
 
@@ -25,16 +26,16 @@ class OracleComputeInstance(VirtualMachine):
         self.image_id = config.get("image_id", "ocid1.image.oc1..example")
         
     def start(self) -> None:
+        complete_transition(self, "start")
         print(f"🟢 Oracle: Iniciando Compute instance {self.name} en AD {self.availability_domain}")
-        self.status = ResourceStatus.RUNNING
         
     def stop(self) -> None:
+        complete_transition(self, "stop")
         print(f"🔴 Oracle: Deteniendo Compute instance {self.name}")
-        self.status = ResourceStatus.STOPPED
         
     def restart(self) -> None:
+        complete_transition(self, "restart")
         print(f"🔁 Oracle: Reiniciando Compute instance {self.name}")
-        self.status = ResourceStatus.RUNNING
         
     def resize(self, new_size: str) -> None:
         print(f"🔄 Oracle: Cambiando shape de {self.compute_shape} a {new_size}")
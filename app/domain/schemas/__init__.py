@@ -10,8 +10,13 @@ from .common import (
 	VMProfile,
 )
 from .create_requests import VMCreateRequest
+from .fleet import FleetGroup, VMFleetBuildRequest, FleetBuildEvent, FleetItemError
 from .aws import AWSParams
 from .azure import AzureParams
 from .gcp import GCPParams
 from .onpremise import OnPremParams
 from .oracle import OracleParams 
+from .cost import CostItem, CostEstimateRequest, CostEstimateResponse, CostLine
+from .placement import VMPlacementRequest, VMPlacementResponse, PlacementCandidate
+from .changes import ChangeDTO, ChangesResponse
+from .watch import VMWatchEvent, VMWatchPollResponse
@@ -0,0 +1,29 @@
+"""
+Modelos de GET /changes (sincronización incremental del inventario).
+"""
+from typing import List, Literal, Optional, Union
+from pydantic import BaseModel, Field
+
+from .common import VMDTO
+from .infrastructure import InfrastructureRecord
+
+ChangeResource = Literal["vm", "infrastructure"]
+ChangeOp = Literal["created", "updated", "deleted"]
+
+
+class ChangeDTO(BaseModel):
+    seq: int = Field(..., description="Secuencia del último cambio del recurso en esta página")
+    resource: ChangeResource
+    id: str
+    op: ChangeOp
+    data: Optional[Union[VMDTO, InfrastructureRecord]] = Field(
+        None, description="Estado actual del recurso (None si es una VM borrada)"
+    )
+
+
+class ChangesResponse(BaseModel):
+    since: int
+    next_since: int = Field(..., description="Valor de `since` para la siguiente llamada")
+    current_seq: int
+    has_more: bool = Field(..., description="Quedan cambios: volver a llamar con next_since")
+    changes: List[ChangeDTO]
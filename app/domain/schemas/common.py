@@ -57,8 +57,9 @@ class VMListResponse(BaseModel):
 
 class VMBuildRequest(BaseModel):
     name: str = Field(..., example="web-01")
-    provider: ProviderEnum
-    region: str = Field(..., example="us-east-1")
+    # Sin provider y/o region el servicio elige el mejor candidato (placement multi-proveedor)
+    provider: Optional[ProviderEnum] = Field(default=None, example="aws")
+    region: Optional[str] = Field(default=None, example="us-east-1")
     tier: VMTier = Field(..., example="small", description="Nivel de VM: small|medium|large|xlarge")
     # Perfil/familia de la VM (opcional); por defecto general-purpose
     profile: VMProfile = Field(default=VMProfile.general, description="Familia de máquina: general|memory|compute")
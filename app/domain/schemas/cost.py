@@ -0,0 +1,55 @@
+"""
+Modelos de estimación de costes (catálogo de precios de app.domain.catalog).
+"""
+from typing import Dict, List, Literal, Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+CostResourceType = Literal["virtual_machine", "database", "load_balancer", "storage"]
+MAX_COST_ITEMS = 100_000
+
+
+class CostItem(BaseModel):
+    """Un recurso (o `count` recursos iguales) a valorar."""
+    # Un campo mal escrito (instance_type en vez de size) no debe valorarse en silencio como tamaño desconocido
+    model_config = ConfigDict(extra="forbid")
+
+    provider: str = Field(..., example="aws", description="aws | azure | gcp | oracle | onprem (u onpremise)")
+    resource_type: CostResourceType = Field(..., example="virtual_machine")
+    size: Optional[str] = Field(
+        default=None,
+        example="t3.medium",
+        description="Tipo de instancia, clase de BD, SKU/shape de LB o clase de storage; si no está en el catálogo se usan precios por unidad (vcpus/ram_gb) y, sin ellos, el item queda sin precio",
+    )
+    vcpus: float = Field(default=0, ge=0, description="vCPU (on-prem, tamaños fuera de catálogo, OCPU de BD Oracle)")
+    ram_gb: float = Field(default=0, ge=0)
+    storage_gb: float = Field(default=0, ge=0, description="GB de almacenamiento (BD y storage)")
+    count: int = Field(default=1, ge=1)
+    ref: Optional[str] = Field(default=None, description="Identificador libre que se devuelve en el desglose")
+
+
+class CostEstimateRequest(BaseModel):
+    items: List[CostItem] = Field(..., min_length=1, max_length=MAX_COST_ITEMS)
+    include_items: bool = Field(default=False, description="Devolver el coste de cada item")
+
+
+class CostLine(BaseModel):
+    ref: Optional[str] = None
+    provider: str
+    resource_type: str
+    size: Optional[str] = None
+    count: int = 1
+    hourly: float
+    monthly: float
+    priced: bool = Field(..., description="False si el proveedor no tiene precios para ese tipo de recurso o el tamaño no está en el catálogo y no se indicaron vcpus/ram_gb")
+
+
+class CostEstimateResponse(BaseModel):
+    currency: str = "USD"
+    hours_per_month: int
+    resources: int = Field(..., description="Recursos valorados (suma de count)")
+    total_hourly: float
+    total_monthly: float
+    by_provider: Dict[str, float]
+    by_resource_type: Dict[str, float]
+    unpriced: int = Field(0, description="Items sin precio (coste 0): tipo sin catálogo, o tamaño desconocido sin vcpus/ram_gb")
+    items: Optional[List[CostLine]] = None
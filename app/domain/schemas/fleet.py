@@ -0,0 +1,87 @@
+"""
+Modelos de construcción de flotas: varios grupos de VMs idénticas en una petición.
+"""
+from typing import List, Literal, Optional
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from .common import ProviderEnum, VMDTO, VMProfile, VMTier
+
+MAX_FLEET_SIZE = 5000
+# Marcadores disponibles en name_template
+FLEET_NAME_FIELDS = ("fleet", "group", "tier", "profile", "region", "provider", "index", "n")
+
+
+def _check_template(template: str) -> str:
+    try:
+        template.format(fleet="f", group="g", tier="t", profile="p", region="r", provider="aws", index=1, n=1)
+    except (KeyError, IndexError, ValueError) as e:
+        raise ValueError(f"name_template inválido ({e}); marcadores disponibles: {list(FLEET_NAME_FIELDS)}")
+    return template
+
+
+class FleetGroup(BaseModel):
+    """N VMs con la misma forma (proveedor, tier, perfil, región y opcionales)."""
+    name: str = Field(..., example="web", description="Nombre del grupo ({group} en la plantilla)")
+    count: int = Field(..., ge=1, le=MAX_FLEET_SIZE, example=40)
+    tier: VMTier = Field(..., example="medium")
+    region: str = Field(..., example="us-east-1")
+    provider: Optional[ProviderEnum] = Field(default=None, description="Por defecto el proveedor de la flota")
+    profile: VMProfile = Field(default=VMProfile.general)
+    name_template: Optional[str] = Field(default=None, description="Sobrescribe la plantilla de la flota para este grupo")
+    key_pair_name: Optional[str] = None
+    firewall_rules: Optional[List[str]] = None
+    public_ip: Optional[bool] = None
+    memory_optimization: Optional[bool] = None
+    disk_optimization: Optional[bool] = None
+    storage_iops: Optional[int] = None
+
+    @field_validator("name_template")
+    @classmethod
+    def _validate_template(cls, value: Optional[str]) -> Optional[str]:
+        return _check_template(value) if value is not None else value
+
+
+class VMFleetBuildRequest(BaseModel):
+    name: str = Field(..., example="checkout", description="Nombre de la flota ({fleet} en la plantilla)")
+    provider: ProviderEnum = Field(..., example="aws")
+    name_template: str = Field(
+        default="{fleet}-{group}-{index:03d}",
+        description=f"Plantilla de nombre de cada VM; marcadores: {', '.join(FLEET_NAME_FIELDS)} (index empieza en 1 por grupo)",
+    )
+    groups: List[FleetGroup] = Field(..., min_length=1)
+    requested_by: Optional[str] = Field(default="system")
+
+    @field_validator("name_template")
+    @classmethod
+    def _validate_template(cls, value: str) -> str:
+        return _check_template(value)
+
+    @model_validator(mode="after")
+    def _validate_size(self) -> "VMFleetBuildRequest":
+        total = sum(g.count for g in self.groups)
+        if total > MAX_FLEET_SIZE:
+            raise ValueError(f"La flota pide {total} VMs; máximo {MAX_FLEET_SIZE} por petición")
+        names = [g.name for g in self.groups]
+        if len(set(names)) != len(names):
+            raise ValueError("Los nombres de grupo deben ser únicos")
+        return self
+
+
+class FleetItemError(BaseModel):
+    status_code: int
+    detail: str
+
+
+class FleetBuildEvent(BaseModel):
+    """Línea del stream NDJSON: una por VM (type=vm) y un resumen final (type=summary)."""
+    type: Literal["vm", "summary"]
+    group: Optional[str] = None
+    name: Optional[str] = None
+    success: Optional[bool] = None
+    vm: Optional[VMDTO] = None
+    error: Optional[FleetItemError] = None
+    requested: Optional[int] = None
+    created: Optional[int] = None
+    failed: Optional[int] = None
+    saved: Optional[int] = None
+    elapsed_ms: Optional[float] = None
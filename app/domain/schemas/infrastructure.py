@@ -0,0 +1,111 @@
+"""
+Modelos de la API de infraestructura completa (Abstract Factory).
+"""
+from typing import Dict, Any, Optional, List
+from datetime import datetime
+from pydantic import BaseModel, Field
+
+
+class InfrastructureCreateRequest(BaseModel):
+    """Request model para crear infraestructura completa"""
+    provider: str = Field(..., description="Proveedor de cloud (aws, azure, gcp, oracle, onprem)")
+    name: str = Field(..., description="Nombre de la infraestructura")
+    region: Optional[str] = Field("us-east-1", description="Región donde crear la infraestructura")
+    vm_config: Optional[Dict[str, Any]] = Field(None, description="Configuración de VM")
+    database_config: Optional[Dict[str, Any]] = Field(None, description="Configuración de base de datos") 
+    load_balancer_config: Optional[Dict[str, Any]] = Field(None, description="Configuración de load balancer")
+    storage_config: Optional[Dict[str, Any]] = Field(None, description="Configuración de almacenamiento")
+    include_database: Optional[bool] = Field(True, description="Incluir base de datos")
+    include_load_balancer: Optional[bool] = Field(True, description="Incluir load balancer")
+    include_storage: Optional[bool] = Field(True, description="Incluir almacenamiento")
+    requested_by: Optional[str] = Field("system", description="Usuario que solicita la creación")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "provider": "aws",
+                "vm": {
+                    "name": "web-server-vm",
+                    "config": {
+                        "instance_type": "t3.micro",
+                        "ami": "ami-0abcdef1234567890",
+                        "vpc_id": "vpc-12345",
+                        "region": "us-east-1"
+                    }
+                },
+                "database": {
+                    "name": "app-database",
+                    "config": {
+                        "engine": "mysql",
+                        "instance_class": "db.t3.micro",
+                        "allocated_storage": 20,
+                        "region": "us-east-1"
+                    }
+                },
+                "load_balancer": {
+                    "name": "web-lb",
+                    "config": {
+                        "vpc_id": "vpc-12345",
+                        "region": "us-east-1",
+                        "scheme": "internet-facing"
+                    }
+                },
+                "storage": {
+                    "name": "app-storage-bucket",
+                    "config": {
+                        "region": "us-east-1",
+                        "storage_class": "STANDARD"
+                    }
+                },
+                "requested_by": "admin"
+            }
+        }
+
+
+class InfrastructureResponse(BaseModel):
+    """Response model para operaciones de infraestructura"""
+    success: bool
+    message: str
+    provider: Optional[str] = None
+    infrastructure_id: Optional[str] = None
+    resources_created: Optional[int] = None
+    infrastructure: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+class InfrastructureRecord(BaseModel):
+    """Registro persistido en memoria de una infraestructura creada"""
+    id: str
+    name: str
+    provider: str
+    region: str
+    created_at: datetime
+    updated_at: datetime
+    requested_by: str
+    resources: Dict[str, Any]
+    includes: Dict[str, bool]
+    status: str = "active"  # active | deleted
+
+
+class InfrastructureUpdateRequest(BaseModel):
+    """Modelo para actualizar componentes de una infraestructura existente"""
+    vm_config: Optional[Dict[str, Any]] = None
+    database_config: Optional[Dict[str, Any]] = None
+    load_balancer_config: Optional[Dict[str, Any]] = None
+    storage_config: Optional[Dict[str, Any]] = None
+    include_database: Optional[bool] = None
+    include_load_balancer: Optional[bool] = None
+    include_storage: Optional[bool] = None
+    requested_by: Optional[str] = "system"
+
+
+class InfrastructureListResponse(BaseModel):
+    """Listado de infraestructuras"""
+    total: int
+    items: List[InfrastructureRecord]
+
+
+class InfrastructureDeleteResponse(BaseModel):
+    success: bool
+    message: str
+    infrastructure_id: str
@@ -0,0 +1,58 @@
+"""
+Modelos de jobs de aprovisionamiento asíncrono (202 + consulta de estado).
+"""
+from typing import Any, Dict, List, Literal, Optional
+from datetime import datetime
+from pydantic import BaseModel, Field
+
+JobKind = Literal["vm.create", "vm.build", "infrastructure.create"]
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+TERMINAL_JOB_STATUSES = frozenset({"succeeded", "failed"})
+
+
+class JobProgress(BaseModel):
+    current: int = 0
+    total: int = 0
+    message: str = ""
+
+
+class JobError(BaseModel):
+    """Error final del job con el código HTTP que habría devuelto la llamada síncrona."""
+    status_code: int
+    detail: str
+
+
+class JobStatusResponse(BaseModel):
+    """Estado público de un job (lo que devuelven GET /jobs/{id} y el stream SSE)."""
+    id: str
+    kind: JobKind
+    provider: str
+    priority: int = Field(5, description="0 = máxima prioridad")
+    status: JobStatus = "queued"
+    submitted_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    progress: JobProgress = Field(default_factory=JobProgress)
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[JobError] = None
+
+
+class JobRecord(JobStatusResponse):
+    """Estado persistido: incluye el payload original para poder re-encolar tras un reinicio."""
+    request: Dict[str, Any] = Field(default_factory=dict)
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.status in TERMINAL_JOB_STATUSES
+
+
+class JobSubmitResponse(BaseModel):
+    job_id: str
+    status: JobStatus
+    status_url: str
+    events_url: str
+
+
+class JobListResponse(BaseModel):
+    total: int
+    items: List[JobStatusResponse]
@@ -0,0 +1,35 @@
+"""
+Modelos del placement multi-proveedor de /vm/build (elección de proveedor y región).
+"""
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+from .common import ProviderEnum, VMProfile, VMTier
+
+
+class VMPlacementRequest(BaseModel):
+    """Forma de la VM; provider/region opcionales restringen los candidatos."""
+    tier: VMTier = Field(..., example="medium")
+    profile: VMProfile = Field(default=VMProfile.general)
+    provider: Optional[ProviderEnum] = Field(default=None, description="Solo candidatos de este proveedor")
+    region: Optional[str] = Field(default=None, description="Solo candidatos de esta región")
+
+
+class PlacementCandidate(BaseModel):
+    provider: ProviderEnum
+    region: str
+    instance_type: Optional[str] = Field(default=None, description="Tipo elegido por el motor de sizing")
+    hourly_price: Optional[float] = Field(default=None, description="Precio/hora del tipo en esa región (precio de lista por factor regional)")
+    waste: Optional[float] = Field(default=None, description="vCPU/RAM sobrantes del tipo sobre lo pedido (fracción media)")
+    headroom: Optional[float] = Field(default=None, description="Fracción de cuota/capacidad libre tras colocar la VM")
+    score: Optional[float] = Field(default=None, description="Menor es mejor; null si el candidato no es viable")
+    feasible: bool
+
+
+class VMPlacementResponse(BaseModel):
+    tier: VMTier
+    profile: VMProfile
+    vcpus: int
+    ram_gb: float
+    chosen: Optional[PlacementCandidate] = None
+    candidates: List[PlacementCandidate]
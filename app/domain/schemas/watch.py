@@ -0,0 +1,26 @@
+"""
+Modelos de GET /vm/watch y /vm/watch/poll (transiciones de estado de VMs).
+"""
+from typing import List, Literal, Optional
+from pydantic import BaseModel, Field
+
+from .common import VMDTO
+
+WatchEventType = Literal["created", "updated", "deleted"]
+
+
+class VMWatchEvent(BaseModel):
+    seq: int = Field(..., description="Secuencia del evento (id del evento SSE)")
+    type: WatchEventType
+    id: str
+    action: Optional[str] = Field(None, description="Acción que provocó el cambio (start, stop, restart)")
+    previous_status: Optional[str] = Field(None, description="Estado anterior (None en las altas)")
+    status: str
+    vm: VMDTO = Field(..., description="Estado de la VM tras el evento (el último conocido en las bajas)")
+
+
+class VMWatchPollResponse(BaseModel):
+    since: int
+    next_since: int = Field(..., description="Valor de `since` para la siguiente llamada")
+    current_seq: int
+    events: List[VMWatchEvent]
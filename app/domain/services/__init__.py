@@ -1,5 +1,11 @@
 # Services package
 from .vm_service import VMService
+from .async_vm_service import AsyncVMService
 from .log_service import LogService
+from .infrastructure_service import InfrastructureService
+from .job_service import JobService
+from .cost_service import CostService
+from .placement_service import PlacementService
+from .lifecycle_service import VMLifecycleService
 
-__all__ = ["VMService", "LogService"]
\ No newline at end of file
+__all__ = ["VMService", "AsyncVMService", "LogService", "InfrastructureService", "JobService", "CostService", "PlacementService", "VMLifecycleService"]
@@ -0,0 +1,384 @@
+import asyncio
+import time
+from typing import TYPE_CHECKING, List, Dict, Any, AsyncIterator, Optional, Tuple
+from app.domain.schemas import (
+    VMCreateRequest,
+    VMDTO,
+    VMUpdateRequest,
+    VMActionRequest,
+    ProviderEnum,
+    VMBuildRequest,
+    VMFleetBuildRequest,
+    FleetBuildEvent,
+    FleetItemError,
+)
+from app.domain.ports import AsyncVMRepositoryPort
+from app.domain.factory_provider import create_cloud_factory
+from app.domain.abstractions.factory import CloudAbstractFactory, CloudResourceManager
+from app.domain.builders.plans import VMBuildPlan, get_vm_build_plan
+from app.domain.abstractions.lifecycle import DELETE, PROVISION, VM_LIFECYCLE
+from app.domain.abstractions.products import ResourceStatus
+from app.domain.errors import status_code_for
+from app.infrastructure.logger import audit_log_async
+from app.infrastructure.tracing import traced
+from app.infrastructure.vm_watch import WATCH_CREATED, WATCH_DELETED, WATCH_UPDATED, VMWatchHub
+from .placement_service import PlacementService
+from .vm_service import (
+    _to_cloud_provider,
+    _build_vm_config,
+    _to_vm_dto,
+    _apply_vm_changes,
+    _release_capacity,
+    _begin_transition,
+    _schedule,
+    _matches_filters,
+    _publish,
+)
+
+if TYPE_CHECKING:
+    from .lifecycle_service import VMLifecycleService
+
+# Máximo de VMs de una flota creándose a la vez
+FLEET_CONCURRENCY = 64
+
+# (grupo, nombre de la VM, proveedor, plan, región)
+_FleetItem = Tuple[str, str, ProviderEnum, VMBuildPlan, str]
+
+
+class AsyncVMService:
+    """
+    Variante asíncrona de VMService para los controladores `async def`.
+    Comparte la lógica de negocio con VMService (helpers de vm_service) y espera con
+    `await` a repositorio, hooks acreate_* de la factory y auditoría, de modo que la
+    latencia de proveedor no ocupa un hilo del pool por petición.
+    """
+
+    def __init__(
+        self,
+        repo: AsyncVMRepositoryPort,
+        placement: Optional[PlacementService] = None,
+        watch: Optional[VMWatchHub] = None,
+        lifecycle: Optional["VMLifecycleService"] = None,
+    ):
+        self.repo = repo
+        self.placement = placement or PlacementService()
+        self.watch = watch
+        self.lifecycle = lifecycle
+
+    @traced("AsyncVMService.create_vm")
+    async def create_vm(self, data: VMCreateRequest) -> VMDTO:
+        try:
+            abstract_factory = create_cloud_factory(_to_cloud_provider(data.provider))
+            vm_config = data.params.model_dump()
+            virtual_machine = await abstract_factory.acreate_virtual_machine(data.name, vm_config)
+            vm = _to_vm_dto(virtual_machine, data.provider)
+
+            provision = _begin_transition(vm, PROVISION, self.lifecycle)
+            await self.repo.save(vm)
+            _publish(self.watch, WATCH_CREATED, vm)
+            _schedule(self.lifecycle, vm, provision, data.requested_by or "system")
+            await audit_log_async(
+                actor=data.requested_by or "system",
+                action="create",
+                vm_id=vm.id,
+                provider=vm.provider,
+                success=True,
+                details={"name": vm.name},
+            )
+            return vm
+        except Exception as e:
+            await audit_log_async(
+                actor=data.requested_by or "system",
+                action="create",
+                vm_id="",
+                provider=data.provider,
+                success=False,
+                details={"error": str(e)},
+            )
+            raise
+
+    @traced("AsyncVMService.build_vm")
+    async def build_vm(self, data: VMBuildRequest) -> VMDTO:
+        try:
+            data = self.placement.resolve(data)
+            vm_config = _build_vm_config(data)
+            factory = create_cloud_factory(_to_cloud_provider(data.provider))
+            vm = await factory.acreate_virtual_machine(data.name, vm_config)
+
+            dto = _to_vm_dto(vm, data.provider)
+            provision = _begin_transition(dto, PROVISION, self.lifecycle)
+            await self.repo.save(dto)
+            _publish(self.watch, WATCH_CREATED, dto)
+            _schedule(self.lifecycle, dto, provision, "system")
+            await audit_log_async(
+                actor="system",
+                action="create(builder)",
+                vm_id=dto.id,
+                provider=dto.provider,
+                success=True,
+                details={"tier": data.tier.value, "region": data.region},
+            )
+            return dto
+        except Exception as e:
+            await audit_log_async(
+                actor="system",
+                action="create(builder)",
+                vm_id="",
+                provider=data.provider,
+                success=False,
+                details={"error": str(e)},
+            )
+            raise
+
+    async def build_fleet(
+        self,
+        data: VMFleetBuildRequest,
+        max_concurrency: int = FLEET_CONCURRENCY,
+    ) -> AsyncIterator[FleetBuildEvent]:
+        """
+        Construye una flota: el Director se ejecuta una vez por forma distinta (plan
+        memoizado), se usa una sola factory por proveedor y todas las VMs se guardan
+        con una única escritura por lotes. Emite un evento por VM en orden de
+        finalización y un resumen al final, tras guardar.
+        """
+        started = time.perf_counter()
+        factories: Dict[ProviderEnum, CloudAbstractFactory] = {}
+        items: List[_FleetItem] = []
+        n = 0
+        for group in data.groups:
+            provider = group.provider or data.provider
+            shape = VMBuildRequest(
+                name=group.name,
+                provider=provider,
+                region=group.region,
+                tier=group.tier,
+                profile=group.profile,
+                key_pair_name=group.key_pair_name,
+                firewall_rules=group.firewall_rules,
+                public_ip=group.public_ip,
+                memory_optimization=group.memory_optimization,
+                disk_optimization=group.disk_optimization,
+                storage_iops=group.storage_iops,
+            )
+            plan = get_vm_build_plan(shape)
+            if provider not in factories:
+                factories[provider] = create_cloud_factory(_to_cloud_provider(provider))
+            template = group.name_template or data.name_template
+            for index in range(1, group.count + 1):
+                n += 1
+                name = template.format(
+                    fleet=data.name, group=group.name, tier=group.tier.value, profile=group.profile.value,
+                    region=group.region, provider=provider.value, index=index, n=n,
+                )
+                items.append((group.name, name, provider, plan, group.region))
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        created: List[VMDTO] = []
+
+        async def create_one(item: _FleetItem) -> FleetBuildEvent:
+            group_name, name, provider, plan, region = item
+            async with semaphore:
+                try:
+                    vm = await factories[provider].acreate_virtual_machine(name, plan.stamp(region))
+                except Exception as e:
+                    error = FleetItemError(status_code=status_code_for(e), detail=str(e))
+                    return FleetBuildEvent(type="vm", group=group_name, name=name, success=False, error=error)
+            dto = _to_vm_dto(vm, provider)
+            _begin_transition(dto, PROVISION, self.lifecycle)
+            created.append(dto)
+            return FleetBuildEvent(type="vm", group=group_name, name=name, success=True, vm=dto)
+
+        tasks = [asyncio.create_task(create_one(item)) for item in items]
+        persisted = False
+        try:
+            failed = 0
+            for next_done in asyncio.as_completed(tasks):
+                event = await next_done
+                if not event.success:
+                    failed += 1
+                yield event
+
+            saved = await self.repo.save_many(created)
+            persisted = True
+            self._publish_created(created)
+            await audit_log_async(
+                actor=data.requested_by or "system",
+                action="create(fleet)",
+                vm_id="multiple",
+                provider=data.provider,
+                success=failed == 0,
+                details={"fleet": data.name, "requested": len(items), "created": len(created), "failed": failed},
+            )
+            yield FleetBuildEvent(
+                type="summary",
+                requested=len(items),
+                created=len(created),
+                failed=failed,
+                saved=saved,
+                elapsed_ms=round((time.perf_counter() - started) * 1000, 3),
+            )
+        finally:
+            if not persisted:
+                # Cliente desconectado a mitad: no lanzar más, pero no perder las VMs ya creadas
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                await self.repo.save_many(created)
+                self._publish_created(created)
+
+    def _publish_created(self, vms: List[VMDTO]) -> None:
+        """Publica las VMs de la flota ya guardadas y programa su aprovisionamiento (si quedaron en creating)."""
+        provision = VM_LIFECYCLE.transition(ResourceStatus.CREATING.value, PROVISION)
+        for vm in vms:
+            _publish(self.watch, WATCH_CREATED, vm)
+            if vm.status == provision.transient and self.lifecycle is not None and self.lifecycle.running:
+                self.lifecycle.schedule(vm, provision, "system")
+
+    @traced("AsyncVMService.create_infrastructure")
+    async def create_infrastructure(
+        self,
+        provider_name: str,
+        infrastructure_config: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        try:
+            cloud_factory = create_cloud_factory(_to_cloud_provider(provider_name.lower()))
+            resource_manager = CloudResourceManager(cloud_factory)
+            infrastructure = await resource_manager.acreate_infrastructure(infrastructure_config)
+
+            await audit_log_async(
+                actor=infrastructure_config.get("requested_by", "system"),
+                action="create_infrastructure",
+                vm_id="multiple",
+                provider=provider_name,
+                success=True,
+                details={
+                    "resources_created": len(infrastructure),
+                    "provider": cloud_factory.get_provider_name()
+                }
+            )
+            return {
+                "success": True,
+                "infrastructure": infrastructure,
+                "provider": cloud_factory.get_provider_name(),
+                "resources_created": len(infrastructure)
+            }
+        except Exception as e:
+            await audit_log_async(
+                actor=infrastructure_config.get("requested_by", "system"),
+                action="create_infrastructure",
+                vm_id="multiple",
+                provider=provider_name,
+                success=False,
+                details={"error": str(e)}
+            )
+            raise
+
+    @traced("AsyncVMService.update_vm")
+    async def update_vm(self, vm_id: str, changes: VMUpdateRequest) -> VMDTO:
+        vm = await self.repo.get(vm_id)
+        try:
+            previous_status = vm.status
+            _apply_vm_changes(vm, changes)
+            await self.repo.save(vm)
+            _publish(self.watch, WATCH_UPDATED, vm, previous_status)
+            await audit_log_async(
+                actor="system",
+                action="update",
+                vm_id=vm.id,
+                provider=vm.provider,
+                success=True,
+                details=changes.model_dump(exclude_none=True),
+            )
+            return vm
+        except Exception as e:
+            await audit_log_async(
+                actor="system",
+                action="update",
+                vm_id=vm_id,
+                provider=vm.provider if vm else "unknown",
+                success=False,
+                details={"error": str(e)},
+            )
+            raise
+
+    @traced("AsyncVMService.delete_vm")
+    async def delete_vm(self, vm_id: str) -> Optional[VMDTO]:
+        vm = await self.repo.get(vm_id)
+        try:
+            previous_status = vm.status
+            transition = _begin_transition(vm, DELETE, self.lifecycle)
+            if transition is None:
+                await self.repo.delete(vm_id)
+                _release_capacity(vm)
+                _publish(self.watch, WATCH_DELETED, vm, previous_status)
+            else:
+                await self.repo.save(vm)
+                _publish(self.watch, WATCH_UPDATED, vm, previous_status, action=DELETE)
+                _schedule(self.lifecycle, vm, transition, "system")
+            await audit_log_async(
+                actor="system",
+                action="delete",
+                vm_id=vm.id,
+                provider=vm.provider,
+                success=True,
+                details={"from": previous_status, "to": vm.status} if transition else None,
+            )
+            return vm if transition else None
+        except Exception as e:
+            await audit_log_async(
+                actor="system",
+                action="delete",
+                vm_id=vm_id,
+                provider=vm.provider if vm else "unknown",
+                success=False,
+                details={"error": str(e)},
+            )
+            raise
+
+    @traced("AsyncVMService.apply_action")
+    async def apply_action(self, vm_id: str, action_req: VMActionRequest) -> VMDTO:
+        vm = await self.repo.get(vm_id)
+        try:
+            previous_status = vm.status
+            transition = _begin_transition(vm, action_req.action, self.lifecycle)
+            await self.repo.save(vm)
+            _publish(self.watch, WATCH_UPDATED, vm, previous_status, action=action_req.action)
+            _schedule(self.lifecycle, vm, transition, action_req.requested_by or "system")
+            await audit_log_async(
+                actor=action_req.requested_by or "system",
+                action=action_req.action,
+                vm_id=vm.id,
+                provider=vm.provider,
+                success=True,
+                details={"from": previous_status, "to": vm.status},
+            )
+            return vm
+        except Exception as e:
+            await audit_log_async(
+                actor=action_req.requested_by or "system",
+                action=action_req.action,
+                vm_id=vm_id,
+                provider=vm.provider if vm else "unknown",
+                success=False,
+                details={"error": str(e)},
+            )
+            raise
+
+    @traced("AsyncVMService.get_vm")
+    async def get_vm(self, vm_id: str) -> VMDTO:
+        return await self.repo.get(vm_id)
+
+    @traced("AsyncVMService.list_vms")
+    async def list_vms(self) -> List[VMDTO]:
+        return await self.repo.list()
+
+    async def iter_vms(
+        self,
+        provider: Optional[ProviderEnum] = None,
+        status: Optional[str] = None,
+        name_contains: Optional[str] = None,
+    ) -> AsyncIterator[VMDTO]:
+        needle = name_contains.lower() if name_contains else None
+        async for vm in self.repo.iter():
+            if _matches_filters(vm, provider, status, needle):
+                yield vm
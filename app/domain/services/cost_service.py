@@ -0,0 +1,163 @@
+"""
+Estimación de costes de VMs e infraestructuras con el catálogo de precios.
+
+Las peticiones y el inventario se pasan a columnas (proveedor, tipo, tamaño,
+vCPU, RAM, GB, count) y se valoran de una vez con PriceCatalog (NumPy); lo
+único que se recorre en Python es la lectura de specs de cada recurso.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.domain.catalog import HOURS_PER_MONTH, CostEstimate, PriceCatalog, get_price_catalog
+from app.domain.ports import VMRepositoryPort
+from app.domain.schemas.cost import CostEstimateRequest, CostEstimateResponse, CostItem, CostLine
+from app.infrastructure.infrastructure_repository import InfrastructureRepository
+
+# Campo de specs que identifica el tamaño de cada tipo de recurso (el primero presente)
+_SIZE_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "virtual_machine": ("instance_type", "vm_size", "machine_type", "compute_shape"),
+    "database": ("instance_class", "tier", "workload_type"),
+    "load_balancer": ("sku", "shape", "type"),
+    "storage": ("storage_class", "access_tier", "storage_tier", "storage_type"),
+}
+_VCPU_FIELDS = ("vcpus", "cpu_cores", "cpu", "cpu_count")
+_RAM_FIELDS = ("memory_gb", "ram_gb")
+# GB de almacenamiento: (campo, factor a GB)
+_STORAGE_FIELDS = (
+    ("allocated_storage", 1), ("storage_size", 1), ("max_size_gb", 1), ("capacity_gb", 1),
+    ("size_gb", 1), ("storage_tb", 1024),
+)
+# Los buckets no declaran tamaño: se asume este volumen salvo que se indique otro
+DEFAULT_ASSUMED_STORAGE_GB = 100.0
+
+
+def _first(specs: Dict[str, Any], fields: Iterable[str]) -> Any:
+    for field in fields:
+        value = specs.get(field)
+        if value is not None:
+            return value
+    return None
+
+
+def _number(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def cost_item_from_specs(
+    provider: str,
+    resource_type: str,
+    specs: Optional[Dict[str, Any]],
+    ref: Optional[str] = None,
+    assumed_storage_gb: float = DEFAULT_ASSUMED_STORAGE_GB,
+) -> CostItem:
+    """Traduce las specs de un producto (get_specs) a un item valorable."""
+    specs = specs or {}
+    size = _first(specs, _SIZE_FIELDS[resource_type])
+    storage_gb = next(
+        (_number(specs[field]) * factor for field, factor in _STORAGE_FIELDS if specs.get(field) is not None),
+        assumed_storage_gb if resource_type == "storage" else 0.0,
+    )
+    return CostItem.model_construct(
+        provider=provider,
+        resource_type=resource_type,
+        size=str(size) if size is not None else None,
+        vcpus=_number(_first(specs, _VCPU_FIELDS)),
+        ram_gb=_number(_first(specs, _RAM_FIELDS)),
+        storage_gb=storage_gb,
+        count=1,
+        ref=ref,
+    )
+
+
+class CostService:
+    def __init__(
+        self,
+        vm_repo: VMRepositoryPort,
+        infra_repo: InfrastructureRepository,
+        catalog: Optional[PriceCatalog] = None,
+    ):
+        self._vm_repo = vm_repo
+        self._infra_repo = infra_repo
+        self._catalog = catalog or get_price_catalog()
+
+    def price(self, items: List[CostItem]) -> CostEstimate:
+        return self._catalog.estimate(
+            [i.provider for i in items],
+            [i.resource_type for i in items],
+            [i.size for i in items],
+            vcpus=[i.vcpus for i in items],
+            ram_gb=[i.ram_gb for i in items],
+            storage_gb=[i.storage_gb for i in items],
+            count=[i.count for i in items],
+        )
+
+    def estimate(self, request: CostEstimateRequest) -> CostEstimateResponse:
+        return self._response(request.items, include_items=request.include_items)
+
+    def vm_cost(self, provider: Optional[str] = None, include_items: bool = False) -> CostEstimateResponse:
+        """Coste del inventario de VMs (opcionalmente de un proveedor)."""
+        items = [
+            cost_item_from_specs(vm.provider.value, "virtual_machine", vm.specs, ref=vm.id)
+            for vm in self._vm_repo.iter()
+            if provider is None or vm.provider.value == provider
+        ]
+        return self._response(items, include_items=include_items)
+
+    def infrastructure_cost(
+        self,
+        infra_id: str,
+        assumed_storage_gb: float = DEFAULT_ASSUMED_STORAGE_GB,
+    ) -> CostEstimateResponse:
+        """Coste de los recursos de una infraestructura activa. KeyError si no existe."""
+        record = self._infra_repo.get(infra_id)
+        if record is None or record.status != "active":
+            raise KeyError("Infraestructura no encontrada")
+        items = [
+            cost_item_from_specs(
+                record.provider,
+                resource_type,
+                resource.get("specs"),
+                ref=resource.get("resource_id") or resource_type,
+                assumed_storage_gb=assumed_storage_gb,
+            )
+            for resource_type, resource in record.resources.items()
+            if resource_type in _SIZE_FIELDS and isinstance(resource, dict)
+        ]
+        return self._response(items, include_items=True)
+
+    def _response(self, items: List[CostItem], include_items: bool) -> CostEstimateResponse:
+        if not items:
+            return CostEstimateResponse(
+                hours_per_month=HOURS_PER_MONTH, resources=0, total_hourly=0.0, total_monthly=0.0,
+                by_provider={}, by_resource_type={}, items=[] if include_items else None,
+            )
+        estimate = self.price(items)
+        lines = None
+        if include_items:
+            lines = [
+                CostLine(
+                    ref=item.ref,
+                    provider=item.provider,
+                    resource_type=item.resource_type,
+                    size=item.size,
+                    count=item.count,
+                    hourly=round(hourly, 6),
+                    monthly=round(monthly, 4),
+                    priced=priced,
+                )
+                for item, hourly, monthly, priced in zip(
+                    items, estimate.hourly.tolist(), estimate.monthly.tolist(), estimate.priced.tolist()
+                )
+            ]
+        return CostEstimateResponse(
+            hours_per_month=HOURS_PER_MONTH,
+            resources=sum(item.count for item in items),
+            total_hourly=round(estimate.total_hourly, 6),
+            total_monthly=round(estimate.total_monthly, 4),
+            by_provider={k: round(v, 4) for k, v in estimate.by_provider.items()},
+            by_resource_type={k: round(v, 4) for k, v in estimate.by_resource_type.items()},
+            unpriced=estimate.unpriced,
+            items=lines,
+        )
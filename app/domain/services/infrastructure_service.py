@@ -0,0 +1,271 @@
+"""
+Servicio de infraestructura completa (Abstract Factory).
+Contiene el flujo de creación que antes vivía en el controlador, para que pueda
+ejecutarse tanto dentro de una petición HTTP como desde un worker de jobs.
+"""
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from uuid import uuid4
+from datetime import datetime
+
+from app.domain.factory_provider import create_cloud_factory, CloudProvider
+from app.domain.abstractions.factory import CloudResourceManager
+from app.domain.abstractions.products import CloudResource
+from app.domain.abstractions.provisioning import DEFAULT_MAX_CONCURRENCY, RESOURCE_TYPES_BY_KEY
+from app.domain.errors import ProviderError, UnsupportedProviderError
+from app.domain.placement import get_placement_scheduler
+from app.domain.schemas.infrastructure import (
+    InfrastructureCreateRequest,
+    InfrastructureResponse,
+    InfrastructureRecord,
+    InfrastructureUpdateRequest,
+)
+from app.domain.validation import CONFIG_SCHEMAS
+from app.infrastructure.governor import get_governor
+from app.infrastructure.infrastructure_repository import InfrastructureRepository
+from app.infrastructure.logger import audit_log_async
+from app.infrastructure.tracing import traced
+
+# Callback de progreso: (pasos completados, pasos totales, recurso recién creado)
+ProgressCallback = Callable[[int, int, str], Awaitable[None]]
+
+
+_RESOURCE_ICONS = {"vm": "🖥️", "database": "🗄️", "load_balancer": "⚖️", "storage": "💾"}
+_NAME_SUFFIXES = {"database": "db", "load_balancer": "lb", "storage": "storage"}
+
+
+def _resource_info(resource: CloudResource) -> Dict[str, Any]:
+    return {
+        "name": resource.name,
+        "resource_id": resource.resource_id,
+        "region": resource.region,
+        "status": resource.status.value,
+        "type": resource.get_resource_type(),
+        "specs": resource.get_specs()
+    }
+
+
+def _release_capacity(rec: InfrastructureRecord) -> None:
+    """Libera lo que reservaban los recursos de una infraestructura borrada: host on-prem y cuota del governor."""
+    scheduler = get_placement_scheduler() if rec.provider == CloudProvider.ONPREM.value else None
+    governor = get_governor()
+    for resource in rec.resources.values():
+        # Los recursos añadidos con update no se crearon en el proveedor: no tienen id ni reserva
+        resource_id = resource.get("resource_id")
+        if not resource_id:
+            continue
+        if scheduler is not None:
+            scheduler.release(resource_id)
+        if governor is not None:
+            governor.release(resource_id)
+
+
+async def _report(progress: Optional[ProgressCallback], done: int, total: int, resource: str) -> None:
+    if progress is not None:
+        await progress(done, total, resource)
+
+
+class InfrastructureService:
+    def __init__(self, repo: InfrastructureRepository, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        self._repo = repo
+        # Máximo de recursos de una misma infraestructura creándose a la vez
+        self.max_concurrency = max_concurrency
+
+    @traced("InfrastructureService.create_infrastructure")
+    async def create_infrastructure(
+        self,
+        request: InfrastructureCreateRequest,
+        progress: Optional[ProgressCallback] = None,
+    ) -> InfrastructureResponse:
+        """
+        Crea una infraestructura completa usando el patrón Abstract Factory.
+        Audita el resultado; los errores se relanzan para que el llamador
+        (controlador o worker de jobs) decida cómo exponerlos.
+        """
+        try:
+            return await self._create_infrastructure(request, progress)
+        except UnsupportedProviderError:
+            raise
+        except ProviderError as e:
+            print(f"⏳ Error transitorio del proveedor: {e}")
+            
+            await audit_log_async(
+                actor=request.requested_by,
+                action="create_infrastructure",
+                vm_id="error",
+                provider=request.provider,
+                success=False,
+                details={"error": "provider_error", "status_code": e.status_code, "details": str(e)}
+            )
+            raise
+        except KeyError as e:
+            error_msg = f"Proveedor '{request.provider}' no soportado. Proveedores disponibles: aws, azure, gcp, oracle, onprem"
+            print(f"❌ Error de proveedor: {error_msg}")
+            
+            await audit_log_async(
+                actor=request.requested_by,
+                action="create_infrastructure",
+                vm_id="error",
+                provider=request.provider,
+                success=False,
+                details={"error": "unsupported_provider"}
+            )
+            raise UnsupportedProviderError(error_msg) from e
+        except Exception as e:
+            print(f"❌ Error interno: Error interno al crear infraestructura: {str(e)}")
+            
+            await audit_log_async(
+                actor=request.requested_by,
+                action="create_infrastructure",
+                vm_id="error",
+                provider=request.provider,
+                success=False,
+                details={"error": "internal_error", "details": str(e)}
+            )
+            raise
+
+    async def _create_infrastructure(
+        self,
+        request: InfrastructureCreateRequest,
+        progress: Optional[ProgressCallback],
+    ) -> InfrastructureResponse:
+        print(f"📦 Iniciando creación de infraestructura para proveedor: {request.provider}")
+        
+        # Obtener la factory para el proveedor
+        try:
+            provider_enum = CloudProvider(request.provider.lower())
+            factory = create_cloud_factory(provider_enum)
+        except ValueError:
+            raise UnsupportedProviderError(
+                f"Proveedor '{request.provider}' no soportado. Proveedores disponibles: {[p.value for p in CloudProvider]}"
+            )
+        print(f"🏭 Factory obtenida: {type(factory).__name__}")
+        
+        # Configs del plan: defaults del proveedor y validación en una pasada con los
+        # mismos esquemas que las factories, que ya no los revalidan ni copian
+        schemas = CONFIG_SCHEMAS[provider_enum.value]
+        context = {"name": request.name, "region": request.region, "vm": {}}
+        plan_config: Dict[str, Any] = {}
+        vm_config = schemas["virtual_machine"].prepare(request.vm_config, context)
+        context["vm"] = vm_config
+        plan_config["vm"] = {"name": f"{request.name}-vm", "config": vm_config}
+        
+        for key, include, config in (
+            ("database", request.include_database, request.database_config),
+            ("load_balancer", request.include_load_balancer, request.load_balancer_config),
+            ("storage", request.include_storage, request.storage_config),
+        ):
+            if include:
+                plan_config[key] = {
+                    "name": f"{request.name}-{_NAME_SUFFIXES[key]}",
+                    "config": schemas[RESOURCE_TYPES_BY_KEY[key]].prepare(config, context),
+                }
+        
+        # Crear los recursos como DAG: BD y storage en paralelo con la VM, el LB tras la VM.
+        # Si alguno falla, CloudResourceManager elimina los ya creados y relanza el error.
+        total_steps = len(plan_config)
+        done_steps = 0
+
+        async def _on_created(key: str, resource: CloudResource) -> None:
+            nonlocal done_steps
+            done_steps += 1
+            print(f"{_RESOURCE_ICONS[key]} {resource.get_resource_type()} creado: {resource.name} ({resource.resource_id})")
+            await _report(progress, done_steps, total_steps, RESOURCE_TYPES_BY_KEY[key])
+
+        created = await CloudResourceManager(factory).acreate_infrastructure(
+            plan_config, max_concurrency=self.max_concurrency, on_created=_on_created
+        )
+        infrastructure_details = {
+            RESOURCE_TYPES_BY_KEY[key]: _resource_info(resource) for key, resource in created.items()
+        }
+        resources_created = list(infrastructure_details)
+        
+        # Registrar en logs
+        await audit_log_async(
+            actor=request.requested_by,
+            action="create_infrastructure",
+            vm_id=f"{request.name}-infrastructure",
+            provider=request.provider,
+            success=True,
+            details={
+                "infrastructure_name": request.name,
+                "resources_created": len(resources_created),
+                "pattern": "Abstract Factory"
+            }
+        )
+        
+        infra_id = str(uuid4())
+        record = InfrastructureRecord(
+            id=infra_id,
+            name=request.name,
+            provider=request.provider,
+            region=request.region,
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow(),
+            requested_by=request.requested_by,
+            resources=infrastructure_details,
+            includes={
+                "database": request.include_database,
+                "load_balancer": request.include_load_balancer,
+                "storage": request.include_storage
+            }
+        )
+        self._repo.add(record)
+
+        result = InfrastructureResponse(
+            success=True,
+            message=f"Infraestructura '{request.name}' creada exitosamente usando {request.provider.upper()}",
+            provider=request.provider,
+            infrastructure_id=infra_id,
+            resources_created=len(resources_created),
+            infrastructure=infrastructure_details
+        )
+        
+        print(f"✅ Infraestructura creada exitosamente: {len(resources_created)} recursos")
+        return result
+
+    def list_infrastructures(self) -> List[InfrastructureRecord]:
+        return self._repo.list()
+
+    def get_infrastructure(self, infra_id: str) -> InfrastructureRecord:
+        rec = self._repo.get(infra_id)
+        if not rec or rec.status != "active":
+            raise KeyError("Infraestructura no encontrada")
+        return rec
+
+    def update_infrastructure(self, infra_id: str, update: InfrastructureUpdateRequest) -> InfrastructureRecord:
+        def _apply(rec: InfrastructureRecord):
+            # Actualizar recursos existentes según configs nuevas
+            if update.vm_config and "virtual_machine" in rec.resources:
+                # Merge specs
+                rec.resources["virtual_machine"]["specs"].update(update.vm_config)
+            if update.database_config:
+                if "database" in rec.resources:
+                    rec.resources["database"]["specs"].update(update.database_config)
+                else:
+                    rec.includes["database"] = True
+                    rec.resources["database"] = {"added": True, "specs": update.database_config}
+            if update.load_balancer_config:
+                if "load_balancer" in rec.resources:
+                    rec.resources["load_balancer"]["specs"].update(update.load_balancer_config)
+                else:
+                    rec.includes["load_balancer"] = True
+                    rec.resources["load_balancer"] = {"added": True, "specs": update.load_balancer_config}
+            if update.storage_config:
+                if "storage" in rec.resources:
+                    rec.resources["storage"]["specs"].update(update.storage_config)
+                else:
+                    rec.includes["storage"] = True
+                    rec.resources["storage"] = {"added": True, "specs": update.storage_config}
+            # Flags de inclusión
+            if update.include_database is not None:
+                rec.includes["database"] = update.include_database
+            if update.include_load_balancer is not None:
+                rec.includes["load_balancer"] = update.include_load_balancer
+            if update.include_storage is not None:
+                rec.includes["storage"] = update.include_storage
+        return self._repo.update(infra_id, _apply)
+
+    def delete_infrastructure(self, infra_id: str) -> InfrastructureRecord:
+        rec = self._repo.delete(infra_id)
+        _release_capacity(rec)
+        return rec
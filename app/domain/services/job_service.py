@@ -0,0 +1,346 @@
+"""
+Jobs de aprovisionamiento asíncrono.
+
+Las peticiones de creación devuelven 202 con un id de job y un pool de workers
+las ejecuta en segundo plano. Cada proveedor tiene su propia cola de prioridad
+acotada (un proveedor lento o saturado no bloquea a los demás) y su propio
+grupo de workers. El estado se persiste en un JobStore para sobrevivir a
+reinicios: los jobs en cola se re-encolan y los que estaban en ejecución se
+marcan como fallidos (aprovisionar no es idempotente, repetirlos podría
+duplicar recursos).
+
+Los jobs terminados se conservan `retention_s` segundos y como mucho
+`max_finished` (los más antiguos salen primero); después GET /jobs/{id} da
+404. Una tarea de mantenimiento aplica la retención cada
+`maintenance_interval_s` y compacta el fichero cuando tiene más del doble
+de líneas que jobs vivos. Se configura con VM_API_JOBS_RETENTION (ruta a un
+JSON o el JSON en línea): {"retention_s": 86400, "max_finished": 10000}.
+"""
+import asyncio
+import itertools
+import json
+import os
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from app.domain.errors import JobQueueFullError, status_code_for
+from app.domain.schemas.jobs import JobError, JobKind, JobProgress, JobRecord
+from app.infrastructure.job_store import JsonlJobStore
+
+# Callback de progreso que recibe cada handler: (actual, total, mensaje)
+JobProgressCallback = Callable[[int, int, str], Awaitable[None]]
+# Handler de un tipo de job: (payload original, progreso) -> resultado serializable
+JobHandler = Callable[[Dict[str, Any], JobProgressCallback], Awaitable[Dict[str, Any]]]
+
+_QueueItem = Tuple[int, int, str]
+
+JOBS_RETENTION_ENV_VAR = "VM_API_JOBS_RETENTION"
+DEFAULT_RETENTION_S = 24 * 3600.0
+DEFAULT_MAX_FINISHED = 10_000
+DEFAULT_MAINTENANCE_INTERVAL_S = 60.0
+
+
+def _job_error_for(exc: Exception) -> JobError:
+    """Mismo código que habría devuelto el endpoint síncrono."""
+    status_code = status_code_for(exc)
+    if status_code == 500:
+        return JobError(status_code=500, detail="Internal error")
+    if isinstance(exc, KeyError):
+        return JobError(status_code=404, detail=str(exc.args[0]) if exc.args else "Not found")
+    return JobError(status_code=status_code, detail=str(exc))
+
+
+class JobService:
+    def __init__(
+        self,
+        store: JsonlJobStore,
+        queue_size: int = 100,
+        workers_per_provider: int = 4,
+        retry_after_s: float = 5.0,
+        retention_s: float = DEFAULT_RETENTION_S,
+        max_finished: int = DEFAULT_MAX_FINISHED,
+        maintenance_interval_s: float = DEFAULT_MAINTENANCE_INTERVAL_S,
+    ):
+        if queue_size <= 0 or workers_per_provider <= 0:
+            raise ValueError("queue_size y workers_per_provider deben ser > 0")
+        if retention_s <= 0 or max_finished <= 0 or maintenance_interval_s <= 0:
+            raise ValueError("retention_s, max_finished y maintenance_interval_s deben ser > 0")
+        self._store = store
+        self.queue_size = queue_size
+        self.workers_per_provider = workers_per_provider
+        self.retry_after_s = retry_after_s
+        self.retention_s = retention_s
+        self.max_finished = max_finished
+        self.maintenance_interval_s = maintenance_interval_s
+        self._handlers: Dict[str, JobHandler] = {}
+        self._jobs: Dict[str, JobRecord] = {}
+        # Ids de jobs terminados en orden de finalización: la retención expulsa por el principio
+        self._finished: "OrderedDict[str, None]" = OrderedDict()
+        # Líneas del fichero (una por job tras compactar, más los append desde entonces)
+        self._file_lines = 0
+        self._maintenance: Optional[asyncio.Task] = None
+        # Versión por job: permite a long-poll/SSE detectar cambios sin perder ninguno
+        self._versions: Dict[str, int] = {}
+        self._changed: Dict[str, asyncio.Event] = {}
+        self._queues: Dict[str, asyncio.PriorityQueue] = {}
+        self._workers: List[asyncio.Task] = []
+        self._seq = itertools.count()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def from_env(cls, store: JsonlJobStore) -> "JobService":
+        raw = os.environ.get(JOBS_RETENTION_ENV_VAR)
+        if not raw:
+            return cls(store=store)
+        if os.path.exists(raw):
+            with open(raw, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        else:
+            data = json.loads(raw)
+        return cls(
+            store=store,
+            retention_s=data.get("retention_s", DEFAULT_RETENTION_S),
+            max_finished=data.get("max_finished", DEFAULT_MAX_FINISHED),
+        )
+
+    def register_handler(self, kind: JobKind, handler: JobHandler) -> None:
+        self._handlers[kind] = handler
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None
+
+    async def start(self) -> None:
+        """Carga el estado persistido y re-encola lo pendiente. Idempotente."""
+        if self._loop is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        await self._store.start()
+        self._jobs = self._store.load()
+        pending: List[JobRecord] = []
+        for record in self._jobs.values():
+            self._versions[record.id] = 0
+            if record.status == "running":
+                record.status = "failed"
+                record.finished_at = datetime.utcnow()
+                record.error = JobError(status_code=500, detail="Job interrumpido por reinicio del servicio")
+            elif record.status == "queued":
+                pending.append(record)
+        finished = sorted((r for r in self._jobs.values() if r.is_terminal), key=lambda r: r.finished_at or r.submitted_at)
+        self._finished = OrderedDict((r.id, None) for r in finished)
+        self._evict()
+        self._compact()
+        self._maintenance = asyncio.create_task(self._maintain(), name="jobs-maintenance")
+
+        for record in sorted(pending, key=lambda r: (r.priority, r.submitted_at)):
+            queue = self._queue_for(record.provider)
+            try:
+                queue.put_nowait((record.priority, next(self._seq), record.id))
+            except asyncio.QueueFull:
+                self._finish(record, error=JobError(status_code=503, detail="Cola llena al re-encolar tras reinicio"))
+        if self._jobs:
+            print(f"🗂️ Jobs restaurados: {len(self._jobs)} ({len(pending)} re-encolados)")
+
+    async def stop(self) -> None:
+        tasks, self._workers = self._workers, []
+        if self._maintenance is not None:
+            tasks.append(self._maintenance)
+            self._maintenance = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._queues.clear()
+        # Lo encolado en el escritor llega a disco antes de salir
+        await self._store.stop()
+        self._loop = None
+
+    async def submit(self, kind: JobKind, provider: str, request: Dict[str, Any], priority: int = 5) -> JobRecord:
+        if kind not in self._handlers:
+            raise ValueError(f"Tipo de job no soportado: {kind}")
+        await self.start()
+        queue = self._queue_for(provider)
+        if queue.full():
+            raise JobQueueFullError(
+                f"Cola de jobs de '{provider}' llena ({self.queue_size}); reintente más tarde",
+                provider=provider,
+                retry_after=self.retry_after_s,
+            )
+        record = JobRecord(
+            id=str(uuid4()),
+            kind=kind,
+            provider=provider,
+            priority=priority,
+            submitted_at=datetime.utcnow(),
+            request=request,
+        )
+        self._jobs[record.id] = record
+        self._versions[record.id] = 0
+        self._append(record)
+        queue.put_nowait((priority, next(self._seq), record.id))
+        return record
+
+    def get(self, job_id: str) -> JobRecord:
+        record = self._jobs.get(job_id)
+        if record is None:
+            raise KeyError("Job no encontrado")
+        return record
+
+    def list(self, status: Optional[str] = None, kind: Optional[str] = None, limit: int = 100) -> List[JobRecord]:
+        items = [
+            r for r in self._jobs.values()
+            if (status is None or r.status == status) and (kind is None or r.kind == kind)
+        ]
+        items.sort(key=lambda r: r.submitted_at, reverse=True)
+        return items[:limit]
+
+    def queue_depths(self) -> Dict[str, int]:
+        return {provider: queue.qsize() for provider, queue in self._queues.items()}
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "jobs": len(self._jobs),
+            "finished": len(self._finished),
+            "max_finished": self.max_finished,
+            "retention_s": self.retention_s,
+            "file_lines": self._file_lines,
+            "queues": self.queue_depths(),
+        }
+
+    async def wait(self, job_id: str, timeout: float) -> JobRecord:
+        """Long-poll: espera hasta que el job termine o venza el timeout y devuelve su estado."""
+        record = self.get(job_id)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while not record.is_terminal:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                await asyncio.wait_for(self._event_for(job_id).wait(), remaining)
+            except asyncio.TimeoutError:
+                break
+        return record
+
+    async def events(self, job_id: str, heartbeat_s: float = 15.0) -> AsyncIterator[Optional[JobRecord]]:
+        """
+        Emite el estado del job en cada cambio hasta que termina.
+        Produce None cuando pasa `heartbeat_s` sin cambios (keep-alive del stream).
+        """
+        record = self.get(job_id)
+        seen = -1
+        while True:
+            version = self._versions.get(job_id, 0)
+            # Terminado y expulsado por la retención: su versión ya no está, pero no hay más cambios
+            if version != seen or (record.is_terminal and job_id not in self._jobs):
+                seen = version
+                yield record
+                if record.is_terminal:
+                    return
+                continue
+            try:
+                await asyncio.wait_for(self._event_for(job_id).wait(), heartbeat_s)
+            except asyncio.TimeoutError:
+                yield None
+
+    # ------------------------------------------------------------------ internos
+
+    def _queue_for(self, provider: str) -> asyncio.PriorityQueue:
+        queue = self._queues.get(provider)
+        if queue is None:
+            queue = asyncio.PriorityQueue(maxsize=self.queue_size)
+            self._queues[provider] = queue
+            for i in range(self.workers_per_provider):
+                self._workers.append(asyncio.create_task(self._worker(queue), name=f"jobs-{provider}-{i}"))
+        return queue
+
+    def _event_for(self, job_id: str) -> asyncio.Event:
+        event = self._changed.get(job_id)
+        if event is None:
+            event = self._changed[job_id] = asyncio.Event()
+        return event
+
+    def _notify(self, job_id: str) -> None:
+        self._versions[job_id] = self._versions.get(job_id, 0) + 1
+        # Cada cambio despierta a los que esperan y deja un Event nuevo para el siguiente
+        event = self._changed.pop(job_id, None)
+        if event is not None:
+            event.set()
+
+    def _finish(self, record: JobRecord, result: Optional[Dict[str, Any]] = None, error: Optional[JobError] = None) -> None:
+        record.status = "failed" if error is not None else "succeeded"
+        record.finished_at = datetime.utcnow()
+        record.result = result
+        record.error = error
+        self._append(record)
+        self._notify(record.id)
+        self._finished[record.id] = None
+        self._evict()
+
+    def _append(self, record: JobRecord) -> None:
+        self._store.append(record)
+        self._file_lines += 1
+
+    def _compact(self) -> None:
+        self._store.compact(self._jobs.values())
+        self._file_lines = len(self._jobs)
+
+    def _evict(self) -> None:
+        """Expulsa los terminados que superan max_finished o llevan más de retention_s terminados."""
+        cutoff = datetime.utcnow() - timedelta(seconds=self.retention_s)
+        while self._finished:
+            job_id = next(iter(self._finished))
+            record = self._jobs.get(job_id)
+            if (
+                record is not None
+                and len(self._finished) <= self.max_finished
+                and (record.finished_at or record.submitted_at) > cutoff
+            ):
+                break
+            del self._finished[job_id]
+            self._jobs.pop(job_id, None)
+            self._versions.pop(job_id, None)
+            # Quien espere ya tiene el registro terminado; solo hay que despertarlo
+            event = self._changed.pop(job_id, None)
+            if event is not None:
+                event.set()
+
+    async def _maintain(self) -> None:
+        while True:
+            await asyncio.sleep(self.maintenance_interval_s)
+            self._evict()
+            # Compactar cuesta O(jobs vivos): solo cuando el fichero ya dobla lo necesario
+            if self._file_lines > 2 * len(self._jobs):
+                self._compact()
+
+    async def _worker(self, queue: asyncio.PriorityQueue) -> None:
+        while True:
+            _, _, job_id = await queue.get()
+            try:
+                record = self._jobs.get(job_id)
+                if record is not None and record.status == "queued":
+                    await self._run(record)
+            finally:
+                queue.task_done()
+
+    async def _run(self, record: JobRecord) -> None:
+        record.status = "running"
+        record.started_at = datetime.utcnow()
+        self._append(record)
+        self._notify(record.id)
+
+        async def progress(current: int, total: int, message: str) -> None:
+            record.progress = JobProgress(current=current, total=total, message=message)
+            self._notify(record.id)
+
+        try:
+            result = await self._handlers[record.kind](record.request, progress)
+        except asyncio.CancelledError:
+            # Parada del servicio: queda "running" en disco y se marca fallido al reiniciar
+            raise
+        except Exception as e:
+            print(f"❌ Job {record.id} ({record.kind}) falló: {e}")
+            self._finish(record, error=_job_error_for(e))
+            return
+        self._finish(record, result=result)
@@ -0,0 +1,276 @@
+"""
+Ejecución asíncrona de las transiciones del ciclo de vida de las VMs.
+
+Los servicios de VMs validan cada acción con VM_LIFECYCLE, dejan la VM en su
+estado transitorio (creating, starting, stopping, restarting, deleting) y
+responden al momento. Este servicio la completa cuando vence su duración
+simulada: la VM pasa al estado final (o a error), se guarda, se audita y se
+publica en /vm/watch.
+
+Las esperas no ocupan hilos ni una tarea por transición: cada transición
+pendiente es una entrada de un heap ordenado por vencimiento, un planificador
+duerme hasta la siguiente y pasa las vencidas a un grupo de workers. Miles de
+transiciones en curso cuestan lo que sus entradas en el heap.
+
+Se configura con VM_API_LIFECYCLE (ruta a un JSON o el JSON en línea):
+
+    {"workers": 4, "seed": 42,
+     "providers": {"*":   {"*": {"latency": {"distribution": "fixed", "ms": 300}}},
+                   "aws": {"provision": {"latency": {"distribution": "lognormal", "median_ms": 800, "sigma": 0.3},
+                                         "error_rate": 0.02}}}}
+
+La latencia usa el formato de VM_API_SIMULATION y se resuelve de lo más
+específico a lo más genérico: (proveedor, acción) → (proveedor, "*") →
+("*", acción) → ("*", "*"); sin perfil se usa DEFAULT_DURATIONS_MS. Si el
+servicio no está arrancado (sin lifespan) las transiciones se completan en la
+misma petición.
+"""
+import asyncio
+import heapq
+import itertools
+import json
+import os
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.domain.abstractions.lifecycle import VM_LIFECYCLE, LifecycleTransition
+from app.domain.abstractions.products import ResourceStatus
+from app.domain.ports import AsyncVMRepositoryPort
+from app.domain.schemas import VMDTO
+from app.infrastructure.logger import audit_log_async
+from app.infrastructure.metrics import get_metrics_registry
+from app.infrastructure.simulation import WILDCARD, LatencyModel
+from app.infrastructure.vm_watch import WATCH_DELETED, WATCH_UPDATED, VMWatchHub
+from .vm_service import _publish, _release_capacity
+
+LIFECYCLE_ENV_VAR = "VM_API_LIFECYCLE"
+DEFAULT_WORKERS = 4
+# Sin perfil configurado: lo bastante largo para ver los estados transitorios
+DEFAULT_DURATIONS_MS = {"provision": 500.0, "start": 300.0, "stop": 300.0, "restart": 500.0, "delete": 200.0}
+
+LIFECYCLE_TRANSITIONS = get_metrics_registry().counter(
+    "vm_api_lifecycle_transitions_total",
+    "Transiciones de ciclo de vida terminadas por acción y resultado (completed, failed, skipped)",
+    ("action", "result"),
+)
+
+
+class TransitionProfile:
+    """Duración y tasa de fallo simuladas de una acción."""
+
+    __slots__ = ("latency", "error_rate")
+
+    def __init__(self, latency: LatencyModel, error_rate: float = 0.0):
+        if not 0.0 <= error_rate <= 1.0:
+            raise ValueError("error_rate debe estar entre 0 y 1")
+        self.latency = latency
+        self.error_rate = error_rate
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TransitionProfile":
+        latency = LatencyModel.from_dict(data["latency"]) if "latency" in data else LatencyModel()
+        return cls(latency, error_rate=data.get("error_rate", 0.0))
+
+
+class LifecycleConfig:
+    __slots__ = ("workers", "seed", "profiles", "_defaults")
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        seed: Optional[int] = None,
+        profiles: Optional[Dict[Tuple[str, str], TransitionProfile]] = None,
+    ):
+        if workers <= 0:
+            raise ValueError("workers debe ser > 0")
+        self.workers = workers
+        self.seed = seed
+        self.profiles = dict(profiles or {})
+        # Último recurso, detrás incluso de ("*", "*") configurado
+        self._defaults = {action: TransitionProfile(LatencyModel(ms=ms)) for action, ms in DEFAULT_DURATIONS_MS.items()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LifecycleConfig":
+        profiles: Dict[Tuple[str, str], TransitionProfile] = {}
+        for provider, actions in data.get("providers", {}).items():
+            for action, profile in actions.items():
+                if action != WILDCARD and action not in VM_LIFECYCLE.actions:
+                    raise ValueError(f"Acción de ciclo de vida desconocida: {action}. Válidas: {list(VM_LIFECYCLE.actions)}")
+                profiles[(provider, action)] = TransitionProfile.from_dict(profile)
+        return cls(workers=data.get("workers", DEFAULT_WORKERS), seed=data.get("seed"), profiles=profiles)
+
+    @classmethod
+    def from_env(cls) -> "LifecycleConfig":
+        raw = os.environ.get(LIFECYCLE_ENV_VAR)
+        if not raw:
+            return cls()
+        if os.path.exists(raw):
+            with open(raw, "r", encoding="utf-8") as fh:
+                return cls.from_dict(json.load(fh))
+        return cls.from_dict(json.loads(raw))
+
+    def profile_for(self, provider: str, action: str) -> TransitionProfile:
+        for key in ((provider, action), (provider, WILDCARD), (WILDCARD, action), (WILDCARD, WILDCARD)):
+            profile = self.profiles.get(key)
+            if profile is not None:
+                return profile
+        return self._defaults.get(action) or TransitionProfile(LatencyModel())
+
+
+class _PendingTransition:
+    __slots__ = ("vm_id", "provider", "transition", "actor", "requested_at", "error_rate")
+
+    def __init__(self, vm_id: str, provider: str, transition: LifecycleTransition, actor: str):
+        self.vm_id = vm_id
+        self.provider = provider
+        self.transition = transition
+        self.actor = actor
+        self.requested_at = time.monotonic()
+        self.error_rate = 0.0
+
+
+class VMLifecycleService:
+    def __init__(
+        self,
+        repo: AsyncVMRepositoryPort,
+        watch: Optional[VMWatchHub] = None,
+        config: Optional[LifecycleConfig] = None,
+    ):
+        self.repo = repo
+        self.watch = watch
+        self.config = config or LifecycleConfig()
+        self._rng = random.Random(self.config.seed)
+        # (vencimiento en loop.time(), desempate, transición); solo se toca desde el event loop
+        self._heap: List[Tuple[float, int, _PendingTransition]] = []
+        self._order = itertools.count()
+        self._ready: Optional[asyncio.Queue] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._in_flight = 0
+        self._counts = {"scheduled": 0, "completed": 0, "failed": 0, "skipped": 0}
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None
+
+    async def start(self) -> None:
+        """Arranca planificador y workers. Idempotente."""
+        if self._loop is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._ready = asyncio.Queue()
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._scheduler(), name="lifecycle-scheduler")]
+        self._tasks += [
+            asyncio.create_task(self._worker(), name=f"lifecycle-worker-{i}") for i in range(self.config.workers)
+        ]
+
+    async def stop(self) -> None:
+        """Las transiciones pendientes se descartan: el inventario en memoria tampoco sobrevive al proceso."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._heap.clear()
+        self._loop = None
+
+    def schedule(self, vm: VMDTO, transition: LifecycleTransition, actor: str = "system") -> None:
+        """
+        Programa el final de una transición ya iniciada (la VM está en
+        transition.transient). Se puede llamar desde el event loop o desde el
+        threadpool de los endpoints sync.
+        """
+        pending = _PendingTransition(vm.id, getattr(vm.provider, "value", str(vm.provider)), transition, actor)
+        loop = self._loop
+        if loop is None:
+            raise RuntimeError("VMLifecycleService no está arrancado")
+        if asyncio._get_running_loop() is loop:
+            self._push(pending)
+        else:
+            loop.call_soon_threadsafe(self._push, pending)
+
+    def _push(self, pending: _PendingTransition) -> None:
+        profile = self.config.profile_for(pending.provider, pending.transition.action)
+        pending.error_rate = profile.error_rate
+        due = self._loop.time() + profile.latency.sample(self._rng)
+        heapq.heappush(self._heap, (due, next(self._order), pending))
+        self._counts["scheduled"] += 1
+        # Solo hace falta despertar al planificador si esta es ahora la más próxima
+        if self._heap[0][2] is pending:
+            self._wakeup.set()
+
+    async def _scheduler(self) -> None:
+        loop = asyncio.get_running_loop()
+        heap, ready, wakeup = self._heap, self._ready, self._wakeup
+        while True:
+            wakeup.clear()
+            now = loop.time()
+            while heap and heap[0][0] <= now:
+                ready.put_nowait(heapq.heappop(heap)[2])
+            timeout = heap[0][0] - now if heap else None
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _worker(self) -> None:
+        while True:
+            pending = await self._ready.get()
+            self._in_flight += 1
+            try:
+                await self._complete(pending)
+            except Exception as e:
+                print(f"⚠️ Transición {pending.transition.action} de {pending.vm_id} fallida: {e}")
+            finally:
+                self._in_flight -= 1
+
+    def _finish(self, pending: _PendingTransition, result: str) -> None:
+        self._counts[result] += 1
+        LIFECYCLE_TRANSITIONS.inc((pending.transition.action, result))
+
+    async def _complete(self, pending: _PendingTransition) -> None:
+        transition = pending.transition
+        try:
+            vm = await self.repo.get(pending.vm_id)
+        except KeyError:
+            self._finish(pending, "skipped")
+            return
+        if vm.status != transition.transient:
+            # Otra transición la reemplazó (p. ej. se borró mientras arrancaba)
+            self._finish(pending, "skipped")
+            return
+        previous_status = vm.status
+        elapsed_ms = round((time.monotonic() - pending.requested_at) * 1000, 1)
+        failed = pending.error_rate > 0 and self._rng.random() < pending.error_rate
+        if failed:
+            vm.status = ResourceStatus.ERROR.value
+            await self.repo.save(vm)
+            _publish(self.watch, WATCH_UPDATED, vm, previous_status, action=transition.action)
+        elif transition.target is None:
+            await self.repo.delete(vm.id)
+            _release_capacity(vm)
+            _publish(self.watch, WATCH_DELETED, vm, previous_status, action=transition.action)
+        else:
+            vm.status = transition.target
+            await self.repo.save(vm)
+            _publish(self.watch, WATCH_UPDATED, vm, previous_status, action=transition.action)
+        self._finish(pending, "failed" if failed else "completed")
+        await audit_log_async(
+            actor=pending.actor,
+            action=f"{transition.action}(completed)",
+            vm_id=vm.id,
+            provider=vm.provider,
+            success=not failed,
+            details={"from": previous_status, "to": vm.status if transition.target or failed else "deleted", "elapsed_ms": elapsed_ms},
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "workers": self.config.workers,
+            "pending": len(self._heap) + (self._ready.qsize() if self._ready is not None else 0) + self._in_flight,
+            **self._counts,
+            "transitions": VM_LIFECYCLE.describe(),
+        }
@@ -1,17 +1,65 @@
-import json
 import os
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from app.domain.schemas.logs import AuditLogEntry, LogsQuery
+from app.infrastructure.logger import LOG_FILE
+from app.infrastructure.metrics import get_metrics_registry
+from app.infrastructure.serialization import JSONDecodeError, loads
+
+_metrics = get_metrics_registry()
+LOG_SCAN_LINES = _metrics.counter("vm_api_log_scan_lines_total", "Líneas leídas del log de auditoría", ("op",))
+LOG_SCAN_BYTES = _metrics.counter("vm_api_log_scan_bytes_total", "Bytes leídos del log de auditoría", ("op",))
+
+_ENTRY_STR_FIELDS = ("timestamp", "actor", "action", "vm_id", "provider")
+
+
+def _as_entry(data: Any) -> Dict[str, Any]:
+    """
+    Dict con el esquema de AuditLogEntry. Las líneas que escribe audit_log ya
+    tienen los tipos exactos y se aceptan sin pasar por Pydantic; el resto se
+    valida (y coerciona) con el modelo, que lanza si no encaja.
+    """
+    if type(data) is dict and type(data.get("success")) is bool:
+        for field in _ENTRY_STR_FIELDS:
+            if type(data.get(field)) is not str:
+                break
+        else:
+            details = data.get("details")
+            if details is None or type(details) is dict:
+                return data
+    return AuditLogEntry(**data).model_dump()
 
 
 class LogService:
     def __init__(self):
-        # Ruta absoluta al archivo de logs
-        project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-        self.log_file_path = os.path.join(project_root, "logs", "audit.log")
+        # El mismo fichero en el que escribe audit_log (VM_API_LOG_DIR)
+        self.log_file_path = LOG_FILE
         print(f"🔍 LogService - Ruta del archivo: {self.log_file_path}")
         print(f"📁 Existe archivo: {os.path.exists(self.log_file_path)}")
 
+    def _scan(self, op: str) -> List[Dict[str, Any]]:
+        """
+        Entradas válidas del log como dicts. Se lee en binario (loads acepta
+        bytes) y solo se construyen modelos para lo que se devuelve.
+        """
+        entries = []
+        line_count = 0
+        with open(self.log_file_path, 'rb') as file:
+            for line in file:
+                line_count += 1
+                line = line.strip()
+                if line:
+                    try:
+                        entries.append(_as_entry(loads(line)))
+                    except JSONDecodeError as e:
+                        print(f"❌ Error JSON en línea {line_count}: {e}")
+                        continue  # Skip malformed lines
+                    except Exception as e:
+                        print(f"❌ Error creando AuditLogEntry en línea {line_count}: {e}")
+                        continue
+            LOG_SCAN_LINES.inc((op,), line_count)
+            LOG_SCAN_BYTES.inc((op,), file.tell())
+        return entries
+
     def get_logs(self, query: LogsQuery) -> tuple[List[AuditLogEntry], int]:
         """
         Obtiene logs con filtros y paginación.
@@ -21,27 +69,9 @@ class LogService:
             print(f"❌ Archivo no encontrado: {self.log_file_path}")
             return [], 0
 
-        all_logs = []
-        line_count = 0
-        
         try:
-            with open(self.log_file_path, 'r', encoding='utf-8') as file:
-                for line in file:
-                    line_count += 1
-                    line = line.strip()
-                    if line:
-                        try:
-                            log_data = json.loads(line)
-                            all_logs.append(AuditLogEntry(**log_data))
-                        except json.JSONDecodeError as e:
-                            print(f"❌ Error JSON en línea {line_count}: {e}")
-                            continue  # Skip malformed lines
-                        except Exception as e:
-                            print(f"❌ Error creando AuditLogEntry en línea {line_count}: {e}")
-                            continue
-            
-            print(f"✅ Cargados {len(all_logs)} logs de {line_count} líneas")
-            
+            all_logs = self._scan("get_logs")
+            print(f"✅ Cargados {len(all_logs)} logs")
         except FileNotFoundError:
             print(f"❌ Archivo no encontrado: {self.log_file_path}")
             return [], 0
@@ -53,34 +83,38 @@ class LogService:
         filtered_logs = self._apply_filters(all_logs, query)
         
         # Ordenar por timestamp (más recientes primero)
-        filtered_logs.sort(key=lambda x: x.timestamp, reverse=True)
+        filtered_logs.sort(key=lambda x: x["timestamp"], reverse=True)
         
         # Aplicar paginación
         total = len(filtered_logs)
         start_idx = (query.page - 1) * query.page_size
         end_idx = start_idx + query.page_size
-        paginated_logs = filtered_logs[start_idx:end_idx]
+        paginated_logs = [AuditLogEntry.model_validate(entry) for entry in filtered_logs[start_idx:end_idx]]
         
         return paginated_logs, total
 
-    def _apply_filters(self, logs: List[AuditLogEntry], query: LogsQuery) -> List[AuditLogEntry]:
+    def _apply_filters(self, logs: List[Dict[str, Any]], query: LogsQuery) -> List[Dict[str, Any]]:
         """Aplica filtros a la lista de logs"""
         filtered = logs
         
         if query.actor:
-            filtered = [log for log in filtered if query.actor.lower() in log.actor.lower()]
+            actor = query.actor.lower()
+            filtered = [log for log in filtered if actor in log["actor"].lower()]
         
         if query.action:
-            filtered = [log for log in filtered if query.action.lower() in log.action.lower()]
+            action = query.action.lower()
+            filtered = [log for log in filtered if action in log["action"].lower()]
         
         if query.provider:
-            filtered = [log for log in filtered if query.provider.lower() in log.provider.lower()]
+            provider = query.provider.lower()
+            filtered = [log for log in filtered if provider in log["provider"].lower()]
         
         if query.success is not None:
-            filtered = [log for log in filtered if log.success == query.success]
+            filtered = [log for log in filtered if log["success"] == query.success]
         
         if query.vm_id:
-            filtered = [log for log in filtered if query.vm_id.lower() in log.vm_id.lower()]
+            vm_id = query.vm_id.lower()
+            filtered = [log for log in filtered if vm_id in log["vm_id"].lower()]
         
         return filtered
 
@@ -101,33 +135,24 @@ class LogService:
                 "actions": {}
             }
 
-        all_logs = []
         try:
-            with open(self.log_file_path, 'r', encoding='utf-8') as file:
-                for line in file:
-                    line = line.strip()
-                    if line:
-                        try:
-                            log_data = json.loads(line)
-                            all_logs.append(AuditLogEntry(**log_data))
-                        except json.JSONDecodeError:
-                            continue
+            all_logs = self._scan("get_stats")
         except FileNotFoundError:
-            pass
+            all_logs = []
 
         total = len(all_logs)
-        successful = len([log for log in all_logs if log.success])
+        successful = sum(1 for log in all_logs if log["success"])
         failed = total - successful
 
         # Contar por proveedor
         providers = {}
         for log in all_logs:
-            providers[log.provider] = providers.get(log.provider, 0) + 1
+            providers[log["provider"]] = providers.get(log["provider"], 0) + 1
 
         # Contar por acción
         actions = {}
         for log in all_logs:
-            actions[log.action] = actions.get(log.action, 0) + 1
+            actions[log["action"]] = actions.get(log["action"], 0) + 1
 
         return {
             "total_operations": total,
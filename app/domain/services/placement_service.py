@@ -0,0 +1,235 @@
+"""
+Placement multi-proveedor para /vm/build: elige proveedor y región cuando el
+cliente no los fija.
+
+Cada candidato (proveedor, región) se puntúa con:
+- el precio/hora del tipo que el motor de sizing elige para la forma, por el
+  factor de precio de la región (catálogo de proveedores),
+- la holgura de ese tipo sobre lo pedido (vCPU/RAM que se pagan sin usarse),
+- el margen de cuota que deja en el governor (si hay cuotas configuradas),
+- la capacidad libre del datacenter on-prem (si hay inventario).
+
+Lo que solo depende de la forma (tier, perfil) —tipo, precio, holgura— se
+calcula una vez y se cachea como arrays NumPy; en cada petición solo se leen
+los márgenes dinámicos y la puntuación es una operación vectorizada sobre
+todos los candidatos. Menor puntuación es mejor; a igual puntuación gana la
+región que va antes en el catálogo del proveedor (su orden de preferencia).
+"""
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.domain.catalog import SizingEngine, get_provider_catalog, get_sizing_engine
+from app.domain.factory_provider import CloudProvider
+from app.domain.placement import InsufficientCapacityError, PlacementScheduler, get_placement_scheduler
+from app.domain.schemas import ProviderEnum, VMBuildRequest
+from app.domain.schemas.placement import PlacementCandidate, VMPlacementResponse
+from app.infrastructure.governor import ProvisioningGovernor, get_governor
+
+# Peso de cada término: precio relativo al candidato viable más barato (1.0 = el
+# más barato), holgura del tipo y cuota/capacidad que se consume
+SCORE_WEIGHTS: Dict[str, float] = {"price": 1.0, "waste": 0.25, "headroom": 0.5}
+# Sin inventario no se conoce la capacidad on-prem: solo es candidato si se pide
+# provider=onpremise, en la región por defecto de los productos
+DEFAULT_ONPREM_REGIONS: Tuple[str, ...] = ("datacenter-1",)
+SHAPE_CACHE_SIZE = 64
+
+
+_PROVIDER_CODES: Dict[ProviderEnum, int] = {p: i for i, p in enumerate(ProviderEnum)}
+
+
+# (región, factor de precio) en el orden de preferencia del catálogo
+_Regions = Tuple[Tuple[str, float], ...]
+
+
+def _cloud_key(provider: ProviderEnum) -> str:
+    return CloudProvider.ONPREM.value if provider == ProviderEnum.onpremise else provider.value
+
+
+class _ShapeTable:
+    """Candidatos y su parte estática de la puntuación para una forma (tier, perfil)."""
+
+    __slots__ = (
+        "providers", "regions", "cloud_keys", "instance_types",
+        "provider_codes", "region_names", "price", "waste", "vcpus", "ram_gb", "onprem",
+    )
+
+    def __init__(self, engine: SizingEngine, tier: str, profile: str, regions: Dict[ProviderEnum, _Regions]):
+        need_vcpus, need_ram = engine.requirements(tier, profile)
+        self.providers: List[ProviderEnum] = []
+        self.regions: List[str] = []
+        self.cloud_keys: List[str] = []
+        self.instance_types: List[Optional[str]] = []
+        price, waste, vcpus, ram_gb = [], [], [], []
+        for provider, provider_regions in regions.items():
+            key = _cloud_key(provider)
+            try:
+                selected = engine.select_for_tier(key, tier, profile)
+            except ValueError:
+                selected = None
+            for region, factor in provider_regions:
+                self.providers.append(provider)
+                self.regions.append(region)
+                self.cloud_keys.append(key)
+                self.instance_types.append(selected.name if selected else None)
+                if selected is None:
+                    price.append(np.inf)
+                    waste.append(np.inf)
+                    vcpus.append(need_vcpus)
+                    ram_gb.append(need_ram)
+                else:
+                    price.append(selected.price_hour * factor)
+                    waste.append(((selected.vcpus - need_vcpus) / need_vcpus + (selected.ram_gb - need_ram) / need_ram) / 2)
+                    vcpus.append(selected.vcpus)
+                    ram_gb.append(selected.ram_gb)
+        self.price = np.asarray(price, dtype=np.float64)
+        self.waste = np.asarray(waste, dtype=np.float64)
+        self.vcpus = np.asarray(vcpus, dtype=np.float64)
+        self.ram_gb = np.asarray(ram_gb, dtype=np.float64)
+        self.provider_codes = np.asarray([_PROVIDER_CODES[p] for p in self.providers], dtype=np.int8)
+        self.region_names = np.asarray(self.regions, dtype=object)
+        self.onprem = self.provider_codes == _PROVIDER_CODES[ProviderEnum.onpremise]
+
+
+class PlacementService:
+    def __init__(
+        self,
+        engine: Optional[SizingEngine] = None,
+        quota_source: Callable[[], Optional[ProvisioningGovernor]] = get_governor,
+        capacity_source: Callable[[], Optional[PlacementScheduler]] = get_placement_scheduler,
+    ):
+        self._engine = engine or get_sizing_engine()
+        self._quota_source = quota_source
+        self._capacity_source = capacity_source
+        self._cloud_regions: Optional[Dict[ProviderEnum, _Regions]] = None
+        self._shape_table = lru_cache(maxsize=SHAPE_CACHE_SIZE)(self._build_shape_table)
+
+    def _cloud_regions_table(self) -> Dict[ProviderEnum, _Regions]:
+        if self._cloud_regions is None:
+            # Regiones del catálogo de proveedores (las mismas con las que validan las
+            # factories), en su orden: np.argmin se queda con la primera en un empate
+            self._cloud_regions = {}
+            for provider in ProviderEnum:
+                if provider == ProviderEnum.onpremise:
+                    continue
+                catalog = get_provider_catalog(_cloud_key(provider))
+                self._cloud_regions[provider] = tuple((r, catalog.price_factor(r)) for r in catalog.region_list)
+        return self._cloud_regions
+
+    def _build_shape_table(self, tier: str, profile: str, onprem_regions: Tuple[str, ...]) -> _ShapeTable:
+        regions = {**self._cloud_regions_table(), ProviderEnum.onpremise: tuple((r, 1.0) for r in onprem_regions)}
+        return _ShapeTable(self._engine, tier, profile, regions)
+
+    def _headroom(self, table: _ShapeTable, mask: np.ndarray) -> np.ndarray:
+        """Margen dinámico por candidato (1.0 = sin límites); solo se consulta lo enmascarado."""
+        headroom = np.ones(len(table.providers), dtype=np.float64)
+        governor = self._quota_source()
+        scheduler = self._capacity_source()
+        if governor is None and scheduler is None:
+            return headroom
+        for i in np.flatnonzero(mask):
+            if governor is not None:
+                quota = governor.quota_headroom(table.cloud_keys[i], table.regions[i], table.vcpus[i])
+                if quota is not None:
+                    headroom[i] = min(headroom[i], quota)
+            if scheduler is not None and table.onprem[i]:
+                capacity = scheduler.headroom(table.vcpus[i], table.ram_gb[i], datacenter=table.regions[i])
+                if capacity is not None:
+                    headroom[i] = min(headroom[i], capacity)
+        return headroom
+
+    def score(
+        self,
+        tier: str,
+        profile: str = "general",
+        provider: Optional[ProviderEnum] = None,
+        region: Optional[str] = None,
+    ) -> Tuple[_ShapeTable, np.ndarray, np.ndarray, np.ndarray]:
+        """(tabla, máscara de candidatos, margen, puntuación) con inf en los no viables."""
+        scheduler = self._capacity_source()
+        onprem_regions = tuple(scheduler.datacenters()) if scheduler is not None else ()
+        if not onprem_regions and provider == ProviderEnum.onpremise:
+            onprem_regions = DEFAULT_ONPREM_REGIONS
+        table = self._shape_table(tier, profile, onprem_regions)
+        mask = np.isfinite(table.price)
+        if provider is not None:
+            mask &= table.provider_codes == _PROVIDER_CODES[provider]
+        if region is not None:
+            mask &= table.region_names == region
+        headroom = self._headroom(table, mask)
+        feasible = mask & (headroom >= 0)
+        if not feasible.any():
+            return table, mask, headroom, np.full(len(table.providers), np.inf)
+        cheapest = table.price[feasible].min()
+        scores = (
+            SCORE_WEIGHTS["price"] * table.price / cheapest
+            + SCORE_WEIGHTS["waste"] * table.waste
+            + SCORE_WEIGHTS["headroom"] * (1.0 - np.clip(headroom, 0.0, 1.0))
+        )
+        return table, mask, headroom, np.where(feasible, scores, np.inf)
+
+    def choose(
+        self,
+        tier: str,
+        profile: str = "general",
+        provider: Optional[ProviderEnum] = None,
+        region: Optional[str] = None,
+    ) -> Tuple[ProviderEnum, str]:
+        """Mejor (proveedor, región) para la forma. InsufficientCapacityError si ninguno es viable."""
+        table, mask, _, scores = self.score(tier, profile, provider, region)
+        best = int(np.argmin(scores))
+        if not np.isfinite(scores[best]):
+            raise InsufficientCapacityError(
+                f"Sin candidato viable para {tier}/{profile} (proveedor={provider.value if provider else '*'}, "
+                f"región={region or '*'}): {int(mask.sum())} candidatos sin cuota o capacidad libre"
+            )
+        return table.providers[best], table.regions[best]
+
+    def resolve(self, data: VMBuildRequest) -> VMBuildRequest:
+        """Completa provider/region si faltan; si vienen los dos se devuelve la petición tal cual."""
+        if data.provider is not None and data.region is not None:
+            return data
+        provider, region = self.choose(data.tier.value, data.profile.value, data.provider, data.region)
+        return data.model_copy(update={"provider": provider, "region": region})
+
+    def rank(
+        self,
+        tier: str,
+        profile: str = "general",
+        provider: Optional[ProviderEnum] = None,
+        region: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> VMPlacementResponse:
+        """Candidatos ordenados por puntuación (los no viables al final)."""
+        table, mask, headroom, scores = self.score(tier, profile, provider, region)
+        indices = np.flatnonzero(mask)
+        indices = indices[np.argsort(scores[indices], kind="stable")]
+        if limit is not None:
+            indices = indices[:limit]
+        candidates = [
+            PlacementCandidate(
+                provider=table.providers[i],
+                region=table.regions[i],
+                instance_type=table.instance_types[i],
+                hourly_price=float(table.price[i]),
+                waste=round(float(table.waste[i]), 4),
+                headroom=round(float(headroom[i]), 4),
+                score=round(float(scores[i]), 4) if np.isfinite(scores[i]) else None,
+                feasible=bool(np.isfinite(scores[i])),
+            )
+            for i in indices
+        ]
+        vcpus, ram_gb = self._engine.requirements(tier, profile)
+        return VMPlacementResponse(
+            tier=tier,
+            profile=profile,
+            vcpus=vcpus,
+            ram_gb=ram_gb,
+            chosen=candidates[0] if candidates and candidates[0].feasible else None,
+            candidates=candidates,
+        )
+
+    def cache_stats(self) -> Dict[str, int]:
+        info = self._shape_table.cache_info()
+        return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "max_size": info.maxsize}
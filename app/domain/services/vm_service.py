@@ -1,4 +1,4 @@
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, List, Dict, Any, Iterator, Optional
 from datetime import datetime
 from app.domain.schemas import (
     VMCreateRequest,
@@ -11,32 +11,162 @@ from app.domain.schemas import (
 from app.domain.ports import VMRepositoryPort
 from app.domain.factory_provider import create_cloud_factory, CloudProvider
 from app.domain.abstractions.factory import CloudResourceManager
+from app.domain.abstractions.products import VirtualMachine
+from app.domain.abstractions.lifecycle import DELETE, PROVISION, VM_LIFECYCLE, LifecycleTransition
 from app.infrastructure.logger import audit_log
-from app.domain.builders import (
-    VMTierDirector,
-    VMBuilder,
-    AWSVMBuilder,
-    AzureVMBuilder,
-    GCPVMBuilder,
-    OnPremVMBuilder,
-    OracleVMBuilder,
-)
+from app.infrastructure.governor import get_governor
+from app.infrastructure.tracing import traced
+from app.infrastructure.vm_watch import WATCH_CREATED, WATCH_DELETED, WATCH_UPDATED, VMWatchHub
+from app.domain.builders import build_vm_config
+from app.domain.placement import get_placement_scheduler
+from .placement_service import PlacementService
+
+if TYPE_CHECKING:
+    from .lifecycle_service import VMLifecycleService
+
+
+# ---------------------------------------------------------------------------
+# Helpers sin I/O compartidos por VMService y AsyncVMService: ambas variantes
+# aplican exactamente la misma lógica de negocio y solo difieren en cómo
+# esperan a repositorio, factory y auditoría.
+# ---------------------------------------------------------------------------
+
+def _to_cloud_provider(provider: ProviderEnum) -> CloudProvider:
+    value = provider.value if isinstance(provider, ProviderEnum) else str(provider)
+    if value == "onpremise":
+        return CloudProvider.ONPREM
+    return CloudProvider(value)
+
+
+def _build_vm_config(data: VMBuildRequest) -> Dict[str, Any]:
+    """Director + Builder del proveedor → config lista para la Abstract Factory.
+    El builder se obtiene del registro y el resultado del Director se memoiza por
+    (proveedor, tier, perfil, opcionales); por petición sólo se estampa la región.
+    """
+    return build_vm_config(data)
+
+
+def _to_vm_dto(virtual_machine: VirtualMachine, provider: ProviderEnum) -> VMDTO:
+    return VMDTO(
+        id=virtual_machine.resource_id,
+        name=virtual_machine.name,
+        provider=ProviderEnum(provider),
+        status=virtual_machine.status.value,
+        specs=virtual_machine.get_specs(),
+    )
+
+
+def _release_capacity(vm: VMDTO) -> None:
+    """Libera la capacidad reservada por la VM: host on-prem y cuota del governor (si están activos)."""
+    scheduler = get_placement_scheduler()
+    if scheduler is not None and vm.provider == ProviderEnum.onpremise:
+        scheduler.release(vm.id)
+    governor = get_governor()
+    if governor is not None:
+        governor.release(vm.id)
+
+
+def _apply_vm_changes(vm: VMDTO, changes: VMUpdateRequest) -> None:
+    # Actualizar nombre si viene
+    if changes.name is not None:
+        vm.name = changes.name
+
+    # Actualizar specs conocidas si vienen
+    if vm.specs is None:
+        vm.specs = {}
+    if changes.cpu is not None:
+        vm.specs["cpu"] = changes.cpu
+    if changes.ram_gb is not None:
+        vm.specs["ram_gb"] = changes.ram_gb
+    if changes.disk_gb is not None:
+        vm.specs["disk_gb"] = changes.disk_gb
+    if changes.instance_type is not None:
+        vm.specs["instance_type"] = changes.instance_type
+    if changes.size is not None:
+        vm.specs["vm_size"] = changes.size
+    if changes.machine_type is not None:
+        vm.specs["machine_type"] = changes.machine_type
+
+
+def _begin_transition(
+    vm: VMDTO,
+    action: str,
+    lifecycle: Optional["VMLifecycleService"],
+) -> Optional[LifecycleTransition]:
+    """
+    Valida `action` con la máquina de estados (InvalidTransitionError → 409).
+    Con el servicio de ciclo de vida en marcha deja la VM en el estado
+    transitorio y devuelve la transición, que hay que programar tras guardar;
+    sin él la completa ya (estado final, o sin cambios en delete) y devuelve None.
+    """
+    transition = VM_LIFECYCLE.transition(vm.status, action)
+    if lifecycle is not None and lifecycle.running:
+        vm.status = transition.transient
+        return transition
+    if transition.target is not None:
+        vm.status = transition.target
+    return None
+
+
+def _publish(
+    watch: Optional[VMWatchHub],
+    event_type: str,
+    vm: VMDTO,
+    previous_status: Optional[str] = None,
+    action: Optional[str] = None,
+) -> None:
+    """Notifica el cambio ya guardado a los watch de /vm/watch (si hay hub)."""
+    if watch is not None:
+        watch.publish(event_type, vm, previous_status=previous_status, action=action)
+
+
+def _schedule(
+    lifecycle: Optional["VMLifecycleService"],
+    vm: VMDTO,
+    transition: Optional[LifecycleTransition],
+    actor: str,
+) -> None:
+    """Programa el final de una transición iniciada con _begin_transition (si no se completó ya)."""
+    if transition is not None:
+        lifecycle.schedule(vm, transition, actor)
+
+
+def _matches_filters(
+    vm: VMDTO,
+    provider: Optional[ProviderEnum],
+    status: Optional[str],
+    needle: Optional[str],
+) -> bool:
+    if provider is not None and vm.provider != provider:
+        return False
+    if status is not None and vm.status != status:
+        return False
+    if needle is not None and needle not in vm.name.lower():
+        return False
+    return True
 
 
 class VMService:
-    def __init__(self, repo: VMRepositoryPort):
+    def __init__(
+        self,
+        repo: VMRepositoryPort,
+        placement: Optional[PlacementService] = None,
+        watch: Optional[VMWatchHub] = None,
+        lifecycle: Optional["VMLifecycleService"] = None,
+    ):
         self.repo = repo
+        # Elige proveedor/región en /vm/build cuando la petición no los fija
+        self.placement = placement or PlacementService()
+        # Pub/sub de GET /vm/watch: cada mutación guardada se publica
+        self.watch = watch
+        # Completa en segundo plano las transiciones (creating → running, stopping → stopped...)
+        self.lifecycle = lifecycle
 
-    def _to_cloud_provider(self, provider: ProviderEnum) -> CloudProvider:
-        value = provider.value if isinstance(provider, ProviderEnum) else str(provider)
-        if value == "onpremise":
-            return CloudProvider.ONPREM
-        return CloudProvider(value)
-
+    @traced("VMService.create_vm")
     def create_vm(self, data: VMCreateRequest) -> VMDTO:
         # Usar el nuevo Abstract Factory
         try:
-            provider = self._to_cloud_provider(data.provider)
+            provider = _to_cloud_provider(data.provider)
             abstract_factory = create_cloud_factory(provider)
 
             # Crear VM usando Abstract Factory (firma: name, config)
@@ -44,15 +174,12 @@ class VMService:
             virtual_machine = abstract_factory.create_virtual_machine(data.name, vm_config)
 
             # Convertir a VMDTO
-            vm = VMDTO(
-                id=virtual_machine.resource_id,
-                name=virtual_machine.name,
-                provider=ProviderEnum(data.provider),
-                status=virtual_machine.status.value,
-                specs=virtual_machine.get_specs(),
-            )
-            
+            vm = _to_vm_dto(virtual_machine, data.provider)
+
+            provision = _begin_transition(vm, PROVISION, self.lifecycle)
             self.repo.save(vm)
+            _publish(self.watch, WATCH_CREATED, vm)
+            _schedule(self.lifecycle, vm, provision, data.requested_by or "system")
             audit_log(
                 actor=data.requested_by or "system",
                 action="create",
@@ -73,55 +200,25 @@ class VMService:
             )
             raise
 
+    @traced("VMService.build_vm")
     def build_vm(self, data: VMBuildRequest) -> VMDTO:
         """
         Construye una VM con el patrón Builder+Director y la crea con la Abstract Factory.
         Director define CPU/RAM por tier; Builder traduce al esquema del proveedor.
         """
         try:
-            # Elegir builder por proveedor
-            builder: VMBuilder
-            if data.provider == ProviderEnum.aws:
-                builder = AWSVMBuilder()
-            elif data.provider == ProviderEnum.azure:
-                builder = AzureVMBuilder()
-            elif data.provider == ProviderEnum.gcp:
-                builder = GCPVMBuilder()
-            elif data.provider == ProviderEnum.onpremise:
-                builder = OnPremVMBuilder()
-            elif data.provider == ProviderEnum.oracle:
-                builder = OracleVMBuilder()
-            else:
-                raise ValueError(f"Proveedor no soportado: {data.provider}")
-
-            director = VMTierDirector()
-            vm_config = director.construct(
-                builder,
-                name=data.name,
-                region=data.region,
-                tier=data.tier.value,
-                profile=data.profile,
-                key_pair_name=data.key_pair_name,
-                firewall_rules=data.firewall_rules,
-                public_ip=data.public_ip,
-                memory_optimization=data.memory_optimization,
-                disk_optimization=data.disk_optimization,
-                storage_iops=data.storage_iops,
-            )
+            data = self.placement.resolve(data)
+            vm_config = _build_vm_config(data)
 
             # Crear con Abstract Factory
-            provider_enum = self._to_cloud_provider(data.provider)
-            factory = create_cloud_factory(provider_enum)
+            factory = create_cloud_factory(_to_cloud_provider(data.provider))
             vm = factory.create_virtual_machine(data.name, vm_config)
 
-            dto = VMDTO(
-                id=vm.resource_id,
-                name=vm.name,
-                provider=data.provider,
-                status=vm.status.value,
-                specs=vm.get_specs(),
-            )
+            dto = _to_vm_dto(vm, data.provider)
+            provision = _begin_transition(dto, PROVISION, self.lifecycle)
             self.repo.save(dto)
+            _publish(self.watch, WATCH_CREATED, dto)
+            _schedule(self.lifecycle, dto, provision, "system")
             audit_log(
                 actor="system",
                 action="create(builder)",
@@ -142,6 +239,7 @@ class VMService:
             )
             raise
     
+    @traced("VMService.create_infrastructure")
     def create_infrastructure(
         self, 
         provider_name: str,
@@ -203,30 +301,14 @@ class VMService:
             )
             raise
 
+    @traced("VMService.update_vm")
     def update_vm(self, vm_id: str, changes: VMUpdateRequest) -> VMDTO:
         vm = self.repo.get(vm_id)
         try:
-            # Actualizar nombre si viene
-            if changes.name is not None:
-                vm.name = changes.name
-
-            # Actualizar specs conocidas si vienen
-            if vm.specs is None:
-                vm.specs = {}
-            if changes.cpu is not None:
-                vm.specs["cpu"] = changes.cpu
-            if changes.ram_gb is not None:
-                vm.specs["ram_gb"] = changes.ram_gb
-            if changes.disk_gb is not None:
-                vm.specs["disk_gb"] = changes.disk_gb
-            if changes.instance_type is not None:
-                vm.specs["instance_type"] = changes.instance_type
-            if changes.size is not None:
-                vm.specs["vm_size"] = changes.size
-            if changes.machine_type is not None:
-                vm.specs["machine_type"] = changes.machine_type
-
+            previous_status = vm.status
+            _apply_vm_changes(vm, changes)
             self.repo.save(vm)
+            _publish(self.watch, WATCH_UPDATED, vm, previous_status)
             audit_log(
                 actor="system",
                 action="update",
@@ -247,19 +329,34 @@ class VMService:
             )
             raise
 
-    def delete_vm(self, vm_id: str) -> None:
+    @traced("VMService.delete_vm")
+    def delete_vm(self, vm_id: str) -> Optional[VMDTO]:
+        """
+        Borra la VM. Con el servicio de ciclo de vida en marcha la deja en
+        deleting y la devuelve (desaparece al completarse); si no, la borra ya y devuelve None.
+        """
         vm = self.repo.get(vm_id)
         try:
-            # No intentamos recrear la VM; simplemente eliminamos del repositorio
-            self.repo.delete(vm_id)
+            previous_status = vm.status
+            transition = _begin_transition(vm, DELETE, self.lifecycle)
+            if transition is None:
+                # No intentamos recrear la VM; simplemente eliminamos del repositorio
+                self.repo.delete(vm_id)
+                _release_capacity(vm)
+                _publish(self.watch, WATCH_DELETED, vm, previous_status)
+            else:
+                self.repo.save(vm)
+                _publish(self.watch, WATCH_UPDATED, vm, previous_status, action=DELETE)
+                _schedule(self.lifecycle, vm, transition, "system")
             audit_log(
                 actor="system",
                 action="delete",
                 vm_id=vm.id,
                 provider=vm.provider,
                 success=True,
-                details=None,
+                details={"from": previous_status, "to": vm.status} if transition else None,
             )
+            return vm if transition else None
         except Exception as e:
             audit_log(
                 actor="system",
@@ -271,25 +368,22 @@ class VMService:
             )
             raise
 
+    @traced("VMService.apply_action")
     def apply_action(self, vm_id: str, action_req: VMActionRequest) -> VMDTO:
         vm = self.repo.get(vm_id)
         try:
-            # Simular acciones actualizando el estado
-            if action_req.action == "start":
-                vm.status = "running"
-            elif action_req.action == "stop":
-                vm.status = "stopped"
-            elif action_req.action == "restart":
-                vm.status = "running"
-            
+            previous_status = vm.status
+            transition = _begin_transition(vm, action_req.action, self.lifecycle)
             self.repo.save(vm)
+            _publish(self.watch, WATCH_UPDATED, vm, previous_status, action=action_req.action)
+            _schedule(self.lifecycle, vm, transition, action_req.requested_by or "system")
             audit_log(
                 actor=action_req.requested_by or "system",
                 action=action_req.action,
                 vm_id=vm.id,
                 provider=vm.provider,
                 success=True,
-                details=None,
+                details={"from": previous_status, "to": vm.status},
             )
             return vm
         except Exception as e:
@@ -303,8 +397,25 @@ class VMService:
             )
             raise
 
+    @traced("VMService.get_vm")
     def get_vm(self, vm_id: str) -> VMDTO:
         return self.repo.get(vm_id)
 
+    @traced("VMService.list_vms")
     def list_vms(self) -> List[VMDTO]:
-        return self.repo.list()
\ No newline at end of file
+        return self.repo.list()
+
+    def iter_vms(
+        self,
+        provider: Optional[ProviderEnum] = None,
+        status: Optional[str] = None,
+        name_contains: Optional[str] = None,
+    ) -> Iterator[VMDTO]:
+        """
+        Recorre el inventario aplicando filtros de forma perezosa (sin construir listas),
+        pensado para exportaciones en streaming de flotas grandes.
+        """
+        needle = name_contains.lower() if name_contains else None
+        for vm in self.repo.iter():
+            if _matches_filters(vm, provider, status, needle):
+                yield vm
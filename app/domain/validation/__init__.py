@@ -0,0 +1,14 @@
+# Esquemas de configuración compilados por proveedor y recurso (compartidos por factories y plan de infraestructura)
+from .schema import ConfigField, ConfigSchema, ValidatedConfig, from_request, from_vm, named
+from .providers import CONFIG_SCHEMAS, get_config_schema
+
+__all__ = [
+    "ConfigField",
+    "ConfigSchema",
+    "ValidatedConfig",
+    "from_request",
+    "from_vm",
+    "named",
+    "CONFIG_SCHEMAS",
+    "get_config_schema",
+]
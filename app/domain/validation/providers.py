@@ -0,0 +1,218 @@
+"""
+Esquemas de configuración de cada proveedor y recurso.
+
+Los valores válidos salen del catálogo de proveedores; los mensajes de error
+son los que cada factory devolvía antes (inglés en AWS/Azure, castellano en el
+resto). Los plan_default son los que /cloud/infrastructure/create inyecta si
+el cliente no los envía.
+"""
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+
+from app.domain.catalog import ProviderCatalog, get_provider_catalog
+
+from .schema import ConfigField as F, ConfigSchema, from_request, from_vm, named
+
+_AWS = get_provider_catalog("aws")
+_AZURE = get_provider_catalog("azure")
+_GCP = get_provider_catalog("gcp")
+_ORACLE = get_provider_catalog("oracle")
+_ONPREM = get_provider_catalog("onprem")
+
+_DEMO_RESOURCE_GROUP = "rg-default"
+_DEMO_COMPARTMENT = "ocid1.compartment.oc1..exampleuniqueID"
+_ONPREM_DEFAULT_PORTS = {"postgresql": 5432, "mysql": 3306, "oracle": 1521, "sqlserver": 1433}
+
+
+# La región de la petición completa la de cada recurso; AWS y Azure además la exigen y validan
+_PLAN_REGION = F("region", plan_default=from_request("region"))
+
+
+def _checked_region(catalog: ProviderCatalog, message: str) -> F:
+    return F("region", required=True, plan_default=from_request("region"), check=catalog.has_region, message=message)
+
+
+def _warn_onprem_port(config: Dict[str, Any]) -> None:
+    expected_port = _ONPREM_DEFAULT_PORTS.get(config["engine"])
+    actual_port = config.get("port", expected_port)
+    if actual_port != expected_port:
+        print(f"⚠️ Advertencia: Puerto {actual_port} no es el estándar para {config['engine']} ({expected_port})")
+
+
+def _aws() -> Dict[str, ConfigSchema]:
+    missing = "Missing required fields for AWS: {fields}"
+    region = _checked_region(_AWS, "Region {value} not supported by AWS")
+    return {
+        "virtual_machine": ConfigSchema("aws", "virtual_machine", [
+            F("instance_type", required=True, plan_default="t2.micro"),
+            F("ami", required=True, plan_default="ami-0abcdef1234567890"),
+            F("vpc_id", required=True, plan_default="vpc-12345678"),
+            region,
+        ], missing),
+        "database": ConfigSchema("aws", "database", [
+            F("engine", required=True, plan_default="mysql"),
+            F("instance_class", required=True, plan_default="db.t3.micro"),
+            F("allocated_storage", required=True, plan_default=20),
+            region,
+        ], missing),
+        "load_balancer": ConfigSchema("aws", "load_balancer", [
+            F("vpc_id", required=True, plan_default="vpc-12345678"),
+            region,
+            F("scheme", default="internet-facing"),
+        ], missing),
+        "storage": ConfigSchema("aws", "storage", [
+            region,
+            F("storage_class", default="STANDARD"),
+            F("size_gb", plan_default=100),
+            F("storage_type", plan_default="gp3"),
+        ], missing),
+    }
+
+
+def _azure() -> Dict[str, ConfigSchema]:
+    missing = "Missing required fields for Azure: {fields}"
+    region = _checked_region(_AZURE, "Region {value} not supported by Azure")
+    resource_group = F("resource_group", required=True, plan_default=from_vm("resource_group", _DEMO_RESOURCE_GROUP))
+    return {
+        "virtual_machine": ConfigSchema("azure", "virtual_machine", [
+            F("vm_size", required=True, plan_default="Standard_B1s"),
+            F("image", required=True, plan_default="Ubuntu 20.04 LTS"),
+            F("resource_group", required=True, plan_default=_DEMO_RESOURCE_GROUP),
+            region,
+        ], missing),
+        "database": ConfigSchema("azure", "database", [
+            F("tier", required=True, plan_default="Basic"),
+            F("server_name", required=True, plan_default=named("-sqlsrv")),
+            resource_group,
+            region,
+        ], missing),
+        "load_balancer": ConfigSchema("azure", "load_balancer", [
+            resource_group,
+            region,
+            F("sku", default="Standard"),
+        ], missing),
+        "storage": ConfigSchema("azure", "storage", [
+            region,
+            F("account_type", default="Standard_LRS"),
+            F("size_gb", plan_default=100),
+            F("storage_type", plan_default="standard"),
+        ], missing),
+    }
+
+
+def _gcp() -> Dict[str, ConfigSchema]:
+    return {
+        "virtual_machine": ConfigSchema("gcp", "virtual_machine", [
+            F("machine_type", required=True, plan_default="e2-micro",
+              choices=_GCP.values("machine_types"), message="Machine type inválido para GCP: {value}"),
+            F("zone", plan_default="us-central1-a"),
+            F("project", plan_default="demo-project"),
+            _PLAN_REGION,
+        ], "Campo requerido faltante para GCP VM: {field}"),
+        "database": ConfigSchema("gcp", "database", [
+            F("engine", required=True, plan_default="mysql",
+              choices=_GCP.values("database_engines"), message="Engine de base de datos inválido para GCP: {value}"),
+            _PLAN_REGION,
+        ], "Campo requerido faltante para GCP Database: {field}"),
+        "load_balancer": ConfigSchema("gcp", "load_balancer", [
+            F("type", default="HTTP(S)",
+              choices=_GCP.values("load_balancer_types"), message="Tipo de load balancer inválido para GCP: {value}"),
+            _PLAN_REGION,
+        ], "Campo requerido faltante para GCP Load Balancer: {field}"),
+        "storage": ConfigSchema("gcp", "storage", [
+            F("storage_class", default="STANDARD",
+              choices=_GCP.values("storage_classes"), message="Storage class inválido para GCP: {value}"),
+            F("location", default="US",
+              choices=_GCP.values("locations"), message="Ubicación inválida para GCP Storage: {value}"),
+            _PLAN_REGION,
+            F("size_gb", plan_default=100),
+            F("storage_type", plan_default="standard"),
+        ], "Campo requerido faltante para GCP Storage: {field}"),
+    }
+
+
+def _oracle() -> Dict[str, ConfigSchema]:
+    compartment = F("compartment_id", required=True, plan_default=from_vm("compartment_id", _DEMO_COMPARTMENT))
+    return {
+        "virtual_machine": ConfigSchema("oracle", "virtual_machine", [
+            F("compute_shape", required=True, plan_default="VM.Standard2.1",
+              choices=_ORACLE.values("compute_shapes"), message="Compute shape inválido para Oracle: {value}"),
+            F("compartment_id", required=True, plan_default=_DEMO_COMPARTMENT),
+            F("availability_domain", required=True, plan_default="AD-1"),
+            F("subnet_id", required=True, plan_default="ocid1.subnet.oc1..examplesubnet"),
+            F("image_id", required=True, plan_default="ocid1.image.oc1..exampleimage"),
+            _PLAN_REGION,
+        ], "Campo requerido faltante para Oracle VM: {field}"),
+        "database": ConfigSchema("oracle", "database", [
+            F("workload_type", required=True, plan_default="OLTP",
+              choices=_ORACLE.values("database_workloads"), message="Workload type inválido para Oracle Database: {value}"),
+            compartment,
+            F("cpu_count", plan_default=1),
+            F("storage_size", plan_default=20),
+            _PLAN_REGION,
+        ], "Campo requerido faltante para Oracle Database: {field}"),
+        "load_balancer": ConfigSchema("oracle", "load_balancer", [
+            compartment,
+            F("shape", default="100Mbps",
+              choices=_ORACLE.values("load_balancer_shapes"), message="Shape de load balancer inválido para Oracle: {value}"),
+            _PLAN_REGION,
+        ], "Campo requerido faltante para Oracle Load Balancer: {field}"),
+        "storage": ConfigSchema("oracle", "storage", [
+            F("namespace", required=True, plan_default="mytenantns"),
+            compartment,
+            F("storage_tier", default="Standard",
+              choices=_ORACLE.values("storage_tiers"), message="Storage tier inválido para Oracle: {value}"),
+            _PLAN_REGION,
+        ], "Campo requerido faltante para Oracle Storage: {field}"),
+    }
+
+
+def _onprem() -> Dict[str, ConfigSchema]:
+    return {
+        "virtual_machine": ConfigSchema("onprem", "virtual_machine", [
+            F("hypervisor", default="vmware",
+              choices=_ONPREM.values("hypervisors"), message="Hipervisor inválido para OnPrem: {value}. Soportados: {choices}"),
+            F("cpu", required=True, plan_default=2, minimum=1, message="CPU mínimo: 1 core"),
+            F("ram_gb", required=True, plan_default=4, minimum=1, message="RAM mínima: 1GB"),
+            F("disk_gb", required=True, plan_default=50, minimum=10, message="Disco mínimo: 10GB"),
+            F("nic", required=True),
+            _PLAN_REGION,
+        ], "Campo requerido faltante para OnPrem VM: {field}"),
+        "database": ConfigSchema("onprem", "database", [
+            F("engine", required=True, plan_default="mysql",
+              choices=_ONPREM.values("database_engines"),
+              message="Engine de base de datos inválido para OnPrem: {value}. Soportados: {choices}"),
+            _PLAN_REGION,
+        ], "Campo requerido faltante para OnPrem Database: {field}", post_checks=[_warn_onprem_port]),
+        "load_balancer": ConfigSchema("onprem", "load_balancer", [
+            F("type", default="nginx",
+              choices=_ONPREM.values("load_balancer_types"),
+              message="Tipo de load balancer inválido para OnPrem: {value}. Soportados: {choices}"),
+            F("algorithm", default="round_robin",
+              choices=_ONPREM.values("load_balancer_algorithms"),
+              message="Algoritmo de balanceo inválido: {value}. Válidos: {choices}"),
+            _PLAN_REGION,
+        ], "Campo requerido faltante para OnPrem Load Balancer: {field}"),
+        "storage": ConfigSchema("onprem", "storage", [
+            F("storage_type", required=True, plan_default="nfs",
+              choices=_ONPREM.values("storage_types"), message="Tipo de storage inválido para OnPrem: {value}. Soportados: {choices}"),
+            F("capacity_gb", default=1000, minimum=10, message="Capacidad mínima de storage: 10GB"),
+            _PLAN_REGION,
+        ], "Campo requerido faltante para OnPrem Storage: {field}"),
+    }
+
+
+# Claves = valores de CloudProvider; dentro, los tipos de recurso de RESOURCE_TYPES_BY_KEY
+CONFIG_SCHEMAS: Mapping[str, Mapping[str, ConfigSchema]] = MappingProxyType({
+    provider: MappingProxyType(schemas)
+    for provider, schemas in (
+        ("aws", _aws()), ("azure", _azure()), ("gcp", _gcp()), ("oracle", _oracle()), ("onprem", _onprem()),
+    )
+})
+
+
+def get_config_schema(provider: str, resource_type: str) -> ConfigSchema:
+    try:
+        return CONFIG_SCHEMAS[provider][resource_type]
+    except KeyError:
+        raise ValueError(f"Sin esquema de configuración para {provider}/{resource_type}")
@@ -0,0 +1,199 @@
+"""
+Esquemas declarativos de configuración por proveedor y tipo de recurso.
+
+Un ConfigSchema se declara una vez (campos requeridos, defaults, valores
+válidos, mínimos) y se compila a una función Python generada para ese esquema
+(frozensets y mensajes ya resueltos): validar es un único recorrido que
+construye el dict final con los defaults ya aplicados. El resultado es un
+ValidatedConfig; si una factory lo recibe de su mismo esquema no vuelve a
+validarlo ni a copiarlo.
+
+Dos niveles de default:
+- default: valor que el producto asume si falta (p. ej. el tipo de LB); se
+  escribe en el config para que specs y validación vean lo mismo.
+- plan_default: valor de demo con el que /cloud/infrastructure/create completa
+  campos requeridos que el cliente no envió. Puede depender del contexto de la
+  petición (nombre, región, config de la VM) con from_request/from_vm/named.
+"""
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+PlanContext = Mapping[str, Any]
+DynamicDefault = Callable[[PlanContext], Any]
+
+_MISSING = object()
+
+
+class _Dynamic:
+    """Default calculado a partir del contexto del plan de infraestructura."""
+
+    __slots__ = ("fn",)
+
+    def __init__(self, fn: DynamicDefault):
+        self.fn = fn
+
+
+def from_request(key: str) -> _Dynamic:
+    return _Dynamic(lambda ctx: ctx[key])
+
+
+def from_vm(key: str, fallback: Any) -> _Dynamic:
+    """Reutiliza un campo del config de la VM (mismo resource group, compartment...)."""
+    return _Dynamic(lambda ctx: ctx["vm"].get(key, fallback))
+
+
+def named(suffix: str) -> _Dynamic:
+    return _Dynamic(lambda ctx: f"{ctx['name']}{suffix}")
+
+
+class ConfigField:
+    __slots__ = ("name", "required", "default", "plan_default", "choices", "check", "minimum", "message")
+
+    def __init__(
+        self,
+        name: str,
+        required: bool = False,
+        default: Any = _MISSING,
+        plan_default: Any = _MISSING,
+        choices: Optional[Sequence[str]] = None,
+        check: Optional[Callable[[Any], bool]] = None,
+        minimum: Optional[float] = None,
+        message: Optional[str] = None,
+    ):
+        """message admite {value}, {choices} y {minimum}."""
+        if (choices is not None or check is not None or minimum is not None) and message is None:
+            raise ValueError(f"El campo {name} valida valores y necesita un mensaje de error")
+        self.name = name
+        self.required = required
+        self.default = default
+        self.plan_default = plan_default
+        self.choices = tuple(choices) if choices is not None else None
+        self.check = check
+        self.minimum = minimum
+        self.message = message
+
+
+class ValidatedConfig(dict):
+    """Config ya validado y con defaults aplicados por un esquema concreto."""
+
+    __slots__ = ("schema",)
+
+
+class ConfigSchema:
+    """
+    Esquema de un recurso de un proveedor.
+
+    missing_message recibe {fields} (todos los que faltan) y {field} (el
+    primero), para conservar el mensaje de cada proveedor.
+    """
+
+    __slots__ = (
+        "provider", "resource_type", "fields", "missing_message", "post_checks",
+        "_required", "_defaults", "_plan_static", "_plan_dynamic", "_finish", "source",
+    )
+
+    def __init__(
+        self,
+        provider: str,
+        resource_type: str,
+        fields: Sequence[ConfigField],
+        missing_message: str,
+        post_checks: Sequence[Callable[[Dict[str, Any]], None]] = (),
+    ):
+        self.provider = provider
+        self.resource_type = resource_type
+        self.fields: Tuple[ConfigField, ...] = tuple(fields)
+        self.missing_message = missing_message
+        self.post_checks = tuple(post_checks)
+        self._compile()
+
+    def _compile(self) -> None:
+        self._required: Tuple[str, ...] = tuple(f.name for f in self.fields if f.required)
+        self._defaults: Dict[str, Any] = {f.name: f.default for f in self.fields if f.default is not _MISSING}
+        self._plan_static: Dict[str, Any] = {
+            f.name: f.plan_default for f in self.fields
+            if f.plan_default is not _MISSING and not isinstance(f.plan_default, _Dynamic)
+        }
+        self._plan_dynamic: Tuple[Tuple[str, DynamicDefault], ...] = tuple(
+            (f.name, f.plan_default.fn) for f in self.fields if isinstance(f.plan_default, _Dynamic)
+        )
+        self.source, namespace = self._generate()
+        exec(compile(self.source, f"<schema {self.provider}/{self.resource_type}>", "exec"), namespace)
+        self._finish: Callable[[ValidatedConfig], ValidatedConfig] = namespace["finish"]
+
+    def _generate(self) -> Tuple[str, Dict[str, Any]]:
+        """
+        Genera el validador como código Python lineal: una comprobación por
+        campo, sin bucles ni tuplas que desempaquetar en cada llamada.
+        """
+        namespace: Dict[str, Any] = {"_schema": self, "_missing": self._raise_missing}
+        lines = ["def finish(out):"]
+        if self._required:
+            present = " and ".join(f"{name!r} in out" for name in self._required)
+            lines += [f"    if not ({present}):", "        _missing(out)"]
+        for i, f in enumerate(self.fields):
+            if f.choices is None and f.check is None and f.minimum is None:
+                continue
+            namespace[f"_m{i}"] = f.message
+            # Los requeridos y los que tienen default siempre están presentes aquí
+            always = f.required or f.default is not _MISSING
+            indent = "    " if always else "        "
+            if not always:
+                lines.append(f"    if {f.name!r} in out:")
+            lines.append(f"{indent}v = out[{f.name!r}]")
+            if f.choices is not None:
+                namespace[f"_c{i}"] = frozenset(f.choices)
+                namespace[f"_l{i}"] = list(f.choices)
+                lines += [
+                    f"{indent}try:",
+                    f"{indent}    ok = v in _c{i}",
+                    f"{indent}except TypeError:",
+                    f"{indent}    ok = False",
+                    f"{indent}if not ok:",
+                    f"{indent}    raise ValueError(_m{i}.format(value=v, choices=_l{i}))",
+                ]
+            if f.check is not None:
+                namespace[f"_p{i}"] = f.check
+                lines += [f"{indent}if not _p{i}(v):", f"{indent}    raise ValueError(_m{i}.format(value=v))"]
+            if f.minimum is not None:
+                lines += [f"{indent}if v < {f.minimum!r}:", f"{indent}    raise ValueError(_m{i}.format(value=v, minimum={f.minimum!r}))"]
+        for i, post_check in enumerate(self.post_checks):
+            namespace[f"_post{i}"] = post_check
+            lines.append(f"    _post{i}(out)")
+        lines += ["    out.schema = _schema", "    return out"]
+        return "\n".join(lines) + "\n", namespace
+
+    def _raise_missing(self, config: Mapping[str, Any]) -> None:
+        missing = [name for name in self._required if name not in config]
+        raise ValueError(self.missing_message.format(fields=missing, field=missing[0]))
+
+    def validate(self, config: Mapping[str, Any]) -> ValidatedConfig:
+        """Config validado con defaults; si ya lo validó este esquema se devuelve tal cual."""
+        if type(config) is ValidatedConfig and config.schema is self:
+            return config
+        out = ValidatedConfig(self._defaults)
+        out.update(config)
+        return self._finish(out)
+
+    def prepare(self, config: Optional[Mapping[str, Any]], context: PlanContext) -> ValidatedConfig:
+        """Completa con los defaults del plan (y los del producto) y valida, en una pasada."""
+        out = ValidatedConfig(self._defaults)
+        out.update(self._plan_static)
+        for name, fn in self._plan_dynamic:
+            if not config or name not in config:
+                out[name] = fn(context)
+        if config:
+            out.update(config)
+        return self._finish(out)
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "provider": self.provider,
+            "resource_type": self.resource_type,
+            "required": list(self._required),
+            "defaults": dict(self._defaults),
+            "choices": {f.name: list(f.choices) for f in self.fields if f.choices is not None},
+            "minimums": {f.name: f.minimum for f in self.fields if f.minimum is not None},
+        }
+
+    def __repr__(self) -> str:
+        return f"ConfigSchema({self.provider!r}, {self.resource_type!r}, requeridos={list(self._required)})"
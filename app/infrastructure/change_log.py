@@ -0,0 +1,148 @@
+"""
+Registro de cambios del inventario (VMs e infraestructuras) para sincronización
+incremental: GET /changes?since=<seq>.
+
+Cada mutación de un repositorio recibe un número de secuencia global y
+creciente. Se guardan los últimos `max_entries` en un buffer circular, de modo
+que leer los cambios desde `since` cuesta lo que el churn desde entonces y no
+el tamaño de la flota. Si `since` es anterior a lo que aún se conserva, el
+cliente debe volver a descargar el listado completo (ChangesExpiredError → 410);
+los listados llevan X-Change-Seq para continuar desde ahí.
+
+Tamaño con VM_API_CHANGELOG_SIZE (100 000 por defecto).
+"""
+from __future__ import annotations
+import os
+import threading
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from app.domain.errors import ChangesExpiredError
+
+CHANGELOG_SIZE_ENV_VAR = "VM_API_CHANGELOG_SIZE"
+DEFAULT_MAX_ENTRIES = 100_000
+
+CHANGE_CREATED = "created"
+CHANGE_UPDATED = "updated"
+CHANGE_DELETED = "deleted"
+
+
+class ChangeEntry:
+    """
+    Un cambio: `obj` es la referencia guardada en el repositorio (no una copia),
+    así que al leerlo se ve su estado actual; None en los borrados de VMs.
+    """
+
+    __slots__ = ("seq", "resource", "resource_id", "op", "obj")
+
+    def __init__(self, seq: int, resource: str, resource_id: str, op: str, obj: Any):
+        self.seq = seq
+        self.resource = resource
+        self.resource_id = resource_id
+        self.op = op
+        self.obj = obj
+
+
+# En el buffer cada cambio es una tupla (seq, resource, resource_id, op, obj):
+# record() está en el camino de cada save() y crear una tupla cuesta bastante
+# menos que un objeto. Los ChangeEntry solo se crean para lo que se lee.
+_Slot = Tuple[int, str, str, str, Any]
+
+
+class ChangeLog:
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        if max_entries <= 0:
+            raise ValueError("max_entries debe ser > 0")
+        self.max_entries = max_entries
+        # Buffer circular indexado por seq % max_entries: el cambio `seq` está en
+        # su hueco mientras seq > current_seq - max_entries (acceso O(1))
+        self._ring: List[Optional[_Slot]] = [None] * max_entries
+        self._seq = 0
+        # Los repositorios se usan desde el event loop y desde el threadpool de
+        # los endpoints sync: la secuencia y el contenido del buffer deben coincidir
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "ChangeLog":
+        raw = os.environ.get(CHANGELOG_SIZE_ENV_VAR)
+        return cls(int(raw)) if raw else cls()
+
+    @property
+    def current_seq(self) -> int:
+        return self._seq
+
+    @property
+    def oldest_seq(self) -> int:
+        """Menor `since` que aún se puede servir sin perder cambios."""
+        return max(0, self._seq - self.max_entries)
+
+    def record(self, resource: str, resource_id: str, op: str, obj: Any) -> int:
+        with self._lock:
+            seq = self._seq = self._seq + 1
+            self._ring[seq % self.max_entries] = (seq, resource, resource_id, op, obj)
+            return seq
+
+    def record_many(self, resource: str, changes: Iterable[Tuple[str, str, Any]]) -> int:
+        """Varios cambios (id, op, obj) con secuencias consecutivas; devuelve la última."""
+        ring, size = self._ring, self.max_entries
+        with self._lock:
+            seq = self._seq
+            for resource_id, op, obj in changes:
+                seq += 1
+                ring[seq % size] = (seq, resource, resource_id, op, obj)
+            self._seq = seq
+            return seq
+
+    def changes_since(
+        self,
+        since: int,
+        limit: int = 1000,
+        resources: Optional[FrozenSet[str]] = None,
+    ) -> Tuple[List[ChangeEntry], int, bool]:
+        """
+        Cambios con seq > since, como máximo `limit` (de `resources` si se
+        indica), compactados a uno por recurso: el último, con "created" si el
+        recurso se creó dentro de la ventana y no se borró después. Devuelve
+        (cambios en orden de seq, siguiente since, hay_más).
+        """
+        with self._lock:
+            current = self._seq
+            if since >= current:
+                return [], current, False
+            oldest = max(0, current - self.max_entries)
+            if since < oldest:
+                raise ChangesExpiredError(since, oldest, current)
+            window: List[_Slot] = []
+            seq = since
+            while seq < current and len(window) < limit:
+                seq += 1
+                slot = self._ring[seq % self.max_entries]
+                if resources is None or slot[1] in resources:
+                    window.append(slot)
+            next_since, has_more = seq, seq < current
+
+        latest: Dict[Tuple[str, str], _Slot] = {}
+        created: Dict[Tuple[str, str], bool] = {}
+        for slot in window:
+            key = (slot[1], slot[2])
+            if slot[3] == CHANGE_CREATED:
+                created[key] = True
+            elif slot[3] == CHANGE_DELETED:
+                created[key] = False
+            # Reinsertar deja el dict ordenado por el último cambio de cada recurso
+            latest.pop(key, None)
+            latest[key] = slot
+        compacted = []
+        for key, (seq, resource, resource_id, op, obj) in latest.items():
+            if op == CHANGE_UPDATED and created.get(key):
+                op = CHANGE_CREATED
+            compacted.append(ChangeEntry(seq, resource, resource_id, op, obj))
+        return compacted, next_since, has_more
+
+    def stats(self) -> Dict[str, int]:
+        current = self._seq
+        return {
+            "current_seq": current,
+            "oldest_seq": max(0, current - self.max_entries),
+            "entries": min(current, self.max_entries),
+            "max_entries": self.max_entries,
+        }
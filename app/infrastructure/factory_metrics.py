@@ -0,0 +1,87 @@
+"""
+Latencia de las factories por proveedor, tipo de recurso y resultado.
+
+MeteredCloudFactory envuelve las factories (vía CloudFactoryDecorator) y
+observa cada create_* en vm_api_factory_create_duration_seconds. Se registra
+después de la simulación y antes del governor: mide la llamada al proveedor
+(con la latencia simulada) pero no las esperas en la cola del governor.
+"""
+from __future__ import annotations
+import time
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+from app.domain.abstractions.factory import CloudAbstractFactory, CloudFactoryDecorator
+from app.domain.abstractions.products import VirtualMachine, Database, LoadBalancer, Storage
+from app.domain.factory_provider import add_factory_decorator, remove_factory_decorator
+from app.infrastructure.metrics import get_metrics_registry
+
+T = TypeVar("T")
+
+FACTORY_CREATE_SECONDS = get_metrics_registry().histogram(
+    "vm_api_factory_create_duration_seconds",
+    "Duración de los create_* de las factories por proveedor, tipo de recurso y resultado",
+    ("provider", "resource_type", "outcome"),
+)
+
+
+class MeteredCloudFactory(CloudFactoryDecorator):
+    """Factory que mide cada creación antes de devolverla (o de propagar el error)."""
+
+    def __init__(self, inner: CloudAbstractFactory, provider: str):
+        super().__init__(inner)
+        self._provider = provider
+
+    def _measure(self, resource_type: str, create: Callable[..., T], *args: Any) -> T:
+        outcome = "error"
+        t0 = time.perf_counter()
+        try:
+            resource = create(*args)
+            outcome = "ok"
+            return resource
+        finally:
+            FACTORY_CREATE_SECONDS.observe((self._provider, resource_type, outcome), time.perf_counter() - t0)
+
+    async def _ameasure(self, resource_type: str, create: Callable[..., Awaitable[T]], *args: Any) -> T:
+        outcome = "error"
+        t0 = time.perf_counter()
+        try:
+            resource = await create(*args)
+            outcome = "ok"
+            return resource
+        finally:
+            FACTORY_CREATE_SECONDS.observe((self._provider, resource_type, outcome), time.perf_counter() - t0)
+
+    def create_virtual_machine(self, name: str, vm_config: Dict[str, Any]) -> VirtualMachine:
+        return self._measure("virtual_machine", super().create_virtual_machine, name, vm_config)
+
+    def create_database(self, name: str, db_config: Dict[str, Any]) -> Database:
+        return self._measure("database", super().create_database, name, db_config)
+
+    def create_load_balancer(self, name: str, lb_config: Dict[str, Any]) -> LoadBalancer:
+        return self._measure("load_balancer", super().create_load_balancer, name, lb_config)
+
+    def create_storage(self, name: str, storage_config: Dict[str, Any]) -> Storage:
+        return self._measure("storage", super().create_storage, name, storage_config)
+
+    async def acreate_virtual_machine(self, name: str, vm_config: Dict[str, Any]) -> VirtualMachine:
+        return await self._ameasure("virtual_machine", super().acreate_virtual_machine, name, vm_config)
+
+    async def acreate_database(self, name: str, db_config: Dict[str, Any]) -> Database:
+        return await self._ameasure("database", super().acreate_database, name, db_config)
+
+    async def acreate_load_balancer(self, name: str, lb_config: Dict[str, Any]) -> LoadBalancer:
+        return await self._ameasure("load_balancer", super().acreate_load_balancer, name, lb_config)
+
+    async def acreate_storage(self, name: str, storage_config: Dict[str, Any]) -> Storage:
+        return await self._ameasure("storage", super().acreate_storage, name, storage_config)
+
+
+_DECORATOR_NAME = "metrics"
+
+
+def enable_factory_metrics() -> None:
+    add_factory_decorator(_DECORATOR_NAME, lambda provider, factory: MeteredCloudFactory(factory, provider.value))
+
+
+def disable_factory_metrics() -> None:
+    remove_factory_decorator(_DECORATOR_NAME)
@@ -0,0 +1,73 @@
+"""
+Spans de las factories: uno por create_* con proveedor, tipo de recurso y nombre.
+
+TracedCloudFactory envuelve las factories (vía CloudFactoryDecorator) por
+fuera de todo lo demás, así que el span incluye la espera en el governor y la
+latencia simulada: es lo que el servicio ve de la llamada al proveedor.
+"""
+from __future__ import annotations
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+from app.domain.abstractions.factory import CloudAbstractFactory, CloudFactoryDecorator
+from app.domain.abstractions.products import VirtualMachine, Database, LoadBalancer, Storage
+from app.domain.factory_provider import add_factory_decorator, remove_factory_decorator
+from app.infrastructure.tracing import current_span
+
+T = TypeVar("T")
+
+
+class TracedCloudFactory(CloudFactoryDecorator):
+    def __init__(self, inner: CloudAbstractFactory, provider: str):
+        super().__init__(inner)
+        self._provider = provider
+
+    def _traced(self, resource_type: str, name: str, create: Callable[..., T], *args: Any) -> T:
+        parent = current_span()
+        if parent is None:
+            return create(name, *args)
+        attrs = {"provider": self._provider, "resource_type": resource_type, "name": name}
+        with parent.trace.new_span(parent, f"factory.create_{resource_type}", attrs):
+            return create(name, *args)
+
+    async def _atraced(self, resource_type: str, name: str, create: Callable[..., Awaitable[T]], *args: Any) -> T:
+        parent = current_span()
+        if parent is None:
+            return await create(name, *args)
+        attrs = {"provider": self._provider, "resource_type": resource_type, "name": name}
+        with parent.trace.new_span(parent, f"factory.create_{resource_type}", attrs):
+            return await create(name, *args)
+
+    def create_virtual_machine(self, name: str, vm_config: Dict[str, Any]) -> VirtualMachine:
+        return self._traced("virtual_machine", name, super().create_virtual_machine, vm_config)
+
+    def create_database(self, name: str, db_config: Dict[str, Any]) -> Database:
+        return self._traced("database", name, super().create_database, db_config)
+
+    def create_load_balancer(self, name: str, lb_config: Dict[str, Any]) -> LoadBalancer:
+        return self._traced("load_balancer", name, super().create_load_balancer, lb_config)
+
+    def create_storage(self, name: str, storage_config: Dict[str, Any]) -> Storage:
+        return self._traced("storage", name, super().create_storage, storage_config)
+
+    async def acreate_virtual_machine(self, name: str, vm_config: Dict[str, Any]) -> VirtualMachine:
+        return await self._atraced("virtual_machine", name, super().acreate_virtual_machine, vm_config)
+
+    async def acreate_database(self, name: str, db_config: Dict[str, Any]) -> Database:
+        return await self._atraced("database", name, super().acreate_database, db_config)
+
+    async def acreate_load_balancer(self, name: str, lb_config: Dict[str, Any]) -> LoadBalancer:
+        return await self._atraced("load_balancer", name, super().acreate_load_balancer, lb_config)
+
+    async def acreate_storage(self, name: str, storage_config: Dict[str, Any]) -> Storage:
+        return await self._atraced("storage", name, super().acreate_storage, storage_config)
+
+
+_DECORATOR_NAME = "tracing"
+
+
+def enable_factory_tracing() -> None:
+    add_factory_decorator(_DECORATOR_NAME, lambda provider, factory: TracedCloudFactory(factory, provider.value))
+
+
+def disable_factory_tracing() -> None:
+    remove_factory_decorator(_DECORATOR_NAME)
@@ -0,0 +1,590 @@
+"""
+Governor de llamadas de aprovisionamiento: límites de tasa, concurrencia y cuotas.
+
+Envuelve las factories (vía CloudFactoryDecorator, por fuera de la simulación)
+y, antes de delegar cada create_*, aplica los límites configurados en tres
+ámbitos:
+- proveedor:           aws
+- región:              aws/us-east-1 (además cuotas de VMs: vCPU e instancias)
+- tipo de recurso:     aws:virtual_machine
+
+Las llamadas que exceden un límite esperan en cola (FIFO, sin adelantamientos)
+en lugar de fallar; solo se rechazan si la espera superaría `max_wait_s`
+(ProviderThrottledError → 429) o si la petición no cabría nunca en la cuota
+(QuotaExceededError → 429). Las cuotas se liberan al borrar la VM.
+
+Se activa con la variable de entorno VM_API_GOVERNOR (ruta a un JSON o el JSON
+en línea) o programáticamente con enable_governor(ProvisioningGovernor...).
+
+Formato:
+{
+  "max_wait_s": 30,
+  "providers": {
+    "*":   {"rate_limit": {"rate_per_s": 50, "burst": 100}, "max_concurrency": 64},
+    "aws": {"rate_limit": {"rate_per_s": 100, "burst": 200}, "max_concurrency": 32,
+            "resources": {"virtual_machine": {"rate_limit": {"rate_per_s": 20, "burst": 40}}},
+            "regions": {"*": {"max_concurrency": 16, "quota": {"max_vcpus": 512, "max_instances": 128}},
+                        "us-east-1": {"quota": {"max_vcpus": 1024}}}}
+  }
+}
+Un proveedor sin entrada usa la de "*", y lo mismo regiones y recursos; cada
+clave concreta (proveedor, región o recurso) tiene sus propios contadores.
+"""
+from __future__ import annotations
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple, TypeVar
+
+from app.domain.abstractions.factory import CloudAbstractFactory, CloudFactoryDecorator
+from app.domain.abstractions.products import CloudResource, VirtualMachine, Database, LoadBalancer, Storage
+from app.domain.catalog import PROVIDER_CATALOG, instance_types
+from app.domain.errors import ProviderThrottledError, QuotaExceededError
+from app.domain.factory_provider import add_factory_decorator, remove_factory_decorator
+
+GOVERNOR_ENV_VAR = "VM_API_GOVERNOR"
+DEFAULT_MAX_WAIT_S = 30.0
+WILDCARD = "*"
+DEFAULT_REGION = "default"
+
+# Campos de la config de cada proveedor con la región y con el tamaño de la VM
+_REGION_FIELDS = ("region", "location", "datacenter")
+_VCPU_FIELDS = ("vcpus", "cpu", "cpu_cores")
+_SIZE_FIELDS = ("instance_type", "vm_size", "machine_type", "compute_shape")
+
+T = TypeVar("T")
+
+
+class RatePacer:
+    """
+    Límite de tasa como token bucket en forma de GCRA: en vez de contar tokens,
+    guarda el instante teórico de la siguiente llamada. earliest() dice cuándo
+    puede empezar una llamada y commit() reserva ese turno, así que las esperas
+    salen en orden de llegada y varios límites se combinan tomando el máximo.
+    """
+
+    __slots__ = ("rate", "burst", "_interval", "_tolerance", "_tat")
+
+    def __init__(self, rate_per_s: float, burst: Optional[float] = None):
+        if rate_per_s <= 0:
+            raise ValueError("rate_per_s debe ser > 0")
+        self.rate = float(rate_per_s)
+        self.burst = float(burst if burst is not None else rate_per_s)
+        if self.burst < 1:
+            raise ValueError("burst debe ser >= 1")
+        self._interval = 1.0 / self.rate
+        self._tolerance = (self.burst - 1.0) * self._interval
+        self._tat = 0.0
+
+    def earliest(self, now: float) -> float:
+        return max(now, self._tat - self._tolerance)
+
+    def commit(self, start: float) -> None:
+        self._tat = max(self._tat, start) + self._interval
+
+
+class _Waiter:
+    __slots__ = ("cost", "granted", "event", "future", "loop")
+
+    def __init__(self, cost: float, event: Optional[threading.Event] = None,
+                 future: Optional[asyncio.Future] = None, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.cost = cost
+        self.granted = False
+        self.event = event
+        self.future = future
+        self.loop = loop
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class CapacityGate:
+    """
+    Capacidad acotada con cola FIFO (concurrencia, vCPU o instancias de cuota).
+    Sirve a hilos (acquire) y a corrutinas (aacquire) a la vez: nadie se adelanta
+    a quien ya espera, aunque su petición cupiese.
+    """
+
+    def __init__(self, capacity: float):
+        if capacity <= 0:
+            raise ValueError("La capacidad debe ser > 0")
+        self.capacity = float(capacity)
+        self.in_use = 0.0
+        self._waiters: Deque[_Waiter] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def _grant_locked(self) -> None:
+        while self._waiters and self.in_use + self._waiters[0].cost <= self.capacity:
+            waiter = self._waiters.popleft()
+            self.in_use += waiter.cost
+            waiter.granted = True
+            if waiter.event is not None:
+                waiter.event.set()
+            else:
+                waiter.loop.call_soon_threadsafe(_resolve, waiter.future)
+
+    def _try_acquire_locked(self, cost: float) -> bool:
+        if not self._waiters and self.in_use + cost <= self.capacity:
+            self.in_use += cost
+            return True
+        return False
+
+    def _abandon_locked(self, waiter: _Waiter) -> bool:
+        """El que esperaba se rinde: True si ya se le había concedido (y lo conserva)."""
+        if waiter.granted:
+            return True
+        self._waiters.remove(waiter)
+        # Quitar la cabeza de la cola puede desbloquear a los siguientes
+        self._grant_locked()
+        return False
+
+    def acquire(self, cost: float, timeout: float) -> bool:
+        with self._lock:
+            if self._try_acquire_locked(cost):
+                return True
+            waiter = _Waiter(cost, event=threading.Event())
+            self._waiters.append(waiter)
+        if waiter.event.wait(max(timeout, 0.0)):
+            return True
+        with self._lock:
+            return self._abandon_locked(waiter)
+
+    async def aacquire(self, cost: float, timeout: float) -> bool:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._try_acquire_locked(cost):
+                return True
+            waiter = _Waiter(cost, future=loop.create_future(), loop=loop)
+            self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), max(timeout, 0.0))
+            return True
+        except asyncio.TimeoutError:
+            with self._lock:
+                return self._abandon_locked(waiter)
+        except asyncio.CancelledError:
+            with self._lock:
+                if self._abandon_locked(waiter):
+                    self.in_use -= cost
+                    self._grant_locked()
+            raise
+
+    def release(self, cost: float) -> None:
+        with self._lock:
+            self.in_use = max(0.0, self.in_use - cost)
+            self._grant_locked()
+
+
+class _Limits:
+    """Límites de un ámbito leídos del JSON (una instancia se comparte como plantilla)."""
+
+    __slots__ = ("rate_limit", "max_concurrency", "max_vcpus", "max_instances")
+
+    def __init__(self, data: Dict[str, Any]):
+        rate_limit = data.get("rate_limit")
+        quota = data.get("quota") or {}
+        self.rate_limit: Optional[Tuple[float, Optional[float]]] = (
+            (rate_limit["rate_per_s"], rate_limit.get("burst")) if rate_limit else None
+        )
+        self.max_concurrency: Optional[int] = data.get("max_concurrency")
+        self.max_vcpus: Optional[float] = quota.get("max_vcpus")
+        self.max_instances: Optional[int] = quota.get("max_instances")
+
+
+class _Scope:
+    """Estado de un ámbito concreto (p. ej. aws/us-east-1): pacer, gates y métricas."""
+
+    def __init__(self, name: str, limits: _Limits):
+        self.name = name
+        self.pacer = RatePacer(*limits.rate_limit) if limits.rate_limit else None
+        self.concurrency = CapacityGate(limits.max_concurrency) if limits.max_concurrency else None
+        self.vcpus = CapacityGate(limits.max_vcpus) if limits.max_vcpus else None
+        self.instances = CapacityGate(limits.max_instances) if limits.max_instances else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {}
+        if self.pacer is not None:
+            out["rate_limit"] = {"rate_per_s": self.pacer.rate, "burst": self.pacer.burst}
+        for key, gate in (("concurrency", self.concurrency), ("quota_vcpus", self.vcpus), ("quota_instances", self.instances)):
+            if gate is not None:
+                out[key] = {"limit": gate.capacity, "in_use": gate.in_use, "queue_depth": gate.queue_depth}
+        return out
+
+
+class _CallStats:
+    """Métricas por (proveedor, tipo de recurso)."""
+
+    __slots__ = ("admitted", "rejected", "waited", "waiting", "wait_s_total", "wait_s_max")
+
+    def __init__(self):
+        self.admitted = 0
+        self.rejected = 0
+        self.waited = 0
+        self.waiting = 0
+        self.wait_s_total = 0.0
+        self.wait_s_max = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "waited": self.waited,
+            "queue_depth": self.waiting,
+            "wait_ms_avg": round(self.wait_s_total / self.admitted * 1000, 3) if self.admitted else 0.0,
+            "wait_ms_max": round(self.wait_s_max * 1000, 3),
+        }
+
+
+class _Ticket:
+    """Lo que una llamada admitida tiene reservado (para liberarlo después)."""
+
+    __slots__ = ("gates", "quota")
+
+    def __init__(self):
+        self.gates: List[Tuple[CapacityGate, float]] = []
+        self.quota: List[Tuple[CapacityGate, float]] = []
+
+
+def _region_of(provider: str, config: Dict[str, Any]) -> str:
+    for field in _REGION_FIELDS:
+        if config.get(field):
+            return str(config[field])
+    zone = config.get("zone")
+    if zone:
+        catalog = PROVIDER_CATALOG.get(provider)
+        region = catalog.region_for_zone(str(zone)) if catalog is not None else None
+        # Zona fuera del catálogo: GCP us-central1-a → us-central1
+        return region or str(zone).rsplit("-", 1)[0]
+    return DEFAULT_REGION
+
+
+def _vcpus_of(provider: str, config: Dict[str, Any]) -> float:
+    for field in _VCPU_FIELDS:
+        if config.get(field) is not None:
+            try:
+                return float(config[field])
+            except (TypeError, ValueError):
+                break
+    size = next((config[f] for f in _SIZE_FIELDS if config.get(f)), None)
+    if size is not None:
+        for instance_type in instance_types(provider):
+            if instance_type.name == size:
+                return float(instance_type.vcpus)
+    return 1.0
+
+
+class ProvisioningGovernor:
+    """Aplica límites de tasa, concurrencia y cuotas a las llamadas create_* de las factories."""
+
+    def __init__(self, providers: Dict[str, Dict[str, Any]], max_wait_s: float = DEFAULT_MAX_WAIT_S):
+        if max_wait_s < 0:
+            raise ValueError("max_wait_s debe ser >= 0")
+        self.max_wait_s = max_wait_s
+        self._providers: Dict[str, Tuple[_Limits, Dict[str, _Limits], Dict[str, _Limits]]] = {}
+        for provider, data in providers.items():
+            self._providers[provider] = (
+                _Limits(data),
+                {k: _Limits(v) for k, v in (data.get("regions") or {}).items()},
+                {k: _Limits(v) for k, v in (data.get("resources") or {}).items()},
+            )
+        self._scopes: Dict[str, Optional[_Scope]] = {}
+        self._stats: Dict[str, _CallStats] = {}
+        self._quota_holds: Dict[str, List[Tuple[CapacityGate, float]]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ProvisioningGovernor":
+        return cls(data.get("providers", {}), max_wait_s=data.get("max_wait_s", DEFAULT_MAX_WAIT_S))
+
+    @classmethod
+    def from_env(cls) -> Optional["ProvisioningGovernor"]:
+        raw = os.environ.get(GOVERNOR_ENV_VAR)
+        if not raw:
+            return None
+        if os.path.exists(raw):
+            with open(raw, "r", encoding="utf-8") as fh:
+                return cls.from_dict(json.load(fh))
+        return cls.from_dict(json.loads(raw))
+
+    # ------------------------------------------------------------------ ámbitos
+
+    def _scope_locked(self, name: str, limits: Optional[_Limits]) -> Optional[_Scope]:
+        if name not in self._scopes:
+            self._scopes[name] = _Scope(name, limits) if limits is not None else None
+        return self._scopes[name]
+
+    def _scopes_for_locked(self, provider: str, resource_type: str, region: str) -> List[_Scope]:
+        """Ámbitos de la llamada de más específico a más general (orden de adquisición fijo)."""
+        entry = self._providers.get(provider) or self._providers.get(WILDCARD)
+        if entry is None:
+            return []
+        limits, regions, resources = entry
+        scopes = [
+            self._scope_locked(f"{provider}/{region}", regions.get(region) or regions.get(WILDCARD)),
+            self._scope_locked(f"{provider}:{resource_type}", resources.get(resource_type) or resources.get(WILDCARD)),
+            self._scope_locked(provider, limits),
+        ]
+        return [s for s in scopes if s is not None]
+
+    # ------------------------------------------------------------------ admisión
+
+    def _prepare(self, provider: str, resource_type: str, config: Dict[str, Any]):
+        """Reserva el turno de tasa y devuelve (ámbitos, espera de tasa, coste de cuota, stats)."""
+        region = _region_of(provider, config)
+        vcpus = _vcpus_of(provider, config) if resource_type == "virtual_machine" else 0.0
+        key = f"{provider}/{resource_type}"
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = _CallStats()
+            scopes = self._scopes_for_locked(provider, resource_type, region)
+            for scope in scopes:
+                if resource_type == "virtual_machine":
+                    for gate, cost in ((scope.vcpus, vcpus), (scope.instances, 1.0)):
+                        if gate is not None and cost > gate.capacity:
+                            stats.rejected += 1
+                            raise QuotaExceededError(
+                                f"La VM ({vcpus:g} vCPU) supera la cuota de {scope.name} ({gate.capacity:g})",
+                                provider=provider,
+                                resource_type=resource_type,
+                            )
+            pacers = [s.pacer for s in scopes if s.pacer is not None]
+            now = time.monotonic()
+            start = max((p.earliest(now) for p in pacers), default=now)
+            delay = start - now
+            if delay > self.max_wait_s:
+                stats.rejected += 1
+                raise ProviderThrottledError(
+                    f"Límite de tasa de {provider}/{resource_type}: espera de {delay:.1f}s > {self.max_wait_s:g}s",
+                    provider=provider,
+                    resource_type=resource_type,
+                    retry_after=delay,
+                )
+            for pacer in pacers:
+                pacer.commit(start)
+            stats.waiting += 1
+        return scopes, delay, vcpus, stats
+
+    def _gates(self, scopes: List[_Scope], resource_type: str, vcpus: float):
+        """(gate, coste, es_cuota): primero las cuotas, para no ocupar concurrencia esperándolas."""
+        quota, concurrency = [], []
+        for scope in scopes:
+            if resource_type == "virtual_machine":
+                if scope.vcpus is not None:
+                    quota.append((scope.vcpus, vcpus, True))
+                if scope.instances is not None:
+                    quota.append((scope.instances, 1.0, True))
+            if scope.concurrency is not None:
+                concurrency.append((scope.concurrency, 1.0, False))
+        return quota + concurrency
+
+    def _admitted(self, stats: _CallStats, waited_s: float) -> None:
+        with self._lock:
+            stats.waiting -= 1
+            stats.admitted += 1
+            stats.wait_s_total += waited_s
+            stats.wait_s_max = max(stats.wait_s_max, waited_s)
+            if waited_s > 0.001:
+                stats.waited += 1
+
+    def _wait_exceeded(self, stats: _CallStats, provider: str, resource_type: str, gate: CapacityGate, quota: bool):
+        with self._lock:
+            stats.rejected += 1
+        error_cls = QuotaExceededError if quota else ProviderThrottledError
+        return error_cls(
+            f"Sin hueco en {provider}/{resource_type} tras esperar {self.max_wait_s:g}s "
+            f"({'cuota' if quota else 'concurrencia'}: {gate.in_use:g}/{gate.capacity:g}, en cola {gate.queue_depth})",
+            provider=provider,
+            resource_type=resource_type,
+            retry_after=self.max_wait_s,
+        )
+
+    @staticmethod
+    def _release(held: List[Tuple[CapacityGate, float]]) -> None:
+        for gate, cost in reversed(held):
+            gate.release(cost)
+
+    def _finish(self, ticket: _Ticket, resource: Optional[CloudResource]) -> None:
+        self._release(ticket.gates)
+        if resource is None:
+            self._release(ticket.quota)
+        elif ticket.quota:
+            with self._lock:
+                self._quota_holds[resource.resource_id] = ticket.quota
+
+    def run(self, provider: str, resource_type: str, config: Dict[str, Any], call: Callable[[], T]) -> T:
+        t0 = time.monotonic()
+        scopes, delay, vcpus, stats = self._prepare(provider, resource_type, config)
+        ticket = _Ticket()
+        try:
+            if delay > 0:
+                time.sleep(delay)
+            for gate, cost, quota in self._gates(scopes, resource_type, vcpus):
+                if not gate.acquire(cost, self.max_wait_s - (time.monotonic() - t0)):
+                    raise self._wait_exceeded(stats, provider, resource_type, gate, quota)
+                (ticket.quota if quota else ticket.gates).append((gate, cost))
+        except BaseException:
+            # Timeout o cancelación esperando turno: se devuelve lo ya reservado
+            self._release(ticket.gates + ticket.quota)
+            with self._lock:
+                stats.waiting -= 1
+            raise
+        self._admitted(stats, time.monotonic() - t0)
+        resource = None
+        try:
+            resource = call()
+            return resource
+        finally:
+            self._finish(ticket, resource)
+
+    async def arun(self, provider: str, resource_type: str, config: Dict[str, Any], call: Callable[[], Awaitable[T]]) -> T:
+        t0 = time.monotonic()
+        scopes, delay, vcpus, stats = self._prepare(provider, resource_type, config)
+        ticket = _Ticket()
+        try:
+            if delay > 0:
+                await asyncio.sleep(delay)
+            for gate, cost, quota in self._gates(scopes, resource_type, vcpus):
+                if not await gate.aacquire(cost, self.max_wait_s - (time.monotonic() - t0)):
+                    raise self._wait_exceeded(stats, provider, resource_type, gate, quota)
+                (ticket.quota if quota else ticket.gates).append((gate, cost))
+        except BaseException:
+            # Timeout o cancelación esperando turno: se devuelve lo ya reservado
+            self._release(ticket.gates + ticket.quota)
+            with self._lock:
+                stats.waiting -= 1
+            raise
+        self._admitted(stats, time.monotonic() - t0)
+        resource = None
+        try:
+            resource = await call()
+            return resource
+        finally:
+            self._finish(ticket, resource)
+
+    def quota_headroom(self, provider: str, region: str, vcpus: float) -> Optional[float]:
+        """
+        Fracción de cuota de VMs (vCPU e instancias, la más justa) que quedaría libre en
+        la región tras una VM de `vcpus`. None si no hay cuotas; negativo si ahora no
+        cabe (la llamada tendría que esperar en cola).
+        """
+        with self._lock:
+            scopes = self._scopes_for_locked(provider, "virtual_machine", region)
+        fractions = []
+        for scope in scopes:
+            for gate, cost in ((scope.vcpus, vcpus), (scope.instances, 1.0)):
+                if gate is not None:
+                    free = gate.capacity - gate.in_use - cost
+                    fractions.append(free / gate.capacity if not gate.queue_depth else -1.0)
+        return min(fractions) if fractions else None
+
+    def release(self, resource_id: str) -> bool:
+        """Devuelve a la cuota lo que ocupaba un recurso borrado. False si no ocupaba nada."""
+        with self._lock:
+            held = self._quota_holds.pop(resource_id, None)
+        if held is None:
+            return False
+        self._release(held)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_wait_s": self.max_wait_s,
+                "calls": {key: s.to_dict() for key, s in sorted(self._stats.items())},
+                "scopes": {name: s.to_dict() for name, s in sorted(self._scopes.items()) if s is not None},
+                "quota_holds": len(self._quota_holds),
+            }
+
+
+class GovernedCloudFactory(CloudFactoryDecorator):
+    """Factory que pasa cada create_* por el governor antes de delegar."""
+
+    def __init__(self, inner: CloudAbstractFactory, provider: str, governor: ProvisioningGovernor):
+        super().__init__(inner)
+        self._provider = provider
+        self._governor = governor
+
+    def create_virtual_machine(self, name: str, vm_config: Dict[str, Any]) -> VirtualMachine:
+        return self._governor.run(self._provider, "virtual_machine", vm_config,
+                                  lambda: self._inner.create_virtual_machine(name, vm_config))
+
+    def create_database(self, name: str, db_config: Dict[str, Any]) -> Database:
+        return self._governor.run(self._provider, "database", db_config,
+                                  lambda: self._inner.create_database(name, db_config))
+
+    def create_load_balancer(self, name: str, lb_config: Dict[str, Any]) -> LoadBalancer:
+        return self._governor.run(self._provider, "load_balancer", lb_config,
+                                  lambda: self._inner.create_load_balancer(name, lb_config))
+
+    def create_storage(self, name: str, storage_config: Dict[str, Any]) -> Storage:
+        return self._governor.run(self._provider, "storage", storage_config,
+                                  lambda: self._inner.create_storage(name, storage_config))
+
+    async def acreate_virtual_machine(self, name: str, vm_config: Dict[str, Any]) -> VirtualMachine:
+        return await self._governor.arun(self._provider, "virtual_machine", vm_config,
+                                         lambda: self._inner.acreate_virtual_machine(name, vm_config))
+
+    async def acreate_database(self, name: str, db_config: Dict[str, Any]) -> Database:
+        return await self._governor.arun(self._provider, "database", db_config,
+                                         lambda: self._inner.acreate_database(name, db_config))
+
+    async def acreate_load_balancer(self, name: str, lb_config: Dict[str, Any]) -> LoadBalancer:
+        return await self._governor.arun(self._provider, "load_balancer", lb_config,
+                                         lambda: self._inner.acreate_load_balancer(name, lb_config))
+
+    async def acreate_storage(self, name: str, storage_config: Dict[str, Any]) -> Storage:
+        return await self._governor.arun(self._provider, "storage", storage_config,
+                                         lambda: self._inner.acreate_storage(name, storage_config))
+
+    def delete_resource(self, resource: CloudResource) -> None:
+        # Rollback de infraestructura: la VM deja de contar para la cuota
+        self._governor.release(resource.resource_id)
+        super().delete_resource(resource)
+
+    async def adelete_resource(self, resource: CloudResource) -> None:
+        self._governor.release(resource.resource_id)
+        await super().adelete_resource(resource)
+
+
+_DECORATOR_NAME = "governor"
+# Governor del proceso: None = sin límites (las factories aceptan todo)
+_governor: Optional[ProvisioningGovernor] = None
+
+
+def get_governor() -> Optional[ProvisioningGovernor]:
+    return _governor
+
+
+def enable_governor(governor: ProvisioningGovernor) -> None:
+    """Envuelve todas las factories creadas a partir de ahora con GovernedCloudFactory."""
+    global _governor
+    _governor = governor
+    add_factory_decorator(
+        _DECORATOR_NAME,
+        lambda provider, factory: GovernedCloudFactory(factory, provider.value, governor),
+    )
+    print("🚦 Governor de aprovisionamiento activado")
+
+
+def disable_governor() -> None:
+    global _governor
+    _governor = None
+    remove_factory_decorator(_DECORATOR_NAME)
+
+
+def enable_governor_from_env() -> bool:
+    governor = ProvisioningGovernor.from_env()
+    if governor is None:
+        return False
+    enable_governor(governor)
+    return True
@@ -0,0 +1,130 @@
+"""
+Almacén de respuestas para Idempotency-Key (TTL + LRU acotado, en memoria).
+
+- miss: primera ejecución con esa clave; se guarda la respuesta si es definitiva.
+- coalesced: llega un duplicado mientras la primera sigue en curso; espera a su
+  resultado en lugar de ejecutar de nuevo. Si la primera se cancela (el cliente
+  cortó la conexión) la cancelación no llega a los duplicados: el primero que
+  despierta ejecuta su propia petición y el resto pasa a esperarle a él.
+- hit: reintento posterior; se devuelve la respuesta almacenada.
+Las respuestas transitorias (5xx, 429) no se guardan: el reintento debe ejecutarse.
+"""
+from __future__ import annotations
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from app.domain.errors import IdempotencyKeyReuseError
+
+_Key = Tuple[str, str]
+
+
+class IdempotentResponse:
+    """Respuesta HTTP ya serializada que se reproduce tal cual en los reintentos."""
+
+    __slots__ = ("status_code", "body", "headers")
+
+    def __init__(self, status_code: int, body: bytes, headers: Optional[Dict[str, str]] = None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers or {}
+
+    @property
+    def cacheable(self) -> bool:
+        return self.status_code < 500 and self.status_code != 429
+
+
+class IdempotencyStore:
+    def __init__(self, max_entries: int = 10_000, ttl_s: float = 24 * 3600.0, clock: Callable[[], float] = time.monotonic):
+        if max_entries <= 0 or ttl_s <= 0:
+            raise ValueError("max_entries y ttl_s deben ser > 0")
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self._clock = clock
+        # (scope, clave) -> (expira_en, huella del payload, respuesta); orden = recencia de uso
+        self._entries: "OrderedDict[_Key, Tuple[float, str, IdempotentResponse]]" = OrderedDict()
+        self._in_flight: Dict[_Key, Tuple[str, asyncio.Future]] = {}
+        self._counters = {"hits": 0, "misses": 0, "coalesced": 0, "mismatches": 0, "evictions": 0, "expirations": 0, "takeovers": 0}
+
+    async def run(
+        self,
+        scope: str,
+        key: str,
+        fingerprint: str,
+        execute: Callable[[], Awaitable[IdempotentResponse]],
+    ) -> Tuple[IdempotentResponse, str]:
+        """Devuelve (respuesta, resultado) con resultado en {"hit", "miss", "coalesced"}."""
+        entry_key = (scope, key)
+        waited = False
+        while True:
+            stored = self._lookup(entry_key)
+            if stored is not None:
+                self._check_fingerprint(key, stored[1], fingerprint)
+                self._counters["hits"] += 1
+                return stored[2], "hit"
+
+            in_flight = self._in_flight.get(entry_key)
+            if in_flight is None:
+                break
+            self._check_fingerprint(key, in_flight[0], fingerprint)
+            if not waited:
+                self._counters["coalesced"] += 1
+                waited = True
+            # shield: si este duplicado se cancela, no cancela la ejecución original
+            response = await asyncio.shield(in_flight[1])
+            if response is not None:
+                return response, "coalesced"
+            # None: la ejecución que se esperaba se canceló; se vuelve a mirar
+            # (otro duplicado puede haber tomado ya el relevo)
+
+        if waited:
+            self._counters["takeovers"] += 1
+        else:
+            self._counters["misses"] += 1
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[entry_key] = (fingerprint, future)
+        try:
+            response = await execute()
+        except asyncio.CancelledError:
+            # La cancelación es de quien ejecutaba, no de los duplicados: se les despierta sin error
+            future.set_result(None)
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # marcar como recuperada aunque no haya duplicados esperando
+            raise
+        finally:
+            self._in_flight.pop(entry_key, None)
+        if response.cacheable:
+            self._store(entry_key, fingerprint, response)
+        future.set_result(response)
+        return response, "miss"
+
+    def stats(self) -> Dict[str, int]:
+        return {**self._counters, "entries": len(self._entries), "in_flight": len(self._in_flight)}
+
+    def _lookup(self, entry_key: _Key) -> Optional[Tuple[float, str, IdempotentResponse]]:
+        stored = self._entries.get(entry_key)
+        if stored is None:
+            return None
+        if stored[0] <= self._clock():
+            del self._entries[entry_key]
+            self._counters["expirations"] += 1
+            return None
+        self._entries.move_to_end(entry_key)
+        return stored
+
+    def _store(self, entry_key: _Key, fingerprint: str, response: IdempotentResponse) -> None:
+        self._entries[entry_key] = (self._clock() + self.ttl_s, fingerprint, response)
+        self._entries.move_to_end(entry_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._counters["evictions"] += 1
+
+    def _check_fingerprint(self, key: str, expected: str, fingerprint: str) -> None:
+        if expected != fingerprint:
+            self._counters["mismatches"] += 1
+            raise IdempotencyKeyReuseError(
+                f"Idempotency-Key '{key}' ya se usó con un payload distinto"
+            )
@@ -0,0 +1,66 @@
+from __future__ import annotations
+from typing import Dict, List, Optional
+from datetime import datetime
+from app.domain.schemas.infrastructure import InfrastructureRecord
+from app.infrastructure.change_log import CHANGE_CREATED, CHANGE_DELETED, CHANGE_UPDATED, ChangeLog
+from app.infrastructure.metrics import timed
+from app.infrastructure.repository import REPOSITORY_OP_SECONDS
+from app.infrastructure.tracing import traced
+
+
+class InfrastructureRepository:
+    """
+    Repositorio en memoria de infraestructuras creadas (soft-delete). Con un
+    ChangeLog, altas, cambios y bajas quedan registrados para GET /changes.
+    """
+
+    RESOURCE = "infrastructure"
+
+    def __init__(self, changes: Optional[ChangeLog] = None):
+        self._store: Dict[str, InfrastructureRecord] = {}
+        self._changes = changes
+
+    def _record(self, record: InfrastructureRecord, op: str) -> None:
+        if self._changes is not None:
+            self._changes.record(self.RESOURCE, record.id, op, record)
+
+    @traced("InfrastructureRepository.add")
+    @timed(REPOSITORY_OP_SECONDS, "infrastructure", "add")
+    def add(self, record: InfrastructureRecord):
+        op = CHANGE_UPDATED if record.id in self._store else CHANGE_CREATED
+        self._store[record.id] = record
+        self._record(record, op)
+
+    @traced("InfrastructureRepository.list")
+    @timed(REPOSITORY_OP_SECONDS, "infrastructure", "list")
+    def list(self) -> List[InfrastructureRecord]:
+        return [r for r in self._store.values() if r.status == "active"]
+
+    @traced("InfrastructureRepository.get")
+    @timed(REPOSITORY_OP_SECONDS, "infrastructure", "get")
+    def get(self, infra_id: str) -> Optional[InfrastructureRecord]:
+        return self._store.get(infra_id)
+
+    @traced("InfrastructureRepository.update")
+    @timed(REPOSITORY_OP_SECONDS, "infrastructure", "update")
+    def update(self, infra_id: str, updater) -> InfrastructureRecord:
+        rec = self._store.get(infra_id)
+        if not rec or rec.status != "active":
+            raise KeyError("Infraestructura no encontrada")
+        updater(rec)
+        rec.updated_at = datetime.utcnow()
+        self._store[infra_id] = rec
+        self._record(rec, CHANGE_UPDATED)
+        return rec
+
+    @traced("InfrastructureRepository.delete")
+    @timed(REPOSITORY_OP_SECONDS, "infrastructure", "delete")
+    def delete(self, infra_id: str) -> InfrastructureRecord:
+        rec = self._store.get(infra_id)
+        if not rec or rec.status != "active":
+            raise KeyError("Infraestructura no encontrada")
+        rec.status = "deleted"
+        rec.updated_at = datetime.utcnow()
+        # Soft delete: el registro sigue guardado pero para los clientes es una baja
+        self._record(rec, CHANGE_DELETED)
+        return rec
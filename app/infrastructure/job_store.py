@@ -0,0 +1,131 @@
+"""
+Persistencia de jobs en un fichero JSONL de sólo-añadir.
+Cada cambio de estado añade una línea; al cargar gana la última línea de cada id.
+compact() reescribe el fichero con un único registro por job.
+
+Con start() las escrituras no bloquean el event loop: append()/compact()
+serializan el registro en el momento (foto del estado) y lo encolan; una única
+tarea escribe por lotes en un hilo, como AsyncAuditSink. Las compactaciones
+pasan por la misma cola, así una línea encolada antes nunca se escribe
+después de la reescritura que ya la incluye. Sin start() se escribe en línea.
+"""
+from __future__ import annotations
+import asyncio
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from app.domain.schemas.jobs import JobRecord
+
+JOBS_FILE_ENV_VAR = "VM_API_JOBS_FILE"
+DEFAULT_JOBS_FILE = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "data", "jobs.jsonl"))
+
+_APPEND = "append"
+_COMPACT = "compact"
+# (operación, líneas): una línea en append, el fichero entero en compact
+_WriteOp = Tuple[str, List[str]]
+
+
+class JsonlJobStore:
+    def __init__(self, path: str | None = None, batch_size: int = 256):
+        self.path = path or os.environ.get(JOBS_FILE_ENV_VAR) or DEFAULT_JOBS_FILE
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._batch_size = batch_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run(), name="job-store-writer")
+
+    async def stop(self) -> None:
+        """Escribe lo pendiente y detiene la tarea escritora."""
+        if not self.running:
+            return
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+        self._queue = None
+
+    def append(self, record: JobRecord) -> None:
+        self._submit((_APPEND, [record.model_dump_json() + "\n"]))
+
+    def compact(self, records: Iterable[JobRecord]) -> None:
+        self._submit((_COMPACT, [record.model_dump_json() + "\n" for record in records]))
+
+    def _submit(self, op: _WriteOp) -> None:
+        # Solo se encola desde el loop de la tarea escritora (como audit_log_async)
+        if self.running and asyncio._get_running_loop() is self._loop:
+            self._queue.put_nowait(op)
+        else:
+            self._apply([op])
+
+    async def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            op = await self._queue.get()
+            batch: List[_WriteOp] = []
+            if op is None:
+                stopping = True
+            else:
+                batch.append(op)
+            while not stopping and len(batch) < self._batch_size:
+                try:
+                    op = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if op is None:
+                    stopping = True
+                else:
+                    batch.append(op)
+            if batch:
+                try:
+                    await asyncio.to_thread(self._apply, batch)
+                except Exception as e:
+                    print(f"❌ Error escribiendo jobs: {e}")
+
+    def _apply(self, batch: List[_WriteOp]) -> None:
+        # En orden: los append seguidos van en una sola escritura; un compact
+        # reescribe el fichero (y deja sin efecto los append anteriores del lote)
+        pending: List[str] = []
+        with self._lock:
+            for kind, lines in batch:
+                if kind == _APPEND:
+                    pending.extend(lines)
+                    continue
+                pending = []
+                tmp_path = self.path + ".tmp"
+                with open(tmp_path, "w", encoding="utf-8") as fh:
+                    fh.writelines(lines)
+                os.replace(tmp_path, self.path)
+            if pending:
+                with open(self.path, "a", encoding="utf-8") as fh:
+                    fh.writelines(pending)
+
+    def load(self) -> Dict[str, JobRecord]:
+        records: Dict[str, JobRecord] = {}
+        if not os.path.exists(self.path):
+            return records
+        with open(self.path, "r", encoding="utf-8") as fh:
+            for line in fh:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = JobRecord.model_validate_json(line)
+                except ValidationError:
+                    # Línea truncada por una caída a mitad de escritura: se ignora
+                    continue
+                records[record.id] = record
+        return records
@@ -1,36 +1,171 @@
+import asyncio
 import logging
-import json
 import os
+import time
 from datetime import datetime
 from enum import Enum
+from json.encoder import encode_basestring_ascii
+from typing import List, Optional
 
-LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "logs"))
+from app.infrastructure.metrics import FAST_LATENCY_BUCKETS, get_metrics_registry
+from app.infrastructure.serialization import dumps
+from app.infrastructure.tracing import traced
+
+LOG_DIR_ENV_VAR = "VM_API_LOG_DIR"
+DEFAULT_LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "logs"))
+# Se lee al importar: el handler del logger "audit" se crea una sola vez
+LOG_DIR = os.path.abspath(os.environ.get(LOG_DIR_ENV_VAR) or DEFAULT_LOG_DIR)
 os.makedirs(LOG_DIR, exist_ok=True)
 LOG_FILE = os.path.join(LOG_DIR, "audit.log")
 
 logger = logging.getLogger("audit")
 if not logger.handlers:
     logger.setLevel(logging.INFO)
-    fh = logging.FileHandler(LOG_FILE)
+    fh = logging.FileHandler(LOG_FILE, encoding="utf-8")
     fmt = logging.Formatter("%(message)s")
     fh.setFormatter(fmt)
     logger.addHandler(fh)
 
+_metrics = get_metrics_registry()
+# mode: inline (la petición escribe) | batch (lote del sink asíncrono)
+AUDIT_WRITE_SECONDS = _metrics.histogram(
+    "vm_api_audit_write_duration_seconds",
+    "Duración de cada escritura de auditoría (una línea inline o un lote del sink)",
+    ("mode",),
+    buckets=FAST_LATENCY_BUCKETS,
+)
+AUDIT_LINES = _metrics.counter("vm_api_audit_lines_total", "Líneas de auditoría escritas", ("mode",))
 
-def audit_log(actor: str, action: str, vm_id: str, provider, success: bool, details=None):
+
+def _format_audit_line(actor: str, action: str, vm_id: str, provider, success: bool, details=None) -> str:
     # Normalizar provider a string
     if isinstance(provider, Enum):
         provider_value = provider.value
     else:
         provider_value = str(provider)
-    payload = {
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-        "actor": actor,
-        "action": action,
-        "vm_id": vm_id,
-        "provider": provider_value,
-        "success": success,
-        "details": details,
-    }
-    # evitar credenciales sensibles: nunca registramos 'params' completos ni secretos
-    logger.info(json.dumps(payload, default=str))
+    # Esquema fijo: plantilla con los str escapados por el encoder C de json; solo
+    # details pasa por el serializador genérico (orjson si está disponible).
+    # Evitar credenciales sensibles: nunca registramos 'params' completos ni secretos
+    return (
+        f'{{"timestamp":"{datetime.utcnow().isoformat()}Z"'
+        f',"actor":{encode_basestring_ascii(str(actor))}'
+        f',"action":{encode_basestring_ascii(str(action))}'
+        f',"vm_id":{encode_basestring_ascii(str(vm_id))}'
+        f',"provider":{encode_basestring_ascii(provider_value)}'
+        f',"success":{"true" if success else "false"}'
+        f',"details":{"null" if details is None else dumps(details).decode("utf-8")}}}'
+    )
+
+
+def _write_inline(line: str) -> None:
+    t0 = time.perf_counter()
+    logger.info(line)
+    AUDIT_WRITE_SECONDS.observe(("inline",), time.perf_counter() - t0)
+    AUDIT_LINES.inc(("inline",))
+
+
+@traced("audit_log")
+def audit_log(actor: str, action: str, vm_id: str, provider, success: bool, details=None):
+    _write_inline(_format_audit_line(actor, action, vm_id, provider, success, details))
+
+
+class AsyncAuditSink:
+    """
+    Sink de auditoría para el camino asíncrono.
+    Los eventos se encolan en una asyncio.Queue acotada (backpressure si se llena) y una
+    única tarea los escribe por lotes en un executor, de modo que ninguna petición
+    espera la escritura a disco. El formato de línea es idéntico al de audit_log.
+    """
+
+    def __init__(self, maxsize: int = 10_000, batch_size: int = 256):
+        self._maxsize = maxsize
+        self._batch_size = batch_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def accepts_from_current_loop(self) -> bool:
+        try:
+            return self.running and asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def qsize(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self._maxsize)
+        self._task = asyncio.create_task(self._run(), name="audit-sink")
+
+    async def stop(self) -> None:
+        """Vacía la cola pendiente y detiene la tarea escritora."""
+        if not self.running:
+            return
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+
+    async def put(self, line: str) -> None:
+        await self._queue.put(line)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            line = await self._queue.get()
+            batch: List[str] = []
+            if line is None:
+                stopping = True
+            else:
+                batch.append(line)
+            while not stopping and len(batch) < self._batch_size:
+                try:
+                    line = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if line is None:
+                    stopping = True
+                else:
+                    batch.append(line)
+            if batch:
+                try:
+                    await loop.run_in_executor(None, _write_lines, batch)
+                except Exception as e:
+                    print(f"❌ Error escribiendo auditoría: {e}")
+
+
+def _write_lines(lines: List[str]) -> None:
+    t0 = time.perf_counter()
+    for line in lines:
+        logger.info(line)
+    AUDIT_WRITE_SECONDS.observe(("batch",), time.perf_counter() - t0)
+    AUDIT_LINES.inc(("batch",), len(lines))
+
+
+_async_sink = AsyncAuditSink()
+_metrics.gauge("vm_api_audit_queue_depth", "Líneas pendientes en la cola del sink de auditoría asíncrono", _async_sink.qsize)
+
+
+async def start_async_audit_sink() -> None:
+    await _async_sink.start()
+
+
+async def stop_async_audit_sink() -> None:
+    await _async_sink.stop()
+
+
+@traced("audit_log_async")
+async def audit_log_async(actor: str, action: str, vm_id: str, provider, success: bool, details=None):
+    """Variante no bloqueante de audit_log; si el sink no está arrancado escribe en línea."""
+    line = _format_audit_line(actor, action, vm_id, provider, success, details)
+    if _async_sink.accepts_from_current_loop():
+        await _async_sink.put(line)
+    else:
+        _write_inline(line)
@@ -0,0 +1,299 @@
+"""
+Métricas en memoria con exposición en formato de texto de Prometheus (/metrics).
+
+Contadores e histogramas con acumuladores por hilo: cada hilo escribe solo en
+su propio shard (un dict etiquetas → celda), así que observe()/inc() no toman
+ningún lock y cuestan unos cientos de ns. El scrape suma los shards de todos
+los hilos (también los de hilos ya terminados, que se conservan). Las lecturas
+no se sincronizan con las escrituras: un scrape puede ver una observación a
+medias (bucket contado y suma aún no), lo que es aceptable para métricas.
+
+En el event loop todas las corrutinas comparten hilo y por tanto shard; los
+endpoints sync y los executors usan el shard de su hilo del pool.
+
+Los gauges son callbacks que se evalúan al hacer scrape (profundidad de colas...).
+"""
+from __future__ import annotations
+import functools
+import math
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+Labels = Tuple[str, ...]
+GaugeValue = Union[float, Mapping[Labels, float]]
+
+# Latencias de peticiones y llamadas a proveedores (segundos)
+DEFAULT_LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+# Operaciones en memoria o de E/S local (repositorios, escrituras de auditoría)
+FAST_LATENCY_BUCKETS = (
+    0.000001, 0.0000025, 0.000005, 0.00001, 0.000025, 0.00005, 0.0001,
+    0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.1,
+)
+
+
+class _Metric:
+    """Base de contadores e histogramas: shards por hilo registrados en una lista."""
+
+    kind = ""
+    __slots__ = ("name", "help", "labelnames", "_local", "_shards", "_lock")
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames: Tuple[str, ...] = tuple(labelnames)
+        self._local = threading.local()
+        self._shards: List[Dict[Labels, Any]] = []
+        self._lock = threading.Lock()
+
+    def _register_shard(self) -> Dict[Labels, Any]:
+        # Solo la primera escritura de cada hilo pasa por aquí (y por el lock)
+        cells: Dict[Labels, Any] = {}
+        with self._lock:
+            self._shards.append(cells)
+        self._local.cells = cells
+        return cells
+
+    def _snapshots(self) -> List[Dict[Labels, Any]]:
+        with self._lock:
+            shards = list(self._shards)
+        # dict.copy() es atómico con el GIL: el hilo dueño puede seguir insertando
+        return [cells.copy() for cells in shards]
+
+    def samples(self) -> List[Tuple[str, Labels, float]]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Contador monótono; por convención el nombre termina en _total."""
+
+    kind = "counter"
+    __slots__ = ()
+
+    def inc(self, labels: Labels = (), amount: float = 1.0) -> None:
+        try:
+            cells = self._local.cells
+        except AttributeError:
+            cells = self._register_shard()
+        cells[labels] = cells.get(labels, 0.0) + amount
+
+    def values(self) -> Dict[Labels, float]:
+        totals: Dict[Labels, float] = {}
+        for cells in self._snapshots():
+            for labels, value in cells.items():
+                totals[labels] = totals.get(labels, 0.0) + value
+        return totals
+
+    def samples(self) -> List[Tuple[str, Labels, float]]:
+        return [("", labels, value) for labels, value in sorted(self.values().items())]
+
+
+class Histogram(_Metric):
+    """
+    Cada celda es una lista [n_bucket_0, ..., n_bucket_+Inf, suma]; los buckets
+    se guardan sin acumular y se acumulan al exponerlos.
+    """
+
+    kind = "histogram"
+    __slots__ = ("bounds", "_width")
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        bounds = tuple(float(b) for b in buckets if b != math.inf)
+        if not bounds or list(bounds) != sorted(set(bounds)):
+            raise ValueError(f"Histograma {name}: los buckets deben ser crecientes y sin repetir")
+        self.bounds = bounds
+        self._width = len(bounds) + 1
+
+    def observe(self, labels: Labels, value: float) -> None:
+        try:
+            cell = self._local.cells[labels]
+        except (AttributeError, KeyError):
+            cell = self._new_cell(labels)
+        cell[bisect_left(self.bounds, value)] += 1
+        cell[-1] += value
+
+    def _new_cell(self, labels: Labels) -> List[float]:
+        try:
+            cells = self._local.cells
+        except AttributeError:
+            cells = self._register_shard()
+        cell = cells[labels] = [0] * self._width + [0.0]
+        return cell
+
+    def time(self, labels: Labels) -> "_Timer":
+        """with histogram.time(labels): ... (para código no caliente; en el camino caliente, perf_counter directo)."""
+        return _Timer(self, labels)
+
+    def merged(self) -> Dict[Labels, List[float]]:
+        merged: Dict[Labels, List[float]] = {}
+        for cells in self._snapshots():
+            for labels, cell in cells.items():
+                total = merged.get(labels)
+                if total is None:
+                    merged[labels] = list(cell)
+                else:
+                    for i, value in enumerate(cell):
+                        total[i] += value
+        return merged
+
+    def summary(self) -> Dict[Labels, Dict[str, float]]:
+        return {
+            labels: {"count": sum(cell[:-1]), "sum": cell[-1]}
+            for labels, cell in self.merged().items()
+        }
+
+    def samples(self) -> List[Tuple[str, Labels, float]]:
+        out: List[Tuple[str, Labels, float]] = []
+        for labels, cell in sorted(self.merged().items()):
+            cumulative = 0
+            for bound, count in zip(self.bounds + (math.inf,), cell):
+                cumulative += count
+                out.append(("_bucket", labels + (_format_value(bound),), cumulative))
+            out.append(("_sum", labels, cell[-1]))
+            out.append(("_count", labels, cumulative))
+        return out
+
+
+class _Timer:
+    __slots__ = ("_histogram", "_labels", "_t0")
+
+    def __init__(self, histogram: Histogram, labels: Labels):
+        self._histogram = histogram
+        self._labels = labels
+
+    def __enter__(self) -> "_Timer":
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._histogram.observe(self._labels, time.perf_counter() - self._t0)
+
+
+class Gauge:
+    """Gauge calculado al hacer scrape: fn devuelve un valor o un dict etiquetas → valor."""
+
+    kind = "gauge"
+    __slots__ = ("name", "help", "labelnames", "_fn")
+
+    def __init__(self, name: str, help: str, fn: Callable[[], GaugeValue], labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames: Tuple[str, ...] = tuple(labelnames)
+        self._fn = fn
+
+    def samples(self) -> List[Tuple[str, Labels, float]]:
+        value = self._fn()
+        if isinstance(value, Mapping):
+            return [("", labels, v) for labels, v in sorted(value.items())]
+        return [("", (), value)]
+
+
+def timed(histogram: Histogram, *labels: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorador que observa la duración de cada llamada (también si lanza)."""
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        perf_counter = time.perf_counter
+        observe = histogram.observe
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            t0 = perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                observe(labels, perf_counter() - t0)
+        return wrapper
+    return decorator
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class MetricsRegistry:
+    """Registro de métricas por nombre; render() produce el texto de /metrics."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls: type, name: str, *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                if type(existing) is not cls:
+                    raise ValueError(f"Métrica {name} ya registrada como {existing.kind}")
+                return existing
+            metric = cls(name, *args, **kwargs)
+            self._metrics[name] = metric
+            return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, help, labelnames, buckets)
+
+    def gauge(self, name: str, help: str, fn: Callable[[], GaugeValue], labelnames: Sequence[str] = ()) -> Gauge:
+        """Registra (o reemplaza) un gauge calculado."""
+        gauge = Gauge(name, help, fn, labelnames)
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None and type(existing) is not Gauge:
+                raise ValueError(f"Métrica {name} ya registrada como {existing.kind}")
+            self._metrics[name] = gauge
+        return gauge
+
+    def get(self, name: str) -> Optional[Any]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines: List[str] = []
+        for metric in metrics:
+            try:
+                samples = metric.samples()
+            except Exception as e:
+                # Un gauge roto no debe tumbar el scrape entero
+                print(f"❌ Error calculando la métrica {metric.name}: {e}")
+                continue
+            lines.append(f"# HELP {metric.name} {_escape(metric.help)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            names = metric.labelnames + (("le",) if metric.kind == "histogram" else ())
+            for suffix, labels, value in samples:
+                label_names = names if suffix == "_bucket" else metric.labelnames
+                if labels:
+                    rendered = ",".join(f'{n}="{_escape(str(v))}"' for n, v in zip(label_names, labels))
+                    lines.append(f"{metric.name}{suffix}{{{rendered}}} {_format_value(value)}")
+                else:
+                    lines.append(f"{metric.name}{suffix} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    return _registry
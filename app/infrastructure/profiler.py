@@ -0,0 +1,218 @@
+"""
+Profiler estadístico bajo demanda para workers en producción.
+
+Un hilo muestreador toma sys._current_frames() cada `interval_s` y cuenta la
+pila de cada hilo del proceso (event loop, threadpool de endpoints sync,
+executors...). No instrumenta nada: el coste es el del propio muestreo (unas
+decenas de µs por muestra con pocos hilos), y se reporta en el resultado.
+
+Las pilas se guardan como tuplas de code objects y solo se convierten a texto
+al final. La salida "collapsed" (una línea "marco;marco;... cuenta" por pila)
+es la que consumen flamegraph.pl, speedscope o inferno.
+
+Por defecto se descartan las muestras de hilos ociosos (event loop esperando
+en select, workers del pool esperando trabajo) para que el perfil muestre
+solo dónde se gasta CPU o se bloquea una petición.
+"""
+from __future__ import annotations
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Tuple
+
+DEFAULT_INTERVAL_S = 0.01
+DEFAULT_MAX_DEPTH = 128
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# (fichero, función) de la hoja de una pila ociosa
+_IDLE_LEAVES = frozenset({
+    ("selectors.py", "select"),
+    ("threading.py", "wait"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+})
+
+
+def _short_path(filename: str) -> str:
+    if filename.startswith(_PROJECT_ROOT):
+        return os.path.relpath(filename, _PROJECT_ROOT)
+    marker = "site-packages" + os.sep
+    index = filename.find(marker)
+    if index >= 0:
+        return filename[index + len(marker):]
+    return os.path.basename(filename)
+
+
+class ProfileResult:
+    """Cuentas por (hilo, pila) de una sesión de muestreo."""
+
+    __slots__ = (
+        "interval_s", "duration_s", "sampling_s", "samples", "idle_samples",
+        "_stacks", "_lines", "_labels",
+    )
+
+    def __init__(self, interval_s: float, lines: bool):
+        self.interval_s = interval_s
+        self.duration_s = 0.0
+        # Tiempo del hilo muestreador dentro de las muestras (el overhead)
+        self.sampling_s = 0.0
+        self.samples = 0
+        self.idle_samples = 0
+        self._stacks: Dict[Tuple[str, Tuple[Any, ...]], int] = {}
+        self._lines = lines
+        self._labels: Dict[Any, str] = {}
+
+    def _label(self, key: Any) -> str:
+        label = self._labels.get(key)
+        if label is None:
+            code, lineno = key if self._lines else (key, None)
+            line = lineno if lineno is not None else code.co_firstlineno
+            label = f"{code.co_qualname} ({_short_path(code.co_filename)}:{line})"
+            self._labels[key] = label
+        return label
+
+    def collapsed(self, threads: bool = True) -> str:
+        """Formato "collapsed"/folded: raíz a la izquierda, una pila por línea."""
+        merged: Dict[str, int] = {}
+        for (thread, stack), count in self._stacks.items():
+            frames = [self._label(key) for key in reversed(stack)]
+            if threads:
+                frames.insert(0, f"thread:{thread}")
+            line = ";".join(frames)
+            merged[line] = merged.get(line, 0) + count
+        ordered = sorted(merged.items(), key=lambda item: item[1], reverse=True)
+        return "".join(f"{line} {count}\n" for line, count in ordered)
+
+    def top(self, limit: int = 20) -> Dict[str, List[Dict[str, Any]]]:
+        """Funciones con más muestras propias (hoja) y totales (en cualquier punto de la pila)."""
+        own: Dict[str, int] = {}
+        total: Dict[str, int] = {}
+        for (_, stack), count in self._stacks.items():
+            if not stack:
+                continue
+            leaf = self._label(stack[0])
+            own[leaf] = own.get(leaf, 0) + count
+            for label in {self._label(key) for key in stack}:
+                total[label] = total.get(label, 0) + count
+        busy = sum(self._stacks.values()) or 1
+
+        def rows(counts: Dict[str, int]) -> List[Dict[str, Any]]:
+            ordered = sorted(counts.items(), key=lambda item: item[1], reverse=True)[:limit]
+            return [{"function": f, "samples": n, "pct": round(100.0 * n / busy, 2)} for f, n in ordered]
+
+        return {"self": rows(own), "total": rows(total)}
+
+    def by_thread(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for (thread, _), count in self._stacks.items():
+            counts[thread] = counts.get(thread, 0) + count
+        return dict(sorted(counts.items(), key=lambda item: item[1], reverse=True))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "duration_s": round(self.duration_s, 3),
+            "interval_ms": round(self.interval_s * 1000, 3),
+            "samples": self.samples,
+            "stack_samples": sum(self._stacks.values()),
+            "idle_samples": self.idle_samples,
+            "distinct_stacks": len(self._stacks),
+            "sampling_ms": round(self.sampling_s * 1000, 3),
+            "overhead_pct": round(100.0 * self.sampling_s / self.duration_s, 3) if self.duration_s else 0.0,
+        }
+
+    def to_dict(self, limit: int = 20) -> Dict[str, Any]:
+        return {**self.stats(), "threads": self.by_thread(), "top": self.top(limit)}
+
+
+class SamplingProfiler:
+    """
+    Muestrea todos los hilos salvo el suyo. run() bloquea el hilo que lo llama
+    durante `seconds` (desde async: await asyncio.to_thread(profiler.run, s)).
+    Solo una sesión a la vez por proceso.
+    """
+
+    _session_lock = threading.Lock()
+
+    def __init__(
+        self,
+        interval_s: float = DEFAULT_INTERVAL_S,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        include_idle: bool = False,
+        lines: bool = False,
+    ):
+        if interval_s <= 0:
+            raise ValueError("interval_s debe ser > 0")
+        if max_depth < 1:
+            raise ValueError("max_depth debe ser >= 1")
+        self.interval_s = interval_s
+        self.max_depth = max_depth
+        self.include_idle = include_idle
+        self.lines = lines
+
+    @classmethod
+    def busy(cls) -> bool:
+        return cls._session_lock.locked()
+
+    def run(self, seconds: float) -> ProfileResult:
+        if not self._session_lock.acquire(blocking=False):
+            raise RuntimeError("Ya hay una sesión de profiling en curso")
+        try:
+            return self._run(seconds)
+        finally:
+            self._session_lock.release()
+
+    def _run(self, seconds: float) -> ProfileResult:
+        result = ProfileResult(self.interval_s, self.lines)
+        stacks = result._stacks
+        own = threading.get_ident()
+        max_depth = self.max_depth
+        lines = self.lines
+        include_idle = self.include_idle
+        names: Dict[int, str] = {}
+        names_at = 0.0
+        perf_counter = time.perf_counter
+
+        start = perf_counter()
+        deadline = start + seconds
+        next_at = start
+        while True:
+            t0 = perf_counter()
+            if t0 >= deadline:
+                break
+            if t0 - names_at >= 1.0:
+                # Los nombres de hilo cambian poco: se refrescan una vez por segundo
+                names = {t.ident: t.name for t in threading.enumerate()}
+                names_at = t0
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                if not include_idle:
+                    code = frame.f_code
+                    if (os.path.basename(code.co_filename), code.co_name) in _IDLE_LEAVES:
+                        result.idle_samples += 1
+                        continue
+                stack = []
+                depth = 0
+                while frame is not None and depth < max_depth:
+                    stack.append((frame.f_code, frame.f_lineno) if lines else frame.f_code)
+                    frame = frame.f_back
+                    depth += 1
+                key = (names.get(ident, str(ident)), tuple(stack))
+                stacks[key] = stacks.get(key, 0) + 1
+            result.samples += 1
+            result.sampling_s += perf_counter() - t0
+            next_at += self.interval_s
+            delay = next_at - perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Atrasados (GIL ocupado): no se intentan recuperar muestras perdidas
+                next_at = perf_counter()
+        result.duration_s = perf_counter() - start
+        return result
+
+
+def profile(seconds: float, interval_s: float = DEFAULT_INTERVAL_S, **kwargs: Any) -> ProfileResult:
+    return SamplingProfiler(interval_s=interval_s, **kwargs).run(seconds)
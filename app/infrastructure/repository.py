@@ -1,28 +1,113 @@
 from __future__ import annotations
-from typing import List, Dict
+import asyncio
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Optional
 from app.domain.schemas import VMDTO
-from app.domain.ports import VMRepositoryPort
+from app.domain.ports import AsyncVMRepositoryPort, VMRepositoryPort
+from app.infrastructure.change_log import CHANGE_CREATED, CHANGE_DELETED, CHANGE_UPDATED, ChangeLog
+from app.infrastructure.metrics import FAST_LATENCY_BUCKETS, get_metrics_registry, timed
+from app.infrastructure.tracing import traced
+
+# Compartido con InfrastructureRepository (etiqueta repository)
+REPOSITORY_OP_SECONDS = get_metrics_registry().histogram(
+    "vm_api_repository_op_duration_seconds",
+    "Duración de las operaciones de los repositorios en memoria",
+    ("repository", "op"),
+    buckets=FAST_LATENCY_BUCKETS,
+)
 
 
 class VMRepository(VMRepositoryPort):
-    """Repositorio en memoria (dict) para simular persistencia sin BD."""
+    """
+    Repositorio en memoria (dict) para simular persistencia sin BD. Con un
+    ChangeLog, cada mutación queda registrada para GET /changes.
+    """
+
+    RESOURCE = "vm"
 
-    def __init__(self):
+    def __init__(self, changes: Optional[ChangeLog] = None):
         self._store: Dict[str, VMDTO] = {}
+        self._changes = changes
 
+    @traced("VMRepository.save")
+    @timed(REPOSITORY_OP_SECONDS, "vm", "save")
     def save(self, vm: VMDTO) -> None:
+        op = CHANGE_UPDATED if vm.id in self._store else CHANGE_CREATED
         self._store[vm.id] = vm
+        if self._changes is not None:
+            self._changes.record(self.RESOURCE, vm.id, op, vm)
 
+    @traced("VMRepository.save_many")
+    @timed(REPOSITORY_OP_SECONDS, "vm", "save_many")
+    def save_many(self, vms: Iterable[VMDTO]) -> int:
+        batch = {vm.id: vm for vm in vms}
+        if self._changes is not None:
+            store = self._store
+            ops = [(vm_id, CHANGE_UPDATED if vm_id in store else CHANGE_CREATED, vm) for vm_id, vm in batch.items()]
+            store.update(batch)
+            self._changes.record_many(self.RESOURCE, ops)
+        else:
+            self._store.update(batch)
+        return len(batch)
+
+    @traced("VMRepository.get")
+    @timed(REPOSITORY_OP_SECONDS, "vm", "get")
     def get(self, vm_id: str) -> VMDTO:
         vm = self._store.get(vm_id)
         if not vm:
             raise KeyError("VM not found")
         return vm
 
+    @traced("VMRepository.delete")
+    @timed(REPOSITORY_OP_SECONDS, "vm", "delete")
     def delete(self, vm_id: str) -> None:
         if vm_id not in self._store:
             raise KeyError("VM not found")
         del self._store[vm_id]
+        if self._changes is not None:
+            self._changes.record(self.RESOURCE, vm_id, CHANGE_DELETED, None)
 
+    @traced("VMRepository.list")
+    @timed(REPOSITORY_OP_SECONDS, "vm", "list")
     def list(self) -> List[VMDTO]:
         return list(self._store.values())
+
+    def iter(self) -> Iterator[VMDTO]:
+        # Snapshot de referencias (no de copias): permite mutar el store mientras
+        # el consumidor (p. ej. un export en streaming) sigue iterando.
+        for vm in tuple(self._store.values()):
+            yield vm
+
+
+class AsyncVMRepository(AsyncVMRepositoryPort):
+    """
+    Adaptador asíncrono sobre el mismo store en memoria que VMRepository, de modo
+    que los caminos sync y async ven el mismo inventario. Las operaciones sobre el
+    dict no bloquean, así que no se delegan a hilos.
+    """
+
+    # Cada cuántas VMs el iterador cede el event loop durante recorridos largos
+    _YIELD_EVERY = 1000
+
+    def __init__(self, repo: VMRepository):
+        self._repo = repo
+
+    async def save(self, vm: VMDTO) -> None:
+        self._repo.save(vm)
+
+    async def save_many(self, vms: Iterable[VMDTO]) -> int:
+        return self._repo.save_many(vms)
+
+    async def get(self, vm_id: str) -> VMDTO:
+        return self._repo.get(vm_id)
+
+    async def delete(self, vm_id: str) -> None:
+        self._repo.delete(vm_id)
+
+    async def list(self) -> List[VMDTO]:
+        return self._repo.list()
+
+    async def iter(self) -> AsyncIterator[VMDTO]:
+        for i, vm in enumerate(self._repo.iter(), 1):
+            yield vm
+            if i % self._YIELD_EVERY == 0:
+                await asyncio.sleep(0)
@@ -0,0 +1,260 @@
+"""
+Serialización JSON rápida para respuestas, auditoría y lectura de logs.
+
+Usa orjson si está instalado (pip install orjson) y json de la stdlib si no;
+ambos producen JSON compacto equivalente. VM_API_JSON=stdlib fuerza la stdlib
+(útil para comparar en benchmarks).
+
+FastJSONResponse serializa modelos Pydantic ya validados sin revalidarlos
+contra el response_model ni pasar por jsonable_encoder. Los modelos "planos"
+(campos de tipos JSON nativos, sin alias ni serializadores propios) se
+vuelcan directamente desde su __dict__; el resto con model_dump(mode="json").
+
+negotiated_response elige por Accept entre JSON y, si están instalados,
+MessagePack (pip install msgpack) y CBOR (pip install cbor2), con los mismos
+datos que el JSON: para clientes que sincronizan inventarios grandes.
+"""
+from __future__ import annotations
+import datetime
+import enum
+import functools
+import json
+import operator
+import os
+import typing
+from typing import Any, Callable, Dict, Optional, Type
+
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # dependencia opcional
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # dependencia opcional
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:  # dependencia opcional
+    cbor2 = None
+
+JSON_ENV_VAR = "VM_API_JSON"
+JSONDecodeError = json.JSONDecodeError  # orjson.JSONDecodeError hereda de esta
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+CBOR_MEDIA_TYPE = "application/cbor"
+
+_NATIVE_TYPES = (str, int, float, bool, type(None), dict, list, Any)
+_plain_models: Dict[Type[BaseModel], bool] = {}
+
+
+def _native_annotation(annotation: Any) -> bool:
+    """True si Pydantic serializaría el tipo igual que el valor Python tal cual."""
+    if annotation in _NATIVE_TYPES:
+        return True
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return _is_plain_model(annotation)
+        # Enums de str/int: orjson y json escriben el valor, como Pydantic en modo json
+        return issubclass(annotation, enum.Enum) and issubclass(annotation, (str, int))
+    origin = typing.get_origin(annotation)
+    if origin in (typing.Union, list, dict, typing.Literal):
+        if origin is typing.Literal:
+            return all(isinstance(arg, (str, int, bool)) or arg is None for arg in typing.get_args(annotation))
+        return all(_native_annotation(arg) for arg in typing.get_args(annotation))
+    return False
+
+
+def _is_plain_model(cls: Type[BaseModel]) -> bool:
+    plain = _plain_models.get(cls)
+    if plain is None:
+        # Provisional: cubre modelos recursivos mientras se calcula
+        _plain_models[cls] = False
+        decorators = cls.__pydantic_decorators__
+        plain = (
+            not decorators.field_serializers
+            and not decorators.model_serializers
+            and not cls.model_computed_fields
+            and all(
+                field.alias is None and field.serialization_alias is None and _native_annotation(field.annotation)
+                for field in cls.model_fields.values()
+            )
+        )
+        _plain_models[cls] = plain
+    return plain
+
+
+def _model_dump_json(obj: BaseModel) -> Any:
+    return obj.model_dump(mode="json")
+
+
+def _isoformat(obj: Any) -> str:
+    return obj.isoformat()
+
+
+_model_dict = operator.attrgetter("__dict__")
+_enum_value = operator.attrgetter("value")
+
+
+def _encoder_for(cls: type) -> Callable[[Any], Any]:
+    if issubclass(cls, BaseModel):
+        return _model_dict if _is_plain_model(cls) else _model_dump_json
+    if issubclass(cls, enum.Enum):
+        return _enum_value
+    if issubclass(cls, (datetime.datetime, datetime.date)):
+        return _isoformat
+    return str
+
+
+# Conversión por tipo exacto: isinstance contra BaseModel (metaclase ABC) cuesta
+# ~1 µs por objeto y el hook se llama una vez por modelo del listado
+_encoders: Dict[type, Callable[[Any], Any]] = {}
+
+
+def _default(obj: Any) -> Any:
+    encode = _encoders.get(type(obj))
+    if encode is None:
+        encode = _encoders[type(obj)] = _encoder_for(type(obj))
+    return encode(obj)
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def _orjson_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, default=_default, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+_dumps: Callable[[Any], bytes] = _stdlib_dumps
+_loads: Callable[[Any], Any] = json.loads
+_backend = "stdlib"
+
+
+def set_json_backend(name: Optional[str] = None) -> str:
+    """Elige "orjson" o "stdlib" (None: orjson si está disponible). Devuelve el activo."""
+    global _dumps, _loads, _backend
+    if name is None:
+        name = "orjson" if orjson is not None else "stdlib"
+    if name == "orjson":
+        if orjson is None:
+            raise ValueError("orjson no está instalado")
+        _dumps, _loads = _orjson_dumps, orjson.loads
+    elif name == "stdlib":
+        _dumps, _loads = _stdlib_dumps, json.loads
+    else:
+        raise ValueError(f"Backend JSON desconocido: {name} (orjson | stdlib)")
+    _backend = name
+    return name
+
+
+def json_backend() -> str:
+    return _backend
+
+
+def dumps(obj: Any) -> bytes:
+    """JSON compacto en UTF-8. Modelos, enums y fechas se convierten como en el modo json de Pydantic."""
+    return _dumps(obj)
+
+
+def loads(data: Any) -> Any:
+    """Acepta str o bytes (con orjson, bytes evita decodificar la línea)."""
+    return _loads(data)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse con dumps(): devolverla desde un endpoint hace que FastAPI no
+    revalide el contenido contra el response_model (que sigue documentando la
+    respuesta en OpenAPI). Solo para contenido ya validado (VMDTO del repositorio...).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return _dumps(content)
+
+
+def _msgpack_dumps(obj: Any) -> bytes:
+    # Los enums de str/int se empaquetan como su valor (msgpack acepta subclases)
+    return msgpack.packb(obj, default=_default)
+
+
+def _cbor_default(encoder: Any, obj: Any) -> None:
+    encoder.encode(_default(obj))
+
+
+def _cbor_dumps(obj: Any) -> bytes:
+    return cbor2.dumps(obj, default=_cbor_default)
+
+
+_BINARY_ENCODERS: Dict[str, Callable[[Any], bytes]] = {}
+# Alias habituales de cada tipo -> tipo con el que se responde
+_MEDIA_ALIASES: Dict[str, str] = {}
+if msgpack is not None:
+    _BINARY_ENCODERS[MSGPACK_MEDIA_TYPE] = _msgpack_dumps
+    for alias in (MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack"):
+        _MEDIA_ALIASES[alias] = MSGPACK_MEDIA_TYPE
+if cbor2 is not None:
+    _BINARY_ENCODERS[CBOR_MEDIA_TYPE] = _cbor_dumps
+    _MEDIA_ALIASES[CBOR_MEDIA_TYPE] = CBOR_MEDIA_TYPE
+
+# Documentación OpenAPI de los endpoints que negocian (responses=NEGOTIATED_RESPONSES)
+NEGOTIATED_RESPONSES: Dict[int, Dict[str, Any]] = {
+    200: {"content": {media_type: {} for media_type in (MSGPACK_MEDIA_TYPE, CBOR_MEDIA_TYPE)}}
+}
+
+
+def available_media_types() -> tuple:
+    return (JSON_MEDIA_TYPE, *_BINARY_ENCODERS)
+
+
+@functools.lru_cache(maxsize=256)
+def negotiate(accept: Optional[str]) -> str:
+    """
+    Tipo de respuesta según Accept: el de mayor q entre JSON y los binarios
+    disponibles (a igual q, el primero que nombra el cliente). JSON si no se
+    nombra ninguno de ellos (*/*, sin cabecera o solo tipos no instalados).
+    """
+    if not accept or not _BINARY_ENCODERS:
+        return JSON_MEDIA_TYPE
+    best, best_q = JSON_MEDIA_TYPE, 0.0
+    for part in accept.lower().split(","):
+        media_type, _, params = part.partition(";")
+        media_type = media_type.strip()
+        media_type = JSON_MEDIA_TYPE if media_type == JSON_MEDIA_TYPE else _MEDIA_ALIASES.get(media_type)
+        if media_type is None:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if q > best_q:
+            best, best_q = media_type, q
+    return best
+
+
+def negotiated_response(
+    accept: Optional[str], content: Any, status_code: int = 200, headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """
+    FastJSONResponse, o el mismo contenido en MessagePack/CBOR si el cliente
+    lo pide en Accept. Lleva Vary: Accept para que las cachés no mezclen formatos.
+    """
+    media_type = negotiate(accept)
+    headers = {**(headers or {}), "Vary": "Accept"}
+    if media_type == JSON_MEDIA_TYPE:
+        return FastJSONResponse(content, status_code=status_code, headers=headers)
+    return Response(_BINARY_ENCODERS[media_type](content), status_code=status_code, headers=headers, media_type=media_type)
+
+
+set_json_backend(None if os.environ.get(JSON_ENV_VAR, "").lower() != "stdlib" else "stdlib")
@@ -0,0 +1,289 @@
+"""
+Simulación de latencia y fallos de proveedor para pruebas de carga locales.
+
+Envuelve las factories concretas (vía CloudFactoryDecorator) e inyecta, por
+proveedor y tipo de recurso:
+- latencia muestreada de una distribución (fixed | normal | lognormal),
+- errores transitorios con una tasa dada (ProviderError → 503),
+- throttling estilo HTTP 429 con un token bucket (ProviderThrottledError),
+- timeout opcional (ProviderTimeoutError → 504).
+
+Se activa con la variable de entorno VM_API_SIMULATION (ruta a un JSON o el
+JSON en línea) o programáticamente con enable_simulation(SimulationConfig...).
+
+Formato:
+{
+  "seed": 42,
+  "providers": {
+    "*":   {"*": {"latency": {"distribution": "lognormal", "median_ms": 150, "sigma": 0.4}}},
+    "aws": {"virtual_machine": {"latency": {"distribution": "normal", "mean_ms": 800, "stddev_ms": 200},
+                                "error_rate": 0.02, "timeout_ms": 2000,
+                                "rate_limit": {"rate_per_s": 50, "burst": 100}}}
+  }
+}
+La resolución va de lo más específico a lo más genérico:
+(proveedor, recurso) → (proveedor, "*") → ("*", recurso) → ("*", "*").
+"""
+from __future__ import annotations
+import asyncio
+import json
+import math
+import os
+import random
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from app.domain.abstractions.factory import CloudAbstractFactory, CloudFactoryDecorator
+from app.domain.abstractions.products import VirtualMachine, Database, LoadBalancer, Storage
+from app.domain.errors import ProviderError, ProviderThrottledError, ProviderTimeoutError
+from app.domain.factory_provider import add_factory_decorator, remove_factory_decorator
+
+SIMULATION_ENV_VAR = "VM_API_SIMULATION"
+RESOURCE_TYPES = ("virtual_machine", "database", "load_balancer", "storage")
+WILDCARD = "*"
+
+
+class LatencyModel:
+    """Distribución de latencia en milisegundos; sample() devuelve segundos."""
+
+    DISTRIBUTIONS = ("fixed", "normal", "lognormal")
+
+    def __init__(
+        self,
+        distribution: str = "fixed",
+        ms: float = 0.0,
+        mean_ms: float = 0.0,
+        stddev_ms: float = 0.0,
+        median_ms: float = 0.0,
+        sigma: float = 0.0,
+        max_ms: Optional[float] = None,
+    ):
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f"Distribución de latencia no soportada: {distribution}. Válidas: {list(self.DISTRIBUTIONS)}")
+        self.distribution = distribution
+        self.ms = ms
+        self.mean_ms = mean_ms
+        self.stddev_ms = stddev_ms
+        self.median_ms = median_ms
+        self.sigma = sigma
+        self.max_ms = max_ms
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyModel":
+        return cls(**data)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.distribution == "fixed":
+            value = self.ms
+        elif self.distribution == "normal":
+            value = rng.gauss(self.mean_ms, self.stddev_ms)
+        else:
+            value = math.exp(rng.gauss(math.log(max(self.median_ms, 1e-6)), self.sigma))
+        value = max(value, 0.0)
+        if self.max_ms is not None:
+            value = min(value, self.max_ms)
+        return value / 1000.0
+
+
+class TokenBucket:
+    """Token bucket thread-safe: `rate_per_s` tokens por segundo con ráfaga máxima `burst`."""
+
+    def __init__(self, rate_per_s: float, burst: Optional[float] = None):
+        if rate_per_s <= 0:
+            raise ValueError("rate_per_s debe ser > 0")
+        self.rate = float(rate_per_s)
+        self.capacity = float(burst if burst is not None else rate_per_s)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self, tokens: float = 1.0) -> Tuple[bool, float]:
+        """Consume si hay tokens. Devuelve (ok, segundos hasta que habría tokens suficientes)."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True, 0.0
+            return False, (tokens - self._tokens) / self.rate
+
+
+class FaultProfile:
+    """Comportamiento simulado para un (proveedor, tipo de recurso)."""
+
+    def __init__(
+        self,
+        latency: Optional[LatencyModel] = None,
+        error_rate: float = 0.0,
+        timeout_ms: Optional[float] = None,
+        rate_limit: Optional[TokenBucket] = None,
+    ):
+        if not 0.0 <= error_rate <= 1.0:
+            raise ValueError("error_rate debe estar entre 0 y 1")
+        self.latency = latency or LatencyModel()
+        self.error_rate = error_rate
+        self.timeout_s = timeout_ms / 1000.0 if timeout_ms is not None else None
+        self.rate_limit = rate_limit
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FaultProfile":
+        rate_limit = data.get("rate_limit")
+        return cls(
+            latency=LatencyModel.from_dict(data["latency"]) if "latency" in data else None,
+            error_rate=data.get("error_rate", 0.0),
+            timeout_ms=data.get("timeout_ms"),
+            rate_limit=TokenBucket(**rate_limit) if rate_limit else None,
+        )
+
+
+class SimulationConfig:
+    """Perfiles por proveedor/recurso más el RNG compartido (reproducible con seed)."""
+
+    def __init__(self, profiles: Dict[Tuple[str, str], FaultProfile], seed: Optional[int] = None):
+        self._profiles = profiles
+        self.rng = random.Random(seed)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SimulationConfig":
+        profiles: Dict[Tuple[str, str], FaultProfile] = {}
+        for provider, resources in data.get("providers", {}).items():
+            for resource_type, profile in resources.items():
+                if resource_type != WILDCARD and resource_type not in RESOURCE_TYPES:
+                    raise ValueError(f"Tipo de recurso desconocido en simulación: {resource_type}")
+                # Cada clave tiene su propio bucket: los límites son por proveedor y recurso
+                profiles[(provider, resource_type)] = FaultProfile.from_dict(profile)
+        return cls(profiles, seed=data.get("seed"))
+
+    @classmethod
+    def from_env(cls) -> Optional["SimulationConfig"]:
+        raw = os.environ.get(SIMULATION_ENV_VAR)
+        if not raw:
+            return None
+        if os.path.exists(raw):
+            with open(raw, "r", encoding="utf-8") as fh:
+                return cls.from_dict(json.load(fh))
+        return cls.from_dict(json.loads(raw))
+
+    def profile_for(self, provider: str, resource_type: str) -> Optional[FaultProfile]:
+        for key in (
+            (provider, resource_type),
+            (provider, WILDCARD),
+            (WILDCARD, resource_type),
+            (WILDCARD, WILDCARD),
+        ):
+            profile = self._profiles.get(key)
+            if profile is not None:
+                return profile
+        return None
+
+
+class SimulatedCloudFactory(CloudFactoryDecorator):
+    """Factory que añade latencia/errores/throttling simulados antes de delegar."""
+
+    def __init__(self, inner: CloudAbstractFactory, provider: str, config: SimulationConfig):
+        super().__init__(inner)
+        self._provider = provider
+        self._config = config
+
+    def _plan(self, resource_type: str) -> Tuple[float, Optional[ProviderError]]:
+        """Decide (latencia a esperar, error a lanzar tras la espera) para una llamada."""
+        profile = self._config.profile_for(self._provider, resource_type)
+        if profile is None:
+            return 0.0, None
+        if profile.rate_limit is not None:
+            ok, retry_after = profile.rate_limit.try_acquire()
+            if not ok:
+                # El throttling responde de inmediato, como un 429 real
+                raise ProviderThrottledError(
+                    f"Rate limit excedido en {self._provider}/{resource_type}",
+                    provider=self._provider,
+                    resource_type=resource_type,
+                    retry_after=retry_after,
+                )
+        rng = self._config.rng
+        delay = profile.latency.sample(rng)
+        if profile.timeout_s is not None and delay > profile.timeout_s:
+            return profile.timeout_s, ProviderTimeoutError(
+                f"Timeout de {self._provider}/{resource_type} tras {profile.timeout_s * 1000:.0f} ms",
+                provider=self._provider,
+                resource_type=resource_type,
+            )
+        if profile.error_rate and rng.random() < profile.error_rate:
+            return delay, ProviderError(
+                f"Error transitorio simulado en {self._provider}/{resource_type}",
+                provider=self._provider,
+                resource_type=resource_type,
+            )
+        return delay, None
+
+    def _simulate(self, resource_type: str) -> None:
+        delay, error = self._plan(resource_type)
+        if delay:
+            time.sleep(delay)
+        if error is not None:
+            raise error
+
+    async def _asimulate(self, resource_type: str) -> None:
+        delay, error = self._plan(resource_type)
+        if delay:
+            await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+
+    def create_virtual_machine(self, name: str, vm_config: Dict[str, Any]) -> VirtualMachine:
+        self._simulate("virtual_machine")
+        return super().create_virtual_machine(name, vm_config)
+
+    def create_database(self, name: str, db_config: Dict[str, Any]) -> Database:
+        self._simulate("database")
+        return super().create_database(name, db_config)
+
+    def create_load_balancer(self, name: str, lb_config: Dict[str, Any]) -> LoadBalancer:
+        self._simulate("load_balancer")
+        return super().create_load_balancer(name, lb_config)
+
+    def create_storage(self, name: str, storage_config: Dict[str, Any]) -> Storage:
+        self._simulate("storage")
+        return super().create_storage(name, storage_config)
+
+    async def acreate_virtual_machine(self, name: str, vm_config: Dict[str, Any]) -> VirtualMachine:
+        await self._asimulate("virtual_machine")
+        return await super().acreate_virtual_machine(name, vm_config)
+
+    async def acreate_database(self, name: str, db_config: Dict[str, Any]) -> Database:
+        await self._asimulate("database")
+        return await super().acreate_database(name, db_config)
+
+    async def acreate_load_balancer(self, name: str, lb_config: Dict[str, Any]) -> LoadBalancer:
+        await self._asimulate("load_balancer")
+        return await super().acreate_load_balancer(name, lb_config)
+
+    async def acreate_storage(self, name: str, storage_config: Dict[str, Any]) -> Storage:
+        await self._asimulate("storage")
+        return await super().acreate_storage(name, storage_config)
+
+
+_DECORATOR_NAME = "simulation"
+
+
+def enable_simulation(config: SimulationConfig) -> None:
+    """Envuelve todas las factories creadas a partir de ahora con SimulatedCloudFactory."""
+    add_factory_decorator(
+        _DECORATOR_NAME,
+        lambda provider, factory: SimulatedCloudFactory(factory, provider.value, config),
+    )
+    print("🧪 Simulación de proveedores activada")
+
+
+def disable_simulation() -> None:
+    remove_factory_decorator(_DECORATOR_NAME)
+
+
+def enable_simulation_from_env() -> bool:
+    config = SimulationConfig.from_env()
+    if config is None:
+        return False
+    enable_simulation(config)
+    return True
@@ -0,0 +1,316 @@
+"""
+Trazas ligeras en proceso: un span por petición y spans hijos en servicios,
+factories, repositorios y auditoría.
+
+El span activo viaja en un ContextVar, así que los hijos se enganchan solos
+al padre correcto tanto en corrutinas (cada tarea de asyncio copia el
+contexto al crearse) como en el threadpool de los endpoints sync (anyio
+también copia el contexto). Fuera de una traza muestreada span() devuelve un
+span nulo compartido: el coste es una lectura del ContextVar.
+
+Las trazas terminadas se guardan en un ring buffer en memoria (GET
+/debug/traces) y, opcionalmente, se añaden como JSON por línea a un fichero.
+
+Se configura con VM_API_TRACING (ruta a un JSON o el JSON en línea):
+{"sample_rate": 0.1, "buffer_size": 500, "max_spans": 1000, "export_path": "logs/traces.jsonl"}
+Sin la variable el trazado está desactivado (ni middleware activo ni parches
+en FastAPI); con la variable y sin "sample_rate" se muestrea el 1 % y solo se
+guarda en memoria. "sample_rate": 0 también lo desactiva.
+"""
+from __future__ import annotations
+import asyncio
+import functools
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+TRACING_ENV_VAR = "VM_API_TRACING"
+DEFAULT_SAMPLE_RATE = 0.01
+DEFAULT_BUFFER_SIZE = 256
+DEFAULT_MAX_SPANS = 1000
+
+_current: ContextVar[Optional["Span"]] = ContextVar("vm_api_current_span", default=None)
+
+
+class Span:
+    """Un tramo de la traza. Se usa como context manager (with span(...))."""
+
+    __slots__ = ("trace", "span_id", "parent_id", "name", "attrs", "start", "end", "error", "_token")
+
+    def __init__(self, trace: "Trace", span_id: int, parent_id: Optional[int], name: str, attrs: Dict[str, Any]):
+        self.trace = trace
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.name = name
+        self.attrs = attrs
+        self.start = 0.0
+        self.end = 0.0
+        self.error: Optional[str] = None
+
+    def set(self, key: str, value: Any) -> None:
+        self.attrs[key] = value
+
+    def __enter__(self) -> "Span":
+        self._token = _current.set(self)
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.end = perf_counter()
+        if exc_type is not None:
+            self.error = exc_type.__name__
+        _current.reset(self._token)
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end - self.start) * 1000.0
+
+
+class _NoopSpan:
+    """Span nulo: lo que devuelve span() fuera de una traza muestreada."""
+
+    __slots__ = ()
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+class Trace:
+    """Spans de una petición en lista plana (parent_id enlaza el árbol)."""
+
+    __slots__ = ("trace_id", "started_at", "spans", "max_spans", "dropped_spans", "_next_id")
+
+    def __init__(self, trace_id: str, max_spans: int):
+        self.trace_id = trace_id
+        self.started_at = time.time()
+        self.spans: List[Span] = []
+        self.max_spans = max_spans
+        self.dropped_spans = 0
+        self._next_id = 0
+
+    def new_span(self, parent: Optional[Span], name: str, attrs: Dict[str, Any]):
+        if len(self.spans) >= self.max_spans:
+            # Operaciones masivas (fleet, export): se cuenta lo descartado
+            self.dropped_spans += 1
+            return _NOOP
+        self._next_id += 1
+        span = Span(self, self._next_id, parent.span_id if parent is not None else None, name, attrs)
+        # list.append es atómico con el GIL: hilos del pool y tareas pueden añadir a la vez
+        self.spans.append(span)
+        return span
+
+    @property
+    def root(self) -> Span:
+        return self.spans[0]
+
+    def summary(self) -> Dict[str, Any]:
+        root = self.root
+        children = [s for s in self.spans if s.parent_id == root.span_id]
+        return {
+            "trace_id": self.trace_id,
+            "name": root.name,
+            "started_at": self.started_at,
+            "duration_ms": round(root.duration_ms, 3),
+            "status": root.attrs.get("status"),
+            "error": root.error,
+            "span_count": len(self.spans),
+            "dropped_spans": self.dropped_spans,
+            # Primer nivel bajo la petición: dónde se fue el tiempo de un vistazo
+            "breakdown": [{"name": s.name, "duration_ms": round(s.duration_ms, 3)} for s in children],
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        origin = self.root.start
+        nodes: Dict[int, Dict[str, Any]] = {}
+        for s in self.spans:
+            nodes[s.span_id] = {
+                "span_id": s.span_id,
+                "name": s.name,
+                "offset_ms": round((s.start - origin) * 1000.0, 3),
+                "duration_ms": round(s.duration_ms, 3),
+                "attrs": s.attrs,
+                "error": s.error,
+                "children": [],
+            }
+        for s in self.spans:
+            if s.parent_id is not None and s.parent_id in nodes:
+                nodes[s.parent_id]["children"].append(nodes[s.span_id])
+        # Tiempo propio: lo que no cubren los hijos (serialización, espera del event loop...)
+        for node in nodes.values():
+            covered = sum(child["duration_ms"] for child in node["children"])
+            node["self_ms"] = round(max(node["duration_ms"] - covered, 0.0), 3)
+        return {**self.summary(), "spans": nodes[self.root.span_id]}
+
+
+class Tracer:
+    """Decide el muestreo, y guarda y exporta las trazas terminadas."""
+
+    def __init__(
+        self,
+        sample_rate: float = DEFAULT_SAMPLE_RATE,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        max_spans: int = DEFAULT_MAX_SPANS,
+        export_path: Optional[str] = None,
+        seed: Optional[int] = None,
+    ):
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate debe estar entre 0 y 1")
+        if buffer_size < 1 or max_spans < 1:
+            raise ValueError("buffer_size y max_spans deben ser >= 1")
+        self.sample_rate = sample_rate
+        self.max_spans = max_spans
+        self.export_path = export_path
+        self._buffer: Deque[Trace] = deque(maxlen=buffer_size)
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.started = 0
+        self.sampled = 0
+        self.exported = 0
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Tracer":
+        return cls(**data)
+
+    @classmethod
+    def from_env(cls) -> Optional["Tracer"]:
+        """Tracer de VM_API_TRACING, o None si la variable no está definida."""
+        raw = os.environ.get(TRACING_ENV_VAR)
+        if not raw:
+            return None
+        if os.path.exists(raw):
+            with open(raw, "r", encoding="utf-8") as fh:
+                return cls.from_dict(json.load(fh))
+        return cls.from_dict(json.loads(raw))
+
+    @property
+    def buffer_size(self) -> int:
+        return self._buffer.maxlen
+
+    def start_trace(self, name: str, **attrs: Any) -> Optional[Span]:
+        """Span raíz de una traza nueva, o None si no se muestrea."""
+        self.started += 1
+        if self.sample_rate < 1.0 and self._rng.random() >= self.sample_rate:
+            return None
+        self.sampled += 1
+        trace = Trace(os.urandom(8).hex(), self.max_spans)
+        return trace.new_span(None, name, attrs)
+
+    def finish(self, trace: Trace) -> None:
+        with self._lock:
+            self._buffer.append(trace)
+            if self.export_path:
+                try:
+                    with open(self.export_path, "a", encoding="utf-8") as fh:
+                        fh.write(json.dumps(trace.to_dict(), default=str) + "\n")
+                    self.exported += 1
+                except OSError as e:
+                    print(f"❌ Error exportando traza {trace.trace_id}: {e}")
+
+    def recent(self, limit: int = 20, min_ms: float = 0.0, name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Las trazas más lentas del buffer (las más recientes primero a igual duración)."""
+        with self._lock:
+            traces = list(self._buffer)
+        picked = [
+            t for t in reversed(traces)
+            if t.root.duration_ms >= min_ms and (name is None or name in t.root.name)
+        ]
+        picked.sort(key=lambda t: t.root.duration_ms, reverse=True)
+        return [t.summary() for t in picked[:limit]]
+
+    def get(self, trace_id: str) -> Optional[Trace]:
+        with self._lock:
+            for trace in self._buffer:
+                if trace.trace_id == trace_id:
+                    return trace
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "sample_rate": self.sample_rate,
+            "buffer_size": self.buffer_size,
+            "buffered": len(self._buffer),
+            "max_spans": self.max_spans,
+            "export_path": self.export_path,
+            "started": self.started,
+            "sampled": self.sampled,
+            "exported": self.exported,
+        }
+
+
+def span(name: str, **attrs: Any):
+    """Span hijo del activo; sin traza activa devuelve el span nulo."""
+    parent = _current.get()
+    if parent is None:
+        return _NOOP
+    return parent.trace.new_span(parent, name, attrs)
+
+
+def current_span() -> Optional[Span]:
+    return _current.get()
+
+
+def traced(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorador: un span por llamada (funciones sync o corrutinas)."""
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def awrapper(*args: Any, **kwargs: Any) -> Any:
+                parent = _current.get()
+                if parent is None:
+                    return await fn(*args, **kwargs)
+                with parent.trace.new_span(parent, name, {}):
+                    return await fn(*args, **kwargs)
+            return awrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            parent = _current.get()
+            if parent is None:
+                return fn(*args, **kwargs)
+            with parent.trace.new_span(parent, name, {}):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Tracer activo (None si el trazado está desactivado)."""
+    return _tracer
+
+
+def enable_tracing(tracer: Tracer) -> None:
+    global _tracer
+    _tracer = tracer
+    print(f"🔎 Trazado activado (sample_rate={tracer.sample_rate}, buffer={tracer.buffer_size})")
+
+
+def disable_tracing() -> None:
+    global _tracer
+    _tracer = None
+
+
+def enable_tracing_from_env() -> bool:
+    tracer = Tracer.from_env()
+    if tracer is None or tracer.sample_rate == 0:
+        disable_tracing()
+        return False
+    enable_tracing(tracer)
+    return True
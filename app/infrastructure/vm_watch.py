@@ -0,0 +1,354 @@
+"""
+Watch de VMs: pub/sub en proceso de las altas, cambios, acciones y bajas que
+hacen VMService y AsyncVMService, para que los clientes esperen a un estado
+(p. ej. `running`) sin sondear GET /vm/{id}.
+
+Cada evento lleva una secuencia propia y creciente, y una foto de la VM en ese
+momento (los VMDTO se mutan en sitio). Los últimos `history_size` eventos se
+guardan en un buffer circular para reanudar desde una secuencia (`since` o
+Last-Event-ID). Cada suscriptor tiene una cola acotada de `queue_size`: si un
+consumidor lento la llena, los publicadores no esperan; se marca como
+retrasado y al vaciarla se pone al día desde el histórico (WatchExpiredError
+si ya no llega tan atrás).
+
+Se configura con VM_API_WATCH (ruta a un JSON o el JSON en línea):
+
+    {"history_size": 10000, "queue_size": 1000}
+"""
+from __future__ import annotations
+import asyncio
+import json
+import os
+import threading
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from app.domain.errors import WatchExpiredError
+from app.infrastructure.metrics import get_metrics_registry
+from app.infrastructure.serialization import dumps
+
+WATCH_ENV_VAR = "VM_API_WATCH"
+DEFAULT_HISTORY_SIZE = 10_000
+DEFAULT_QUEUE_SIZE = 1000
+
+WATCH_CREATED = "created"
+WATCH_UPDATED = "updated"
+WATCH_DELETED = "deleted"
+
+# Claves del selector que no están en specs
+_TOP_LEVEL_KEYS = ("id", "name", "provider", "status")
+
+_metrics = get_metrics_registry()
+WATCH_EVENTS = _metrics.counter("vm_api_watch_events_total", "Eventos publicados en el watch de VMs", ("type",))
+WATCH_OVERFLOWS = _metrics.counter(
+    "vm_api_watch_overflows_total", "Suscriptores del watch que llenaron su cola y se pusieron al día desde el histórico"
+)
+
+
+class WatchEvent:
+    """Un evento del watch; `vm` es la foto JSON de la VM al publicarlo."""
+
+    __slots__ = ("seq", "type", "vm_id", "action", "previous_status", "vm", "_encoded")
+
+    def __init__(
+        self,
+        seq: int,
+        type: str,
+        vm_id: str,
+        vm: Dict[str, Any],
+        previous_status: Optional[str] = None,
+        action: Optional[str] = None,
+    ):
+        self.seq = seq
+        self.type = type
+        self.vm_id = vm_id
+        self.vm = vm
+        self.previous_status = previous_status
+        self.action = action
+        self._encoded: Optional[bytes] = None
+
+    @property
+    def status(self) -> str:
+        return self.vm["status"]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "seq": self.seq,
+            "type": self.type,
+            "id": self.vm_id,
+            "action": self.action,
+            "previous_status": self.previous_status,
+            "status": self.status,
+            "vm": self.vm,
+        }
+
+    def encoded(self) -> bytes:
+        """JSON del evento, serializado una sola vez para todos los suscriptores."""
+        if self._encoded is None:
+            self._encoded = dumps(self.to_dict())
+        return self._encoded
+
+
+class WatchSelector:
+    """
+    Filtro de un watch: una VM (`vm_id`) y/o pares clave=valor separados por
+    coma sobre id, name, provider, status o cualquier clave de specs
+    (`provider=aws,region=us-east-1`). Vacío = toda la flota.
+    """
+
+    __slots__ = ("vm_id", "terms")
+
+    def __init__(self, vm_id: Optional[str] = None, terms: Optional[Dict[str, str]] = None):
+        self.vm_id = vm_id
+        self.terms: Tuple[Tuple[str, str], ...] = tuple((terms or {}).items())
+
+    @classmethod
+    def parse(cls, selector: Optional[str] = None, vm_id: Optional[str] = None) -> "WatchSelector":
+        terms: Dict[str, str] = {}
+        for part in (selector or "").split(","):
+            if not part.strip():
+                continue
+            key, sep, value = part.partition("=")
+            key, value = key.strip(), value.strip()
+            if not sep or not key or not value:
+                raise ValueError(f"Término de selector inválido: '{part.strip()}' (se espera clave=valor)")
+            terms[key] = value
+        return cls(vm_id=vm_id, terms=terms)
+
+    def matches(self, event: WatchEvent) -> bool:
+        if self.vm_id is not None and event.vm_id != self.vm_id:
+            return False
+        vm = event.vm
+        for key, value in self.terms:
+            actual = vm.get(key) if key in _TOP_LEVEL_KEYS else (vm.get("specs") or {}).get(key)
+            if actual is None or str(actual) != value:
+                return False
+        return True
+
+
+class _Subscription:
+    __slots__ = ("selector", "queue", "loop", "behind")
+
+    def __init__(self, selector: WatchSelector, queue_size: int, loop: asyncio.AbstractEventLoop):
+        self.selector = selector
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.loop = loop
+        # True: hay eventos que no pasaron por la cola y deben leerse del histórico
+        self.behind = False
+
+    def put(self, event: WatchEvent) -> None:
+        # Siempre en el hilo del event loop del suscriptor
+        if self.behind:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.behind = True
+            WATCH_OVERFLOWS.inc()
+
+
+class VMWatchHub:
+    def __init__(self, history_size: int = DEFAULT_HISTORY_SIZE, queue_size: int = DEFAULT_QUEUE_SIZE):
+        if history_size <= 0 or queue_size <= 0:
+            raise ValueError("history_size y queue_size deben ser > 0")
+        self.history_size = history_size
+        self.queue_size = queue_size
+        # Buffer circular indexado por seq % history_size (como el ChangeLog)
+        self._ring: List[Optional[WatchEvent]] = [None] * history_size
+        self._seq = 0
+        # Suscriptores de una VM concreta (por id) y del resto (selector o flota):
+        # con miles de clientes esperando cada uno a su VM, publish solo mira los
+        # de esa VM. Tuplas copiadas al (des)suscribir: publish las recorre sin copiar
+        self._by_vm: Dict[str, Tuple[_Subscription, ...]] = {}
+        self._fleet: Tuple[_Subscription, ...] = ()
+        # Se publica desde el event loop y desde el threadpool de los endpoints sync
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "VMWatchHub":
+        return cls(**data)
+
+    @classmethod
+    def from_env(cls) -> "VMWatchHub":
+        raw = os.environ.get(WATCH_ENV_VAR)
+        if not raw:
+            return cls()
+        if os.path.exists(raw):
+            with open(raw, "r", encoding="utf-8") as fh:
+                return cls.from_dict(json.load(fh))
+        return cls.from_dict(json.loads(raw))
+
+    @property
+    def current_seq(self) -> int:
+        return self._seq
+
+    @property
+    def oldest_seq(self) -> int:
+        """Menor secuencia desde la que aún se puede reanudar sin perder eventos."""
+        return max(0, self._seq - self.history_size)
+
+    def publish(
+        self,
+        type: str,
+        vm: Any,
+        previous_status: Optional[str] = None,
+        action: Optional[str] = None,
+    ) -> int:
+        """Publica un evento de la VM (VMDTO) y devuelve su secuencia. Nunca espera a los suscriptores."""
+        snapshot = vm.model_dump(mode="json")
+        # None desde el threadpool (sin excepción, a diferencia de get_running_loop)
+        current_loop = asyncio._get_running_loop()
+        with self._lock:
+            seq = self._seq = self._seq + 1
+            event = WatchEvent(seq, type, vm.id, snapshot, previous_status, action)
+            self._ring[seq % self.history_size] = event
+            # Se entrega con el lock tomado: cada suscriptor recibe los eventos en orden de seq
+            for sub in self._fleet + self._by_vm.get(event.vm_id, ()):
+                if not sub.selector.matches(event):
+                    continue
+                if sub.loop is current_loop:
+                    sub.put(event)
+                else:
+                    try:
+                        sub.loop.call_soon_threadsafe(sub.put, event)
+                    except RuntimeError:
+                        pass  # loop cerrado: el suscriptor ya no existe
+        WATCH_EVENTS.inc((type,))
+        return seq
+
+    def check_since(self, since: int) -> None:
+        """WatchExpiredError si ya no se puede reanudar desde `since`."""
+        oldest = self.oldest_seq
+        if since < oldest:
+            raise WatchExpiredError(since, oldest, self._seq)
+
+    def events_since(self, since: int, selector: WatchSelector, limit: int = 1000) -> Tuple[List[WatchEvent], int]:
+        """
+        Eventos del histórico con seq > since que cumplen el selector (como
+        máximo `limit`). Devuelve (eventos, secuencia hasta la que se ha leído).
+        """
+        with self._lock:
+            current = self._seq
+            if since >= current:
+                return [], current
+            oldest = max(0, current - self.history_size)
+            if since < oldest:
+                raise WatchExpiredError(since, oldest, current)
+            events: List[WatchEvent] = []
+            seq = since
+            while seq < current and len(events) < limit:
+                seq += 1
+                event = self._ring[seq % self.history_size]
+                if selector.matches(event):
+                    events.append(event)
+            return events, seq
+
+    def _subscribe(self, selector: WatchSelector) -> _Subscription:
+        sub = _Subscription(selector, self.queue_size, asyncio.get_running_loop())
+        vm_id = selector.vm_id
+        with self._lock:
+            if vm_id is None:
+                self._fleet = self._fleet + (sub,)
+            else:
+                self._by_vm[vm_id] = self._by_vm.get(vm_id, ()) + (sub,)
+        return sub
+
+    def _unsubscribe(self, sub: _Subscription) -> None:
+        vm_id = sub.selector.vm_id
+        with self._lock:
+            if vm_id is None:
+                self._fleet = tuple(s for s in self._fleet if s is not sub)
+                return
+            remaining = tuple(s for s in self._by_vm.get(vm_id, ()) if s is not sub)
+            if remaining:
+                self._by_vm[vm_id] = remaining
+            else:
+                self._by_vm.pop(vm_id, None)
+
+    async def watch(
+        self,
+        selector: WatchSelector,
+        since: Optional[int] = None,
+        heartbeat_s: float = 15.0,
+    ) -> AsyncIterator[Optional[WatchEvent]]:
+        """
+        Emite los eventos que cumplen el selector: primero los del histórico
+        posteriores a `since` (si se indica) y después los nuevos según llegan.
+        Produce None cuando pasa `heartbeat_s` sin eventos (keep-alive).
+        """
+        # Suscribirse antes de leer el histórico: lo publicado entre medias llega
+        # por la cola y los duplicados se descartan por seq
+        sub = self._subscribe(selector)
+        try:
+            last = self._seq if since is None else since
+            sub.behind = since is not None
+            while True:
+                if sub.behind and sub.queue.empty():
+                    # Sin await entre reiniciar la marca y leer el histórico: ningún put se pierde
+                    sub.behind = False
+                    while True:
+                        events, read_to = self.events_since(last, selector)
+                        for event in events:
+                            last = event.seq
+                            yield event
+                        if read_to >= self._seq:
+                            break
+                        last = max(last, read_to)
+                    continue
+                try:
+                    event = await asyncio.wait_for(sub.queue.get(), heartbeat_s)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                if event.seq > last:
+                    last = event.seq
+                    yield event
+        finally:
+            self._unsubscribe(sub)
+
+    async def poll(
+        self,
+        selector: WatchSelector,
+        since: int,
+        timeout: float,
+        limit: int = 1000,
+    ) -> Tuple[List[WatchEvent], int]:
+        """
+        Long-poll: eventos posteriores a `since`; si no hay ninguno espera hasta
+        `timeout` al siguiente. Devuelve (eventos, siguiente since).
+        """
+        sub = self._subscribe(selector)
+        try:
+            events, next_since = self.events_since(since, selector, limit)
+            if events or timeout <= 0:
+                return events, next_since
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return [], next_since
+                try:
+                    event = await asyncio.wait_for(sub.queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    return [], next_since
+                # La cola puede traer lo publicado entre suscribirse y leer el histórico
+                if event.seq > next_since:
+                    break
+            # El primero y lo que haya llegado con él, ya filtrado por la cola (sin
+            # recorrer el histórico); se continúa desde el último devuelto
+            events = [event]
+            while len(events) < limit and not sub.queue.empty():
+                events.append(sub.queue.get_nowait())
+            return events, events[-1].seq
+        finally:
+            self._unsubscribe(sub)
+
+    def stats(self) -> Dict[str, int]:
+        current = self._seq
+        return {
+            "current_seq": current,
+            "oldest_seq": max(0, current - self.history_size),
+            "history_size": self.history_size,
+            "queue_size": self.queue_size,
+            "subscribers": len(self._fleet) + sum(len(subs) for subs in self._by_vm.values()),
+        }
@@ -1,13 +1,53 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.api.vm_controller import router as vm_router
 from app.api.logs_controller import router as logs_router
 from app.api.abstract_factory_controller import router as abstract_factory_router
+from app.api.jobs_controller import router as jobs_router
+from app.api.debug_controller import router as debug_router
+from app.api.cost_controller import router as cost_router
+from app.api.changes_controller import router as changes_router
+from app.api.metrics_controller import router as metrics_router, RequestMetricsMiddleware
+from app.api.tracing import TracingMiddleware, instrument_fastapi
+from app.api.compression import CompressionMiddleware
+from app.core.container import get_job_service, get_lifecycle_service
+from app.infrastructure.tracing import get_tracer
+from app.infrastructure.logger import start_async_audit_sink, stop_async_audit_sink
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Sink de auditoría asíncrono: las peticiones async encolan y una tarea escribe por lotes
+    await start_async_audit_sink()
+    # Jobs: restaura el estado persistido y re-encola lo pendiente
+    job_service = await get_job_service()
+    await job_service.start()
+    # Ciclo de vida: desde aquí las acciones responden 202 y terminan en segundo plano
+    lifecycle_service = await get_lifecycle_service()
+    await lifecycle_service.start()
+    try:
+        yield
+    finally:
+        await lifecycle_service.stop()
+        await job_service.stop()
+        await stop_async_audit_sink()
+
 
 app = FastAPI(
     title="VM Abstract Factory API", 
     version="2.0.0",
-    description="API que implementa el patrón Abstract Factory para gestión completa de infraestructura cloud"
+    description="API que implementa el patrón Abstract Factory para gestión completa de infraestructura cloud",
+    lifespan=lifespan,
 )
+# gzip/brotli según Accept-Encoding (VM_API_COMPRESSION); la latencia medida incluye comprimir
+app.add_middleware(CompressionMiddleware)
+# Latencia por ruta y código de estado para /metrics
+app.add_middleware(RequestMetricsMiddleware)
+# Span raíz por petición (el último middleware añadido queda por fuera)
+app.add_middleware(TracingMiddleware)
+# Los spans de FastAPI parchean fastapi.routing: solo con el trazado activo (VM_API_TRACING)
+if get_tracer() is not None:
+    instrument_fastapi()
 
 # Rutas principales - Abstract Factory Pattern
 app.include_router(abstract_factory_router, prefix="/cloud", tags=["abstract-factory"])
@@ -15,7 +55,12 @@ app.include_router(abstract_factory_router, prefix="/cloud", tags=["abstract-fac
 # Rutas de VM (ahora usando Abstract Factory internamente)
 app.include_router(vm_router, prefix="/vm", tags=["virtual-machines"])
 app.include_router(logs_router, prefix="/api", tags=["logs"])
+app.include_router(jobs_router, prefix="/jobs", tags=["jobs"])
+app.include_router(debug_router, prefix="/debug", tags=["debug"])
+app.include_router(cost_router, prefix="/cost", tags=["cost"])
+app.include_router(changes_router, tags=["changes"])
+app.include_router(metrics_router, tags=["metrics"])
 
 @app.get("/health")
-def health():
-    return {"status": "ok", "version": "2.0.0", "pattern": "Abstract Factory"}
\ No newline at end of file
+async def health():
+    return {"status": "ok", "version": "2.0.0", "pattern": "Abstract Factory"}
@@ -0,0 +1,4 @@
+"""
+Benchmarks offline de la API (no forman parte del paquete `app`).
+Se ejecutan como módulos: `python -m benchmarks.<nombre> --help`.
+"""
@@ -0,0 +1,109 @@
+"""
+Cliente ASGI mínimo en proceso para benchmarks.
+Evita depender de httpx/uvicorn: habla directamente el protocolo ASGI con la app,
+midiendo tiempo al primer byte (TTFB) y, opcionalmente, descartando el cuerpo
+para no contaminar las mediciones de memoria.
+"""
+from __future__ import annotations
+import asyncio
+import json
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class ASGIResponse:
+    def __init__(self):
+        self.status: int = 0
+        self.headers: List[Tuple[bytes, bytes]] = []
+        self.body = bytearray()
+        self.body_bytes: int = 0
+        self.chunks: int = 0
+        self.ttfb_s: Optional[float] = None
+        self.total_s: float = 0.0
+
+    def json(self) -> Any:
+        return json.loads(bytes(self.body))
+
+    def header(self, name: str) -> Optional[str]:
+        key = name.lower().encode("latin-1")
+        for k, v in self.headers:
+            if k.lower() == key:
+                return v.decode("latin-1")
+        return None
+
+
+class ASGIClient:
+    def __init__(self, app):
+        self.app = app
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        query: str = "",
+        json_body: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        keep_body: bool = True,
+    ) -> ASGIResponse:
+        body = json.dumps(json_body).encode("utf-8") if json_body is not None else b""
+        raw_headers = [(b"host", b"bench.local")]
+        if json_body is not None:
+            raw_headers.append((b"content-type", b"application/json"))
+            raw_headers.append((b"content-length", str(len(body)).encode()))
+        for k, v in (headers or {}).items():
+            raw_headers.append((k.lower().encode("latin-1"), v.encode("latin-1")))
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method.upper(),
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode("utf-8"),
+            "query_string": query.encode("utf-8"),
+            "root_path": "",
+            "headers": raw_headers,
+            "client": ("127.0.0.1", 50000),
+            "server": ("bench.local", 80),
+        }
+
+        response = ASGIResponse()
+        request_sent = False
+        done = asyncio.Event()
+
+        async def receive() -> Dict[str, Any]:
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            await done.wait()
+            return {"type": "http.disconnect"}
+
+        start = time.perf_counter()
+
+        async def send(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                response.status = message["status"]
+                response.headers = list(message.get("headers", []))
+            elif message["type"] == "http.response.body":
+                chunk = message.get("body", b"")
+                if chunk:
+                    if response.ttfb_s is None:
+                        response.ttfb_s = time.perf_counter() - start
+                    response.chunks += 1
+                    response.body_bytes += len(chunk)
+                    if keep_body:
+                        response.body.extend(chunk)
+                if not message.get("more_body", False):
+                    done.set()
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            done.set()
+        response.total_s = time.perf_counter() - start
+        if response.ttfb_s is None:
+            response.ttfb_s = response.total_s
+        return response
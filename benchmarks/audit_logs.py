@@ -0,0 +1,113 @@
+"""
+Logs de auditoría sintéticos para medir LogService.
+
+Genera líneas con el mismo formato que escribe audit_log (una línea JSON por
+evento) con una semilla fija: mismo --lines y --seed, mismo fichero byte a
+byte. Mezcla acciones, proveedores y actores como un inventario real y ~5 %
+de operaciones fallidas.
+
+    python -m benchmarks.audit_logs --lines 1000000   # data/bench/audit-1000000-s42.log
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+DEFAULT_SEED = 42
+DEFAULT_DIR = os.path.join("data", "bench")
+
+_ACTIONS = (
+    ("create", 30), ("create(builder)", 25), ("create_infrastructure", 10), ("update", 10),
+    ("start", 8), ("stop", 8), ("restart", 4), ("delete", 5),
+)
+_PROVIDERS = ("aws", "azure", "gcp", "onpremise", "oracle")
+_VM_PREFIXES = {"aws": "i-", "azure": "vm-", "gcp": "gcp-vm-", "onpremise": "onprem-vm-", "oracle": "oci-vm-"}
+_REGIONS = {"aws": "us-east-1", "azure": "eastus", "gcp": "us-central1", "onpremise": "datacenter-1", "oracle": "us-ashburn-1"}
+_ACTORS = ("system",) * 6 + tuple(f"user{i}" for i in range(20))
+_TIERS = ("small", "medium", "large", "xlarge")
+_START = datetime(2025, 1, 1)
+
+
+def default_path(lines: int, seed: int = DEFAULT_SEED, directory: str = DEFAULT_DIR) -> str:
+    return os.path.join(directory, f"audit-{lines}-s{seed}.log")
+
+
+def generate(path: str, lines: int, seed: int = DEFAULT_SEED, chunk: int = 10_000) -> int:
+    """Escribe `lines` líneas en `path` (lo sobrescribe). Devuelve los bytes escritos."""
+    rng = random.Random(seed)
+    actions = [a for a, _ in _ACTIONS]
+    weights = [w for _, w in _ACTIONS]
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp = path + ".tmp"
+    written = 0
+    with open(tmp, "w", encoding="utf-8") as fh:
+        buffer: List[str] = []
+        for i in range(lines):
+            action = rng.choices(actions, weights)[0]
+            provider = rng.choice(_PROVIDERS)
+            success = rng.random() >= 0.05
+            vm_id = "multiple" if action == "create_infrastructure" else f"{_VM_PREFIXES[provider]}{rng.getrandbits(32):08x}"
+            if not success:
+                details = {"error": "provider_unavailable"}
+            elif action == "create(builder)":
+                details = {"tier": rng.choice(_TIERS), "region": _REGIONS[provider]}
+            elif action == "create_infrastructure":
+                details = {"resources_created": rng.randint(1, 4), "provider": provider}
+            else:
+                details = {"name": f"vm-{i}"}
+            payload = {
+                # Un evento cada ~50 ms de media: 10^7 líneas cubren ~6 días
+                "timestamp": (_START + timedelta(milliseconds=i * 50 + rng.randint(0, 49))).isoformat() + "Z",
+                "actor": rng.choice(_ACTORS),
+                "action": action,
+                "vm_id": vm_id,
+                "provider": provider,
+                "success": success,
+                "details": details,
+            }
+            buffer.append(json.dumps(payload))
+            if len(buffer) >= chunk:
+                written += fh.write("\n".join(buffer) + "\n")
+                buffer.clear()
+        if buffer:
+            written += fh.write("\n".join(buffer) + "\n")
+    os.replace(tmp, path)
+    return written
+
+
+def ensure(lines: int, seed: int = DEFAULT_SEED, directory: str = DEFAULT_DIR) -> str:
+    """Ruta del log sintético de `lines` líneas, generándolo solo si no existe."""
+    path = default_path(lines, seed, directory)
+    if not os.path.exists(path):
+        generate(path, lines, seed)
+    return path
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lines", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--out", default=None, help="Por defecto data/bench/audit-<lines>-s<seed>.log")
+    args = parser.parse_args(argv)
+
+    path = args.out or default_path(args.lines, args.seed)
+    t0 = time.perf_counter()
+    written = generate(path, args.lines, args.seed)
+    print(json.dumps({
+        "path": path,
+        "lines": args.lines,
+        "bytes": written,
+        "seconds": round(time.perf_counter() - t0, 2),
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
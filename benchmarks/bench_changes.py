@@ -0,0 +1,134 @@
+"""
+Sincronización incremental: GET /changes?since= frente a descargar GET /vm/ entero.
+
+Con una flota de --vms VMs, para cada churn (VMs modificadas entre dos
+sincronizaciones) mide tiempo y bytes de un ciclo de sync completo frente a
+uno incremental (todas las páginas de /changes). También mide lo que añade el
+registro de cambios a VMRepository.save.
+
+    python -m benchmarks.bench_changes --vms 100000 --churn 10,100,1000,10000
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List
+
+from benchmarks.suite import _vm_dtos, audit_redirected
+
+
+def _best(fn, repeat: int) -> float:
+    fn()
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return min(samples)
+
+
+async def _full_sync(client) -> Dict[str, Any]:
+    resp = await client.request("GET", "/vm/", keep_body=False)
+    assert resp.status == 200, resp.status
+    return {"requests": 1, "bytes": resp.body_bytes}
+
+
+async def _delta_sync(client, since: int, limit: int) -> Dict[str, Any]:
+    requests, total = 0, 0
+    while True:
+        resp = await client.request("GET", "/changes", query=f"since={since}&limit={limit}")
+        assert resp.status == 200, resp.status
+        requests += 1
+        total += resp.body_bytes
+        page = json.loads(bytes(resp.body))
+        since = page["next_since"]
+        if not page["has_more"]:
+            return {"requests": requests, "bytes": total}
+
+
+def _bench_sync(args) -> List[Dict[str, Any]]:
+    from app.main import app
+    from app.core.container import get_change_log, get_vm_service
+    from app.domain.schemas import VMUpdateRequest
+    from benchmarks.asgi_client import ASGIClient
+
+    service = get_vm_service()
+    repo = service.repo
+    for vm in repo.list():
+        repo.delete(vm.id)
+    repo.save_many(_vm_dtos(args.vms))
+    changes = asyncio.run(get_change_log())
+    ids = [vm.id for vm in repo.list()]
+    client = ASGIClient(app)
+
+    full_s = _best(lambda: asyncio.run(_full_sync(client)), args.repeat)
+    full = asyncio.run(_full_sync(client))
+    rows = []
+    for churn in args.churn:
+        since = changes.current_seq
+        for i in range(churn):
+            service.update_vm(ids[i % len(ids)], VMUpdateRequest(name=f"renamed-{i}"))
+        delta_s = _best(lambda: asyncio.run(_delta_sync(client, since, args.limit)), args.repeat)
+        delta = asyncio.run(_delta_sync(client, since, args.limit))
+        rows.append({
+            "churn": churn,
+            "full_ms": round(full_s * 1000, 2),
+            "full_kb": round(full["bytes"] / 1024, 1),
+            "delta_ms": round(delta_s * 1000, 2),
+            "delta_kb": round(delta["bytes"] / 1024, 1),
+            "delta_requests": delta["requests"],
+            "speedup": round(full_s / delta_s, 1),
+        })
+    return rows
+
+
+def _bench_repository(args) -> Dict[str, Any]:
+    from app.infrastructure.change_log import ChangeLog
+    from app.infrastructure.repository import VMRepository
+
+    vms = _vm_dtos(args.ops)
+
+    def run(repo_factory):
+        def go() -> None:
+            repo = repo_factory()
+            for vm in vms:
+                repo.save(vm)
+        return go
+
+    plain = _best(run(VMRepository), args.repeat)
+    logged = _best(run(lambda: VMRepository(changes=ChangeLog())), args.repeat)
+    return {
+        "ops": args.ops,
+        "save_ns": round(plain / args.ops * 1e9, 1),
+        "save_with_changelog_ns": round(logged / args.ops * 1e9, 1),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--vms", type=int, default=100_000)
+    parser.add_argument("--churn", type=lambda v: [int(x) for x in v.split(",")], default=[10, 100, 1000, 10_000])
+    parser.add_argument("--limit", type=int, default=1000, help="limit de cada página de /changes")
+    parser.add_argument("--ops", type=int, default=200_000, help="save() para medir el coste del registro")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        import app.main  # noqa: F401
+
+        with audit_redirected(os.devnull):
+            result = {
+                "vms": args.vms,
+                "sync": _bench_sync(args),
+                "repository": _bench_repository(args),
+            }
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""
+Compresión (gzip/brotli) y codificaciones binarias (MessagePack/CBOR) de los
+listados grandes: GET /vm/, GET /cloud/infrastructure y GET /api/logs.
+
+Para cada formato (Accept) y compresión (Accept-Encoding) mide bytes en el
+cable, req/s en proceso y lo que le cuesta al cliente descomprimir y
+decodificar la respuesta. El inventario se crea con VMService (specs reales
+por proveedor) y los logs son sintéticos (benchmarks.audit_logs).
+
+    python -m benchmarks.bench_compression --vms 10000 --infrastructures 500
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import contextlib
+import gc
+import gzip
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+from benchmarks.suite import _infrastructure_bodies, _vm_create_requests, audit_redirected
+
+ENCODINGS = ("identity", "gzip", "br")
+
+
+def _decoders() -> Dict[str, Callable[[bytes], Any]]:
+    from app.infrastructure.serialization import CBOR_MEDIA_TYPE, JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, cbor2, msgpack
+
+    decoders: Dict[str, Callable[[bytes], Any]] = {JSON_MEDIA_TYPE: json.loads}
+    if msgpack is not None:
+        decoders[MSGPACK_MEDIA_TYPE] = msgpack.unpackb
+    if cbor2 is not None:
+        decoders[CBOR_MEDIA_TYPE] = cbor2.loads
+    return decoders
+
+
+def _decompressors() -> Dict[str, Callable[[bytes], bytes]]:
+    from app.api.compression import brotli
+
+    out: Dict[str, Callable[[bytes], bytes]] = {"identity": bytes, "gzip": gzip.decompress}
+    if brotli is not None:
+        out["br"] = brotli.decompress
+    return out
+
+
+def _populate(vms: int, infrastructures: int) -> None:
+    from app.main import app
+    from app.core.container import get_vm_service
+    from benchmarks.asgi_client import ASGIClient
+
+    service = get_vm_service()
+    for vm in service.repo.list():
+        service.repo.delete(vm.id)
+    for req in _vm_create_requests(vms):
+        service.create_vm(req)
+
+    async def create() -> None:
+        client = ASGIClient(app)
+        for body in _infrastructure_bodies(infrastructures):
+            resp = await client.request("POST", "/cloud/infrastructure/create", json_body=body, keep_body=False)
+            assert resp.status == 200, resp.status
+    asyncio.run(create())
+
+
+async def _measure(client, path: str, query: str, headers: Dict[str, str], requests: int) -> Dict[str, Any]:
+    resp = await client.request("GET", path, query=query, headers=headers)
+    assert resp.status == 200, resp.status
+    # Que la basura de poblar el inventario no caiga dentro de la medida
+    gc.collect()
+    t0 = time.perf_counter()
+    for _ in range(requests):
+        await client.request("GET", path, query=query, headers=headers, keep_body=False)
+    elapsed = time.perf_counter() - t0
+    return {"resp": resp, "rps": round(requests / elapsed, 1)}
+
+
+def _bench_endpoint(client, path: str, query: str, args) -> List[Dict[str, Any]]:
+    decoders, decompressors = _decoders(), _decompressors()
+    rows = []
+    for media_type, decode in decoders.items():
+        for encoding in ENCODINGS:
+            if encoding not in decompressors:
+                continue
+            headers = {"accept": media_type, "accept-encoding": encoding}
+            m = asyncio.run(_measure(client, path, query, headers, args.requests))
+            resp = m["resp"]
+            body = bytes(resp.body)
+            sent = dict(resp.headers).get(b"content-encoding", b"identity").decode()
+            raw = decompressors[sent](body)
+
+            def client_side() -> None:
+                decode(decompressors[sent](body))
+            client_side()
+            t0 = time.perf_counter()
+            for _ in range(args.decode_repeat):
+                client_side()
+            decode_ms = (time.perf_counter() - t0) / args.decode_repeat * 1000
+            rows.append({
+                "accept": media_type,
+                "encoding": sent,
+                "wire_kb": round(len(body) / 1024, 1),
+                "raw_kb": round(len(raw) / 1024, 1),
+                "rps": m["rps"],
+                "client_decode_ms": round(decode_ms, 3),
+            })
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--vms", type=int, default=10_000)
+    parser.add_argument("--infrastructures", type=int, default=500)
+    parser.add_argument("--log-lines", type=int, default=100_000)
+    parser.add_argument("--requests", type=int, default=20, help="Peticiones por combinación formato/compresión")
+    parser.add_argument("--decode-repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        from app.main import app
+        from app.api.compression import CompressionConfig
+        from app.api.logs_controller import log_service
+        from benchmarks.asgi_client import ASGIClient
+        from benchmarks.audit_logs import ensure
+
+        with audit_redirected(os.devnull):
+            _populate(args.vms, args.infrastructures)
+            log_service.log_file_path = ensure(args.log_lines)
+            client = ASGIClient(app)
+            config = CompressionConfig.from_env()
+            result = {
+                "config": {"minimum_size": config.minimum_size, "gzip_level": config.gzip_level, "brotli_quality": config.brotli_quality},
+                "vm_list": _bench_endpoint(client, "/vm/", "", args),
+                "infrastructure_list": _bench_endpoint(client, "/cloud/infrastructure", "", args),
+                "logs": _bench_endpoint(client, "/api/logs", "page_size=200", args),
+            }
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+Preparación de configs de infraestructura con los esquemas compilados.
+
+Para cada proveedor prepara el plan completo (VM, BD, LB y storage) como lo
+hace InfrastructureService y lo pasa por la validación de la factory:
+- shared: la factory recibe el ValidatedConfig del plan y no lo revalida
+- revalidate: la factory recibe un dict normal (copia) y lo valida otra vez,
+  que es lo que pasaba antes con la doble validación y los dict.copy()
+
+    python -m benchmarks.bench_config_schemas --plans 100000
+"""
+from __future__ import annotations
+import argparse
+import json
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Configs de ejemplo por proveedor (lo mínimo que enviaría un cliente)
+_REQUESTS: Dict[str, Tuple[str, Dict[str, Optional[Dict[str, Any]]]]] = {
+    "aws": ("us-east-1", {"vm": {"instance_type": "t3.medium"}, "database": None, "load_balancer": None, "storage": None}),
+    "azure": ("eastus", {"vm": None, "database": {"tier": "S1"}, "load_balancer": None, "storage": None}),
+    "gcp": ("us-central1", {"vm": {"machine_type": "e2-medium"}, "database": None, "load_balancer": {"type": "TCP"}, "storage": None}),
+    "oracle": ("us-ashburn-1", {"vm": None, "database": None, "load_balancer": None, "storage": None}),
+    "onprem": ("datacenter-1", {"vm": {"nic": "vmxnet3"}, "database": {"engine": "postgresql"}, "load_balancer": None, "storage": None}),
+}
+_RESOURCE_TYPES = {"vm": "virtual_machine", "database": "database", "load_balancer": "load_balancer", "storage": "storage"}
+
+
+def _best(fn: Callable[[], None], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return min(samples)
+
+
+def _plan(provider: str) -> Callable[[bool], List[Any]]:
+    from app.domain.validation import CONFIG_SCHEMAS
+
+    schemas = CONFIG_SCHEMAS[provider]
+    region, configs = _REQUESTS[provider]
+
+    def run(shared: bool) -> List[Any]:
+        context = {"name": "bench", "region": region, "vm": {}}
+        out = []
+        for key, config in configs.items():
+            schema = schemas[_RESOURCE_TYPES[key]]
+            prepared = schema.prepare(config, context)
+            if key == "vm":
+                context["vm"] = prepared
+            # Lado factory
+            out.append(schema.validate(prepared if shared else dict(prepared)))
+        return out
+
+    return run
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--plans", type=int, default=100_000, help="Planes por proveedor")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeticiones (se reporta la mejor)")
+    args = parser.parse_args(argv)
+
+    result = {}
+    for provider in _REQUESTS:
+        run = _plan(provider)
+        n = args.plans
+
+        def loop(shared: bool) -> Callable[[], None]:
+            def inner() -> None:
+                for _ in range(n):
+                    run(shared)
+            return inner
+
+        shared_s = _best(loop(True), args.repeat)
+        revalidate_s = _best(loop(False), args.repeat)
+        result[provider] = {
+            "plans": n,
+            "shared_us_per_plan": round(shared_s / n * 1e6, 2),
+            "revalidate_us_per_plan": round(revalidate_s / n * 1e6, 2),
+            "speedup": round(revalidate_s / shared_s, 2),
+            "same_configs": run(True) == run(False),
+        }
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""
+Valoración de recursos con el catálogo de precios: NumPy vectorizado vs bucle Python.
+
+Genera N recursos sintéticos (proveedor, tipo, tamaño, vCPU, RAM, GB, count)
+mezclando tamaños del catálogo y desconocidos (precio por unidad) y mide:
+- vectorized: PriceCatalog sobre columnas; encode (texto → códigos enteros con
+  búsqueda binaria) y price (tabla de filas + aritmética) por separado
+- loop: el mismo cálculo item a item con dicts, sobre una muestra y extrapolado
+- endpoint: POST /cost/estimate con --api-items items (incluye parseo Pydantic)
+
+    python -m benchmarks.bench_cost_estimate --resources 1000000
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import sys
+import time
+from typing import Dict, List
+
+import numpy as np
+
+
+def _columns(n: int, seed: int) -> Dict[str, np.ndarray]:
+    from app.domain.catalog.pricing import PRICE_CATALOG
+
+    rng = np.random.default_rng(seed)
+    skus = [
+        (provider, resource_type, size)
+        for provider, types in PRICE_CATALOG.items()
+        for resource_type, sizes in types.items()
+        for size in list(sizes) + ["unknown-size"]
+    ]
+    picks = rng.integers(0, len(skus), n)
+    table = np.array(skus)
+    return {
+        "providers": table[picks, 0],
+        "resource_types": table[picks, 1],
+        "sizes": table[picks, 2],
+        "vcpus": rng.integers(1, 33, n).astype(float),
+        "ram_gb": rng.integers(1, 129, n).astype(float),
+        "storage_gb": rng.integers(0, 2048, n).astype(float),
+        "count": rng.integers(1, 4, n).astype(float),
+    }
+
+
+def _loop_estimate(cols: Dict[str, np.ndarray], limit: int) -> float:
+    """Referencia: dict lookups + aritmética por item (lo que se haría sin NumPy)."""
+    from app.domain.catalog.pricing import HOURS_PER_MONTH, PRICE_CATALOG, PROVIDER_ALIASES, WILDCARD
+
+    rows = zip(*(cols[k][:limit].tolist() for k in ("providers", "resource_types", "sizes", "vcpus", "ram_gb", "storage_gb", "count")))
+    total = 0.0
+    for provider, resource_type, size, vcpus, ram_gb, storage_gb, count in rows:
+        sizes = PRICE_CATALOG.get(PROVIDER_ALIASES.get(provider, provider), {}).get(resource_type)
+        if not sizes:
+            continue
+        hourly, vcpu_hour, ram_hour, gb_month = sizes.get(size) or sizes[WILDCARD]
+        total += (hourly + vcpu_hour * vcpus + ram_hour * ram_gb + gb_month * storage_gb / HOURS_PER_MONTH) * count * HOURS_PER_MONTH
+    return total
+
+
+def _bench_core(args) -> dict:
+    from app.domain.catalog import get_price_catalog
+
+    catalog = get_price_catalog()
+    cols = _columns(args.resources, args.seed)
+    encode_samples, price_samples = [], []
+    estimate = None
+    for _ in range(args.repeat):
+        t0 = time.perf_counter()
+        codes = catalog.encode(cols["providers"], cols["resource_types"], cols["sizes"])
+        t1 = time.perf_counter()
+        estimate = catalog.estimate_codes(*codes, cols["vcpus"], cols["ram_gb"], cols["storage_gb"], cols["count"])
+        t2 = time.perf_counter()
+        encode_samples.append(t1 - t0)
+        price_samples.append(t2 - t1)
+    encode_s, price_s = min(encode_samples), min(price_samples)
+    vectorized_s = encode_s + price_s
+
+    loop_n = min(args.loop_sample, args.resources)
+    t0 = time.perf_counter()
+    loop_total = _loop_estimate(cols, loop_n)
+    loop_s = (time.perf_counter() - t0) * args.resources / loop_n
+    vectorized_sample = float(estimate.monthly[:loop_n].sum())
+
+    return {
+        "resources": args.resources,
+        "encode_s": round(encode_s, 4),
+        "price_s": round(price_s, 4),
+        "vectorized_s": round(vectorized_s, 4),
+        "vectorized_resources_per_s": round(args.resources / vectorized_s),
+        "loop_s_extrapolated": round(loop_s, 3),
+        "speedup": round(loop_s / vectorized_s, 1),
+        "total_monthly": round(estimate.total_monthly, 2),
+        "unpriced": estimate.unpriced,
+        "loop_matches": bool(np.isclose(loop_total, vectorized_sample, rtol=1e-9)),
+    }
+
+
+async def _bench_endpoint(args) -> dict:
+    with contextlib.redirect_stdout(io.StringIO()):
+        from app.main import app
+        from benchmarks.asgi_client import ASGIClient
+
+    cols = _columns(args.api_items, args.seed)
+    items = [
+        {"provider": p, "resource_type": t, "size": s, "vcpus": v, "ram_gb": r, "storage_gb": g, "count": int(c)}
+        for p, t, s, v, r, g, c in zip(*(cols[k].tolist() for k in ("providers", "resource_types", "sizes", "vcpus", "ram_gb", "storage_gb", "count")))
+    ]
+    client = ASGIClient(app)
+    samples: List[float] = []
+    for _ in range(args.repeat):
+        t0 = time.perf_counter()
+        resp = await client.request("POST", "/cost/estimate", json_body={"items": items}, keep_body=False)
+        samples.append(time.perf_counter() - t0)
+        if resp.status != 200:
+            raise RuntimeError(f"POST /cost/estimate devolvió {resp.status}")
+    best = min(samples)
+    return {"items": args.api_items, "best_s": round(best, 4), "items_per_s": round(args.api_items / best)}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--resources", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5, help="Repeticiones (se reporta la mejor)")
+    parser.add_argument("--loop-sample", type=int, default=200_000, help="Items valorados con el bucle Python de referencia")
+    parser.add_argument("--api-items", type=int, default=10_000, help="Items por petición al endpoint (0 = omitir)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+    result = {"core": _bench_core(args)}
+    if args.api_items:
+        result["endpoint"] = asyncio.run(_bench_endpoint(args))
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+Benchmark de `GET /vm/export` (NDJSON en streaming) frente a `GET /vm/`.
+
+Mide tiempo al primer byte (TTFB), tiempo total y RSS pico añadido por la
+petición. Cada endpoint se ejecuta en un subproceso propio para que el RSS pico
+(high-water mark del proceso) de uno no contamine al otro.
+
+    python -m benchmarks.bench_export --vms 1000000
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import resource
+import subprocess
+import sys
+import time
+
+ENDPOINTS = {
+    "export": "/vm/export",
+    "list": "/vm/",
+}
+
+
+def _rss_peak_mb() -> float:
+    # ru_maxrss está en KiB en Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def _populate(n: int) -> None:
+    from app.core.container import _repo
+    from app.domain.schemas import VMDTO, ProviderEnum
+
+    providers = list(ProviderEnum)
+    for i in range(n):
+        vm = VMDTO.model_construct(
+            id=f"vm-{i:08d}",
+            name=f"bench-{i}",
+            provider=providers[i % len(providers)],
+            status="running" if i % 3 else "stopped",
+            specs={"instance_type": "t3.micro", "region": "us-east-1", "index": i},
+        )
+        _repo.save(vm)
+
+
+def run_single(endpoint: str, vms: int) -> dict:
+    # Silenciar los prints de arranque de la app
+    with contextlib.redirect_stdout(io.StringIO()):
+        from app.main import app
+        from benchmarks.asgi_client import ASGIClient
+
+        t0 = time.perf_counter()
+        _populate(vms)
+        populate_s = time.perf_counter() - t0
+    rss_before = _rss_peak_mb()
+
+    client = ASGIClient(app)
+    resp = asyncio.run(client.request("GET", ENDPOINTS[endpoint], keep_body=False))
+    rss_after = _rss_peak_mb()
+    return {
+        "endpoint": ENDPOINTS[endpoint],
+        "vms": vms,
+        "status": resp.status,
+        "populate_s": round(populate_s, 3),
+        "ttfb_ms": round(resp.ttfb_s * 1000, 2),
+        "total_s": round(resp.total_s, 3),
+        "body_mb": round(resp.body_bytes / 1_048_576, 2),
+        "chunks": resp.chunks,
+        "rss_baseline_mb": round(rss_before, 1),
+        "rss_peak_added_mb": round(rss_after - rss_before, 1),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--vms", type=int, default=1_000_000, help="Tamaño de la flota simulada")
+    parser.add_argument("--endpoint", choices=sorted(ENDPOINTS), help="Ejecuta solo un endpoint (modo subproceso)")
+    args = parser.parse_args(argv)
+
+    if args.endpoint:
+        print(json.dumps(run_single(args.endpoint, args.vms)))
+        return 0
+
+    results = []
+    for endpoint in ("export", "list"):
+        out = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_export", "--vms", str(args.vms), "--endpoint", endpoint],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
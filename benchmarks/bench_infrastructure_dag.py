@@ -0,0 +1,114 @@
+"""
+Latencia de creación de infraestructura: secuencial vs DAG en paralelo.
+
+Simula latencia fija por tipo de recurso y crea N infraestructuras completas
+(VM + BD + LB + storage) con InfrastructureService, primero con concurrencia 1
+(equivalente al flujo secuencial anterior) y después con el DAG en paralelo.
+La latencia esperada del DAG es la del camino crítico (VM → LB). Con
+--fail-storage se fuerza un fallo en el storage para verificar el rollback.
+
+    python -m benchmarks.bench_infrastructure_dag --runs 20 \\
+        --latency-ms virtual_machine=400,database=600,load_balancer=300,storage=200
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import sys
+import time
+from typing import Dict
+
+from benchmarks.stats import latency_summary_ms
+
+DEFAULT_LATENCY_MS = "virtual_machine=400,database=600,load_balancer=300,storage=200"
+
+
+def _parse_latencies(raw: str) -> Dict[str, float]:
+    out = {}
+    for item in raw.split(","):
+        key, _, value = item.partition("=")
+        out[key.strip()] = float(value)
+    return out
+
+
+async def _run(args) -> dict:
+    with contextlib.redirect_stdout(io.StringIO()):
+        from app.domain.abstractions.provisioning import ProvisioningPlan
+        from app.domain.schemas.infrastructure import InfrastructureCreateRequest
+        from app.domain.services import InfrastructureService
+        from app.infrastructure.infrastructure_repository import InfrastructureRepository
+        from app.infrastructure.simulation import SimulationConfig, enable_simulation
+
+    latencies_ms = _parse_latencies(args.latency_ms)
+    providers = {
+        "*": {
+            resource: {"latency": {"distribution": "fixed", "ms": ms}}
+            for resource, ms in latencies_ms.items()
+        }
+    }
+    if args.fail_storage:
+        providers["*"]["storage"]["error_rate"] = 1.0
+    enable_simulation(SimulationConfig.from_dict({"seed": 1, "providers": providers}))
+
+    plan = ProvisioningPlan.from_config({
+        key: {"name": key, "config": {}} for key in ("vm", "database", "load_balancer", "storage")
+    })
+    critical_path_ms = plan.critical_path_length(lambda node: latencies_ms.get(node.resource_type, 0.0))
+    sequential_ms = sum(latencies_ms.get(plan.nodes[k].resource_type, 0.0) for k in plan.order)
+
+    results = {}
+    for label, concurrency in (("sequential", 1), ("dag", args.max_concurrency)):
+        repo = InfrastructureRepository()
+        service = InfrastructureService(repo, max_concurrency=concurrency)
+        samples, failures = [], 0
+
+        async def one(i: int) -> None:
+            nonlocal failures
+            request = InfrastructureCreateRequest(provider="aws", name=f"bench-{label}-{i}")
+            start = time.perf_counter()
+            try:
+                await service.create_infrastructure(request)
+            except Exception:
+                failures += 1
+            samples.append(time.perf_counter() - start)
+
+        with contextlib.redirect_stdout(io.StringIO()) as captured:
+            t0 = time.perf_counter()
+            await asyncio.gather(*(one(i) for i in range(args.runs)))
+            elapsed = time.perf_counter() - t0
+        results[label] = {
+            "max_concurrency": concurrency,
+            "elapsed_s": round(elapsed, 3),
+            "failures": failures,
+            "rolled_back_resources": captured.getvalue().count("Rollback:"),
+            "stored_infrastructures": len(repo.list()),
+            "latency": latency_summary_ms(samples),
+        }
+
+    return {
+        "runs": args.runs,
+        "latency_ms_by_resource": latencies_ms,
+        "expected_sequential_ms": sequential_ms,
+        "expected_critical_path_ms": critical_path_ms,
+        "results": results,
+        "speedup_p50": round(
+            results["sequential"]["latency"]["p50_ms"] / max(results["dag"]["latency"]["p50_ms"], 1e-9), 2
+        ),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20, help="Infraestructuras creadas por modo (concurrentes)")
+    parser.add_argument("--latency-ms", default=DEFAULT_LATENCY_MS, help="recurso=ms separados por comas")
+    parser.add_argument("--max-concurrency", type=int, default=4, help="Recursos en paralelo por infraestructura")
+    parser.add_argument("--fail-storage", action="store_true", help="Forzar fallo del storage (verifica rollback)")
+    args = parser.parse_args(argv)
+    print(json.dumps(asyncio.run(_run(args)), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
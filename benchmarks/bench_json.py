@@ -0,0 +1,192 @@
+"""
+Camino rápido de JSON: respuestas de VMs, líneas de auditoría y lectura de logs.
+
+- list: serializar GET /vm/ con N VMs por el camino de FastAPI (el modelo se
+  vuelca y se revalida contra el response_model, y json.dumps) frente a
+  FastJSONResponse con stdlib y con orjson; y req/s del endpoint en proceso
+- audit: json.dumps(payload, default=str) por evento frente a la plantilla
+  del esquema fijo de _format_audit_line
+- logs: LogService.get_logs/get_stats sobre un log sintético, con el bucle
+  anterior (json.loads + AuditLogEntry por línea) y con el actual
+
+    python -m benchmarks.bench_json --vms 1000 --log-lines 100000
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict
+
+from benchmarks.suite import _seed_inventory, _vm_dtos, audit_redirected
+
+
+def _best(fn: Callable[[], object], repeat: int) -> float:
+    fn()
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return min(samples)
+
+
+def _bench_list(args) -> Dict[str, object]:
+    from fastapi.responses import JSONResponse
+    from fastapi.routing import serialize_response
+    from fastapi.utils import create_model_field
+    from app.domain.schemas import VMListResponse
+    from app.infrastructure.serialization import FastJSONResponse, set_json_backend
+
+    vms = _vm_dtos(args.vms)
+    field = create_model_field(name="Response_list_vms", type_=VMListResponse, mode="serialization")
+
+    def fastapi_path() -> None:
+        content = asyncio.run(serialize_response(field=field, response_content=VMListResponse(items=vms)))
+        JSONResponse(content)
+
+    out: Dict[str, object] = {"vms": args.vms, "fastapi_ms": round(_best(fastapi_path, args.repeat) * 1000, 3)}
+    for backend in ("stdlib", "orjson"):
+        try:
+            set_json_backend(backend)
+        except ValueError:
+            continue
+        out[f"fast_{backend}_ms"] = round(_best(lambda: FastJSONResponse(VMListResponse(items=vms)), args.repeat) * 1000, 3)
+    set_json_backend()
+    best = min(v for k, v in out.items() if k.startswith("fast_"))
+    out["speedup"] = round(out["fastapi_ms"] / best, 1)
+    return out
+
+
+async def _endpoint_rps(client, path: str, requests: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(requests):
+        resp = await client.request("GET", path, keep_body=False)
+        assert resp.status == 200, resp.status
+    return round(requests / (time.perf_counter() - t0), 1)
+
+
+def _bench_list_endpoint(args) -> Dict[str, object]:
+    from app.main import app
+    from app.infrastructure.serialization import set_json_backend
+    from benchmarks.asgi_client import ASGIClient
+
+    _seed_inventory(args.vms)
+    client = ASGIClient(app)
+    out: Dict[str, object] = {}
+    for backend in ("stdlib", "orjson"):
+        try:
+            set_json_backend(backend)
+        except ValueError:
+            continue
+        asyncio.run(_endpoint_rps(client, "/vm/", 5))
+        out[f"{backend}_rps"] = asyncio.run(_endpoint_rps(client, "/vm/", args.requests))
+    set_json_backend()
+    return out
+
+
+def _bench_audit(args) -> Dict[str, object]:
+    from app.infrastructure.logger import _format_audit_line
+    from app.infrastructure.serialization import set_json_backend
+
+    n = args.audit_lines
+    details = {"tier": "medium", "region": "us-east-1"}
+
+    def legacy() -> None:
+        for i in range(n):
+            payload = {
+                "timestamp": datetime.utcnow().isoformat() + "Z", "actor": "system", "action": "create(builder)",
+                "vm_id": "i-0000abcd", "provider": "aws", "success": True, "details": details,
+            }
+            json.dumps(payload, default=str)
+
+    def template() -> None:
+        for i in range(n):
+            _format_audit_line("system", "create(builder)", "i-0000abcd", "aws", True, details)
+
+    out: Dict[str, object] = {"lines": n, "legacy_us": round(_best(legacy, args.repeat) / n * 1e6, 3)}
+    for backend in ("stdlib", "orjson"):
+        try:
+            set_json_backend(backend)
+        except ValueError:
+            continue
+        out[f"template_{backend}_us"] = round(_best(template, args.repeat) / n * 1e6, 3)
+    set_json_backend()
+    return out
+
+
+def _legacy_scan(path: str) -> list:
+    from app.domain.schemas.logs import AuditLogEntry
+
+    entries = []
+    with open(path, "r", encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if line:
+                try:
+                    entries.append(AuditLogEntry(**json.loads(line)))
+                except json.JSONDecodeError:
+                    continue
+    return entries
+
+
+def _bench_logs(args) -> Dict[str, object]:
+    from app.domain.schemas.logs import LogsQuery
+    from app.domain.services.log_service import LogService
+    from app.infrastructure.serialization import set_json_backend
+    from benchmarks.audit_logs import ensure
+
+    path = ensure(args.log_lines)
+    service = LogService()
+    service.log_file_path = path
+    query = LogsQuery(provider="aws", success=True, page=1, page_size=50)
+
+    def legacy_get_logs() -> None:
+        entries = [e for e in _legacy_scan(path) if "aws" in e.provider.lower() and e.success]
+        entries.sort(key=lambda e: e.timestamp, reverse=True)
+
+    # Una pasada por repetición: con logs grandes cada una tarda segundos
+    repeat = max(1, args.repeat // 2)
+    out: Dict[str, object] = {"lines": args.log_lines, "legacy_get_logs_s": round(_best(legacy_get_logs, repeat), 3)}
+    for backend in ("stdlib", "orjson"):
+        try:
+            set_json_backend(backend)
+        except ValueError:
+            continue
+        out[f"{backend}_get_logs_s"] = round(_best(lambda: service.get_logs(query), repeat), 3)
+        out[f"{backend}_get_stats_s"] = round(_best(service.get_stats, repeat), 3)
+    set_json_backend()
+    return out
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--vms", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=200, help="Peticiones GET /vm/ por backend")
+    parser.add_argument("--audit-lines", type=int, default=100_000)
+    parser.add_argument("--log-lines", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        import app.main  # noqa: F401
+        from app.infrastructure.serialization import json_backend
+
+        with audit_redirected(os.devnull):
+            result = {
+                "default_backend": json_backend(),
+                "list": _bench_list(args),
+                "list_endpoint": _bench_list_endpoint(args),
+                "audit": _bench_audit(args),
+                "logs": _bench_logs(args),
+            }
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+Miles de transiciones a la vez: esperar dentro de la petición frente a VMLifecycleService.
+
+Con una flota de --vms VMs paradas se piden todas las `start` a la vez, cada
+una con una duración simulada de --duration-ms:
+
+- blocking: la petición espera la duración y completa la transición, como un
+  endpoint sync en el threadpool (--threads hilos, 40 es el límite de AnyIO).
+- lifecycle: POST /vm/{id}/action responde 202 en `starting` y el servicio
+  de ciclo de vida la completa cuando vence (heap + --workers workers).
+
+Por modo: latencia de la respuesta, tiempo hasta que la última VM está en
+running y CPU del proceso.
+
+    python -m benchmarks.bench_lifecycle --vms 5000 --duration-ms 300
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+from benchmarks.suite import _vm_dtos, audit_redirected
+
+
+def _reset_fleet(n: int) -> List[str]:
+    from app.core.container import get_vm_service
+
+    repo = get_vm_service().repo
+    for vm in repo.list():
+        repo.delete(vm.id)
+    vms = _vm_dtos(n)
+    for vm in vms:
+        vm.status = "stopped"
+    repo.save_many(vms)
+    return [vm.id for vm in vms]
+
+
+def _summary(mode: str, latencies: List[float], makespan: float, cpu: float) -> Dict[str, Any]:
+    latencies = sorted(latencies)
+    return {
+        "mode": mode,
+        "transitions": len(latencies),
+        "response_ms_p50": round(statistics.median(latencies) * 1000, 2),
+        "response_ms_p99": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 2),
+        "all_running_s": round(makespan, 3),
+        "cpu_s": round(cpu, 3),
+    }
+
+
+def _run_blocking(args) -> Dict[str, Any]:
+    from app.core.container import get_vm_service
+    from app.domain.schemas import VMActionRequest
+
+    service = get_vm_service()
+    ids = _reset_fleet(args.vms)
+    duration_s = args.duration_ms / 1000
+    action = VMActionRequest(action="start")
+
+    def handle(vm_id: str, submitted: float) -> float:
+        time.sleep(duration_s)
+        service.apply_action(vm_id, action)
+        return time.perf_counter() - submitted
+
+    cpu0, t0 = time.process_time(), time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        futures = [pool.submit(handle, vm_id, time.perf_counter()) for vm_id in ids]
+        latencies = [f.result() for f in futures]
+    return _summary("blocking", latencies, time.perf_counter() - t0, time.process_time() - cpu0)
+
+
+async def _run_lifecycle(args) -> Dict[str, Any]:
+    from app.main import app
+    from app.core.container import get_lifecycle_service, get_vm_service
+    from app.domain.services.lifecycle_service import LifecycleConfig, TransitionProfile
+    from app.infrastructure.simulation import WILDCARD, LatencyModel
+    from benchmarks.asgi_client import ASGIClient
+
+    lifecycle = await get_lifecycle_service()
+    lifecycle.config = LifecycleConfig(
+        workers=args.workers,
+        profiles={(WILDCARD, WILDCARD): TransitionProfile(LatencyModel(ms=args.duration_ms))},
+    )
+    ids = _reset_fleet(args.vms)
+    client = ASGIClient(app)
+    # El ASGIClient no ejecuta el lifespan: se arranca aquí, en el loop del benchmark
+    await lifecycle.start()
+    try:
+        # Latencia desde que se lanzan todas, igual que en blocking (incluye la cola del event loop)
+        async def start(vm_id: str) -> float:
+            resp = await client.request("POST", f"/vm/{vm_id}/action", json_body={"action": "start"})
+            assert resp.status == 202, resp.status
+            return time.perf_counter() - t0
+
+        cpu0, t0 = time.process_time(), time.perf_counter()
+        latencies = await asyncio.gather(*(start(vm_id) for vm_id in ids))
+        while lifecycle.stats()["pending"]:
+            await asyncio.sleep(0.005)
+        makespan, cpu = time.perf_counter() - t0, time.process_time() - cpu0
+    finally:
+        await lifecycle.stop()
+    repo = get_vm_service().repo
+    assert all(repo.get(vm_id).status == "running" for vm_id in ids)
+    return _summary("lifecycle", latencies, makespan, cpu)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--vms", type=int, default=5000)
+    parser.add_argument("--duration-ms", type=float, default=300.0, help="duración simulada de cada start")
+    parser.add_argument("--threads", type=int, default=40, help="hilos del modo blocking")
+    parser.add_argument("--workers", type=int, default=4, help="workers del servicio de ciclo de vida")
+    args = parser.parse_args(argv)
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        import app.main  # noqa: F401
+
+        with audit_redirected(os.devnull):
+            result = {
+                "vms": args.vms,
+                "duration_ms": args.duration_ms,
+                "modes": [_run_blocking(args), asyncio.run(_run_lifecycle(args))],
+            }
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
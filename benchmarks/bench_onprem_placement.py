@@ -0,0 +1,156 @@
+"""
+Simulación de colocación on-prem: throughput y fragmentación por estrategia.
+
+Genera un inventario de --hosts hosts heterogéneos y ejecuta --ops operaciones
+(altas de VMs con formas de los tiers/perfiles del sizing y, con probabilidad
+--churn, bajas de VMs existentes) con cada estrategia del PlacementScheduler.
+Reporta colocaciones por segundo, rechazos, utilización final y fragmentación
+(capacidad libre en hosts donde ya no cabe una VM de referencia). Como
+referencia de coste, mide también un best-fit con recorrido lineal de todos
+los hosts sobre --linear-sample colocaciones.
+
+    python -m benchmarks.bench_onprem_placement --hosts 5000 --ops 200000 --churn 0.3
+"""
+from __future__ import annotations
+import argparse
+import json
+import random
+import sys
+import time
+from typing import Dict, List, Tuple
+
+# Formas (vCPU, RAM GB, disco GB) y peso relativo en la carga
+SHAPES: List[Tuple[Tuple[int, int, int], int]] = [
+    ((2, 4, 50), 30), ((4, 8, 50), 25), ((8, 16, 100), 15), ((16, 32, 200), 5),
+    ((2, 16, 50), 8), ((4, 32, 100), 7), ((8, 64, 200), 4), ((16, 128, 400), 1),
+    ((4, 4, 50), 3), ((8, 8, 100), 2),
+]
+REFERENCE_SHAPE = (4, 8)
+HOST_MODELS = [(16, 128), (32, 256), (64, 512)]
+
+
+def _inventory(n_hosts: int, seed: int):
+    from app.domain.placement import Inventory
+
+    rng = random.Random(seed)
+    hosts = []
+    for i in range(n_hosts):
+        cores, ram = rng.choice(HOST_MODELS)
+        hosts.append({"name": f"host-{i:05d}", "cpu_cores": cores, "ram_gb": ram, "cpu_overcommit": 2.0})
+    datastores = [{"name": f"ds-{i:04d}", "capacity_gb": 65536} for i in range(max(1, n_hosts // 8))]
+    return Inventory.from_dict({"datacenters": {"dc-1": {"hosts": hosts, "datastores": datastores}}})
+
+
+def _workload(ops: int, churn: float, seed: int) -> List[Tuple[str, Tuple[int, int, int]]]:
+    rng = random.Random(seed)
+    shapes, weights = zip(*SHAPES)
+    out = []
+    for _ in range(ops):
+        if rng.random() < churn:
+            out.append(("release", (0, 0, 0)))
+        else:
+            out.append(("place", rng.choices(shapes, weights)[0]))
+    return out
+
+
+def _fragmentation(scheduler_capacity: Dict) -> Dict[str, float]:
+    hosts = scheduler_capacity["hosts"]
+    ref_cpu, ref_ram = REFERENCE_SHAPE
+    free_cpu = sum(h["free_vcpus"] for h in hosts)
+    free_ram = sum(h["free_ram_gb"] for h in hosts)
+    stranded = [h for h in hosts if h["free_vcpus"] < ref_cpu or h["free_ram_gb"] < ref_ram]
+    totals = scheduler_capacity["totals"]
+    return {
+        "cpu_utilization": round(totals["used_vcpus"] / totals["vcpu_capacity"], 4),
+        "ram_utilization": round(totals["used_ram_gb"] / totals["ram_gb"], 4),
+        "stranded_cpu_share": round(sum(h["free_vcpus"] for h in stranded) / free_cpu, 4) if free_cpu else 0.0,
+        "stranded_ram_share": round(sum(h["free_ram_gb"] for h in stranded) / free_ram, 4) if free_ram else 0.0,
+        "empty_hosts": sum(1 for h in hosts if h["vms"] == 0),
+    }
+
+
+def _run_strategy(args, strategy: str, workload) -> dict:
+    from app.domain.placement import InsufficientCapacityError, PlacementScheduler
+
+    scheduler = PlacementScheduler(_inventory(args.hosts, args.seed), strategy=strategy)
+    rng = random.Random(args.seed + 1)
+    live: List[str] = []
+    placed = rejected = released = 0
+    first_rejection_utilization = None
+    place_time = 0.0
+    for i, (op, (cpu, ram, disk)) in enumerate(workload):
+        if op == "release":
+            if live:
+                j = rng.randrange(len(live))
+                live[j], live[-1] = live[-1], live[j]
+                scheduler.release(live.pop())
+                released += 1
+            continue
+        t0 = time.perf_counter()
+        try:
+            scheduler.place(f"vm-{i}", cpu, ram, disk, datacenter="dc-1")
+        except InsufficientCapacityError:
+            rejected += 1
+            if first_rejection_utilization is None:
+                totals = scheduler.capacity()["totals"]
+                first_rejection_utilization = round(totals["used_vcpus"] / totals["vcpu_capacity"], 4)
+            continue
+        finally:
+            place_time += time.perf_counter() - t0
+        live.append(f"vm-{i}")
+        placed += 1
+    attempts = placed + rejected
+    return {
+        "placed": placed,
+        "rejected": rejected,
+        "released": released,
+        "placements_per_s": round(attempts / place_time) if place_time else None,
+        "cpu_utilization_at_first_rejection": first_rejection_utilization,
+        **_fragmentation(scheduler.capacity()),
+    }
+
+
+def _linear_best_fit(args, workload) -> dict:
+    """Best-fit recorriendo todos los hosts en cada colocación (sin índice)."""
+    inventory = _inventory(args.hosts, args.seed)
+    hosts = inventory.hosts
+    sample = [w for w in workload if w[0] == "place"][: args.linear_sample]
+    t0 = time.perf_counter()
+    for _, (cpu, ram, _) in sample:
+        best = None
+        for h in hosts:
+            if h.free_vcpus >= cpu and h.free_ram_gb >= ram and (best is None or h.free_ram_gb < best.free_ram_gb):
+                best = h
+        if best is not None:
+            best.used_vcpus += cpu
+            best.used_ram_gb += ram
+            best.vms += 1
+    elapsed = time.perf_counter() - t0
+    return {"placements": len(sample), "placements_per_s": round(len(sample) / elapsed) if elapsed else None}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--hosts", type=int, default=5000)
+    parser.add_argument("--ops", type=int, default=200_000, help="Operaciones (altas + bajas)")
+    parser.add_argument("--churn", type=float, default=0.3, help="Probabilidad de que una operación sea una baja")
+    parser.add_argument("--linear-sample", type=int, default=2000, help="Colocaciones del best-fit lineal de referencia")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args(argv)
+
+    from app.domain.placement import STRATEGIES
+
+    workload = _workload(args.ops, args.churn, args.seed)
+    result = {
+        "hosts": args.hosts,
+        "ops": args.ops,
+        "churn": args.churn,
+        "strategies": {s: _run_strategy(args, s, workload) for s in STRATEGIES},
+        "linear_best_fit": _linear_best_fit(args, workload),
+    }
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
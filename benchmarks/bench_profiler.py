@@ -0,0 +1,79 @@
+"""
+Overhead del profiler de /debug/profile sobre un worker ocupado.
+
+Un hilo ejecuta trabajo de CPU representativo (validación Pydantic de
+VMBuildRequest y preparación del plan de infraestructura con los esquemas)
+durante --seconds, primero sin profiler y luego con el muestreador activo a
+varios intervalos. Reporta ops/s, la pérdida de throughput y el tiempo que el
+muestreador pasó dentro de las muestras.
+
+    python -m benchmarks.bench_profiler --seconds 3
+"""
+from __future__ import annotations
+import argparse
+import json
+import sys
+import threading
+import time
+from typing import Dict, Optional
+
+_BODY = {"name": "bench", "provider": "aws", "region": "us-east-1", "tier": "medium", "firewall_rules": ["22/tcp"]}
+
+
+def _work(seconds: float) -> float:
+    from app.domain.schemas import VMBuildRequest
+    from app.domain.validation import CONFIG_SCHEMAS
+
+    schemas = CONFIG_SCHEMAS["aws"]
+    context = {"name": "bench", "region": "us-east-1", "vm": {}}
+    ops = 0
+    deadline = time.perf_counter() + seconds
+    t0 = time.perf_counter()
+    while time.perf_counter() < deadline:
+        for _ in range(100):
+            VMBuildRequest(**_BODY)
+            schemas["virtual_machine"].prepare(None, context)
+            schemas["database"].prepare(None, context)
+        ops += 100
+    return ops / (time.perf_counter() - t0)
+
+
+def _measure(seconds: float, interval_s: Optional[float]) -> Dict[str, float]:
+    from app.infrastructure.profiler import SamplingProfiler
+
+    out: Dict[str, float] = {}
+    worker_result: Dict[str, float] = {}
+    worker = threading.Thread(target=lambda: worker_result.update(ops_per_s=_work(seconds)), name="bench-worker")
+    worker.start()
+    if interval_s is not None:
+        result = SamplingProfiler(interval_s=interval_s).run(seconds)
+        stats = result.stats()
+        out.update(samples=stats["samples"], sampling_ms=stats["sampling_ms"], overhead_pct=stats["overhead_pct"])
+        top = result.top(1)["self"]
+        out["top_self"] = top[0]["function"] if top else None
+    worker.join()
+    out["ops_per_s"] = round(worker_result["ops_per_s"], 1)
+    return out
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args(argv)
+
+    _work(0.5)  # calentamiento
+    baseline = _measure(args.seconds, None)
+    runs = {f"interval_{ms}ms": _measure(args.seconds, ms / 1000.0) for ms in (10, 5, 1)}
+    # Segunda referencia al final: el throughput de la máquina deriva entre mediciones
+    baseline_end = _measure(args.seconds, None)
+    reference = (baseline["ops_per_s"] + baseline_end["ops_per_s"]) / 2
+    result = {"baseline_ops_per_s": [baseline["ops_per_s"], baseline_end["ops_per_s"]]}
+    for label, run in runs.items():
+        run["throughput_loss_pct"] = round((1 - run["ops_per_s"] / reference) * 100, 2)
+        result[label] = run
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
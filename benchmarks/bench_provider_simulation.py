@@ -0,0 +1,126 @@
+"""
+Prueba de carga local contra proveedores simulados (latencia, errores, 429).
+
+Lanza N peticiones `POST /vm/build` con concurrencia C contra la app ASGI en
+proceso, con timeout de cliente y reintentos con backoff (respetando Retry-After),
+y reporta throughput, percentiles de latencia y códigos de respuesta. Con
+--governor se activa además el governor de aprovisionamiento (límites por
+proveedor/región/recurso) y se incluyen sus métricas de cola y espera.
+
+    python -m benchmarks.bench_provider_simulation --profile benchmarks/profiles/realistic.json \\
+        --requests 20000 --concurrency 10000 --retries 2 [--governor benchmarks/profiles/governor.json]
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import collections
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import time
+
+from benchmarks.stats import latency_summary_ms
+
+DEFAULT_PROFILE = os.path.join(os.path.dirname(__file__), "profiles", "realistic.json")
+
+REGIONS = {
+    "aws": "us-east-1",
+    "azure": "eastus",
+    "gcp": "us-central1",
+    "onpremise": "datacenter-1",
+    "oracle": "us-ashburn-1",
+}
+
+
+async def _run(args) -> dict:
+    with contextlib.redirect_stdout(io.StringIO()):
+        from app.main import app
+        from app.infrastructure.simulation import SimulationConfig, enable_simulation
+        from benchmarks.asgi_client import ASGIClient
+
+        from app.infrastructure.governor import ProvisioningGovernor, enable_governor, get_governor
+
+        with open(args.profile, "r", encoding="utf-8") as fh:
+            enable_simulation(SimulationConfig.from_dict(json.load(fh)))
+        if args.governor:
+            with open(args.governor, "r", encoding="utf-8") as fh:
+                enable_governor(ProvisioningGovernor.from_dict(json.load(fh)))
+
+    client = ASGIClient(app)
+    providers = args.providers.split(",")
+    sem = asyncio.Semaphore(args.concurrency)
+    statuses = collections.Counter()
+    latencies = []
+    retries = 0
+    in_flight = 0
+    peak_in_flight = 0
+
+    async def one(i: int) -> None:
+        nonlocal retries, in_flight, peak_in_flight
+        provider = providers[i % len(providers)]
+        body = {"name": f"load-{i}", "provider": provider, "region": REGIONS[provider], "tier": "small"}
+        async with sem:
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+            start = time.perf_counter()
+            try:
+                for attempt in range(args.retries + 1):
+                    try:
+                        resp = await asyncio.wait_for(
+                            client.request("POST", "/vm/build", json_body=body, keep_body=False),
+                            timeout=args.client_timeout,
+                        )
+                        status = resp.status
+                    except asyncio.TimeoutError:
+                        resp, status = None, "client_timeout"
+                    if status in (429, 503, 504, "client_timeout") and attempt < args.retries:
+                        retries += 1
+                        retry_after = resp.header("retry-after") if resp is not None else None
+                        backoff = float(retry_after) if retry_after else args.backoff * (2 ** attempt)
+                        await asyncio.sleep(backoff * random.uniform(0.5, 1.0))
+                        continue
+                    break
+            finally:
+                in_flight -= 1
+            latencies.append(time.perf_counter() - start)
+            statuses[str(status)] += 1
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        t0 = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(args.requests)))
+        elapsed = time.perf_counter() - t0
+
+    governor = get_governor()
+    return {
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "peak_in_flight": peak_in_flight,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(args.requests / elapsed, 1),
+        "retries": retries,
+        "statuses": dict(statuses),
+        "latency": latency_summary_ms(latencies),
+        "governor": governor.stats()["calls"] if governor is not None else None,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--profile", default=DEFAULT_PROFILE, help="JSON de SimulationConfig")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=1000)
+    parser.add_argument("--providers", default="aws,azure,gcp,onpremise,oracle")
+    parser.add_argument("--client-timeout", type=float, default=5.0, help="Timeout por intento (s)")
+    parser.add_argument("--retries", type=int, default=0)
+    parser.add_argument("--governor", help="JSON del governor de aprovisionamiento (opcional)")
+    parser.add_argument("--backoff", type=float, default=0.1, help="Backoff base exponencial (s)")
+    args = parser.parse_args(argv)
+    print(json.dumps(asyncio.run(_run(args)), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+"""
+Validación de regiones y opciones: catálogo de frozensets vs listas por petición.
+
+Genera N comprobaciones (proveedor, qué se valida, valor) mezclando valores
+válidos e inválidos y mide:
+- legacy: lo que hacían las factories antes del catálogo (región en lista,
+  locations/machine types/shapes reconstruidos en cada validación)
+- catalog: ProviderCatalog.has_region / allows (búsqueda en frozenset)
+- factories: los esquemas con los que validan las factories de GCP/Oracle/on-prem
+
+    python -m benchmarks.bench_region_validation --checks 1000000
+"""
+from __future__ import annotations
+import argparse
+import json
+import random
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+Check = Tuple[str, str, str]
+
+
+def _checks(n: int, invalid_ratio: float, seed: int) -> List[Check]:
+    from app.domain.catalog import PROVIDER_CATALOG
+
+    rng = random.Random(seed)
+    pool: List[Check] = []
+    for code, catalog in PROVIDER_CATALOG.items():
+        if not catalog.open_regions:
+            pool += [(code, "region", region) for region in catalog.region_list]
+        for option in catalog.options:
+            pool += [(code, option, value) for value in catalog.values(option)]
+    out = []
+    for _ in range(n):
+        code, kind, value = rng.choice(pool)
+        if rng.random() < invalid_ratio:
+            value = value + "-x"
+        out.append((code, kind, value))
+    return out
+
+
+def _legacy_validators() -> Dict[Tuple[str, str], Callable[[str], bool]]:
+    """Réplica de las comprobaciones previas al catálogo (listas y sets creados por llamada)."""
+    from app.domain.catalog import instance_type_names
+
+    aws_regions = {"us-east-1", "us-west-1", "us-west-2", "eu-west-1", "eu-central-1", "ap-southeast-1", "ap-northeast-1"}
+    azure_regions = {"eastus", "westus", "westus2", "northeurope", "westeurope", "southeastasia", "eastasia", "japaneast", "australiaeast"}
+    gcp_regions = ["us-central1", "us-east1", "us-west1", "us-west2", "europe-west1", "europe-west2", "asia-east1", "asia-southeast1"]
+    oracle_regions = [
+        "us-ashburn-1", "us-phoenix-1", "us-sanjose-1", "ca-toronto-1", "ca-montreal-1",
+        "eu-frankfurt-1", "eu-zurich-1", "eu-amsterdam-1", "uk-london-1", "ap-tokyo-1", "ap-osaka-1",
+        "ap-sydney-1", "ap-melbourne-1", "ap-mumbai-1",
+    ]
+    onprem = {
+        "hypervisors": ["vmware", "hyperv", "kvm", "xen"],
+        "database_engines": ["postgresql", "mysql", "oracle", "sqlserver"],
+        "load_balancer_types": ["nginx", "haproxy", "f5", "citrix"],
+        "storage_types": ["nfs", "smb", "iscsi", "fc"],
+    }
+    return {
+        ("aws", "region"): lambda v: v in aws_regions,
+        ("azure", "region"): lambda v: v in azure_regions,
+        ("gcp", "region"): lambda v: v in gcp_regions,
+        ("oracle", "region"): lambda v: v in oracle_regions,
+        ("gcp", "machine_types"): lambda v: v in instance_type_names("gcp"),
+        ("gcp", "database_engines"): lambda v: v in ["mysql", "postgres", "sqlserver"],
+        ("gcp", "load_balancer_types"): lambda v: v in ["HTTP(S)", "TCP", "UDP", "SSL"],
+        ("gcp", "storage_classes"): lambda v: v in ["STANDARD", "NEARLINE", "COLDLINE", "ARCHIVE"],
+        ("gcp", "locations"): lambda v: v in ["US", "EU", "ASIA"] + gcp_regions,
+        ("oracle", "compute_shapes"): lambda v: v in [
+            "VM.Standard2.1", "VM.Standard2.2", "VM.Standard2.4", "VM.Standard2.8", "VM.Standard2.16",
+            "VM.Standard3.Flex", "VM.Optimized3.Flex", "BM.Standard2.52", "BM.Standard3.64",
+            "VM.Standard.E3.Flex", "VM.Standard.E4.Flex",
+        ],
+        ("oracle", "database_workloads"): lambda v: v in ["OLTP", "DW", "AJD", "APEX"],
+        ("oracle", "load_balancer_shapes"): lambda v: v in ["10Mbps", "100Mbps", "400Mbps", "8000Mbps"],
+        ("oracle", "storage_tiers"): lambda v: v in ["Standard", "InfrequentAccess", "Archive"],
+        ("onprem", "hypervisors"): lambda v: v in onprem["hypervisors"],
+        ("onprem", "database_engines"): lambda v: v in onprem["database_engines"],
+        ("onprem", "load_balancer_types"): lambda v: v in onprem["load_balancer_types"],
+        ("onprem", "load_balancer_algorithms"): lambda v: v in ["round_robin", "least_conn", "ip_hash", "least_time"],
+        ("onprem", "storage_types"): lambda v: v in onprem["storage_types"],
+    }
+
+
+def _best(fn: Callable[[], object], repeat: int) -> Tuple[float, object]:
+    samples, result = [], None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        samples.append(time.perf_counter() - t0)
+    return min(samples), result
+
+
+def _bench_checks(args) -> dict:
+    from app.domain.catalog import PROVIDER_CATALOG
+
+    checks = _checks(args.checks, args.invalid_ratio, args.seed)
+    legacy = _legacy_validators()
+    legacy_calls = [(legacy[(code, kind)], value) for code, kind, value in checks]
+
+    def run_catalog() -> List[bool]:
+        out = []
+        for code, kind, value in checks:
+            catalog = PROVIDER_CATALOG[code]
+            out.append(catalog.has_region(value) if kind == "region" else catalog.allows(kind, value))
+        return out
+
+    def run_legacy() -> List[bool]:
+        return [fn(value) for fn, value in legacy_calls]
+
+    catalog_s, catalog_result = _best(run_catalog, args.repeat)
+    legacy_s, legacy_result = _best(run_legacy, args.repeat)
+    by_kind: Dict[str, int] = {}
+    for _, kind, _ in checks:
+        by_kind[kind] = by_kind.get(kind, 0) + 1
+    return {
+        "checks": args.checks,
+        "invalid_ratio": args.invalid_ratio,
+        "by_kind": dict(sorted(by_kind.items())),
+        "legacy_s": round(legacy_s, 4),
+        "catalog_s": round(catalog_s, 4),
+        "catalog_checks_per_s": round(args.checks / catalog_s),
+        "speedup": round(legacy_s / catalog_s, 1),
+        "results_match": legacy_result == catalog_result,
+        "valid": sum(catalog_result),
+    }
+
+
+def _bench_factories(args) -> dict:
+    from app.domain.validation import get_config_schema
+
+    cases = {
+        "gcp_vm": (get_config_schema("gcp", "virtual_machine"), {"machine_type": "n2-standard-4"}),
+        "gcp_storage": (get_config_schema("gcp", "storage"), {"storage_class": "COLDLINE", "location": "asia-southeast1"}),
+        "oracle_vm": (get_config_schema("oracle", "virtual_machine"), {
+            "compute_shape": "VM.Standard.E4.Flex", "compartment_id": "c", "availability_domain": "AD-1",
+            "subnet_id": "s", "image_id": "i",
+        }),
+        "onprem_lb": (get_config_schema("onprem", "load_balancer"), {"type": "haproxy", "algorithm": "least_time"}),
+    }
+    out = {}
+    for name, (schema, config) in cases.items():
+        n = args.factory_calls
+
+        def run() -> None:
+            for _ in range(n):
+                schema.validate(config)
+
+        best, _ = _best(run, args.repeat)
+        out[name] = {"calls": n, "best_s": round(best, 4), "us_per_call": round(best / n * 1e6, 3)}
+    return out
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--checks", type=int, default=1_000_000)
+    parser.add_argument("--invalid-ratio", type=float, default=0.2, help="Fracción de valores inválidos")
+    parser.add_argument("--factory-calls", type=int, default=200_000, help="Llamadas por validador de factory (0 = omitir)")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeticiones (se reporta la mejor)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+    result = {"checks": _bench_checks(args)}
+    if args.factory_calls:
+        result["factories"] = _bench_factories(args)
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""
+Coste del trazado por petición.
+
+- span: ns por span() dentro de una traza activa y fuera de ella (span nulo)
+- endpoint: POST /cloud/infrastructure/create por segundo contra la app ASGI en
+  proceso con el trazado desactivado, muestreando todo y muestreando el 10 %
+
+    python -m benchmarks.bench_tracing --requests 5000 --concurrency 32
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import sys
+import time
+from typing import Dict, List
+
+PROVIDERS = {"aws": "us-east-1", "azure": "eastus", "gcp": "us-central1", "oracle": "us-ashburn-1"}
+
+
+def _bench_span(ops: int) -> Dict[str, float]:
+    from app.infrastructure.tracing import Tracer, span
+
+    def loop() -> float:
+        t0 = time.perf_counter()
+        for _ in range(ops):
+            with span("bench"):
+                pass
+        return time.perf_counter() - t0
+
+    outside = min(loop() for _ in range(3))
+    # Traza con cupo de sobra para que ningún span se descarte
+    root = Tracer(sample_rate=1.0, max_spans=ops * 3 + 1).start_trace("bench")
+    with root:
+        inside = min(loop() for _ in range(3))
+    return {"ops": ops, "noop_ns": round(outside / ops * 1e9, 1), "traced_ns": round(inside / ops * 1e9, 1)}
+
+
+def _bodies(n: int) -> List[dict]:
+    providers = list(PROVIDERS)
+    return [
+        {"provider": providers[i % len(providers)], "name": f"bench-{i}", "region": PROVIDERS[providers[i % len(providers)]]}
+        for i in range(n)
+    ]
+
+
+async def _bench_endpoint(client, bodies: List[dict], concurrency: int) -> Dict[str, float]:
+    sem = asyncio.Semaphore(concurrency)
+    errors = 0
+
+    async def one(body: dict) -> None:
+        nonlocal errors
+        async with sem:
+            resp = await client.request("POST", "/cloud/infrastructure/create", json_body=body, keep_body=False)
+            if resp.status != 200:
+                errors += 1
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(one(b) for b in bodies))
+    elapsed = time.perf_counter() - t0
+    return {"requests": len(bodies), "errors": errors, "rps": round(len(bodies) / elapsed, 1)}
+
+
+async def _run(args) -> dict:
+    with contextlib.redirect_stdout(io.StringIO()):
+        from app.main import app
+        from app.api.tracing import instrument_fastapi
+        from app.infrastructure.factory_tracing import enable_factory_tracing
+        from app.infrastructure.tracing import Tracer, disable_tracing, enable_tracing
+        from benchmarks.asgi_client import ASGIClient
+
+    result = {"span": _bench_span(args.span_ops)}
+    client = ASGIClient(app)
+    bodies = _bodies(args.requests)
+    endpoint = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        await _bench_endpoint(client, bodies[:200], args.concurrency)  # calentamiento
+        for label, sample_rate in (("off", None), ("sampled_100", 1.0), ("sampled_10", 0.1)):
+            if sample_rate is None:
+                disable_tracing()
+            else:
+                # Lo que hace el arranque con VM_API_TRACING; "off" mide la app sin parches
+                instrument_fastapi()
+                enable_factory_tracing()
+                enable_tracing(Tracer(sample_rate=sample_rate, seed=1))
+            endpoint[label] = await _bench_endpoint(client, bodies, args.concurrency)
+    endpoint["overhead_100_pct"] = round((endpoint["off"]["rps"] / endpoint["sampled_100"]["rps"] - 1) * 100, 1)
+    endpoint["overhead_10_pct"] = round((endpoint["off"]["rps"] / endpoint["sampled_10"]["rps"] - 1) * 100, 1)
+    result["endpoint"] = endpoint
+    return result
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--span-ops", type=int, default=200_000)
+    args = parser.parse_args(argv)
+    print(json.dumps(asyncio.run(_run(args)), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
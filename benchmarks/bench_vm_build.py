@@ -0,0 +1,117 @@
+"""
+Throughput de POST /vm/build con y sin planes Builder/Director memoizados.
+
+Mide dos niveles:
+- config: resolución del config por petición (Director + Builder completo vs plan
+  memoizado + estampado de región), sin HTTP.
+- endpoint: peticiones POST /vm/build por segundo contra la app ASGI en proceso,
+  con el plan memoizado y con el camino sin memoizar (los servicios se parchean
+  sólo durante la medición).
+
+    python -m benchmarks.bench_vm_build --requests 20000 --concurrency 64
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import contextlib
+import io
+import itertools
+import json
+import sys
+import time
+from typing import Callable, Dict, List
+
+PROVIDERS = {
+    "aws": "us-east-1",
+    "azure": "eastus",
+    "gcp": "us-central1",
+    "onpremise": "datacenter-1",
+    "oracle": "us-ashburn-1",
+}
+TIERS = ("small", "medium", "large", "xlarge")
+
+
+def _bodies(n: int) -> List[dict]:
+    shapes = list(itertools.product(PROVIDERS, TIERS))
+    return [
+        {"name": f"bench-{i}", "provider": p, "region": PROVIDERS[p], "tier": t, "firewall_rules": ["22/tcp"]}
+        for i, (p, t) in zip(range(n), itertools.cycle(shapes))
+    ]
+
+
+def _bench_config(bodies: List[dict], repeat: int) -> Dict[str, float]:
+    from app.domain.schemas import VMBuildRequest
+    from app.domain.builders import build_vm_config, construct_vm_config
+
+    requests = [VMBuildRequest(**b) for b in bodies]
+    out = {}
+    for label, fn in (("director", construct_vm_config), ("plan", build_vm_config)):
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            for req in requests:
+                fn(req)
+        elapsed = time.perf_counter() - t0
+        out[f"{label}_ops_per_s"] = round(repeat * len(requests) / elapsed, 1)
+    out["speedup"] = round(out["plan_ops_per_s"] / out["director_ops_per_s"], 2)
+    return out
+
+
+@contextlib.contextmanager
+def _patched_config(fn: Callable):
+    import app.domain.services.vm_service as vm_service
+
+    original = vm_service.build_vm_config
+    vm_service.build_vm_config = fn
+    try:
+        yield
+    finally:
+        vm_service.build_vm_config = original
+
+
+async def _bench_endpoint(client, bodies: List[dict], concurrency: int) -> Dict[str, float]:
+    sem = asyncio.Semaphore(concurrency)
+    errors = 0
+
+    async def one(body: dict) -> None:
+        nonlocal errors
+        async with sem:
+            resp = await client.request("POST", "/vm/build", json_body=body, keep_body=False)
+            if resp.status != 200:
+                errors += 1
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(one(b) for b in bodies))
+    elapsed = time.perf_counter() - t0
+    return {"requests": len(bodies), "errors": errors, "elapsed_s": round(elapsed, 3), "rps": round(len(bodies) / elapsed, 1)}
+
+
+async def _run(args) -> dict:
+    with contextlib.redirect_stdout(io.StringIO()):
+        from app.main import app
+        from app.domain.builders import construct_vm_config
+        from benchmarks.asgi_client import ASGIClient
+
+    bodies = _bodies(args.requests)
+    result = {"config": _bench_config(bodies[:1000], args.config_repeat)}
+    client = ASGIClient(app)
+    with contextlib.redirect_stdout(io.StringIO()):
+        await _bench_endpoint(client, bodies[:200], args.concurrency)  # calentamiento
+        with _patched_config(construct_vm_config):
+            director = await _bench_endpoint(client, bodies, args.concurrency)
+        plan = await _bench_endpoint(client, bodies, args.concurrency)
+    result["endpoint"] = {"director": director, "plan": plan, "speedup": round(plan["rps"] / director["rps"], 3)}
+    return result
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=10000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--config-repeat", type=int, default=50, help="Repeticiones de 1000 configs en la medición sin HTTP")
+    args = parser.parse_args(argv)
+    print(json.dumps(asyncio.run(_run(args)), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+"""
+Esperar a que una VM arranque: sondear GET /vm/{id} frente a /vm/watch/poll.
+
+--waiters clientes esperan cada uno a que su VM pase a `running`; un
+aprovisionador las arranca (POST /vm/{id}/action start) repartidas a lo largo
+de --spread segundos. Con polling cada cliente pide GET /vm/{id} cada
+--interval ms; con watch pide GET /vm/{id} una vez y después long-poll con
+selector status=running. Por modo: peticiones, CPU del proceso y latencia
+desde el arranque hasta que el cliente lo ve. También mide lo que cuesta
+publicar un evento según el número de suscriptores.
+
+    python -m benchmarks.bench_watch --waiters 1000 --spread 2 --interval 50
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Any, Dict, List
+
+from benchmarks.suite import _vm_dtos, audit_redirected
+
+
+def _reset_fleet(n: int) -> List[str]:
+    from app.core.container import get_vm_service
+
+    repo = get_vm_service().repo
+    for vm in repo.list():
+        repo.delete(vm.id)
+    vms = _vm_dtos(n)
+    for vm in vms:
+        vm.status = "stopped"
+    repo.save_many(vms)
+    return [vm.id for vm in vms]
+
+
+async def _provision(client, ids: List[str], spread_s: float, started: Dict[str, float]) -> None:
+    """Arranca las VMs en orden aleatorio repartidas en spread_s segundos."""
+    order = list(ids)
+    random.Random(7).shuffle(order)
+    t0 = time.perf_counter()
+    for i, vm_id in enumerate(order):
+        delay = t0 + spread_s * i / len(order) - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        started[vm_id] = time.perf_counter()
+        resp = await client.request("POST", f"/vm/{vm_id}/action", json_body={"action": "start"})
+        assert resp.status == 200, resp.status
+
+
+async def _wait_polling(client, vm_id: str, interval_s: float, counts: Dict[str, int]) -> float:
+    while True:
+        resp = await client.request("GET", f"/vm/{vm_id}")
+        counts["requests"] += 1
+        if resp.json()["vm"]["status"] == "running":
+            return time.perf_counter()
+        await asyncio.sleep(interval_s)
+
+
+async def _wait_watch(client, vm_id: str, counts: Dict[str, int]) -> float:
+    resp = await client.request("GET", f"/vm/{vm_id}")
+    counts["requests"] += 1
+    if resp.json()["vm"]["status"] == "running":
+        return time.perf_counter()
+    since = resp.header("X-Watch-Seq")
+    while True:
+        resp = await client.request(
+            "GET", "/vm/watch/poll", query=f"vm_id={vm_id}&selector=status=running&since={since}&wait=60"
+        )
+        counts["requests"] += 1
+        page = resp.json()
+        if page["events"]:
+            return time.perf_counter()
+        since = page["next_since"]
+
+
+async def _run_mode(mode: str, args) -> Dict[str, Any]:
+    from app.main import app
+    from benchmarks.asgi_client import ASGIClient
+
+    ids = _reset_fleet(args.waiters)
+    client = ASGIClient(app)
+    counts = {"requests": 0}
+    started: Dict[str, float] = {}
+    interval_s = args.interval / 1000
+
+    async def waiter(vm_id: str) -> float:
+        if mode == "poll":
+            seen = await _wait_polling(client, vm_id, interval_s, counts)
+        else:
+            seen = await _wait_watch(client, vm_id, counts)
+        return seen - started[vm_id]
+
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    waiters = [asyncio.create_task(waiter(vm_id)) for vm_id in ids]
+    # Los clientes ya están esperando cuando empiezan los arranques
+    await asyncio.sleep(0.05)
+    await _provision(client, ids, args.spread, started)
+    latencies = sorted(await asyncio.gather(*waiters))
+    cpu, wall = time.process_time() - cpu0, time.perf_counter() - wall0
+    return {
+        "mode": mode,
+        "waiters": args.waiters,
+        "requests": counts["requests"],
+        "requests_per_waiter": round(counts["requests"] / args.waiters, 1),
+        "cpu_s": round(cpu, 3),
+        "wall_s": round(wall, 3),
+        "detect_ms_mean": round(statistics.mean(latencies) * 1000, 2),
+        "detect_ms_p99": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 2),
+    }
+
+
+async def _bench_fanout(args) -> List[Dict[str, Any]]:
+    """µs por publish con N suscriptores de otras VMs (el selector descarta el evento) y de toda la flota."""
+    from app.infrastructure.vm_watch import VMWatchHub, WatchSelector
+
+    vm = _vm_dtos(1)[0]
+    rows = []
+    for subscribers in args.subscribers:
+        row: Dict[str, Any] = {"subscribers": subscribers}
+        for label, selector in (("other_vm", WatchSelector(vm_id="i-other")), ("fleet", WatchSelector())):
+            hub = VMWatchHub(queue_size=args.ops + 1)
+            subs = [hub._subscribe(selector) for _ in range(subscribers)]
+            t0 = time.perf_counter()
+            for _ in range(args.ops):
+                hub.publish("updated", vm, "running")
+            row[f"publish_us_{label}"] = round((time.perf_counter() - t0) / args.ops * 1e6, 2)
+            for sub in subs:
+                hub._unsubscribe(sub)
+        rows.append(row)
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--waiters", type=int, default=1000)
+    parser.add_argument("--spread", type=float, default=2.0, help="segundos en los que se reparten los arranques")
+    parser.add_argument("--interval", type=float, default=50.0, help="ms entre GET /vm/{id} en modo polling")
+    parser.add_argument("--subscribers", type=lambda v: [int(x) for x in v.split(",")], default=[0, 10, 100, 1000])
+    parser.add_argument("--ops", type=int, default=2000, help="publish por medición de fan-out")
+    args = parser.parse_args(argv)
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        import app.main  # noqa: F401
+
+        with audit_redirected(os.devnull):
+            result = {
+                "wait_for_running": [asyncio.run(_run_mode(mode, args)) for mode in ("poll", "watch")],
+                "fanout": asyncio.run(_bench_fanout(args)),
+            }
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
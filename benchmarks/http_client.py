@@ -0,0 +1,127 @@
+"""
+Cliente HTTP/1.1 mínimo para medir contra un servidor local (uvicorn).
+
+Misma interfaz que ASGIClient (request() devuelve un ASGIResponse), así que
+los generadores de carga pueden apuntar a la app en proceso o a
+http://localhost:8000 sin cambiar nada. Conexiones keep-alive en un pool
+acotado; entiende Content-Length y Transfer-Encoding: chunked. Sin TLS.
+"""
+from __future__ import annotations
+import asyncio
+import json
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from benchmarks.asgi_client import ASGIResponse
+
+Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class HTTPClient:
+    def __init__(self, base_url: str, max_connections: int = 64):
+        parts = urlsplit(base_url)
+        if parts.scheme != "http":
+            raise ValueError("Solo se soporta http:// (servidor local)")
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port or 80
+        self.base_path = parts.path.rstrip("/")
+        self._idle: List[Connection] = []
+        self._slots = asyncio.Semaphore(max_connections)
+
+    async def _connect(self) -> Connection:
+        if self._idle:
+            return self._idle.pop()
+        return await asyncio.open_connection(self.host, self.port)
+
+    async def close(self) -> None:
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        query: str = "",
+        json_body: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        keep_body: bool = True,
+    ) -> ASGIResponse:
+        body = json.dumps(json_body).encode("utf-8") if json_body is not None else b""
+        target = self.base_path + path + (f"?{query}" if query else "")
+        lines = [f"{method.upper()} {target} HTTP/1.1", f"host: {self.host}:{self.port}", f"content-length: {len(body)}"]
+        if json_body is not None:
+            lines.append("content-type: application/json")
+        for k, v in (headers or {}).items():
+            lines.append(f"{k}: {v}")
+        raw = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+        async with self._slots:
+            response = ASGIResponse()
+            start = time.perf_counter()
+            reader, writer = await self._connect()
+            try:
+                writer.write(raw)
+                await writer.drain()
+                reusable = await self._read_response(reader, response, keep_body, start)
+            except BaseException:
+                writer.close()
+                raise
+            if reusable:
+                self._idle.append((reader, writer))
+            else:
+                writer.close()
+        response.total_s = time.perf_counter() - start
+        if response.ttfb_s is None:
+            response.ttfb_s = response.total_s
+        return response
+
+    async def _read_response(self, reader: asyncio.StreamReader, response: ASGIResponse, keep_body: bool, start: float) -> bool:
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("Conexión cerrada por el servidor")
+        response.status = int(status_line.split()[1])
+        length: Optional[int] = None
+        chunked = False
+        keep_alive = True
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            name, value = name.strip().lower(), value.strip()
+            response.headers.append((name.encode("latin-1"), value.encode("latin-1")))
+            if name == "content-length":
+                length = int(value)
+            elif name == "transfer-encoding" and "chunked" in value.lower():
+                chunked = True
+            elif name == "connection" and value.lower() == "close":
+                keep_alive = False
+
+        def consume(chunk: bytes) -> None:
+            if not chunk:
+                return
+            if response.ttfb_s is None:
+                response.ttfb_s = time.perf_counter() - start
+            response.chunks += 1
+            response.body_bytes += len(chunk)
+            if keep_body:
+                response.body.extend(chunk)
+
+        if chunked:
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                consume(await reader.readexactly(size))
+                await reader.readline()
+        elif length is not None:
+            consume(await reader.readexactly(length) if length else b"")
+        else:
+            # Sin longitud ni chunked: el cuerpo llega hasta que el servidor cierra
+            consume(await reader.read())
+            keep_alive = False
+        return keep_alive
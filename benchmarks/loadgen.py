@@ -0,0 +1,456 @@
+"""
+Generador de carga con mezclas de operaciones realistas.
+
+Tres modos:
+- run: usuarios virtuales en bucle cerrado que eligen operación y proveedor
+  según los pesos del perfil y esperan un think time exponencial entre
+  peticiones (perfil de ejemplo en benchmarks/profiles/workload.json)
+- record: convierte el log de auditoría en una carga reproducible (JSONL con
+  el instante relativo de cada operación)
+- replay: relanza una carga grabada en bucle abierto a --speed N× (cada
+  operación sale a su hora aunque las anteriores no hayan terminado)
+
+Por defecto habla con la app ASGI en proceso (la auditoría va a un fichero
+temporal, que es también el que leen las consultas de logs); con --url mide
+contra un servidor local. Reporta por endpoint throughput, p50/p95/p99 y
+tasa de error.
+
+    python -m benchmarks.loadgen run --profile benchmarks/profiles/workload.json --duration 30 --users 50
+    python -m benchmarks.loadgen record --audit-log logs/audit.log --out data/bench/workload.jsonl
+    python -m benchmarks.loadgen replay data/bench/workload.jsonl --speed 10 --url http://localhost:8000
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import collections
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from benchmarks.stats import latency_summary_ms
+from benchmarks.suite import CLOUD_REGIONS, TIERS, VM_PARAMS, VM_PROVIDERS, audit_redirected
+
+DEFAULT_PROFILE = os.path.join(os.path.dirname(__file__), "profiles", "workload.json")
+OPERATIONS = (
+    "vm.create", "vm.build", "infrastructure.create", "vm.action", "vm.update",
+    "vm.delete", "vm.get", "vm.list", "logs.query", "logs.stats",
+)
+# Operaciones que actúan sobre una VM existente del pool
+_NEEDS_VM = frozenset({"vm.action", "vm.update", "vm.delete", "vm.get"})
+_CLOUD_PROVIDER = {vm: cloud for cloud, vm in VM_PROVIDERS.items()}
+_AUDIT_OPS = {
+    "create": "vm.create",
+    "create(builder)": "vm.build",
+    "create_infrastructure": "infrastructure.create",
+    "update": "vm.update",
+    "delete": "vm.delete",
+    "start": "vm.action",
+    "stop": "vm.action",
+    "restart": "vm.action",
+}
+
+Request = Tuple[str, str, str, Optional[Dict[str, Any]]]
+
+
+class Workload:
+    """Perfil de carga: pesos por operación y proveedor, usuarios y think time."""
+
+    def __init__(
+        self,
+        mix: Dict[str, float],
+        providers: Dict[str, float],
+        users: int = 20,
+        duration_s: float = 30.0,
+        think_time_ms: float = 100.0,
+        seed_vms: int = 50,
+        seed: Optional[int] = None,
+    ):
+        unknown = set(mix) - set(OPERATIONS)
+        if unknown:
+            raise ValueError(f"Operaciones desconocidas en mix: {sorted(unknown)}")
+        unknown = set(providers) - set(VM_PARAMS)
+        if unknown:
+            raise ValueError(f"Proveedores desconocidos: {sorted(unknown)} (válidos: {sorted(VM_PARAMS)})")
+        if not mix or not providers:
+            raise ValueError("mix y providers no pueden estar vacíos")
+        self.mix = mix
+        self.providers = providers
+        self.users = users
+        self.duration_s = duration_s
+        self.think_time_ms = think_time_ms
+        self.seed_vms = seed_vms
+        self.seed = seed
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Workload":
+        return cls(**data)
+
+    @classmethod
+    def from_file(cls, path: str) -> "Workload":
+        with open(path, "r", encoding="utf-8") as fh:
+            return cls.from_dict(json.load(fh))
+
+
+class EndpointStats:
+    __slots__ = ("latencies", "statuses", "errors")
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.statuses: collections.Counter = collections.Counter()
+        self.errors = 0
+
+    def record(self, status: int, latency_s: float) -> None:
+        self.latencies.append(latency_s)
+        self.statuses[status] += 1
+        # status 0: fallo de transporte (conexión rechazada, timeout...)
+        if status == 0 or status >= 400:
+            self.errors += 1
+
+    def summary(self, elapsed_s: float) -> Dict[str, Any]:
+        n = len(self.latencies)
+        return {
+            "requests": n,
+            "rps": round(n / elapsed_s, 1) if elapsed_s else 0.0,
+            "errors": self.errors,
+            "error_rate": round(self.errors / n, 4) if n else 0.0,
+            "statuses": {str(k): v for k, v in sorted(self.statuses.items())},
+            "latency": latency_summary_ms(self.latencies),
+        }
+
+
+class VMPool:
+    """VMs vivas conocidas por el generador (ids creados durante la carga)."""
+
+    def __init__(self, rng: random.Random):
+        self._rng = rng
+        self._ids: List[str] = []
+        self._index: Dict[str, int] = {}
+        # id grabado en la auditoría -> id creado en el replay
+        self.aliases: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, vm_id: str) -> None:
+        if vm_id not in self._index:
+            self._index[vm_id] = len(self._ids)
+            self._ids.append(vm_id)
+
+    def remove(self, vm_id: str) -> None:
+        index = self._index.pop(vm_id, None)
+        if index is None:
+            return
+        last = self._ids.pop()
+        if last != vm_id:
+            self._ids[index] = last
+            self._index[last] = index
+
+    def pick(self, recorded_id: Optional[str] = None) -> Optional[str]:
+        if recorded_id is not None:
+            alias = self.aliases.get(recorded_id)
+            if alias is not None and alias in self._index:
+                return alias
+        return self._rng.choice(self._ids) if self._ids else None
+
+
+def build_request(op: str, provider: str, rng: random.Random, vm_id: Optional[str] = None, event: Optional[Dict[str, Any]] = None) -> Request:
+    """(método, ruta, query, body) de una operación; `provider` con los valores de /vm (onpremise)."""
+    event = event or {}
+    n = rng.getrandbits(32)
+    cloud = _CLOUD_PROVIDER[provider]
+    if op == "vm.create":
+        return "POST", "/vm/create", "", {"name": f"load-{n:08x}", "provider": provider, "params": VM_PARAMS[provider]}
+    if op == "vm.build":
+        region = event.get("region") or CLOUD_REGIONS[cloud]
+        tier = event.get("tier") or rng.choice(TIERS)
+        return "POST", "/vm/build", "", {"name": f"load-{n:08x}", "provider": provider, "region": region, "tier": tier}
+    if op == "infrastructure.create":
+        body: Dict[str, Any] = {"provider": cloud, "name": f"load-{n:08x}", "region": CLOUD_REGIONS[cloud]}
+        if cloud == "onprem":
+            body["vm_config"] = {"nic": "vmxnet3"}
+        return "POST", "/cloud/infrastructure/create", "", body
+    if op == "vm.action":
+        return "POST", f"/vm/{vm_id}/action", "", {"action": event.get("action") or rng.choice(("start", "stop", "restart"))}
+    if op == "vm.update":
+        return "PUT", f"/vm/{vm_id}", "", {"name": f"load-{n:08x}"}
+    if op == "vm.delete":
+        return "DELETE", f"/vm/{vm_id}", "", None
+    if op == "vm.get":
+        return "GET", f"/vm/{vm_id}", "", None
+    if op == "vm.list":
+        return "GET", "/vm/", "", None
+    if op == "logs.query":
+        return "GET", "/api/logs", f"provider={provider}&page_size=50", None
+    if op == "logs.stats":
+        return "GET", "/api/logs/stats", "", None
+    raise ValueError(f"Operación desconocida: {op}")
+
+
+class LoadRunner:
+    """Ejecuta operaciones contra el cliente y acumula estadísticas por operación."""
+
+    def __init__(self, client, pool: VMPool, rng: random.Random):
+        self.client = client
+        self.pool = pool
+        self.rng = rng
+        self.stats: Dict[str, EndpointStats] = collections.defaultdict(EndpointStats)
+        self.skipped: collections.Counter = collections.Counter()
+
+    async def execute(self, op: str, provider: str, event: Optional[Dict[str, Any]] = None, record: bool = True) -> None:
+        vm_id = None
+        if op in _NEEDS_VM:
+            vm_id = self.pool.pick((event or {}).get("vm_id"))
+            if vm_id is None:
+                self.skipped[op] += 1
+                return
+            if op == "vm.delete":
+                # Fuera del pool antes de enviar: nadie más la elige mientras tanto
+                self.pool.remove(vm_id)
+        method, path, query, body = build_request(op, provider, self.rng, vm_id, event)
+        creates = op in ("vm.create", "vm.build")
+        t0 = time.perf_counter()
+        try:
+            resp = await self.client.request(method, path, query=query, json_body=body, keep_body=creates)
+            status = resp.status
+        except (OSError, asyncio.IncompleteReadError, ConnectionError):
+            status = 0
+        latency = time.perf_counter() - t0
+        if record:
+            self.stats[op].record(status, latency)
+        if creates and status == 200:
+            new_id = resp.json()["vm"]["id"]
+            self.pool.add(new_id)
+            if event and event.get("vm_id"):
+                self.pool.aliases[event["vm_id"]] = new_id
+
+    def report(self, elapsed_s: float) -> Dict[str, Any]:
+        total = EndpointStats()
+        for stats in self.stats.values():
+            total.latencies.extend(stats.latencies)
+            total.statuses.update(stats.statuses)
+            total.errors += stats.errors
+        return {
+            "elapsed_s": round(elapsed_s, 3),
+            "total": total.summary(elapsed_s),
+            "endpoints": {op: self.stats[op].summary(elapsed_s) for op in OPERATIONS if op in self.stats},
+            "skipped_no_vm": dict(self.skipped),
+            "live_vms": len(self.pool),
+        }
+
+
+def _weighted(rng: random.Random, weights: Dict[str, float]) -> Iterator[str]:
+    keys = list(weights)
+    values = [weights[k] for k in keys]
+    while True:
+        yield from rng.choices(keys, values, k=256)
+
+
+async def _seed_pool(runner: LoadRunner, workload: Workload) -> None:
+    providers = _weighted(runner.rng, workload.providers)
+    for _ in range(workload.seed_vms):
+        await runner.execute("vm.create", next(providers), record=False)
+
+
+async def run_workload(client, workload: Workload, duration_s: Optional[float] = None, users: Optional[int] = None) -> Dict[str, Any]:
+    rng = random.Random(workload.seed)
+    runner = LoadRunner(client, VMPool(rng), rng)
+    await _seed_pool(runner, workload)
+    duration_s = duration_s or workload.duration_s
+    users = users or workload.users
+    ops = _weighted(rng, workload.mix)
+    providers = _weighted(rng, workload.providers)
+    think_s = workload.think_time_ms / 1000.0
+    deadline = time.perf_counter() + duration_s
+
+    async def user() -> None:
+        while time.perf_counter() < deadline:
+            await runner.execute(next(ops), next(providers))
+            if think_s > 0:
+                await asyncio.sleep(rng.expovariate(1.0 / think_s))
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(user() for _ in range(users)))
+    report = runner.report(time.perf_counter() - t0)
+    report["users"] = users
+    report["think_time_ms"] = workload.think_time_ms
+    return report
+
+
+def record_audit_log(path: str, only_success: bool = False, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """Eventos de carga (t relativo en segundos) a partir de las líneas de auditoría."""
+    origin: Optional[datetime] = None
+    emitted = 0
+    with open(path, "r", encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            op = _AUDIT_OPS.get(entry.get("action"))
+            provider = entry.get("provider")
+            if op is None or (only_success and not entry.get("success")):
+                continue
+            if provider not in VM_PARAMS:
+                # "onprem" de las infraestructuras; "unknown" (errores de los controladores) queda sin proveedor
+                provider = VM_PROVIDERS.get(provider)
+            at = datetime.fromisoformat(entry["timestamp"].rstrip("Z"))
+            if origin is None:
+                origin = at
+            event: Dict[str, Any] = {"t": round((at - origin).total_seconds(), 6), "op": op}
+            if provider is not None:
+                event["provider"] = provider
+            vm_id = entry.get("vm_id")
+            if vm_id and vm_id not in ("multiple", "n/a"):
+                event["vm_id"] = vm_id
+            if op == "vm.action":
+                event["action"] = entry["action"]
+            details = entry.get("details") or {}
+            if op == "vm.build":
+                for key in ("tier", "region"):
+                    if key in details:
+                        event[key] = details[key]
+            yield event
+            emitted += 1
+            if limit is not None and emitted >= limit:
+                return
+
+
+async def replay_workload(client, events: List[Dict[str, Any]], speed: float, max_in_flight: int, seed: Optional[int] = None, seed_vms: int = 50) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    runner = LoadRunner(client, VMPool(rng), rng)
+    providers = list(VM_PARAMS)
+    await _seed_pool(runner, Workload({"vm.create": 1}, {p: 1 for p in providers}, seed_vms=seed_vms))
+    sem = asyncio.Semaphore(max_in_flight)
+    lags: List[float] = []
+    tasks = []
+
+    async def fire(event: Dict[str, Any]) -> None:
+        try:
+            await runner.execute(event["op"], event.get("provider") or rng.choice(providers), event)
+        finally:
+            sem.release()
+
+    t0 = time.perf_counter()
+    for event in events:
+        due = t0 + event["t"] / speed
+        delay = due - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        await sem.acquire()
+        # Retraso frente a lo programado: si crece, el generador (o --max-in-flight) es el cuello
+        lags.append(max(time.perf_counter() - due, 0.0))
+        tasks.append(asyncio.create_task(fire(event)))
+    await asyncio.gather(*tasks)
+    report = runner.report(time.perf_counter() - t0)
+    report["speed"] = speed
+    report["events"] = len(events)
+    report["recorded_span_s"] = events[-1]["t"] if events else 0.0
+    report["schedule_lag"] = latency_summary_ms(lags)
+    return report
+
+
+@contextlib.contextmanager
+def _in_process_app():
+    """App en proceso con la auditoría (escrita y consultada) en un fichero temporal."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        from app.main import app
+        from app.api.logs_controller import log_service
+    original_path = log_service.log_file_path
+    with tempfile.TemporaryDirectory(prefix="vm-api-load-") as directory:
+        path = os.path.join(directory, "audit.log")
+        log_service.log_file_path = path
+        try:
+            with audit_redirected(path):
+                yield app
+        finally:
+            log_service.log_file_path = original_path
+
+
+async def _with_client(args, fn):
+    if args.url:
+        from benchmarks.http_client import HTTPClient
+
+        client = HTTPClient(args.url, max_connections=args.connections)
+        try:
+            return await fn(client)
+        finally:
+            await client.close()
+    from benchmarks.asgi_client import ASGIClient
+
+    with _in_process_app() as app, open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        return await fn(ASGIClient(app))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def target(p: argparse.ArgumentParser) -> None:
+        p.add_argument("--url", help="Servidor local (http://localhost:8000); por defecto la app en proceso")
+        p.add_argument("--connections", type=int, default=64, help="Conexiones keep-alive con --url")
+        p.add_argument("--out", help="Guarda el informe JSON")
+
+    run_p = sub.add_parser("run", help="Mezcla de operaciones con usuarios virtuales")
+    run_p.add_argument("--profile", default=DEFAULT_PROFILE)
+    run_p.add_argument("--duration", type=float, help="Segundos (sustituye al del perfil)")
+    run_p.add_argument("--users", type=int, help="Usuarios virtuales (sustituye al del perfil)")
+    target(run_p)
+
+    record_p = sub.add_parser("record", help="Graba una carga desde el log de auditoría")
+    record_p.add_argument("--audit-log", default=os.path.join("logs", "audit.log"))
+    record_p.add_argument("--out", required=True)
+    record_p.add_argument("--only-success", action="store_true")
+    record_p.add_argument("--limit", type=int)
+
+    replay_p = sub.add_parser("replay", help="Reproduce una carga grabada a N× velocidad")
+    replay_p.add_argument("workload")
+    replay_p.add_argument("--speed", type=float, default=1.0)
+    replay_p.add_argument("--max-in-flight", type=int, default=1000)
+    replay_p.add_argument("--seed", type=int, default=42)
+    replay_p.add_argument("--seed-vms", type=int, default=50, help="VMs creadas antes (para acciones sobre VMs ya existentes al grabar)")
+    target(replay_p)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        directory = os.path.dirname(args.out)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        ops: collections.Counter = collections.Counter()
+        last_t = 0.0
+        with open(args.out, "w", encoding="utf-8") as fh:
+            for event in record_audit_log(args.audit_log, args.only_success, args.limit):
+                fh.write(json.dumps(event) + "\n")
+                ops[event["op"]] += 1
+                last_t = event["t"]
+        print(json.dumps({"out": args.out, "events": sum(ops.values()), "span_s": last_t, "ops": dict(ops)}, indent=2))
+        return 0
+
+    if args.command == "run":
+        workload = Workload.from_file(args.profile)
+        report = asyncio.run(_with_client(args, lambda client: run_workload(client, workload, args.duration, args.users)))
+    else:
+        if args.speed <= 0:
+            parser.error("--speed debe ser > 0")
+        with open(args.workload, "r", encoding="utf-8") as fh:
+            events = [json.loads(line) for line in fh if line.strip()]
+        report = asyncio.run(_with_client(
+            args, lambda client: replay_workload(client, events, args.speed, args.max_in_flight, args.seed, args.seed_vms)
+        ))
+    report["target"] = args.url or "in-process"
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
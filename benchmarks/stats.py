@@ -0,0 +1,25 @@
+"""Utilidades estadísticas compartidas por los benchmarks."""
+from __future__ import annotations
+from typing import Dict, Sequence
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Percentil por rango más cercano sobre una secuencia ya ordenada."""
+    if not sorted_values:
+        return 0.0
+    k = max(0, min(len(sorted_values) - 1, int(round(pct / 100.0 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[k]
+
+
+def latency_summary_ms(latencies_s: Sequence[float]) -> Dict[str, float]:
+    values = sorted(latencies_s)
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "mean_ms": round(sum(values) / len(values) * 1000, 3),
+        "p50_ms": round(percentile(values, 50) * 1000, 3),
+        "p95_ms": round(percentile(values, 95) * 1000, 3),
+        "p99_ms": round(percentile(values, 99) * 1000, 3),
+        "max_ms": round(values[-1] * 1000, 3),
+    }
@@ -0,0 +1,572 @@
+"""
+Suite de benchmarks reproducible: micro, servicio, ASGI y logs.
+
+Grupos (cada caso reporta ops_per_s, la métrica que se compara):
+- micro: cada create_* de las factories, VMTierDirector.construct, operaciones
+  de VMRepository y audit_log
+- service: VMService.create_vm / build_vm / create_infrastructure
+- asgi: carga en proceso contra los endpoints principales (ASGIClient, sin red)
+- logs: LogService.get_logs / get_stats sobre logs sintéticos de --log-lines
+  líneas (una op = una línea leída)
+
+La auditoría se redirige a un fichero temporal mientras corre la suite, y los
+logs sintéticos se generan una vez en data/bench/ con semilla fija.
+
+    python -m benchmarks.suite --out data/bench/baseline.json
+    python -m benchmarks.suite --baseline data/bench/baseline.json --threshold 10
+    python -m benchmarks.suite --only micro.factory --quick
+
+Con --baseline compara cada caso (cambio % de ops_per_s) y termina con código 1
+si alguno empeora más de --threshold %.
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.stats import latency_summary_ms
+
+SUITE_VERSION = 1
+CLOUD_REGIONS = {
+    "aws": "us-east-1",
+    "azure": "eastus",
+    "gcp": "us-central1",
+    "oracle": "us-ashburn-1",
+    "onprem": "datacenter-1",
+}
+# Mismos proveedores con el valor de ProviderEnum (endpoints /vm)
+VM_PROVIDERS = {"aws": "aws", "azure": "azure", "gcp": "gcp", "oracle": "oracle", "onprem": "onpremise"}
+VM_PARAMS = {
+    "aws": {"instance_type": "t3.medium", "region": "us-east-1", "vpc_id": "vpc-12345678", "ami": "ami-0abcdef1234567890"},
+    "azure": {"vm_size": "Standard_B2s", "resource_group": "rg-bench", "image": "Ubuntu 22.04 LTS", "region": "eastus"},
+    "gcp": {"machine_type": "e2-medium", "zone": "us-central1-a", "base_disk": "debian-12", "project": "bench-project"},
+    "onpremise": {"cpu": 2, "ram_gb": 4, "disk_gb": 50, "nic": "vmxnet3"},
+    "oracle": {
+        "compute_shape": "VM.Standard2.1",
+        "compartment_id": "ocid1.compartment.oc1..exampleuniqueID",
+        "availability_domain": "AD-1",
+        "subnet_id": "ocid1.subnet.oc1..example",
+        "image_id": "ocid1.image.oc1..example",
+    },
+}
+TIERS = ("small", "medium", "large", "xlarge")
+# VMs en el inventario de la app para asgi.vm_get / asgi.vm_list
+INVENTORY_SIZE = 1_000
+RESOURCE_TYPES = ("virtual_machine", "database", "load_balancer", "storage")
+_CONFIG_KEYS = {"virtual_machine": "vm", "database": "database", "load_balancer": "load_balancer", "storage": "storage"}
+# Lo mínimo que tiene que enviar el cliente (el resto lo rellenan los defaults)
+_CLIENT_CONFIGS = {"onprem": {"virtual_machine": {"nic": "vmxnet3"}}}
+
+Case = Tuple[str, Callable[[argparse.Namespace], Dict[str, Any]]]
+
+
+def _best(fn: Callable[[], int], repeat: int, warmup: bool = True) -> Tuple[float, int]:
+    """Mejor (menor) tiempo de `repeat` ejecuciones de fn, que devuelve las ops hechas."""
+    if warmup:
+        # Cachés de sizing/planes, crecimiento de dicts, imports perezosos...
+        fn()
+    best = float("inf")
+    ops = 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        ops = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, ops
+
+
+def _rate(fn: Callable[[], int], repeat: int, warmup: bool = True, **extra: Any) -> Dict[str, Any]:
+    seconds, ops = _best(fn, repeat, warmup)
+    return {"ops": ops, "ops_per_s": round(ops / seconds, 1), "us_per_op": round(seconds / ops * 1e6, 3), **extra}
+
+
+def _n(args: argparse.Namespace, base: int) -> int:
+    return max(1, int(base * args.scale))
+
+
+@contextlib.contextmanager
+def audit_redirected(path: str):
+    """Manda la auditoría a `path` (la suite no toca logs/audit.log)."""
+    audit = logging.getLogger("audit")
+    original = list(audit.handlers)
+    handler = logging.FileHandler(path)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    audit.handlers = [handler]
+    try:
+        yield
+    finally:
+        audit.handlers = original
+        handler.close()
+
+
+def _prepared_configs() -> Dict[str, Dict[str, Any]]:
+    """Config de cada recurso por proveedor tal como la prepara InfrastructureService."""
+    from app.domain.validation import CONFIG_SCHEMAS
+
+    out: Dict[str, Dict[str, Any]] = {}
+    for provider, region in CLOUD_REGIONS.items():
+        context: Dict[str, Any] = {"name": "bench", "region": region, "vm": {}}
+        configs: Dict[str, Any] = {}
+        for resource_type in RESOURCE_TYPES:
+            client = _CLIENT_CONFIGS.get(provider, {}).get(resource_type)
+            prepared = CONFIG_SCHEMAS[provider][resource_type].prepare(client, context)
+            if resource_type == "virtual_machine":
+                context["vm"] = prepared
+            configs[resource_type] = prepared
+        out[provider] = configs
+    return out
+
+
+# ---------------------------------------------------------------- micro
+
+
+def _micro_factory_cases() -> List[Case]:
+    from app.domain.factory_provider import CloudProvider, create_cloud_factory
+
+    configs = _prepared_configs()
+    cases: List[Case] = []
+    for provider in CLOUD_REGIONS:
+        factory = create_cloud_factory(CloudProvider(provider))
+        for resource_type in RESOURCE_TYPES:
+            create = getattr(factory, f"create_{resource_type}")
+            config = configs[provider][resource_type]
+
+            def case(args, create=create, config=config) -> Dict[str, Any]:
+                n = _n(args, 5_000)
+
+                def run() -> int:
+                    for i in range(n):
+                        create(f"bench-{i}", config)
+                    return n
+                return _rate(run, args.repeat)
+
+            cases.append((f"micro.factory.{provider}.create_{resource_type}", case))
+    return cases
+
+
+def _micro_director(args) -> Dict[str, Any]:
+    from app.domain.builders import VMTierDirector, create_vm_builder
+    from app.domain.schemas.common import ProviderEnum
+
+    director = VMTierDirector()
+    shapes = [(ProviderEnum(VM_PROVIDERS[p]), CLOUD_REGIONS[p], t) for p in CLOUD_REGIONS for t in TIERS]
+    n = _n(args, 2_000)
+
+    def run() -> int:
+        for i in range(n):
+            provider, region, tier = shapes[i % len(shapes)]
+            director.construct(create_vm_builder(provider), name=f"bench-{i}", region=region, tier=tier, firewall_rules=["22/tcp"])
+        return n
+    return _rate(run, args.repeat, shapes=len(shapes))
+
+
+def _vm_dtos(n: int) -> List[Any]:
+    from app.domain.schemas import VMDTO
+
+    specs = {"instance_type": "t3.medium", "region": "us-east-1"}
+    return [VMDTO(id=f"i-{i:08x}", name=f"bench-{i}", provider="aws", status="running", specs=specs) for i in range(n)]
+
+
+def _micro_repository_cases() -> List[Case]:
+    def op(name: str) -> Callable[[argparse.Namespace], Dict[str, Any]]:
+        def case(args) -> Dict[str, Any]:
+            from app.infrastructure.repository import VMRepository
+
+            vms = _vm_dtos(_n(args, 20_000))
+            ids = [vm.id for vm in vms]
+            repo = VMRepository()
+
+            if name == "save":
+                def run() -> int:
+                    for vm in vms:
+                        repo.save(vm)
+                    return len(vms)
+            elif name == "save_many":
+                def run() -> int:
+                    repo.save_many(vms)
+                    return len(vms)
+            elif name == "get":
+                repo.save_many(vms)
+
+                def run() -> int:
+                    for vm_id in ids:
+                        repo.get(vm_id)
+                    return len(ids)
+            elif name == "delete":
+                def run() -> int:
+                    repo.save_many(vms)
+                    for vm_id in ids:
+                        repo.delete(vm_id)
+                    return len(ids)
+            else:  # list: una op = una VM devuelta
+                repo.save_many(vms)
+
+                def run() -> int:
+                    for _ in range(10):
+                        repo.list()
+                    return 10 * len(vms)
+            return _rate(run, args.repeat, store_size=len(vms))
+        return case
+
+    return [(f"micro.repository.{name}", op(name)) for name in ("save", "save_many", "get", "delete", "list")]
+
+
+def _micro_audit_log(args) -> Dict[str, Any]:
+    from app.infrastructure.logger import audit_log
+
+    n = _n(args, 10_000)
+
+    def run() -> int:
+        for i in range(n):
+            audit_log("bench", "create", f"i-{i:08x}", "aws", True, {"name": "bench"})
+        return n
+    return _rate(run, args.repeat)
+
+
+# ---------------------------------------------------------------- service
+
+
+def _vm_create_bodies(n: int) -> List[Dict[str, Any]]:
+    providers = list(VM_PARAMS)
+    bodies = []
+    for i in range(n):
+        provider = providers[i % len(providers)]
+        bodies.append({"name": f"bench-{i}", "provider": provider, "params": VM_PARAMS[provider]})
+    return bodies
+
+
+def _vm_create_requests(n: int) -> List[Any]:
+    from pydantic import TypeAdapter
+    from app.domain.schemas import VMCreateRequest
+
+    adapter = TypeAdapter(VMCreateRequest)
+    return [adapter.validate_python(body) for body in _vm_create_bodies(n)]
+
+
+def _vm_build_bodies(n: int) -> List[Dict[str, Any]]:
+    shapes = [(VM_PROVIDERS[p], CLOUD_REGIONS[p], t) for p in CLOUD_REGIONS for t in TIERS]
+    bodies = []
+    for i in range(n):
+        provider, region, tier = shapes[i % len(shapes)]
+        bodies.append({"name": f"bench-{i}", "provider": provider, "region": region, "tier": tier, "firewall_rules": ["22/tcp"]})
+    return bodies
+
+
+def _service_create_vm(args) -> Dict[str, Any]:
+    from app.domain.services import VMService
+    from app.infrastructure.repository import VMRepository
+
+    requests = _vm_create_requests(_n(args, 2_000))
+
+    def run() -> int:
+        service = VMService(VMRepository())
+        for req in requests:
+            service.create_vm(req)
+        return len(requests)
+    return _rate(run, args.repeat)
+
+
+def _service_build_vm(args) -> Dict[str, Any]:
+    from app.domain.schemas import VMBuildRequest
+    from app.domain.services import VMService
+    from app.infrastructure.repository import VMRepository
+
+    requests = [VMBuildRequest(**b) for b in _vm_build_bodies(_n(args, 2_000))]
+
+    def run() -> int:
+        service = VMService(VMRepository())
+        for req in requests:
+            service.build_vm(req)
+        return len(requests)
+    return _rate(run, args.repeat)
+
+
+def _service_create_infrastructure(args) -> Dict[str, Any]:
+    from app.domain.services import VMService
+    from app.infrastructure.repository import VMRepository
+
+    configs = _prepared_configs()
+    plans = [
+        (provider, {_CONFIG_KEYS[rt]: {"name": f"bench-{rt}", "config": configs[provider][rt]} for rt in RESOURCE_TYPES})
+        for provider in CLOUD_REGIONS
+    ]
+    n = _n(args, 500)
+
+    def run() -> int:
+        service = VMService(VMRepository())
+        for i in range(n):
+            provider, plan = plans[i % len(plans)]
+            service.create_infrastructure(provider, plan)
+        return n
+    return _rate(run, args.repeat, resources_per_op=len(RESOURCE_TYPES))
+
+
+# ---------------------------------------------------------------- asgi
+
+
+def _asgi_case(method: str, path: str, bodies: Callable[[int], List[Any]], base: int, expect: int = 200):
+    def case(args) -> Dict[str, Any]:
+        from app.main import app
+        from benchmarks.asgi_client import ASGIClient
+
+        client = ASGIClient(app)
+        items = bodies(_n(args, base))
+
+        async def once() -> Tuple[float, List[float], int]:
+            sem = asyncio.Semaphore(args.concurrency)
+            latencies: List[float] = []
+            errors = 0
+
+            async def one(item: Any) -> None:
+                nonlocal errors
+                target, body = item if isinstance(item, tuple) else (path, item)
+                async with sem:
+                    resp = await client.request(method, target, json_body=body, keep_body=False)
+                latencies.append(resp.total_s)
+                if resp.status != expect:
+                    errors += 1
+
+            t0 = time.perf_counter()
+            await asyncio.gather(*(one(item) for item in items))
+            return time.perf_counter() - t0, latencies, errors
+
+        async def best() -> Dict[str, Any]:
+            await once()  # calentamiento
+            runs = [await once() for _ in range(args.repeat)]
+            elapsed, latencies, errors = min(runs, key=lambda r: r[0])
+            return {
+                "requests": len(items),
+                "errors": errors,
+                "ops_per_s": round(len(items) / elapsed, 1),
+                "latency": latency_summary_ms(latencies),
+            }
+
+        return asyncio.run(best())
+    return case
+
+
+def _seed_inventory(size: int = INVENTORY_SIZE) -> List[str]:
+    """Deja el inventario de la app con `size` VMs fijas (las de casos anteriores se borran)."""
+    from app.core.container import get_vm_service
+
+    repo = get_vm_service().repo
+    for vm in repo.list():
+        repo.delete(vm.id)
+    vms = _vm_dtos(size)
+    repo.save_many(vms)
+    return [vm.id for vm in vms]
+
+
+def _vm_get_targets(n: int) -> List[Tuple[str, None]]:
+    ids = _seed_inventory()
+    return [(f"/vm/{ids[i % len(ids)]}", None) for i in range(n)]
+
+
+def _vm_list_targets(n: int) -> List[None]:
+    _seed_inventory()
+    return [None] * n
+
+
+def _infrastructure_bodies(n: int) -> List[Dict[str, Any]]:
+    providers = list(CLOUD_REGIONS)
+    bodies = []
+    for i in range(n):
+        provider = providers[i % len(providers)]
+        body = {"provider": provider, "name": f"bench-{i}", "region": CLOUD_REGIONS[provider]}
+        for resource_type, config in _CLIENT_CONFIGS.get(provider, {}).items():
+            body[f"{_CONFIG_KEYS[resource_type]}_config"] = config
+        bodies.append(body)
+    return bodies
+
+
+def _asgi_cases() -> List[Case]:
+    return [
+        ("asgi.health", _asgi_case("GET", "/health", lambda n: [None] * n, 5_000)),
+        ("asgi.vm_create", _asgi_case("POST", "/vm/create", _vm_create_bodies, 2_000)),
+        ("asgi.vm_build", _asgi_case("POST", "/vm/build", _vm_build_bodies, 2_000)),
+        ("asgi.infrastructure_create", _asgi_case("POST", "/cloud/infrastructure/create", _infrastructure_bodies, 1_000)),
+        ("asgi.vm_get", _asgi_case("GET", "", _vm_get_targets, 5_000)),
+        ("asgi.vm_list", _asgi_case("GET", "/vm/", _vm_list_targets, 200)),
+    ]
+
+
+# ---------------------------------------------------------------- logs
+
+
+def _log_cases(args: argparse.Namespace) -> List[Case]:
+    cases: List[Case] = []
+    for lines in args.log_lines:
+        def scan(op: str, lines: int = lines) -> Callable[[argparse.Namespace], Dict[str, Any]]:
+            def case(args) -> Dict[str, Any]:
+                from app.domain.schemas.logs import LogsQuery
+                from app.domain.services.log_service import LogService
+                from benchmarks.audit_logs import ensure
+
+                path = ensure(lines, args.seed)
+                service = LogService()
+                service.log_file_path = path
+                query = LogsQuery(provider="aws", success=True, page=1, page_size=50)
+
+                def run() -> int:
+                    if op == "get_logs":
+                        service.get_logs(query)
+                    else:
+                        service.get_stats()
+                    return lines
+                # Sin calentamiento: con 10^7 líneas cada pasada son minutos
+                return _rate(run, args.repeat, warmup=False, lines=lines, bytes=os.path.getsize(path))
+            return case
+
+        cases.append((f"logs.get_logs.{lines}", scan("get_logs")))
+        cases.append((f"logs.get_stats.{lines}", scan("get_stats")))
+    return cases
+
+
+# ---------------------------------------------------------------- runner
+
+
+def collect_cases(args: argparse.Namespace) -> List[Case]:
+    cases: List[Case] = []
+    cases += _micro_factory_cases()
+    cases.append(("micro.director.construct", _micro_director))
+    cases += _micro_repository_cases()
+    cases.append(("micro.audit_log", _micro_audit_log))
+    cases.append(("service.create_vm", _service_create_vm))
+    cases.append(("service.build_vm", _service_build_vm))
+    cases.append(("service.create_infrastructure", _service_create_infrastructure))
+    cases += _asgi_cases()
+    cases += _log_cases(args)
+    if args.only:
+        cases = [c for c in cases if any(c[0].startswith(prefix) for prefix in args.only)]
+    return cases
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def _meta(args: argparse.Namespace) -> Dict[str, Any]:
+    from app.infrastructure.tracing import get_tracer
+
+    tracer = get_tracer()
+    return {
+        "suite_version": SUITE_VERSION,
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "args": {k: v for k, v in vars(args).items() if k not in ("out", "baseline", "list")},
+        # Lo que cambia el camino medido: simulación, governor y muestreo de trazas
+        "env": {k: os.environ.get(k) for k in ("VM_API_SIMULATION", "VM_API_GOVERNOR", "VM_API_TRACING")},
+        "tracing_sample_rate": tracer.sample_rate if tracer is not None else 0.0,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold_pct: float) -> Dict[str, Any]:
+    """Cambio % de ops_per_s por caso frente al baseline; regresión si cae más de threshold_pct."""
+    rows: Dict[str, Any] = {}
+    regressions = []
+    for name, result in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None or "ops_per_s" not in base or "ops_per_s" not in result:
+            rows[name] = {"status": "new"}
+            continue
+        change = (result["ops_per_s"] / base["ops_per_s"] - 1) * 100 if base["ops_per_s"] else 0.0
+        if change < -threshold_pct:
+            status = "regression"
+            regressions.append(name)
+        elif change > threshold_pct:
+            status = "improvement"
+        else:
+            status = "ok"
+        rows[name] = {
+            "baseline": base["ops_per_s"],
+            "current": result["ops_per_s"],
+            "change_pct": round(change, 1),
+            "status": status,
+        }
+    return {
+        "baseline_commit": baseline.get("meta", {}).get("git_commit"),
+        "threshold_pct": threshold_pct,
+        "regressions": regressions,
+        "cases": rows,
+    }
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    with contextlib.ExitStack() as stack:
+        # Los servicios y factories imprimen por cada operación
+        devnull = stack.enter_context(open(os.devnull, "w"))
+        stack.enter_context(contextlib.redirect_stdout(devnull))
+        from app.main import app  # noqa: F401  (cablea decoradores de factories, métricas y trazas)
+
+        audit_dir = stack.enter_context(tempfile.TemporaryDirectory(prefix="vm-api-bench-"))
+        stack.enter_context(audit_redirected(os.path.join(audit_dir, "audit.log")))
+        meta = _meta(args)
+        for name, case in collect_cases(args):
+            t0 = time.perf_counter()
+            results[name] = case(args)
+            print(f"{name}: {results[name]['ops_per_s']} ops/s ({time.perf_counter() - t0:.1f}s)", file=sys.stderr)
+    return {"meta": meta, "results": results}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--only", action="append", default=[], help="Prefijo de caso (repetible): micro, asgi.vm_build...")
+    parser.add_argument("--list", action="store_true", help="Lista los casos y termina")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplica las ops de cada caso")
+    parser.add_argument("--quick", action="store_true", help="Equivale a --scale 0.1 --repeat 1")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeticiones por caso (se reporta la mejor)")
+    parser.add_argument("--concurrency", type=int, default=32, help="Peticiones en vuelo en los casos asgi")
+    parser.add_argument(
+        "--log-lines", type=lambda raw: [int(float(x)) for x in raw.split(",")], default=[100_000],
+        help="Tamaños de los logs sintéticos, p. ej. 1e5,1e6,1e7",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Semilla de los logs sintéticos")
+    parser.add_argument("--out", help="Guarda el resultado en este JSON (p. ej. para usarlo de baseline)")
+    parser.add_argument("--baseline", help="JSON de una ejecución anterior con el que comparar")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Caída %% de ops/s que cuenta como regresión")
+    args = parser.parse_args(argv)
+    if args.quick:
+        args.scale, args.repeat = 0.1, 1
+
+    if args.list:
+        with contextlib.redirect_stdout(io.StringIO()):
+            names = [name for name, _ in collect_cases(args)]
+        print("\n".join(names))
+        return 0
+
+    result = run(args)
+    if args.out:
+        directory = os.path.dirname(args.out)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.out, "w", encoding="utf-8") as fh:
+            json.dump(result, fh, indent=2)
+    status = 0
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as fh:
+            result["comparison"] = compare(result, json.load(fh), args.threshold)
+        status = 1 if result["comparison"]["regressions"] else 0
+    print(json.dumps(result, indent=2))
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,11 @@
+"""
+Los tests importan app.main: la auditoría y los jobs van a un directorio
+temporal para no ensuciar logs/ ni data/ del repositorio. Tiene que hacerse
+antes de importar la app (el logger abre su fichero al importarse).
+"""
+import os
+import tempfile
+
+_tmp = tempfile.mkdtemp(prefix="vm-api-tests-")
+os.environ.setdefault("VM_API_LOG_DIR", os.path.join(_tmp, "logs"))
+os.environ.setdefault("VM_API_JOBS_FILE", os.path.join(_tmp, "jobs.jsonl"))
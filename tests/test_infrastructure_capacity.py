@@ -0,0 +1,56 @@
+"""
+Borrar una infraestructura devuelve lo que reservaban sus recursos: la cuota
+del governor y el host/datastore on-prem ocupados por su VM.
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.domain.placement import Inventory, PlacementScheduler, configure_placement
+from app.infrastructure.governor import ProvisioningGovernor, disable_governor, enable_governor
+from app.main import app
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture
+def governor():
+    governor = ProvisioningGovernor({"aws": {"quota": {"max_instances": 1}}})
+    enable_governor(governor)
+    yield governor
+    disable_governor()
+
+
+@pytest.fixture
+def scheduler():
+    # Un host y un datastore en los que cabe justo una VM con los valores por defecto (2 vCPU, 4 GB, 50 GB)
+    scheduler = PlacementScheduler(Inventory.from_dict({"datacenters": {"*": {
+        "hosts": [{"name": "esxi-01.company.local", "cpu_cores": 2, "ram_gb": 4}],
+        "datastores": [{"name": "datastore1", "capacity_gb": 50}],
+    }}}))
+    configure_placement(scheduler)
+    yield scheduler
+    configure_placement(None)
+
+
+def _create_and_delete(client, provider, region, n, vm_config=None):
+    for i in range(n):
+        body = {"provider": provider, "name": f"cap-{i}", "region": region, "vm_config": vm_config or {}}
+        response = client.post("/cloud/infrastructure/create", json=body)
+        assert response.status_code == 200, response.text
+        deleted = client.delete(f"/cloud/infrastructure/{response.json()['infrastructure_id']}")
+        assert deleted.status_code == 200, deleted.text
+
+
+def test_delete_releases_governor_quota(client, governor):
+    _create_and_delete(client, "aws", "us-east-1", 3)
+    assert governor.stats()["quota_holds"] == 0
+
+
+def test_delete_releases_onprem_placement(client, scheduler):
+    _create_and_delete(client, "onprem", "datacenter-1", 3, {"nic": "eth0"})
+    totals = scheduler.capacity()["totals"]
+    assert totals["used_vcpus"] == 0 and totals["used_ram_gb"] == 0
@@ -0,0 +1,39 @@
+"""
+Placement de /vm/build: la región elegida debe distinguir entre regiones del
+mismo proveedor y la VM construida debe quedar en esa región.
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.domain.catalog import get_provider_catalog
+from app.main import app
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as c:
+        yield c
+
+
+def _vm_region(vm):
+    specs = vm["specs"]
+    if "region" in specs:
+        return specs["region"]
+    # GCP: la región es la de la zona
+    return get_provider_catalog("gcp").region_for_zone(specs["zone"])
+
+
+def test_regions_of_a_provider_do_not_tie(client):
+    candidates = client.post("/vm/placement", json={"tier": "small", "provider": "aws"}).json()["candidates"]
+    scores = {c["region"]: c["score"] for c in candidates}
+    assert scores["us-east-1"] < scores["ap-northeast-1"]
+
+
+@pytest.mark.parametrize("placement", [{}, {"provider": "gcp"}, {"provider": "aws"}, {"provider": "gcp", "region": "europe-west1"}])
+def test_built_vm_lands_in_chosen_candidate(client, placement):
+    chosen = client.post("/vm/placement", json={"tier": "small", **placement}).json()["chosen"]
+    response = client.post("/vm/build", json={"name": "placed", "tier": "small", **placement})
+    assert response.status_code == 200, response.text
+    vm = response.json()["vm"]
+    assert vm["provider"] == chosen["provider"]
+    assert _vm_region(vm) == chosen["region"]
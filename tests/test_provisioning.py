@@ -0,0 +1,73 @@
+"""
+aexecute_plan: si se cancela a quien espera el plan, lo ya creado (y lo que
+estaba creándose) se deshace antes de propagar la cancelación.
+"""
+import asyncio
+
+import pytest
+
+from app.domain.abstractions.products import CloudResource
+from app.domain.abstractions.provisioning import ProvisioningPlan, ResourceNode, aexecute_plan
+
+# Segundos que tarda cada tipo de recurso en crearse
+DURATIONS = {"virtual_machine": 0.05, "database": 0.2, "load_balancer": 0.05, "storage": 0.01}
+
+
+class _Resource:
+    def __init__(self, name: str):
+        self.name = name
+        self.resource_id = name
+
+    def get_resource_type(self) -> str:
+        return "fake"
+
+
+class _SlowFactory:
+    def __init__(self):
+        self.created = []
+        self.deleted = []
+
+    def __getattr__(self, attr):
+        resource_type = attr[len("acreate_"):]
+        if not attr.startswith("acreate_") or resource_type not in DURATIONS:
+            raise AttributeError(attr)
+
+        async def create(name, config) -> CloudResource:
+            await asyncio.sleep(DURATIONS[resource_type])
+            self.created.append(name)
+            return _Resource(name)
+        return create
+
+    async def adelete_resource(self, resource) -> None:
+        self.deleted.append(resource.name)
+
+
+def _plan() -> ProvisioningPlan:
+    return ProvisioningPlan([
+        ResourceNode("vm", "vm", {}),
+        ResourceNode("database", "db", {}),
+        ResourceNode("load_balancer", "lb", {}, depends_on=("vm",)),
+        ResourceNode("storage", "storage", {}),
+    ])
+
+
+def test_cancelled_plan_rolls_back_created_resources():
+    factory = _SlowFactory()
+
+    async def scenario():
+        task = asyncio.create_task(aexecute_plan(factory, _plan(), max_concurrency=2))
+        await asyncio.sleep(0.03)  # VM y BD en curso; LB y storage sin lanzar
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(scenario())
+    assert sorted(factory.created) == ["db", "vm"]
+    assert sorted(factory.deleted) == sorted(factory.created)
+
+
+def test_completed_plan_keeps_resources():
+    factory = _SlowFactory()
+    created = asyncio.run(aexecute_plan(factory, _plan()))
+    assert sorted(created) == ["database", "load_balancer", "storage", "vm"]
+    assert factory.deleted == []